@@ -0,0 +1,23 @@
+""" Timing helpers shared by the benchmarks; the times are in seconds, which each benchmark scales to the unit it
+reports them in
+"""
+from time import perf_counter
+
+
+def timed(function, repeat: int = 1) -> tuple[float, object]:
+    """ Calls the function `repeat` times and returns the time a single call took on average, along with the result of
+    the last call
+    """
+    started = perf_counter()
+    for _ in range(repeat):
+        result = function()
+    return (perf_counter() - started) / repeat, result
+
+
+def per_call(function, arguments: list) -> tuple[float, list]:
+    """ Calls the function with each of the arguments and returns the time a single call took on average, along with
+    the results of all calls
+    """
+    started = perf_counter()
+    results = [function(argument) for argument in arguments]
+    return (perf_counter() - started) / len(arguments), results
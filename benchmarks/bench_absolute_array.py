@@ -0,0 +1,43 @@
+""" Compares testing a few hundred thousand AbsolutePeriods against a single value with an AbsolutePeriodArray against
+calling the methods of every period. Requires NumPy.
+
+Usage:
+    python -m benchmarks.bench_absolute_array [size]
+"""
+import random
+import sys
+from datetime import datetime, timedelta
+from zoneinfo import ZoneInfo
+from temporals.pydatetime import AbsolutePeriod
+from temporals.pydatetime.arrays import AbsolutePeriodArray
+from benchmarks._timing import timed
+
+ZONES = [ZoneInfo('UTC'), ZoneInfo('Europe/London'), ZoneInfo('America/New_York'), ZoneInfo('Asia/Tokyo')]
+
+
+def main(size: int = 200000):
+    rng = random.Random(0)
+    base = datetime(2024, 1, 1, tzinfo=ZoneInfo('UTC'))
+    periods = []
+    for _ in range(size):
+        zone = rng.choice(ZONES)
+        start = base + timedelta(minutes=rng.randint(0, 525600))
+        end = start + timedelta(minutes=rng.randint(5, 600))
+        periods.append(AbsolutePeriod(start=start.astimezone(zone), end=end.astimezone(zone)))
+    build_time, array = timed(lambda: AbsolutePeriodArray(periods))
+    point = base + timedelta(days=180)
+    other = AbsolutePeriod(start=point, end=point + timedelta(hours=6))
+
+    print(f"{size} periods, array built in {build_time * 1e3:.0f} ms, milliseconds per pass")
+    for name, method, value in (('contains', '__contains__', point), ('is_before', 'is_before', point),
+                                ('is_after', 'is_after', point.date()), ('overlaps_with', 'overlaps_with', other),
+                                ('relation', 'relation', other)):
+        looped_time, looped = timed(lambda: [getattr(period, method)(value) for period in periods])
+        array_method = 'contains' if method == '__contains__' else method
+        array_time, found = timed(lambda: getattr(array, array_method)(value))
+        assert looped == found.tolist()
+        print(f"{name:<14}periods {looped_time * 1e3:>9.1f}   array {array_time * 1e3:>7.2f}")
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200000)
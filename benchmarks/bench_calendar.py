@@ -0,0 +1,54 @@
+""" Compares testing dates against a few hundred DatePeriods spread over 30 years with a DateCalendar against scanning
+the periods with membership tests, along with the set algebra of calendars against that of DatePeriodSets.
+
+Usage:
+    python -m benchmarks.bench_calendar [size]
+"""
+import random
+import sys
+from datetime import date, timedelta
+from temporals.pydatetime import DatePeriod, DatePeriodSet, DateCalendar
+from benchmarks._timing import timed, per_call
+
+QUERIES = 2000
+HORIZON = 30 * 365
+
+
+def _periods(rng: random.Random, size: int) -> list:
+    base = date(2000, 1, 1)
+    periods = []
+    for _ in range(size):
+        start = base + timedelta(days=rng.randint(0, HORIZON))
+        periods.append(DatePeriod(start=start, end=start + timedelta(days=rng.randint(1, 60))))
+    return periods
+
+
+def main(size: int = 300):
+    rng = random.Random(0)
+    first = _periods(rng, size)
+    second = _periods(rng, size)
+    points = [date(2000, 1, 1) + timedelta(days=rng.randint(0, HORIZON)) for _ in range(QUERIES)]
+    calendar = DateCalendar(first)
+    other = DateCalendar(second)
+    first_set = DatePeriodSet(first)
+    second_set = DatePeriodSet(second)
+
+    print(f"{size} periods over 30 years, microseconds")
+    scanned_time, scanned = per_call(lambda point: any(point in period for period in first), points)
+    lookup_time, found = per_call(calendar.__contains__, points)
+    assert scanned == found
+    print(f"{'membership':<14}scan {scanned_time * 1e6:>10.2f}   calendar {lookup_time * 1e6:>8.2f}   per date")
+    in_second = [any(point in period for period in second) for point in points]
+    for name, operation, holds in (('union', '__or__', bool.__or__), ('intersection', '__and__', bool.__and__),
+                                   ('difference', '__sub__', lambda first, second: first and not second)):
+        set_time, _ = timed(lambda: getattr(first_set, operation)(second_set), 100)
+        calendar_time, result = timed(lambda: getattr(calendar, operation)(other), 100)
+        assert [point in result for point in points] == [holds(a, b) for a, b in zip(scanned, in_second)]
+        print(f"{name:<14}set  {set_time * 1e6:>10.2f}   calendar {calendar_time * 1e6:>8.2f}")
+    build_time, _ = timed(lambda: DateCalendar(first), 100)
+    periods_time, _ = timed(calendar.to_periods, 100)
+    print(f"{'build':<14}     {build_time * 1e6:>10.2f}   to_periods {periods_time * 1e6:>6.2f}")
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 300)
@@ -0,0 +1,48 @@
+""" Compares `coalesce` against merging each period with every period merged before it which it overlaps or meets,
+rebuilding a period for each of these pairs.
+
+Usage:
+    python -m benchmarks.bench_coalesce [size]
+"""
+import random
+import sys
+from datetime import datetime, timedelta
+from temporals.pydatetime import WallClockPeriod, coalesce
+from temporals.relations import Relation
+from benchmarks._timing import timed
+
+_APART = {Relation.BEFORE, Relation.AFTER}
+
+
+def _pairwise(periods: list) -> list:
+    merged = []
+    for period in periods:
+        # Every merged period which the new one overlaps or meets is absorbed into it
+        kept = []
+        for other in merged:
+            if period.relation(other) in _APART:
+                kept.append(other)
+            else:
+                period = WallClockPeriod(start=min(period.start, other.start), end=max(period.end, other.end))
+        kept.append(period)
+        merged = kept
+    return sorted(merged)
+
+
+def main(size: int = 2000):
+    rng = random.Random(0)
+    base = datetime(2024, 1, 1)
+    print(f"{'periods':>8}{'pairwise (ms)':>16}{'coalesce (ms)':>16}")
+    for count in (100, 500, size):
+        periods = []
+        for _ in range(count):
+            start = base + timedelta(minutes=rng.randint(0, count * 60))
+            periods.append(WallClockPeriod(start=start, end=start + timedelta(minutes=rng.randint(1, 90))))
+        pairwise, expected = timed(lambda: _pairwise(periods))
+        swept, result = timed(lambda: coalesce(periods))
+        assert result == expected
+        print(f"{count:>8}{pairwise * 1e3:>16.1f}{swept * 1e3:>16.1f}")
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 2000)
@@ -0,0 +1,51 @@
+""" Compares a subscription ledger of DatePeriods built as a DatePeriodArray from its columns against one built as a
+list of DatePeriods: creating the periods, testing a date against them, finding their overlaps with a campaign and
+decomposing their durations. Requires NumPy.
+
+Usage:
+    python -m benchmarks.bench_date_array [size]
+"""
+import random
+import sys
+from datetime import date, timedelta
+import numpy as np
+from temporals.pydatetime import DatePeriod
+from temporals.pydatetime.arrays import DatePeriodArray
+from benchmarks._timing import timed
+
+
+def _fields(duration) -> tuple:
+    return (duration.total_seconds, duration.years, duration.months, duration.days, duration.hours, duration.minutes,
+            duration.seconds)
+
+
+def main(size: int = 200000):
+    rng = random.Random(0)
+    base = date(2015, 1, 1)
+    starts = [base + timedelta(days=rng.randint(0, 3650)) for _ in range(size)]
+    ends = [start + timedelta(days=rng.choice([30, 90, 365, rng.randint(1, 1000)])) for start in starts]
+    start_column = np.array(starts, dtype='datetime64[D]')
+    end_column = np.array(ends, dtype='datetime64[D]')
+    day = date(2020, 6, 1)
+    campaign = DatePeriod(start=date(2020, 1, 1), end=date(2020, 3, 1))
+
+    print(f"{size} subscriptions, milliseconds")
+    listed_time, periods = timed(lambda: [DatePeriod(start=start, end=end) for start, end in zip(starts, ends)])
+    array_time, array = timed(lambda: DatePeriodArray.from_dates(start_column, end_column))
+    print(f"{'create':<14}periods {listed_time * 1e3:>9.1f}   array {array_time * 1e3:>7.2f}")
+    listed_time, listed = timed(lambda: [day in period for period in periods])
+    array_time, found = timed(lambda: array.contains(day))
+    assert listed == found.tolist()
+    print(f"{'contains':<14}periods {listed_time * 1e3:>9.1f}   array {array_time * 1e3:>7.2f}")
+    listed_time, listed = timed(lambda: [period.get_overlap(campaign) for period in periods])
+    array_time, (overlaps, found) = timed(lambda: array.get_overlap(campaign))
+    assert [overlap for overlap in listed if overlap is not None] == list(overlaps)
+    print(f"{'get_overlap':<14}periods {listed_time * 1e3:>9.1f}   array {array_time * 1e3:>7.2f}")
+    listed_time, listed = timed(lambda: [_fields(period.duration) for period in periods])
+    array_time, found = timed(array.durations)
+    assert listed == found.tolist()
+    print(f"{'durations':<14}periods {listed_time * 1e3:>9.1f}   array {array_time * 1e3:>7.2f}")
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200000)
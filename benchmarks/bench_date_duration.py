@@ -0,0 +1,76 @@
+""" Compares the decomposition of the span of a DatePeriod into years, months and days against the month by month walk
+that the library used to perform, for spans from a single day up to a hundred years.
+
+Usage:
+    python -m benchmarks.bench_date_duration [count]
+"""
+import calendar
+import sys
+import timeit
+from datetime import date, timedelta
+from temporals.duration import Duration
+from temporals.pydatetime import DatePeriod
+
+
+class MonthWalkDatePeriod(DatePeriod):
+    """ A DatePeriod which decomposes its span the way the library used to """
+    __slots__ = ()
+
+    def _compute_duration(self) -> Duration:
+        start = self._start
+        end = self._end
+        _total: int = 0
+        _years: int = end.year - start.year
+        if end.month < start.month:
+            _years = _years - 1
+        leap_days = calendar.leapdays(start.year, end.year)
+        total_days = (end - start).days
+        _total += total_days * 24 * 60 * 60
+        days_left = (total_days - (_years * 365)) - leap_days
+        _months: int = 0
+        _year = start.year
+        next_month = start.month + _months
+        days_to_go = abs(days_left)
+        while days_to_go > 0:
+            if next_month > 12:
+                next_month = 1
+                _year += 1
+            days_in_month = calendar.monthrange(_year, next_month)[1]
+            if days_to_go - days_in_month >= 0:
+                _months += 1
+                next_month += 1
+                days_to_go -= days_in_month
+            else:
+                break
+        _days: int = days_to_go
+        return Duration(total_seconds=_total, years=_years, months=_months, days=_days, hours=0, minutes=0,
+                        seconds=0)
+
+
+SPANS = {
+    '1 day': 1,
+    '1 month': 30,
+    '11 months': 334,
+    '1 year': 365,
+    '10 years': 3652,
+    '100 years': 36524,
+}
+
+
+def _per_call(period: DatePeriod, count: int) -> float:
+    return min(timeit.repeat(period._compute_duration, number=count, repeat=5)) / count * 1e9
+
+
+def main(count: int = 20000):
+    start = date(1925, 3, 15)
+    print(f"{'span':<12}{'month walk (ns)':>18}{'closed form (ns)':>20}")
+    for name, days in SPANS.items():
+        end = start + timedelta(days=days)
+        walk = MonthWalkDatePeriod(start=start, end=end)
+        closed = DatePeriod(start=start, end=end)
+        assert walk.duration == closed.duration and walk.duration.months == closed.duration.months
+        print(f"{name:<12}{_per_call(walk, count):>18.0f}{_per_call(closed, count):>20.0f}")
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 20000)
@@ -0,0 +1,36 @@
+""" Compares finding the DatePeriods touching a month through a DatePeriodIndex against testing every period with
+`relation`.
+
+Usage:
+    python -m benchmarks.bench_date_index [size]
+"""
+import random
+import sys
+from datetime import date, timedelta
+from temporals.pydatetime import DatePeriod, DatePeriodIndex
+from temporals.relations import Relation
+from benchmarks._timing import timed, per_call
+
+
+def main(size: int = 500000):
+    rng = random.Random(0)
+    base = date(2015, 1, 1)
+    periods = []
+    for _ in range(size):
+        start = base + timedelta(days=rng.randint(0, 3650))
+        periods.append(DatePeriod(start=start, end=start + timedelta(days=rng.choice((30, 90, 365)))))
+    build_time, index = timed(lambda: DatePeriodIndex(periods))
+    print(f"built an index of {size} periods in {build_time:.2f} s")
+
+    outside = {Relation.BEFORE, Relation.AFTER}
+    months = [DatePeriod(start=date(year, 3, 1), end=date(year, 3, 31)) for year in range(2016, 2024)]
+    scan, scanned = per_call(lambda month: [period for period in periods if period.relation(month) not in outside],
+                             months)
+    bisected, found = per_call(index.overlapping, months)
+    assert [sorted(result) for result in scanned] == found
+    print(f"periods touching a month: scan {scan * 1e3:.1f} ms, index {bisected * 1e3:.1f} ms "
+          f"({sum(map(len, found)) // len(found)} periods on average)")
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 500000)
@@ -0,0 +1,42 @@
+""" Measures the depth profile of AbsolutePeriod sessions, and compares finding their peak concurrency with `max_depth`
+against counting the sessions active at the start of every session.
+
+Usage:
+    python -m benchmarks.bench_depth [size]
+"""
+import random
+import sys
+from datetime import datetime, timedelta, timezone
+from temporals.pydatetime import AbsolutePeriod, depth_profile, max_depth
+from benchmarks._timing import timed
+
+
+def _sessions(rng: random.Random, size: int) -> list:
+    base = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    sessions = []
+    for _ in range(size):
+        start = base + timedelta(seconds=rng.randint(0, 30 * 86400))
+        sessions.append(AbsolutePeriod(start=start, end=start + timedelta(seconds=rng.randint(60, 7200))))
+    return sessions
+
+
+def _naive_peak(sessions: list) -> int:
+    return max(sum(1 for other in sessions if other.start_epoch_us <= session.start_epoch_us < other.end_epoch_us)
+               for session in sessions)
+
+
+def main(size: int = 1000000):
+    rng = random.Random(0)
+    sessions = _sessions(rng, 5000)
+    naive, expected = timed(lambda: _naive_peak(sessions))
+    swept, (depth, _) = timed(lambda: max_depth(sessions))
+    assert depth == expected
+    print(f"peak of 5000 sessions: counting {naive * 1e3:.0f} ms, max_depth {swept * 1e3:.0f} ms")
+
+    sessions = _sessions(rng, size)
+    swept, changes = timed(lambda: sum(1 for _ in depth_profile(sessions)))
+    print(f"depth profile of {size} sessions: {changes} change points in {swept:.2f} s")
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1000000)
@@ -0,0 +1,56 @@
+""" Micro-benchmarks of the operations of each period class, grouped by the type of the operand they are given.
+
+Usage:
+    python -m benchmarks.bench_dispatch [count]
+"""
+import sys
+import timeit
+from datetime import time, date, datetime
+from temporals.pydatetime import TimePeriod, DatePeriod, WallClockPeriod, AbsolutePeriod
+
+OPERATIONS = ('__eq__', '__contains__', 'is_before', 'is_after', 'overlaps_with', 'overlapped_by', 'get_overlap')
+
+
+def _operands() -> dict:
+    return {
+        'time': time(9, 0),
+        'date': date(2024, 1, 1),
+        'datetime': datetime(2024, 1, 1, 9, 0),
+        'TimePeriod': TimePeriod(start=time(9, 0), end=time(10, 0)),
+        'DatePeriod': DatePeriod(start=date(2023, 12, 31), end=date(2024, 1, 1)),
+        'WallClockPeriod': WallClockPeriod(start=datetime(2024, 1, 1, 9, 0), end=datetime(2024, 1, 1, 10, 0)),
+        'AbsolutePeriod': AbsolutePeriod(start=datetime(2024, 1, 1, 9, 0), end=datetime(2024, 1, 1, 10, 0)),
+    }
+
+
+def _periods() -> list:
+    return [
+        TimePeriod(start=time(8, 0), end=time(12, 0)),
+        DatePeriod(start=date(2024, 1, 1), end=date(2024, 1, 10)),
+        WallClockPeriod(start=datetime(2024, 1, 1, 8, 0), end=datetime(2024, 1, 1, 12, 0)),
+        AbsolutePeriod(start=datetime(2024, 1, 1, 8, 0), end=datetime(2024, 1, 1, 12, 0)),
+    ]
+
+
+def _time_call(method, operand, count: int) -> float | None:
+    """ Returns the time, in nanoseconds, per call or None if the operand is not supported by the method """
+    try:
+        method(operand)
+    except Exception:
+        return None
+    return timeit.timeit(lambda: method(operand), number=count) / count * 1e9
+
+
+def main(count: int = 50_000):
+    operands = _operands()
+    print(f"{'period':<17}{'operation':<15}" + ''.join(f"{name:>17}" for name in operands))
+    for period in _periods():
+        for operation in OPERATIONS:
+            method = getattr(period, operation)
+            timings = [_time_call(method, operand, count) for operand in operands.values()]
+            print(f"{type(period).__name__:<17}{operation:<15}"
+                  + ''.join(f"{'-' if value is None else f'{value:.0f}':>17}" for value in timings))
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 50_000)
@@ -0,0 +1,79 @@
+""" Compares membership tests on WallClockPeriod and AbsolutePeriod with a cached Duration against the same tests
+performed by a period that rebuilds its Duration on every access of the `duration` property, as the library used to.
+
+For each operand the script reports the number of Duration objects constructed per membership test and the time it
+takes per test.
+
+Usage:
+    python -m benchmarks.bench_duration_cache [count]
+"""
+import sys
+import timeit
+from datetime import time, datetime
+from temporals.duration import Duration
+from temporals.pydatetime import TimePeriod, WallClockPeriod, AbsolutePeriod
+
+
+class UncachedWallClockPeriod(WallClockPeriod):
+    __slots__ = ()
+
+    @property
+    def duration(self):
+        return self._compute_duration()
+
+
+class UncachedAbsolutePeriod(AbsolutePeriod):
+    __slots__ = ()
+
+    @property
+    def duration(self):
+        return self._compute_duration()
+
+
+class _DurationCounter:
+    """ Counts the number of Duration objects created while active """
+
+    def __init__(self):
+        self.count = 0
+        self._original = Duration.__init__
+
+    def __enter__(self):
+        original = self._original
+
+        def counting_init(duration, *args, **kwargs):
+            self.count += 1
+            original(duration, *args, **kwargs)
+
+        Duration.__init__ = counting_init
+        return self
+
+    def __exit__(self, *exc):
+        Duration.__init__ = self._original
+
+
+def _run(period, item, count: int) -> tuple[float, float]:
+    with _DurationCounter() as counter:
+        elapsed = timeit.timeit(lambda: item in period, number=count)
+    return counter.count / count, elapsed / count * 1e9
+
+
+def main(count: int = 100_000):
+    start = datetime(2024, 1, 1, 8, 0)
+    end = datetime(2024, 1, 2, 6, 0)
+    operands = {
+        'datetime': datetime(2024, 1, 1, 12, 0),
+        'time': time(7, 0),
+        'TimePeriod': TimePeriod(start=time(9, 0), end=time(10, 0)),
+        'WallClockPeriod': WallClockPeriod(start=datetime(2024, 1, 1, 9, 0), end=datetime(2024, 1, 1, 10, 0)),
+        'AbsolutePeriod': AbsolutePeriod(start=datetime(2024, 1, 1, 9, 0), end=datetime(2024, 1, 1, 10, 0)),
+    }
+    print(f"{'period':<18}{'operand':<18}{'allocs (old)':>14}{'allocs (new)':>14}{'ns (old)':>11}{'ns (new)':>11}")
+    for cached, uncached in ((WallClockPeriod, UncachedWallClockPeriod), (AbsolutePeriod, UncachedAbsolutePeriod)):
+        for name, item in operands.items():
+            old_allocs, old_ns = _run(uncached(start=start, end=end), item, count)
+            new_allocs, new_ns = _run(cached(start=start, end=end), item, count)
+            print(f"{cached.__name__:<18}{name:<18}{old_allocs:>14.2f}{new_allocs:>14.5f}{old_ns:>11.0f}{new_ns:>11.0f}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
@@ -0,0 +1,60 @@
+""" Compares decomposing the durations of a few hundred thousand WallClockPeriods, AbsolutePeriods and DatePeriods with
+the batch functions of the arrays module against accessing the `duration` of every period. Requires NumPy.
+
+Usage:
+    python -m benchmarks.bench_durations [size]
+"""
+import random
+import sys
+from datetime import datetime, timedelta
+from zoneinfo import ZoneInfo
+import numpy as np
+from temporals.pydatetime import DatePeriod, WallClockPeriod, AbsolutePeriod
+from temporals.pydatetime.arrays import AbsolutePeriodArray, date_durations, wallclock_durations
+from benchmarks._timing import timed
+
+ZONES = [ZoneInfo('UTC'), ZoneInfo('Europe/London'), ZoneInfo('America/New_York'), ZoneInfo('Asia/Tokyo')]
+
+
+def _fields(duration) -> tuple:
+    return (duration.total_seconds, duration.years, duration.months, duration.days, duration.hours, duration.minutes,
+            duration.seconds)
+
+
+def main(size: int = 200000):
+    rng = random.Random(0)
+    base = datetime(2000, 1, 1)
+    spans = []
+    for _ in range(size):
+        start = base + timedelta(seconds=rng.randrange(0, 25 * 365 * 86400))
+        spans.append((start, start + timedelta(seconds=rng.randrange(60, 3 * 365 * 86400))))
+    wallclock = [WallClockPeriod(start=start, end=end) for start, end in spans]
+    absolute = [AbsolutePeriod(start=start.replace(tzinfo=ZoneInfo('UTC')).astimezone(zone),
+                               end=end.replace(tzinfo=ZoneInfo('UTC')).astimezone(zone))
+                for (start, end), zone in zip(spans, (rng.choice(ZONES) for _ in spans))]
+    dates = [DatePeriod(start=start.date(), end=end.date() + timedelta(days=1)) for start, end in spans]
+
+    print(f"{size} periods, milliseconds")
+    looped_time, looped = timed(lambda: [_fields(period.duration) for period in wallclock])
+    starts = np.array([start for start, _ in spans], dtype='datetime64[us]')
+    ends = np.array([end for _, end in spans], dtype='datetime64[us]')
+    batch_time, found = timed(lambda: wallclock_durations(starts, ends))
+    assert looped == found.tolist()
+    print(f"{'wallclock':<12}periods {looped_time * 1e3:>9.1f}   batch {batch_time * 1e3:>7.1f}")
+
+    array = AbsolutePeriodArray(absolute)
+    looped_time, looped = timed(lambda: [_fields(period.duration) for period in absolute])
+    batch_time, found = timed(array.durations)
+    assert looped == found.tolist()
+    print(f"{'absolute':<12}periods {looped_time * 1e3:>9.1f}   batch {batch_time * 1e3:>7.1f}")
+
+    looped_time, looped = timed(lambda: [_fields(period.duration) for period in dates])
+    starts = np.array([period.start for period in dates], dtype='datetime64[D]')
+    ends = np.array([period.end for period in dates], dtype='datetime64[D]')
+    batch_time, found = timed(lambda: date_durations(starts, ends))
+    assert looped == found.tolist()
+    print(f"{'date':<12}periods {looped_time * 1e3:>9.1f}   batch {batch_time * 1e3:>7.1f}")
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200000)
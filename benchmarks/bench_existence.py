@@ -0,0 +1,53 @@
+""" Compares `check_existence` against the UTC round-trip it used to perform on every tz-aware datetime, for normal,
+nonexistent and ambiguous local times, as well as the construction of an AbsolutePeriod which checks both its ends.
+
+Usage:
+    python -m benchmarks.bench_existence [count]
+"""
+import sys
+import timeit
+from datetime import datetime
+from zoneinfo import ZoneInfo
+from temporals.exceptions import NonexistentTimeError
+from temporals.pydatetime import AbsolutePeriod
+from temporals.pydatetime.utils import check_existence
+
+
+def round_trip(value: datetime) -> datetime:
+    """ The previous implementation of check_existence """
+    if value.tzinfo is None:
+        return value
+    orig_tz = value.tzinfo
+    shifted = value.astimezone(ZoneInfo("UTC")).astimezone(orig_tz)
+    if value != shifted:
+        raise NonexistentTimeError(value, orig_tz)
+    return value
+
+
+def _per_call(func, value, count: int) -> float:
+    def run():
+        try:
+            func(value)
+        except NonexistentTimeError:
+            pass
+    return min(timeit.repeat(run, number=count, repeat=5)) / count * 1e9
+
+
+def main(count: int = 100000):
+    zone = ZoneInfo('Europe/Sofia')
+    values = {
+        'normal': datetime(2025, 6, 1, 12, 0, tzinfo=zone),
+        'nonexistent': datetime(2025, 3, 30, 3, 30, tzinfo=zone),
+        'ambiguous': datetime(2025, 10, 26, 3, 30, tzinfo=zone),
+    }
+    print(f"{'value':<16}{'round trip (ns)':>18}{'check_existence (ns)':>24}")
+    for name, value in values.items():
+        print(f"{name:<16}{_per_call(round_trip, value, count):>18.0f}{_per_call(check_existence, value, count):>24.0f}")
+    start = datetime(2025, 6, 1, 8, 0, tzinfo=zone)
+    end = datetime(2025, 6, 1, 17, 0, tzinfo=zone)
+    construction = min(timeit.repeat(lambda: AbsolutePeriod(start=start, end=end), number=count, repeat=5))
+    print(f"{'AbsolutePeriod':<16}{'':>18}{construction / count * 1e9:>24.0f}")
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100000)
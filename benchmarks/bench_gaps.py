@@ -0,0 +1,32 @@
+""" Compares extracting the idle gaps between sorted WallClockPeriod jobs with `gaps` against calling `get_interim` for
+every pair of consecutive jobs.
+
+Usage:
+    python -m benchmarks.bench_gaps [size]
+"""
+import random
+import sys
+from datetime import datetime, timedelta
+from temporals.pydatetime import WallClockPeriod, gaps
+from benchmarks._timing import timed
+
+
+def main(size: int = 100000):
+    rng = random.Random(0)
+    current = datetime(2024, 1, 1)
+    jobs = []
+    for _ in range(size):
+        current += timedelta(milliseconds=rng.randint(0, 800))
+        end = current + timedelta(milliseconds=rng.randint(1, 800))
+        jobs.append(WallClockPeriod(start=current, end=end))
+        current = end
+
+    pairwise, expected = timed(lambda: [interim for first, second in zip(jobs, jobs[1:])
+                                        if (interim := first.get_interim(second)) is not None])
+    swept, found = timed(lambda: list(gaps(jobs)))
+    assert found == expected
+    print(f"{len(found)} gaps between {size} jobs: get_interim {pairwise * 1e3:.0f} ms, gaps {swept * 1e3:.0f} ms")
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100000)
@@ -0,0 +1,49 @@
+""" Compares the point-stabbing and window-overlap queries of an AbsolutePeriodIndex against scanning every period with
+`__contains__` and `relation`.
+
+Usage:
+    python -m benchmarks.bench_interval_tree [size]
+"""
+import random
+import sys
+from datetime import datetime, timedelta, timezone
+from temporals.pydatetime import AbsolutePeriod, AbsolutePeriodIndex
+from temporals.relations import Relation
+from benchmarks._timing import timed, per_call
+
+QUERIES = 20
+
+
+def _periods(rng: random.Random, size: int) -> list:
+    base = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    periods = []
+    for _ in range(size):
+        start = base + timedelta(minutes=rng.randint(0, 525600))
+        periods.append(AbsolutePeriod(start=start, end=start + timedelta(minutes=rng.randint(1, 600))))
+    return periods
+
+
+def main(size: int = 200000):
+    rng = random.Random(0)
+    periods = _periods(rng, size)
+    build_time, index = timed(lambda: AbsolutePeriodIndex(periods))
+    print(f"built an index of {size} periods in {build_time:.2f} s")
+
+    points = [period.start + timedelta(minutes=5) for period in rng.sample(periods, QUERIES)]
+    windows = _periods(rng, QUERIES)
+    outside = {Relation.BEFORE, Relation.AFTER}
+
+    scan, scanned = per_call(lambda point: [period for period in periods if point in period], points)
+    tree, found = per_call(index.stab, points)
+    assert [sorted(result) for result in scanned] == [sorted(result) for result in found]
+    print(f"{'stab':<12}scan {scan * 1e3:>10.3f} ms   index {tree * 1e3:>8.3f} ms")
+
+    scan, scanned = per_call(lambda window: [period for period in periods if window.relation(period) not in outside],
+                             windows)
+    tree, found = per_call(index.overlapping, windows)
+    assert [sorted(result) for result in scanned] == [sorted(result) for result in found]
+    print(f"{'overlapping':<12}scan {scan * 1e3:>10.3f} ms   index {tree * 1e3:>8.3f} ms")
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200000)
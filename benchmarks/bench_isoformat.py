@@ -0,0 +1,58 @@
+""" Compares exporting periods and their durations as ISO-8601 strings from the period arrays against calling
+`str(period)` and `Duration.isoformat` for every period of a list: for time, date and absolute periods, and for the
+durations of the absolute periods, folded and not. Requires NumPy.
+
+Usage:
+    python -m benchmarks.bench_isoformat [size]
+"""
+import random
+import sys
+from datetime import datetime, time, timedelta
+from zoneinfo import ZoneInfo
+from temporals.pydatetime import TimePeriod, DatePeriod, AbsolutePeriod
+from temporals.pydatetime.arrays import TimePeriodArray, DatePeriodArray, AbsolutePeriodArray, isoformat_durations
+from benchmarks._timing import timed
+
+
+def _compare(label: str, periods: list, array) -> None:
+    listed_time, listed = timed(lambda: [str(period) for period in periods])
+    array_time, found = timed(array.isoformat)
+    assert listed == found.tolist()
+    print(f"{label:<24}periods {listed_time * 1e3:>9.1f}   array {array_time * 1e3:>7.2f}")
+
+
+def main(size: int = 200000):
+    rng = random.Random(0)
+    zones = [ZoneInfo('UTC'), ZoneInfo('Europe/London'), ZoneInfo('America/New_York'), ZoneInfo('Asia/Kolkata')]
+    time_periods = []
+    date_periods = []
+    absolute_periods = []
+    for _ in range(size):
+        start = rng.randrange(0, 20 * 3600)
+        end = start + rng.randrange(60, 4 * 3600)
+        time_periods.append(TimePeriod(start=time(start // 3600, start // 60 % 60, start % 60),
+                                       end=time(end // 3600, end // 60 % 60, end % 60)))
+        moment = datetime(2015, 1, 1) + timedelta(seconds=rng.randrange(0, 10 * 365 * 86400))
+        date_periods.append(DatePeriod(start=moment.date(), end=moment.date() + timedelta(days=rng.randint(1, 400))))
+        zone = rng.choice(zones)
+        # Computed in UTC so that no period starts or ends at a time that does not exist in its timezone
+        start = moment.replace(tzinfo=ZoneInfo('UTC'))
+        end = start + timedelta(seconds=rng.randrange(60, 30 * 86400), microseconds=rng.choice([0, 0, 0, 125000]))
+        absolute_periods.append(AbsolutePeriod(start=start.astimezone(zone), end=end.astimezone(zone)))
+
+    print(f"{size} periods, milliseconds")
+    _compare('time periods', time_periods, TimePeriodArray(time_periods))
+    _compare('date periods', date_periods, DatePeriodArray(date_periods))
+    absolute_array = AbsolutePeriodArray(absolute_periods)
+    _compare('absolute periods', absolute_periods, absolute_array)
+    durations = [period.duration for period in absolute_periods]
+    fields = absolute_array.durations()
+    for fold in (True, False):
+        listed_time, listed = timed(lambda: [duration.isoformat(fold=fold) for duration in durations])
+        array_time, found = timed(lambda: isoformat_durations(fields, fold=fold))
+        assert listed == found.tolist()
+        print(f"{f'durations, fold={fold}':<24}periods {listed_time * 1e3:>9.1f}   array {array_time * 1e3:>7.2f}")
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200000)
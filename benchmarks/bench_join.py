@@ -0,0 +1,48 @@
+""" Compares matching WallClockPeriod shifts to bookings with `overlap_join` against a nested loop testing every pair
+with `relation`.
+
+Usage:
+    python -m benchmarks.bench_join [size]
+"""
+import random
+import sys
+from datetime import datetime, timedelta
+from temporals.pydatetime import WallClockPeriod, overlap_join
+from temporals.relations import Relation
+from benchmarks._timing import timed
+
+_APART = {Relation.BEFORE, Relation.MEETS, Relation.MET_BY, Relation.AFTER}
+
+
+def _periods(rng: random.Random, size: int, longest: int) -> list:
+    base = datetime(2024, 1, 1)
+    periods = []
+    for _ in range(size):
+        start = base + timedelta(minutes=15 * rng.randint(0, size))
+        periods.append(WallClockPeriod(start=start, end=start + timedelta(minutes=15 * rng.randint(1, longest))))
+    return periods
+
+
+def _nested(shifts: list, bookings: list) -> list:
+    pairs = []
+    for shift in shifts:
+        for booking in bookings:
+            if shift.relation(booking) not in _APART:
+                pairs.append((shift, booking))
+    return pairs
+
+
+def main(size: int = 2000):
+    rng = random.Random(0)
+    print(f"{'periods':>8}{'pairs':>8}{'nested loop (ms)':>20}{'join (ms)':>12}")
+    for count in (100, 500, size):
+        shifts = _periods(rng, count, 32)
+        bookings = _periods(rng, count, 8)
+        nested, expected = timed(lambda: _nested(shifts, bookings))
+        joined, found = timed(lambda: list(overlap_join(shifts, bookings)))
+        assert sorted(found) == sorted(expected)
+        print(f"{count:>8}{len(found):>8}{nested * 1e3:>20.1f}{joined * 1e3:>12.1f}")
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 2000)
@@ -0,0 +1,80 @@
+""" Measures the per-instance memory footprint of the period classes and Duration.
+
+Each class is compared against a reference object using the attribute layout the library had before the classes were
+slotted - a regular instance __dict__ holding the start, end and the decomposed duration fields. The start and end
+values are shared between all instances so only the footprint of the period objects themselves is measured.
+
+Usage:
+    python -m benchmarks.bench_memory [count]
+"""
+import sys
+import tracemalloc
+from datetime import time, date, datetime
+from zoneinfo import ZoneInfo
+from temporals.duration import Duration
+from temporals.pydatetime import TimePeriod, DatePeriod, WallClockPeriod, AbsolutePeriod
+
+
+class DictLayout:
+    """ Mimics the previous, __dict__ based, layout of the period classes """
+
+    def __init__(self, **fields):
+        for name, value in fields.items():
+            setattr(self, name, value)
+
+
+def _measure(factory, count: int) -> float:
+    """ Returns the average amount of bytes allocated per object created by `factory` """
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    objects = [factory() for _ in range(count)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    # Exclude the list holding the objects
+    return (after - before - sys.getsizeof(objects)) / count
+
+
+def _legacy_duration(duration) -> dict:
+    # Recreate the total amount of seconds so that each object owns its value, just like a computed one would
+    return {
+        '_total': int(str(duration.total_seconds)),
+        '_years': duration.years,
+        '_months': duration.months,
+        '_days': duration.days,
+        '_hours': duration.hours,
+        '_minutes': duration.minutes,
+        '_seconds': duration.seconds,
+    }
+
+
+def _legacy_factory(period):
+    """ TimePeriod and DatePeriod used to keep a Duration object in their __dict__ while WallClockPeriod and
+    AbsolutePeriod kept the decomposed duration values as attributes of their own """
+    if isinstance(period, (TimePeriod, DatePeriod)):
+        return lambda: DictLayout(_start=period.start, _end=period.end,
+                                  _duration=DictLayout(**_legacy_duration(period.duration)))
+    return lambda: DictLayout(_start=period.start, _end=period.end, **_legacy_duration(period.duration))
+
+
+def main(count: int = 100_000):
+    tz = ZoneInfo("Europe/Paris")
+    samples = {
+        TimePeriod: (time(8, 0), time(17, 30, 15)),
+        DatePeriod: (date(2024, 1, 1), date(2025, 3, 17)),
+        WallClockPeriod: (datetime(2024, 1, 1, 8, 0), datetime(2024, 3, 1, 17, 30, 15)),
+        AbsolutePeriod: (datetime(2024, 1, 1, 8, 0, tzinfo=tz), datetime(2024, 3, 1, 17, 30, 15, tzinfo=tz)),
+    }
+    print(f"{'class':<18}{'slotted (B)':>14}{'__dict__ (B)':>14}{'saved (B)':>12}")
+    for cls, (start, end) in samples.items():
+        slotted = _measure(lambda: cls(start=start, end=end), count)
+        legacy = _measure(_legacy_factory(cls(start=start, end=end)), count)
+        print(f"{cls.__name__:<18}{slotted:>14.1f}{legacy:>14.1f}{legacy - slotted:>12.1f}")
+    duration = Duration(total_seconds=93600, years=0, months=0, days=1, hours=2, minutes=0, seconds=0)
+    slotted = _measure(lambda: Duration(total_seconds=int(str(duration.total_seconds)), years=0, months=0, days=1,
+                                        hours=2, minutes=0, seconds=0), count)
+    legacy = _measure(lambda: DictLayout(**_legacy_duration(duration)), count)
+    print(f"{'Duration':<18}{slotted:>14.1f}{legacy:>14.1f}{legacy - slotted:>12.1f}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
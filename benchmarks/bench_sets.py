@@ -0,0 +1,67 @@
+""" Compares the intersection of two WallClockPeriodSets against intersecting every pair of periods of two lists with
+`get_overlap`, for schedules of a growing number of periods.
+
+Usage:
+    python -m benchmarks.bench_sets [size]
+"""
+import random
+import sys
+import timeit
+from datetime import datetime, timedelta
+from temporals.pydatetime import WallClockPeriod, WallClockPeriodSet
+from temporals.relations import Relation
+
+# get_overlap only covers partially overlapping periods, the others are within one another
+_WITHIN = {Relation.STARTS, Relation.DURING, Relation.FINISHES, Relation.EQUALS}
+_CONTAINING = {Relation.STARTED_BY, Relation.CONTAINS, Relation.FINISHED_BY}
+
+
+def _schedule(rng: random.Random, size: int) -> list:
+    """ Disjoint periods of up to four hours, with gaps of up to four hours between them """
+    periods = []
+    current = datetime(2024, 1, 1)
+    for _ in range(size):
+        current += timedelta(minutes=rng.randint(1, 240))
+        end = current + timedelta(minutes=rng.randint(1, 240))
+        periods.append(WallClockPeriod(start=current, end=end))
+        current = end
+    return periods
+
+
+def _pairwise(first: list, second: list) -> list:
+    overlaps = []
+    for period in first:
+        for other in second:
+            relation = period.relation(other)
+            if relation in _WITHIN:
+                overlaps.append(period)
+            elif relation in _CONTAINING:
+                overlaps.append(other)
+            else:
+                overlap = period.get_overlap(other)
+                if overlap is not None:
+                    overlaps.append(overlap)
+    return overlaps
+
+
+def _best(function, number: int) -> float:
+    return min(timeit.repeat(function, number=number, repeat=3)) / number * 1e3
+
+
+def main(size: int = 1000):
+    rng = random.Random(0)
+    print(f"{'periods':>8}{'pairwise (ms)':>16}{'set (ms)':>12}")
+    for count in (10, 100, size):
+        first = _schedule(rng, count)
+        second = _schedule(rng, count)
+        first_set = WallClockPeriodSet(first)
+        second_set = WallClockPeriodSet(second)
+        assert sorted(_pairwise(first, second)) == list(first_set & second_set)
+        number = 1 if count >= 1000 else 10
+        pairwise = _best(lambda: _pairwise(first, second), number)
+        intersection = _best(lambda: first_set & second_set, number)
+        print(f"{count:>8}{pairwise:>16.3f}{intersection:>12.3f}")
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1000)
@@ -0,0 +1,61 @@
+""" Compares the shifts of a workforce held as a TimePeriodArray of seconds since midnight against a list of
+TimePeriods: creating the shifts, finding who is working at a given time, checking the shifts against a rest period
+that may not be worked, and decomposing their durations. Requires NumPy.
+
+Usage:
+    python -m benchmarks.bench_time_array [size]
+"""
+import random
+import sys
+from datetime import time
+import numpy as np
+from temporals.pydatetime import TimePeriod
+from temporals.pydatetime.arrays import TimePeriodArray
+from benchmarks._timing import timed
+
+
+def _fields(duration) -> tuple:
+    return (duration.total_seconds, duration.years, duration.months, duration.days, duration.hours, duration.minutes,
+            duration.seconds)
+
+
+def _time(seconds: int) -> time:
+    return time(seconds // 3600, seconds // 60 % 60, seconds % 60)
+
+
+def main(size: int = 200000):
+    rng = random.Random(0)
+    starts = [rng.randrange(0, 16 * 3600, 300) for _ in range(size)]
+    ends = [min(start + rng.choice([4, 6, 8, 8, 10]) * 3600, 86399) for start in starts]
+    start_times = [_time(start) for start in starts]
+    end_times = [_time(end) for end in ends]
+    start_column = np.array(starts, dtype=np.int32)
+    end_column = np.array(ends, dtype=np.int32)
+    moment = _time(14 * 3600 + 30 * 60)
+    rest = TimePeriod(start=_time(20 * 3600), end=_time(23 * 3600))
+
+    print(f"{size} shifts, milliseconds")
+    listed_time, periods = timed(lambda: [TimePeriod(start=start, end=end)
+                                           for start, end in zip(start_times, end_times)])
+    array_time, array = timed(lambda: TimePeriodArray.from_seconds(start_column, end_column))
+    print(f"{'create':<16}periods {listed_time * 1e3:>9.1f}   array {array_time * 1e3:>7.2f}")
+    listed_time, listed = timed(lambda: [moment in period for period in periods])
+    array_time, found = timed(lambda: array.contains(moment))
+    assert listed == found.tolist()
+    print(f"{'contains':<16}periods {listed_time * 1e3:>9.1f}   array {array_time * 1e3:>7.2f}")
+    listed_time, listed = timed(lambda: [period.overlapped_by(rest) for period in periods])
+    array_time, found = timed(lambda: array.overlapped_by(rest))
+    assert listed == found.tolist()
+    print(f"{'overlapped_by':<16}periods {listed_time * 1e3:>9.1f}   array {array_time * 1e3:>7.2f}")
+    listed_time, listed = timed(lambda: [period.get_disconnect(rest) for period in periods])
+    array_time, (disconnects, found) = timed(lambda: array.get_disconnect(rest))
+    assert [disconnect for disconnect in listed if disconnect is not None] == list(disconnects)
+    print(f"{'get_disconnect':<16}periods {listed_time * 1e3:>9.1f}   array {array_time * 1e3:>7.2f}")
+    listed_time, listed = timed(lambda: [_fields(period.duration) for period in periods])
+    array_time, found = timed(array.durations)
+    assert listed == found.tolist()
+    print(f"{'durations':<16}periods {listed_time * 1e3:>9.1f}   array {array_time * 1e3:>7.2f}")
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200000)
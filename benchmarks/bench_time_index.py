@@ -0,0 +1,41 @@
+""" Compares finding the TimePeriods which contain a time of the day, and testing if any of them does, with a
+TimePeriodIndex against scanning the list of periods with membership tests.
+
+Usage:
+    python -m benchmarks.bench_time_index [size]
+"""
+import random
+import sys
+from datetime import time as day_time
+from temporals.pydatetime import TimePeriod, TimePeriodIndex
+from benchmarks._timing import timed, per_call
+
+QUERIES = 200
+
+
+def _time(second: int) -> day_time:
+    return day_time(second // 3600, second // 60 % 60, second % 60)
+
+
+def main(size: int = 10000):
+    rng = random.Random(0)
+    periods = []
+    for _ in range(size):
+        start = rng.randint(0, 86398)
+        periods.append(TimePeriod(start=_time(start), end=_time(min(start + rng.randint(60, 1800), 86399))))
+    built, index = timed(lambda: TimePeriodIndex(periods))
+    points = [_time(rng.randint(0, 86399)) for _ in range(QUERIES)]
+
+    print(f"{size} periods, index built in {built * 1e3:.1f} ms, microseconds per query")
+    scanned_time, scanned = per_call(lambda point: [period for period in periods if point in period], points)
+    stab_time, stabbed = per_call(index.stab, points)
+    assert [sorted(found) for found in scanned] == [sorted(found) for found in stabbed]
+    print(f"{'containing':<14}scan {scanned_time * 1e6:>12.1f}   index {stab_time * 1e6:>8.1f}")
+    scanned_time, scanned = per_call(lambda point: any(point in period for period in periods), points)
+    covers_time, covered = per_call(index.covers, points)
+    assert scanned == covered
+    print(f"{'covered':<14}scan {scanned_time * 1e6:>12.1f}   index {covers_time * 1e6:>8.1f}")
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10000)
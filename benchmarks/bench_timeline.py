@@ -0,0 +1,57 @@
+""" Compares finding the next window after a point in time, and the last window that ended before it, with a
+WallClockTimeline against scanning a sorted list of WallClockPeriods with `is_after` and `is_before`.
+
+Usage:
+    python -m benchmarks.bench_timeline [size]
+"""
+import random
+import sys
+from datetime import datetime, timedelta
+from temporals.pydatetime import WallClockPeriod, WallClockTimeline
+from benchmarks._timing import per_call
+
+QUERIES = 200
+
+
+def _next_window(windows: list, now: datetime):
+    for window in windows:
+        if window.is_after(now):
+            return window
+    return None
+
+
+def _last_ended(windows: list, now: datetime):
+    found = None
+    for window in windows:
+        if window.is_before(now) and (found is None or found.end <= window.end):
+            found = window
+    return found
+
+
+def _end(window):
+    return None if window is None else window.end
+
+
+def main(size: int = 100000):
+    rng = random.Random(0)
+    base = datetime(2024, 1, 1)
+    windows = []
+    for _ in range(size):
+        start = base + timedelta(minutes=rng.randint(0, size * 10))
+        windows.append(WallClockPeriod(start=start, end=start + timedelta(minutes=rng.randint(5, 120))))
+    windows.sort()
+    timeline = WallClockTimeline(windows)
+    points = [base + timedelta(minutes=rng.randint(0, size * 10)) for _ in range(QUERIES)]
+
+    print(f"{size} windows, microseconds per query")
+    for name, scan, lookup in (('next window', _next_window, timeline.next_start),
+                               ('last ended', _last_ended, timeline.previous_end)):
+        scanned_time, scanned = per_call(lambda point: scan(windows, point), points)
+        lookup_time, found = per_call(lookup, points)
+        # Windows ending at the same time are equally the last one to end
+        assert [_end(window) for window in scanned] == [_end(window) for window in found]
+        print(f"{name:<14}scan {scanned_time * 1e6:>12.1f}   timeline {lookup_time * 1e6:>8.1f}")
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100000)
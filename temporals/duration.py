@@ -8,6 +8,8 @@ class Duration(AbstractDuration):
     implemented by all Periods that come as part of this library.
     """
 
+    __slots__ = ('_total', '_years', '_months', '_days', '_hours', '_minutes', '_seconds')
+
     def __init__(self, total_seconds: int, years: int, months: int, days: int, hours: int, minutes: int, seconds: int):
         self._total: int = verify_type('total_seconds', int, total_seconds)
         self._years: int = verify_type('years', int, years)
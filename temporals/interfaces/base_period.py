@@ -6,6 +6,8 @@ class AbstractPeriod(ABC):
     """ Implementations of this class must provide logic for the 'equal' comparison, via __eq__ method, as well as the
     membership test operators (is, is not) via __contains__ """
 
+    __slots__ = ()
+
     @property
     @abstractmethod
     def start(self):
@@ -100,6 +102,20 @@ class AbstractPeriod(ABC):
         The returned TimePeriod will be from 1700 to 2000
         """
 
+    def relation(self, other):
+        """ Method returns the relation of this period to the other one, as one of the thirteen relations of Allen's
+        interval algebra (see temporals.relations.Relation):
+                       1000       This period:          1700
+                        |==================================|
+             0800 |=============| 1300
+                         ^ The other period
+        >> this_period.relation(other_period) -> Relation.OVERLAPPED_BY
+        The overlap and disconnect tests below may all be answered by this relation. The method is not abstract, so that
+        implementations written before it was added remain instantiable; those which do not override it raise a
+        NotImplementedError.
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not implement relation()")
+
     @abstractmethod
     def overlaps_with(self, other) -> bool:
         """ Test if this period overlaps with another period that has begun before this one:
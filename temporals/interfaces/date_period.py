@@ -11,6 +11,8 @@ class AbstractDatePeriod(AbstractPeriod):
             an AbsolutePeriod
     """
 
+    __slots__ = ()
+
     @abstractmethod
     def to_wallclock(self, other):
         ...
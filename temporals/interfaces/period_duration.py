@@ -4,6 +4,8 @@ from abc import ABC, abstractmethod
 class AbstractDuration(ABC):
     """ A representation of the duration of each period """
 
+    __slots__ = ()
+
     @property
     @abstractmethod
     def total_seconds(self) -> int:
@@ -9,6 +9,8 @@ class AbstractTimePeriod(AbstractPeriod):
     be combined with a DatePeriod to create either a WallClockPeriod or an AbsolutePeriod.
     """
 
+    __slots__ = ()
+
     @abstractmethod
     def to_wallclock(self, other) -> AbstractWallClockPeriod:
         """ Implementing classes must provide the ability to create an instance of the AbstractWallClockPeriod interface """
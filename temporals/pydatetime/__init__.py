@@ -1,6 +1,12 @@
 """ This package provides the interfaces and implementations for the Python's datetime library """
 from .interface import PyTimePeriod, PyDatePeriod, PyAbsolutePeriod, PyWallClockPeriod
 from .periods import TimePeriod, DatePeriod, WallClockPeriod, AbsolutePeriod
+from .sets import TimePeriodSet, DatePeriodSet, WallClockPeriodSet, AbsolutePeriodSet
+from .indexes import (WallClockPeriodIndex, AbsolutePeriodIndex, DatePeriodIndex, TimePeriodIndex, WallClockTimeline,
+                      AbsoluteTimeline)
+from .calendars import DateCalendar
+from .sweep import (coalesce, coalesce_sorted, gaps, depth_profile, depth_profile_sorted, max_depth, overlap_join,
+                    containment_join, overlap_amounts)
 
 __all__ = [
     "PyTimePeriod",
@@ -10,5 +16,25 @@ __all__ = [
     "TimePeriod",
     "DatePeriod",
     "WallClockPeriod",
-    "AbsolutePeriod"
+    "AbsolutePeriod",
+    "TimePeriodSet",
+    "DatePeriodSet",
+    "WallClockPeriodSet",
+    "AbsolutePeriodSet",
+    "WallClockPeriodIndex",
+    "AbsolutePeriodIndex",
+    "DatePeriodIndex",
+    "TimePeriodIndex",
+    "WallClockTimeline",
+    "AbsoluteTimeline",
+    "DateCalendar",
+    "coalesce",
+    "coalesce_sorted",
+    "gaps",
+    "depth_profile",
+    "depth_profile_sorted",
+    "max_depth",
+    "overlap_join",
+    "containment_join",
+    "overlap_amounts"
 ]
\ No newline at end of file
@@ -0,0 +1,1193 @@
+""" Columnar arrays of periods backed by NumPy, whose predicates are evaluated over all of their periods at once.
+
+NumPy is an optional dependency of this library, installed with the `arrays` extra (`pip install temporals[arrays]`);
+this module is therefore not imported by the `temporals.pydatetime` package and must be imported directly:
+>>> from temporals.pydatetime.arrays import TimePeriodArray, DatePeriodArray, AbsolutePeriodArray
+"""
+import operator
+from datetime import date, datetime, time, timedelta, timezone
+from typing import Iterable, Iterator
+
+import numpy as np
+
+from temporals.relations import Relation
+from .periods import TimePeriod, DatePeriod, AbsolutePeriod
+from .utils import operand_kind, to_epoch_us, Operand
+
+_EPOCH = datetime(1970, 1, 1)
+_EPOCH_UTC = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+_DAY_US = 86400 * 1000000
+_SECOND_US = 1000000
+
+# Relations are computed as indexes into this array, so that they can be turned into the Relation members at once
+_RELATIONS = np.array(list(Relation), dtype=object)
+_CODES = {relation: code for code, relation in enumerate(Relation)}
+_IS = np.frompyfunc(operator.is_, 2, 1)
+# Stands for the offset of naive datetimes, which have none, when formatting them
+_NAIVE = np.iinfo(np.int64).min
+
+
+def _classify(start, end, other_start, other_end) -> np.ndarray:
+    """ The vectorized counterpart of `periods._classify`, returning the index of the relation of every span within
+    `_RELATIONS`; the conditions are checked in the same order, so that spans which are single points are classified
+    the same way as well
+    """
+    same_start = start == other_start
+    same_end = end == other_end
+    starts_first = start < other_start
+    conditions = [
+        same_start & same_end,
+        same_start & (end < other_end),
+        same_start,
+        same_end & (other_start < start),
+        same_end,
+        starts_first & (end < other_start),
+        starts_first & (end == other_start),
+        starts_first & (end < other_end),
+        starts_first,
+        other_end < start,
+        other_end == start,
+        other_end < end,
+    ]
+    choices = [_CODES[relation] for relation in (
+        Relation.EQUALS, Relation.STARTS, Relation.STARTED_BY, Relation.FINISHES, Relation.FINISHED_BY,
+        Relation.BEFORE, Relation.MEETS, Relation.OVERLAPS, Relation.CONTAINS, Relation.AFTER, Relation.MET_BY,
+        Relation.OVERLAPPED_BY,
+    )]
+    return np.select(conditions, choices, default=_CODES[Relation.DURING]).astype(np.int8)
+
+
+def _overlapped(start, end, other_start, other_end) -> np.ndarray:
+    """ Test if every span is overlapped or met by the other one, which has begun before it; the same as the relation
+    being Relation.OVERLAPPED_BY or Relation.MET_BY, without classifying the spans into every other relation
+    """
+    met = (other_end == start) | ((start < other_end) & (other_end < end))
+    return (other_start < start) & (other_end != end) & met
+
+
+def _offset_us(offset: timedelta | None) -> int:
+    return 0 if offset is None else offset // timedelta(microseconds=1)
+
+
+def _dst_seconds(dst: timedelta | None) -> int:
+    return 0 if dst is None else int(dst.total_seconds())
+
+
+def _from_epoch_us(value: int, zone) -> datetime:
+    """ Returns the datetime of the instant in the provided timezone; instants without a zone become naive datetimes,
+    which this library takes to be in UTC
+    """
+    if zone is None:
+        return _EPOCH + timedelta(microseconds=value)
+    return (_EPOCH_UTC + timedelta(microseconds=value)).astimezone(zone)
+
+
+# The fields of a Duration, in the order of its constructor, as returned for many periods at once
+DURATION_DTYPE = np.dtype([(field, np.int64) for field in
+                           ('total_seconds', 'years', 'months', 'days', 'hours', 'minutes', 'seconds')])
+
+
+def _date_fields(days: np.ndarray) -> tuple:
+    """ Returns the year, month and day of the dates, provided as days since the epoch; the dates are resolved with
+    integer arithmetic over the 400 year cycles of the Gregorian calendar, counted from the 1st of March so that the
+    leap day is the last day of the year, which is several times faster than converting to datetime64 years and months
+    """
+    days = days + 719468
+    era = days // 146097
+    day_of_era = days - era * 146097
+    year_of_era = (day_of_era - day_of_era // 1460 + day_of_era // 36524 - day_of_era // 146096) // 365
+    day_of_year = day_of_era - (365 * year_of_era + year_of_era // 4 - year_of_era // 100)
+    month = (5 * day_of_year + 2) // 153
+    day = day_of_year - (153 * month + 2) // 5 + 1
+    month = np.where(month < 10, month + 3, month - 9)
+    return year_of_era + era * 400 + (month <= 2), month, day
+
+
+def _clock_fields(values: np.ndarray) -> tuple:
+    """ Returns the days since the epoch, year, month, day, hour, minute and second of the wall clock values, provided
+    as microseconds since the epoch
+    """
+    days = values // _DAY_US
+    seconds = (values - days * _DAY_US) // _SECOND_US
+    return (days,) + _date_fields(days) + (seconds // 3600, seconds // 60 % 60, seconds % 60)
+
+
+def _leapdays(start_year: np.ndarray, end_year: np.ndarray) -> np.ndarray:
+    """ The vectorized counterpart of `calendar.leapdays` """
+    start_year = start_year - 1
+    end_year = end_year - 1
+    return ((end_year // 4 - start_year // 4) - (end_year // 100 - start_year // 100)
+            + (end_year // 400 - start_year // 400))
+
+
+def _whole_months(start_days: np.ndarray, start_year: np.ndarray, start_month: np.ndarray, start_day: np.ndarray,
+                  days: np.ndarray) -> tuple:
+    """ The vectorized counterpart of `utils.whole_months`, for start dates provided as days since the epoch along with
+    their year, month and day
+    """
+    fits = days >= 28
+    # Only the dates of the periods where a month fits are used, the others are kept at the start of the month
+    reached = start_days - start_day + 1 + np.where(fits, days, 0)
+    reached_year, reached_month, reached_day = _date_fields(reached)
+    months = (reached_year - start_year) * 12 + reached_month - start_month
+    return np.where(fits, months, 0), np.where(fits, reached_day - 1, days)
+
+
+def _offset_fields(seconds: np.ndarray) -> tuple:
+    """ The vectorized counterpart of `Duration.from_seconds`, returning the hours, minutes and seconds it sets """
+    minutes = seconds // 60
+    seconds = np.where(minutes >= 1, seconds - minutes * 60, seconds)
+    hours = np.where(minutes // 60 >= 1, minutes // 60, 0)
+    minutes = np.where(minutes // 60 >= 1, minutes - hours * 60, minutes)
+    days = np.where(hours // 24 >= 1, hours // 24, 0)
+    return hours - days * 24, minutes, seconds
+
+
+def _durations(size: int, **fields) -> np.ndarray:
+    durations = np.empty(size, dtype=DURATION_DTYPE)
+    for field, values in fields.items():
+        durations[field] = values
+    return durations
+
+
+def _clock_durations(start: np.ndarray, end: np.ndarray, elapsed_days: np.ndarray, start_dst: np.ndarray,
+                     end_dst: np.ndarray) -> np.ndarray:
+    """ The vectorized counterpart of the decomposition of WallClockPeriod and AbsolutePeriod, see their
+    `_compute_duration`; the start and end are the wall clock values of the periods as microseconds since the epoch,
+    while the elapsed days and the DST offsets (in seconds) are the ones the periods see. Every branch is kept as it
+    is there, so that the results are the same down to every field.
+    """
+    start_days, start_year, start_month, start_day, start_hour, start_minute, start_second = _clock_fields(start)
+    _, end_year, end_month, _, end_hour, end_minute, end_second = _clock_fields(end)
+    seconds = end_second - start_second
+    minutes = end_minute - start_minute
+    hours = end_hour - start_hour
+    # When only one of the ends is in DST, its DST offset is added for the start or removed for the end
+    in_start = (start_dst != 0) & (end_dst == 0)
+    in_end = (start_dst == 0) & (end_dst != 0)
+    if in_start.any():
+        start_hours, start_minutes, start_seconds = _offset_fields(start_dst)
+        hours = hours + np.where(in_start, start_hours, 0)
+        minutes = minutes + np.where(in_start, start_minutes, 0)
+        seconds = seconds + np.where(in_start, start_seconds, 0)
+    if in_end.any():
+        end_hours, end_minutes, end_seconds = _offset_fields(end_dst)
+        hours = hours - np.where(in_end, end_hours, 0)
+        minutes = minutes - np.where(in_end, end_minutes, 0)
+        seconds = seconds - np.where(in_end, end_seconds, 0)
+    under = seconds < 0
+    over = seconds >= 60
+    minutes = minutes - under + over
+    seconds = np.where(under, 60 - np.abs(seconds), np.where(over, 60 - seconds, seconds))
+    total = seconds.copy()
+    under = minutes < 0
+    over = minutes >= 60
+    hours = hours - under + over
+    minutes = np.where(under, 60 - np.abs(minutes), np.where(over, 60 - minutes, minutes))
+    total += minutes * 60
+    under = hours < 0
+    over = hours >= 24
+    adjustment_days = over.astype(np.int64) - under
+    hours = np.where(under, 24 - np.abs(hours), np.where(over, 24 - hours, hours))
+    total += hours * 60
+    years = end_year - start_year - (end_month < start_month)
+    days_left = elapsed_days + adjustment_days - years * 365 - _leapdays(start_year, end_year)
+    months, days = _whole_months(start_days, start_year, start_month, start_day, days_left)
+    total += np.where(days < 0, 0, days_left * 86400)
+    return _durations(len(total), total_seconds=total, years=years, months=months, days=np.maximum(days, 0),
+                      hours=hours, minutes=minutes, seconds=seconds)
+
+
+def time_durations(start, end) -> np.ndarray:
+    """ Returns the Durations of TimePeriods from their starts and ends, either as timedelta64 values since midnight or
+    as seconds since midnight, as a structured array with the fields of a Duration (see `DURATION_DTYPE`); every one
+    of them is the same as the `duration` of the TimePeriod with the same start and end.
+    """
+    start = _seconds_of_day(start)
+    end = _seconds_of_day(end)
+    seconds = end % 60 - start % 60
+    minutes = end // 60 % 60 - start // 60 % 60
+    hours = end // 3600 - start // 3600
+    under = seconds < 0
+    minutes = minutes - under
+    seconds = np.where(under, seconds + 60, seconds)
+    under = minutes < 0
+    hours = hours - under
+    minutes = np.where(under, minutes + 60, minutes)
+    return _durations(len(start), total_seconds=end - start, years=0, months=0, days=0, hours=np.maximum(hours, 0),
+                      minutes=minutes, seconds=seconds)
+
+
+def date_durations(start, end) -> np.ndarray:
+    """ Returns the Durations of DatePeriods from their starts and ends as datetime64 dates, as a structured array with
+    the fields of a Duration (see `DURATION_DTYPE`); every one of them is the same as the `duration` of the DatePeriod
+    with the same start and end.
+    """
+    start = np.asarray(start).astype('datetime64[D]').view(np.int64)
+    end = np.asarray(end).astype('datetime64[D]').view(np.int64)
+    start_year, start_month, start_day = _date_fields(start)
+    end_year, end_month, _ = _date_fields(end)
+    total_days = end - start
+    years = end_year - start_year - (end_month < start_month)
+    days_left = total_days - years * 365 - _leapdays(start_year, end_year)
+    months, days = _whole_months(start, start_year, start_month, start_day, np.abs(days_left))
+    return _durations(len(start), total_seconds=total_days * 86400, years=years, months=months, days=days, hours=0,
+                      minutes=0, seconds=0)
+
+
+def wallclock_durations(start, end) -> np.ndarray:
+    """ Returns the Durations of WallClockPeriods from their starts and ends as datetime64 values, as a structured array
+    with the fields of a Duration (see `DURATION_DTYPE`); every one of them is the same as the `duration` of the
+    WallClockPeriod with the same start and end.
+    """
+    start = np.asarray(start).astype('datetime64[us]').view(np.int64)
+    end = np.asarray(end).astype('datetime64[us]').view(np.int64)
+    no_dst = np.zeros(len(start), dtype=np.int64)
+    return _clock_durations(start, end, (end - start) // _DAY_US, no_dst, no_dst)
+
+
+def isoformat_durations(durations, fold: bool = True) -> np.ndarray:
+    """ Returns the Durations held by a structured array with the fields of a Duration (see `DURATION_DTYPE`) in the
+    ISO-8601 format, as a NumPy string array; every one of them is the same as `Duration.isoformat(fold=fold)` of the
+    Duration with the same fields.
+    """
+    durations = np.asarray(durations)
+    result = np.full(len(durations), 'P')
+    if not len(durations):
+        return result
+    for fields, clock in (((('years', 'Y'), ('months', 'M'), ('days', 'D')), False),
+                          ((('hours', 'H'), ('minutes', 'M'), ('seconds', 'S')), True)):
+        fields = [(durations[field], designator) for field, designator in fields]
+        if fold:
+            # Fields which are zero for all durations are left out of all of them
+            fields = [(values, designator) for values, designator in fields if values.any()]
+            if not fields:
+                continue
+        result = np.char.add(result, _designated(fields, fold, clock))
+    return result
+
+
+def _designated(fields: list, fold: bool, clock: bool) -> np.ndarray:
+    """ Returns the values of the fields followed by their designators, as strings, preceded by the time designator for
+    the fields of the clock; the values which are zero are left out when `fold` is set.
+
+    The fields of durations are small numbers, so the strings of every combination of their values are created at
+    once, from the strings of the values of each field, and looked up; if there are more combinations than durations,
+    the fields are looked up one by one instead.
+    """
+    size = len(fields[0][0])
+    limit = max(size, 4096)
+    # While there are keys, the text is a table of strings which the keys look up, otherwise a string per duration
+    text = keys = None
+    for values, designator in fields:
+        low = int(values.min())
+        span = int(values.max()) - low + 1
+        if span > limit:
+            # A field with a wide range of values is formatted through its distinct values
+            distinct, inverse = np.unique(values, return_inverse=True)
+            field_text, field_keys = _field_strings(distinct.tolist(), designator, fold), inverse.reshape(size)
+        else:
+            field_text, field_keys = _field_strings(range(low, low + span), designator, fold), values - low
+        if text is None:
+            text, keys = field_text, field_keys
+        elif keys is not None and len(text) * span <= limit:
+            # The strings of every combination of the values so far with the values of this field
+            text = np.char.add(text[:, np.newaxis], field_text).reshape(-1)
+            keys = keys * span + field_keys
+        else:
+            text, keys = np.char.add(_rows(text, keys), field_text[field_keys]), None
+    if clock:
+        text = np.char.add(np.where(np.char.str_len(text) > 0, 'T', '') if fold else 'T', text)
+    return _rows(text, keys)
+
+
+def _rows(text: np.ndarray, keys: np.ndarray | None) -> np.ndarray:
+    return text if keys is None else text[keys]
+
+
+def _field_strings(values, designator: str, fold: bool) -> np.ndarray:
+    return np.array(['' if fold and value == 0 else f"{value}{designator}" for value in values], dtype=str)
+
+
+def _text_buffer(size: int, template: str) -> np.ndarray:
+    """ Returns a buffer holding the ASCII template for each of the `size` strings, one byte per character, for the
+    digits of the values to be written over it; the buffer holds a row per character, so that each character of all
+    strings is written at once, in a contiguous block
+    """
+    buffer = np.empty((len(template), size), dtype=np.uint8)
+    buffer[:] = np.frombuffer(template.encode('ascii'), dtype=np.uint8)[:, np.newaxis]
+    return buffer
+
+
+def _write_digits(buffer: np.ndarray, column: int, values: np.ndarray, width: int) -> None:
+    """ Writes the values, which may not be negative, as zero-padded decimal numbers into the characters of the buffer
+    starting at `column`
+    """
+    values = values.astype(np.uint32)
+    for position in range(column + width - 1, column - 1, -1):
+        values, digit = np.divmod(values, np.uint32(10))
+        np.add(digit, 48, out=buffer[position], casting='unsafe')
+
+
+def _write_date(buffer: np.ndarray, column: int, days: np.ndarray) -> None:
+    """ Writes the dates, provided as days since the epoch, over a YYYY-MM-DD template starting at `column` """
+    year, month, day = _date_fields(days)
+    _write_digits(buffer, column, year, 4)
+    _write_digits(buffer, column + 5, month, 2)
+    _write_digits(buffer, column + 8, day, 2)
+
+
+def _write_clock(buffer: np.ndarray, column: int, seconds: np.ndarray) -> None:
+    """ Writes the seconds since midnight over a HH:MM:SS template starting at `column` """
+    _write_digits(buffer, column, seconds // 3600, 2)
+    _write_digits(buffer, column + 3, seconds // 60 % 60, 2)
+    _write_digits(buffer, column + 6, seconds % 60, 2)
+
+
+def _strings(buffer: np.ndarray) -> np.ndarray:
+    """ Returns the strings held by the buffer as a NumPy string array, widening every character to a code point """
+    width, size = buffer.shape
+    return np.ascontiguousarray(buffer.T, dtype=np.uint32).view(f'U{width}').reshape(size)
+
+
+def _interval_strings(start: np.ndarray, start_offsets: np.ndarray, start_naive: np.ndarray, end: np.ndarray,
+                      end_offsets: np.ndarray, end_naive: np.ndarray) -> np.ndarray:
+    """ Returns the intervals between the instants, as microseconds since the UTC epoch, in the ISO-8601 format of
+    `datetime.isoformat` in their timezones, from the offsets of these timezones from UTC in microseconds.
+
+    The microseconds and the offset of a datetime are only written when it has them, so the strings are grouped by
+    their layout, that is whether their start and end have microseconds and the offsets they are written with, and
+    the strings of each group are written over the same template. There are only a few distinct offsets, hence only a
+    few layouts.
+    """
+    start = start + start_offsets
+    end = end + end_offsets
+    start_offsets, start_texts = _offset_strings(start_offsets, start_naive)
+    end_offsets, end_texts = _offset_strings(end_offsets, end_naive)
+    # The layout of every string, as the indexes of its offsets followed by two bits for its microseconds
+    layouts = (start_offsets * len(end_texts) + end_offsets) * 4
+    layouts += (start % _SECOND_US != 0) * 2 + (end % _SECOND_US != 0)
+    templates = {}
+    for layout in np.flatnonzero(np.bincount(layouts)).tolist():
+        start_text, end_text = divmod(layout // 4, len(end_texts))
+        templates[layout] = (_datetime_template(layout & 2, start_texts[start_text]),
+                             _datetime_template(layout & 1, end_texts[end_text]))
+    width = max((len(first) + len(last) + 1 for first, last in templates.values()), default=1)
+    # The characters of the strings, written over the code points of the array that is returned
+    characters = np.zeros((len(start), width), dtype=np.uint32)
+    for layout, (start_template, end_template) in templates.items():
+        rows = np.flatnonzero(layouts == layout) if len(templates) > 1 else slice(None)
+        starts = start[rows]
+        buffer = _text_buffer(len(starts), f"{start_template}/{end_template}")
+        _write_datetime(buffer, 0, starts, layout & 2)
+        _write_datetime(buffer, len(start_template) + 1, end[rows], layout & 1)
+        characters[rows, :buffer.shape[0]] = buffer.T
+    return characters.view(f'U{width}').reshape(len(start))
+
+
+def _offset_strings(offsets: np.ndarray, naive: np.ndarray) -> tuple[np.ndarray, list[str]]:
+    """ Returns the index of the offset of every datetime within a list of the distinct offsets formatted the way
+    `datetime.isoformat` writes them, along with that list; naive datetimes have no offset
+    """
+    offsets, inverse = np.unique(np.where(naive, _NAIVE, offsets), return_inverse=True)
+    texts = ['' if offset == _NAIVE else
+             datetime(2000, 1, 1, tzinfo=timezone(timedelta(microseconds=offset))).isoformat()[19:]
+             for offset in offsets.tolist()]
+    return inverse.reshape(len(naive)), texts
+
+
+def _datetime_template(microseconds: int, offset: str) -> str:
+    return f"0000-00-00T00:00:00{'.000000' if microseconds else ''}{offset}"
+
+
+def _write_datetime(buffer: np.ndarray, column: int, values: np.ndarray, microseconds: int) -> None:
+    """ Writes the datetimes, provided as microseconds since the epoch, over a template from `_datetime_template`
+    starting at `column`, including their microseconds if the template has them
+    """
+    days = values // _DAY_US
+    of_day = values - days * _DAY_US
+    _write_date(buffer, column, days)
+    _write_clock(buffer, column + 11, of_day // _SECOND_US)
+    if microseconds:
+        _write_digits(buffer, column + 20, of_day % _SECOND_US, 6)
+
+
+def _seconds_of_day(values) -> np.ndarray:
+    """ Returns the whole seconds since midnight of timedelta64 values, or of integers that already are seconds """
+    values = np.asarray(values)
+    if values.dtype.kind == 'm':
+        return values.astype('timedelta64[us]').view(np.int64) // _SECOND_US
+    return values.astype(np.int64)
+
+
+class AbsolutePeriodArray:
+    """ A fixed sequence of AbsolutePeriods stored as columns: the start and end of every period as microseconds since
+    the UTC epoch (see `AbsolutePeriod.start_epoch_us`), the timezones the start and end are set in, and their dates in
+    these timezones. Instead of calling a method on every period, the methods of this class answer the same question
+    for all periods at once and return a NumPy array holding the answer of each of them:
+    >>> shifts = AbsolutePeriodArray(periods)
+    >>> shifts.contains(datetime(2024, 1, 1, 12, 0, tzinfo=ZoneInfo('UTC')))
+    array([ True, False, ...])
+
+    The results are the same as those of the methods of AbsolutePeriod with the same name; the other value may be an
+    instance of any of the types these methods accept and which does not depend on the time of the day, or another
+    array of the same length, in which case the periods are compared pair by pair.
+    Operations with times of the day (datetime.time, TimePeriod and WallClockPeriod) would require a decision per
+    period on which day the time applies to, so they are not supported and raise a TypeError. The same as with the
+    periods, naive periods cannot be compared with aware values and aware periods with naive ones; a TypeError is
+    raised if any of the periods would have to be.
+    """
+
+    __slots__ = ('_start_us', '_end_us', '_start_zones', '_end_zones', '_start_offsets', '_end_offsets', '_start_dst',
+                 '_end_dst', '_start_days', '_end_days', '_naive', '_durations')
+
+    def __init__(self, periods: Iterable = ()):
+        start_us = []
+        end_us = []
+        start_zones = []
+        end_zones = []
+        start_offsets = []
+        end_offsets = []
+        start_dst = []
+        end_dst = []
+        # There are only a few distinct offsets, each of them is converted once
+        offsets = {}
+        dst_offsets = {}
+        for period in periods:
+            if operand_kind(period) != Operand.ABSOLUTE_PERIOD:
+                raise TypeError(f"Cannot add instances of type '{type(period)}' to {type(self).__name__}")
+            start = period.start
+            end = period.end
+            start_us.append(period.start_epoch_us)
+            end_us.append(period.end_epoch_us)
+            start_zones.append(start.tzinfo)
+            end_zones.append(end.tzinfo)
+            for value, column, converted, convert in ((start.utcoffset(), start_offsets, offsets, _offset_us),
+                                                      (end.utcoffset(), end_offsets, offsets, _offset_us),
+                                                      (start.dst(), start_dst, dst_offsets, _dst_seconds),
+                                                      (end.dst(), end_dst, dst_offsets, _dst_seconds)):
+                result = converted.get(value)
+                if result is None:
+                    result = converted[value] = convert(value)
+                column.append(result)
+        self._assign(np.array(start_us, dtype=np.int64), np.array(end_us, dtype=np.int64),
+                     np.array(start_zones, dtype=object), np.array(end_zones, dtype=object),
+                     np.array(start_offsets, dtype=np.int64), np.array(end_offsets, dtype=np.int64),
+                     np.array(start_dst, dtype=np.int64), np.array(end_dst, dtype=np.int64))
+
+    def _assign(self, start_us: np.ndarray, end_us: np.ndarray, start_zones: np.ndarray, end_zones: np.ndarray,
+                start_offsets: np.ndarray, end_offsets: np.ndarray, start_dst: np.ndarray, end_dst: np.ndarray) -> None:
+        """ The offsets from UTC are in microseconds and the DST offsets in seconds, the way `Duration` reads them;
+        the dates of the starts and ends in their timezones are derived from them as ordinals
+        """
+        self._start_us = start_us
+        self._end_us = end_us
+        self._start_zones = start_zones
+        self._end_zones = end_zones
+        self._start_offsets = start_offsets
+        self._end_offsets = end_offsets
+        self._start_dst = start_dst
+        self._end_dst = end_dst
+        self._start_days = (start_us + start_offsets) // _DAY_US + _EPOCH_ORDINAL
+        self._end_days = (end_us + end_offsets) // _DAY_US + _EPOCH_ORDINAL
+        self._naive = np.equal(start_zones, None)
+        self._durations = None
+
+    @classmethod
+    def from_epoch_us(cls, start, end, zone=None) -> 'AbsolutePeriodArray':
+        """ Creates an array from the starts and ends of the periods as microseconds since the UTC epoch, or as UTC
+        datetime64 values, without creating a single AbsolutePeriod. All periods are set in the provided timezone, which
+        must have a fixed offset from UTC (such as datetime.timezone) so that their dates can be computed for all of
+        them at once; None, the default, keeps them as naive datetimes in UTC.
+
+        Raises:
+            ValueError - raised if any of the periods does not start before its end, or if the timezone does not have a
+                fixed offset
+        """
+        start = np.asarray(start)
+        end = np.asarray(end)
+        if start.dtype.kind == 'M':
+            start = start.astype('datetime64[us]').view(np.int64)
+        if end.dtype.kind == 'M':
+            end = end.astype('datetime64[us]').view(np.int64)
+        start = start.astype(np.int64)
+        end = end.astype(np.int64)
+        if start.shape != end.shape or start.ndim != 1:
+            raise ValueError(f"The starts and ends must be one-dimensional and of the same length; shapes provided: "
+                             f"start={start.shape}, end={end.shape}")
+        invalid = np.flatnonzero(start >= end)
+        if invalid.size:
+            raise ValueError(f"The start of a period cannot be equal or after its end; values provided at position "
+                             f"{invalid[0]}: start={start[invalid[0]]}, end={end[invalid[0]]}")
+        offset = zone.utcoffset(None) if zone is not None else timedelta(0)
+        if offset is None:
+            raise ValueError(f"The timezone '{zone}' does not have a fixed offset from UTC")
+        offsets = np.full(start.shape, _offset_us(offset), dtype=np.int64)
+        dst = np.full(start.shape, _dst_seconds(zone.dst(None) if zone is not None else None), dtype=np.int64)
+        zones = np.full(start.shape, zone, dtype=object)
+        array = cls.__new__(cls)
+        array._assign(start, end, zones, zones, offsets, offsets, dst, dst)
+        return array
+
+    def _take(self, index) -> 'AbsolutePeriodArray':
+        """ Internal method that creates an array of the periods selected by a slice, a mask or positions """
+        array = type(self).__new__(type(self))
+        array._assign(self._start_us[index], self._end_us[index], self._start_zones[index], self._end_zones[index],
+                      self._start_offsets[index], self._end_offsets[index], self._start_dst[index],
+                      self._end_dst[index])
+        return array
+
+    @property
+    def start_epoch_us(self) -> np.ndarray:
+        """ The starts of the periods as microseconds since the UTC epoch """
+        return self._start_us
+
+    @property
+    def end_epoch_us(self) -> np.ndarray:
+        """ The ends of the periods as microseconds since the UTC epoch """
+        return self._end_us
+
+    @property
+    def start(self) -> np.ndarray:
+        """ The starts of the periods as UTC datetime64 values """
+        return self._start_us.view('datetime64[us]')
+
+    @property
+    def end(self) -> np.ndarray:
+        """ The ends of the periods as UTC datetime64 values """
+        return self._end_us.view('datetime64[us]')
+
+    @property
+    def start_zones(self) -> np.ndarray:
+        """ The timezones the starts of the periods are set in, None for naive datetimes """
+        return self._start_zones
+
+    @property
+    def end_zones(self) -> np.ndarray:
+        """ The timezones the ends of the periods are set in, None for naive datetimes """
+        return self._end_zones
+
+    def __len__(self) -> int:
+        return len(self._start_us)
+
+    def __getitem__(self, index):
+        """ Returns the AbsolutePeriod at the provided position, recreated in the timezones it was set in, or a new
+        array for a slice, a boolean mask or an array of positions
+        """
+        if isinstance(index, (int, np.integer)):
+            start = _from_epoch_us(int(self._start_us[index]), self._start_zones[index])
+            end = _from_epoch_us(int(self._end_us[index]), self._end_zones[index])
+            return AbsolutePeriod.from_validated(start=start, end=end)
+        return self._take(index)
+
+    def __iter__(self) -> Iterator[AbsolutePeriod]:
+        for index in range(len(self)):
+            yield self[index]
+
+    def __repr__(self):
+        return f"{type(self).__name__}({list(self)!r})"
+
+    def durations(self) -> np.ndarray:
+        """ Returns the Durations of the periods as a structured array with the fields of a Duration (see
+        `DURATION_DTYPE`); every one of them is the same as the `duration` of the period at the same position. The
+        durations are computed once, on the first use.
+        """
+        if self._durations is None:
+            # Subtracting datetimes which share their timezone counts the days between their wall clock values, while
+            # those in different timezones are subtracted as moments in time
+            same_zone = _IS(self._start_zones, self._end_zones).astype(bool)
+            start = self._start_us + self._start_offsets
+            end = self._end_us + self._end_offsets
+            elapsed = np.where(same_zone, end - start, self._end_us - self._start_us) // _DAY_US
+            self._durations = _clock_durations(start, end, elapsed, self._start_dst, self._end_dst)
+        return self._durations
+
+    def _totals(self) -> np.ndarray:
+        """ The `total_seconds` of the duration of every period, which the membership test compares """
+        return self.durations()['total_seconds']
+
+    def isoformat(self) -> np.ndarray:
+        """ Returns the periods as ISO-8601 intervals in a NumPy string array; every one of them is the same as
+        `str(period)` of the period at the same position
+        """
+        return _interval_strings(self._start_us, self._start_offsets, self._naive, self._end_us, self._end_offsets,
+                                 np.equal(self._end_zones, None))
+
+    def _instants(self, other, kind: int) -> tuple:
+        """ Internal method that returns the start and end of the other value as microseconds since the UTC epoch, as
+        single values or as columns for another array. The epochs take naive datetimes to be in UTC, so they are only
+        returned if the periods and the other value are either both naive or both aware, see `check_awareness`.
+        """
+        if isinstance(other, AbsolutePeriodArray):
+            self._check_awareness(other._naive)
+            return other._start_us, other._end_us
+        if kind == Operand.ABSOLUTE_PERIOD:
+            self._check_awareness(other.start.tzinfo is None)
+            return other.start_epoch_us, other.end_epoch_us
+        self._check_awareness(other.tzinfo is None)
+        instant = to_epoch_us(other)
+        return instant, instant
+
+    def _check_awareness(self, naive) -> None:
+        """ Internal method that raises a TypeError if any of the periods is naive while the other value is aware, or
+        the other way around
+        """
+        if np.any(self._naive != naive):
+            raise TypeError("can't compare offset-naive and offset-aware datetimes")
+
+    def _days(self, other, kind: int) -> tuple:
+        """ Internal method that returns the dates of the start and end of the other value as ordinals """
+        if isinstance(other, AbsolutePeriodArray):
+            return other._start_days, other._end_days
+        if kind == Operand.DATE_PERIOD:
+            return other.start.toordinal(), other.end.toordinal()
+        return other.toordinal(), other.toordinal()
+
+    def contains(self, item) -> np.ndarray:
+        """ Test if every period contains the provided datetime, date, AbsolutePeriod or DatePeriod, or the period at
+        the same position of another array, the same way as `item in period`; see `AbsolutePeriod.__contains__`
+        """
+        kind = Operand.ABSOLUTE_PERIOD if isinstance(item, AbsolutePeriodArray) else operand_kind(item)
+        if kind == Operand.DATETIME:
+            instant, _ = self._instants(item, kind)
+            return (self._start_us <= instant) & (instant <= self._end_us)
+        if kind == Operand.DATE:
+            day, _ = self._days(item, kind)
+            return (self._start_days <= day) & (day <= self._end_days)
+        if kind == Operand.ABSOLUTE_PERIOD:
+            start, end = self._instants(item, kind)
+            totals = item._totals() if isinstance(item, AbsolutePeriodArray) else item.duration.total_seconds
+            equal = (self._start_us == start) & (self._end_us == end)
+            return ~equal & (self._start_us <= start) & (end <= self._end_us) & (self._totals() > totals)
+        if kind == Operand.DATE_PERIOD:
+            start, end = self._days(item, kind)
+            equal = (self._start_days == start) & (self._end_days == end)
+            return ~equal & (self._start_days <= start) & (end <= self._end_days)
+        if kind == Operand.UNSUPPORTED:
+            return np.zeros(len(self), dtype=bool)
+        raise TypeError(f"Cannot perform temporal operations with instances of type '{type(item)}'")
+
+    def is_before(self, other) -> np.ndarray:
+        """ Test if every period ends before the provided datetime, date, AbsolutePeriod or DatePeriod, or before the
+        period at the same position of another array; see `AbsolutePeriod.is_before`
+        """
+        kind = Operand.ABSOLUTE_PERIOD if isinstance(other, AbsolutePeriodArray) else operand_kind(other)
+        if kind == Operand.ABSOLUTE_PERIOD or kind == Operand.DATETIME:
+            start, _ = self._instants(other, kind)
+            return self._end_us <= start
+        if kind == Operand.DATE_PERIOD or kind == Operand.DATE:
+            start, _ = self._days(other, kind)
+            return self._end_days < start
+        raise TypeError(f"Cannot perform temporal operations with instances of type '{type(other)}'")
+
+    def is_after(self, other) -> np.ndarray:
+        """ Test if every period starts after the provided datetime, date, AbsolutePeriod or DatePeriod, or after the
+        period at the same position of another array; see `AbsolutePeriod.is_after`
+        """
+        kind = Operand.ABSOLUTE_PERIOD if isinstance(other, AbsolutePeriodArray) else operand_kind(other)
+        if kind == Operand.ABSOLUTE_PERIOD or kind == Operand.DATETIME:
+            _, end = self._instants(other, kind)
+            return end <= self._start_us
+        if kind == Operand.DATE_PERIOD or kind == Operand.DATE:
+            _, end = self._days(other, kind)
+            return end < self._start_days
+        raise TypeError(f"Cannot perform temporal operations with instances of type '{type(other)}'")
+
+    def _overlap_bounds(self, other, kind: int) -> tuple | None:
+        """ Internal method that returns the starts and ends of the periods and of the other value which their overlap
+        is tested on: instants for absolute periods and dates for DatePeriods
+        """
+        if kind == Operand.ABSOLUTE_PERIOD:
+            return (self._start_us, self._end_us) + self._instants(other, kind)
+        if kind == Operand.DATE_PERIOD:
+            return (self._start_days, self._end_days) + self._days(other, kind)
+        if kind == Operand.TIME_PERIOD:
+            raise TypeError(f"Cannot perform temporal operations with instances of type '{type(other)}'")
+        return None
+
+    def relation(self, other) -> np.ndarray:
+        """ Returns the relation of every period to the provided AbsolutePeriod or DatePeriod, or to the period at the
+        same position of another array, as an array of Relation members; see `AbsolutePeriod.relation`
+        """
+        kind = Operand.ABSOLUTE_PERIOD if isinstance(other, AbsolutePeriodArray) else operand_kind(other)
+        bounds = self._overlap_bounds(other, kind)
+        if bounds is None:
+            raise TypeError(f"Cannot perform temporal operations with instances of type '{type(other)}'")
+        return _RELATIONS[_classify(*bounds)]
+
+    def overlaps_with(self, other) -> np.ndarray:
+        """ Test if every period overlaps with the provided period which has begun before it, or with the period at the
+        same position of another array; see `AbsolutePeriod.overlaps_with`
+        """
+        kind = Operand.ABSOLUTE_PERIOD if isinstance(other, AbsolutePeriodArray) else operand_kind(other)
+        bounds = self._overlap_bounds(other, kind)
+        if bounds is None:
+            return np.zeros(len(self), dtype=bool)
+        start, end, other_start, other_end = bounds
+        return _overlapped(start, end, other_start, other_end)
+
+    def overlapped_by(self, other) -> np.ndarray:
+        """ Test if every period is overlapped by the provided period which has begun after it, or by the period at the
+        same position of another array; see `AbsolutePeriod.overlapped_by`
+        """
+        kind = Operand.ABSOLUTE_PERIOD if isinstance(other, AbsolutePeriodArray) else operand_kind(other)
+        bounds = self._overlap_bounds(other, kind)
+        if bounds is None:
+            return np.zeros(len(self), dtype=bool)
+        start, end, other_start, other_end = bounds
+        return _overlapped(other_start, other_end, start, end)
+
+
+class DatePeriodArray:
+    """ A fixed sequence of DatePeriods stored as two datetime64[D] columns, holding the start and end of every period.
+    The same as with an AbsolutePeriodArray, the methods of this class answer the same question for all periods at once
+    and return a NumPy array holding the answer of each of them, which is the same as the one of the method of
+    DatePeriod with the same name:
+    >>> subscriptions = DatePeriodArray.from_dates(starts, ends)
+    >>> subscriptions.contains(date(2024, 7, 1))
+    array([ True, False, ...])
+
+    The other value may be an instance of any of the types these methods accept, or another array of the same length,
+    in which case the periods are compared pair by pair. An array can be created from the columns directly, without
+    creating a single DatePeriod, see `from_dates`.
+    """
+
+    __slots__ = ('_start', '_end')
+
+    def __init__(self, periods: Iterable = ()):
+        start = []
+        end = []
+        for period in periods:
+            if operand_kind(period) != Operand.DATE_PERIOD:
+                raise TypeError(f"Cannot add instances of type '{type(period)}' to {type(self).__name__}")
+            start.append(period.start.toordinal())
+            end.append(period.end.toordinal())
+        self._start = (np.array(start, dtype=np.int64) - _EPOCH_ORDINAL).view('datetime64[D]')
+        self._end = (np.array(end, dtype=np.int64) - _EPOCH_ORDINAL).view('datetime64[D]')
+
+    @classmethod
+    def from_dates(cls, start, end) -> 'DatePeriodArray':
+        """ Creates an array from the starts and ends of the periods as datetime64 values, or anything NumPy converts
+        to them (such as lists of dates or ISO-8601 strings); values with a finer unit than a day are cut to their date.
+
+        Raises:
+            ValueError - raised if any of the periods does not start before its end
+        """
+        start = np.asarray(start, dtype='datetime64[D]')
+        end = np.asarray(end, dtype='datetime64[D]')
+        if start.shape != end.shape or start.ndim != 1:
+            raise ValueError(f"The starts and ends must be one-dimensional and of the same length; shapes provided: "
+                             f"start={start.shape}, end={end.shape}")
+        invalid = np.flatnonzero(~(start < end))
+        if invalid.size:
+            raise ValueError(f"The start of a period cannot be equal or after its end; values provided at position "
+                             f"{invalid[0]}: start={start[invalid[0]]}, end={end[invalid[0]]}")
+        return cls._from_columns(start, end)
+
+    @classmethod
+    def _from_columns(cls, start: np.ndarray, end: np.ndarray) -> 'DatePeriodArray':
+        """ Internal method that creates an array from datetime64[D] columns which are already known to be valid """
+        array = cls.__new__(cls)
+        array._start = start
+        array._end = end
+        return array
+
+    @property
+    def start(self) -> np.ndarray:
+        """ The starts of the periods as datetime64[D] values """
+        return self._start
+
+    @property
+    def end(self) -> np.ndarray:
+        """ The ends of the periods as datetime64[D] values """
+        return self._end
+
+    def __len__(self) -> int:
+        return len(self._start)
+
+    def __getitem__(self, index):
+        """ Returns the DatePeriod at the provided position, or a new array for a slice, a boolean mask or an array of
+        positions
+        """
+        if isinstance(index, (int, np.integer)):
+            start = date.fromordinal(int(self._start[index].view(np.int64)) + _EPOCH_ORDINAL)
+            end = date.fromordinal(int(self._end[index].view(np.int64)) + _EPOCH_ORDINAL)
+            return DatePeriod.from_validated(start=start, end=end)
+        return self._from_columns(self._start[index], self._end[index])
+
+    def __iter__(self) -> Iterator[DatePeriod]:
+        for index in range(len(self)):
+            yield self[index]
+
+    def __repr__(self):
+        return f"{type(self).__name__}({list(self)!r})"
+
+    def durations(self) -> np.ndarray:
+        """ Returns the Durations of the periods as a structured array with the fields of a Duration (see
+        `DURATION_DTYPE`); every one of them is the same as the `duration` of the period at the same position
+        """
+        return date_durations(self._start, self._end)
+
+    def isoformat(self) -> np.ndarray:
+        """ Returns the periods as ISO-8601 intervals in a NumPy string array; every one of them is the same as
+        `str(period)` of the period at the same position
+        """
+        buffer = _text_buffer(len(self), '0000-00-00/0000-00-00')
+        _write_date(buffer, 0, self._start.view(np.int64))
+        _write_date(buffer, 11, self._end.view(np.int64))
+        return _strings(buffer)
+
+    def _bounds(self, other) -> tuple | None:
+        """ Internal method that returns the start and end dates of the other value as days since the epoch, as single
+        values or as columns for another array; None is returned for values that the periods cannot operate with
+        """
+        if isinstance(other, DatePeriodArray):
+            return other._start.view(np.int64), other._end.view(np.int64)
+        kind = operand_kind(other)
+        if kind == Operand.DATE_PERIOD or kind == Operand.WALLCLOCK_PERIOD or kind == Operand.ABSOLUTE_PERIOD:
+            # Only the dates of wallclock and absolute periods are considered, `toordinal` ignores the time of the day
+            return other.start.toordinal() - _EPOCH_ORDINAL, other.end.toordinal() - _EPOCH_ORDINAL
+        if kind == Operand.DATE or kind == Operand.DATETIME:
+            day = other.toordinal() - _EPOCH_ORDINAL
+            return day, day
+        return None
+
+    def _period_bounds(self, other) -> tuple:
+        """ Internal method that returns the bounds of the periods along with the ones of the other period """
+        bounds = self._bounds(other) if not _is_point(other) else None
+        if bounds is None:
+            raise TypeError(f"Cannot perform temporal operations with instances of type '{type(other)}'")
+        return (self._start.view(np.int64), self._end.view(np.int64)) + bounds
+
+    def contains(self, item) -> np.ndarray:
+        """ Test if every period contains the provided date, datetime or period, or the period at the same position of
+        another array, the same way as `item in period`; see `DatePeriod.__contains__`
+        """
+        bounds = self._bounds(item)
+        if bounds is None:
+            raise TypeError(f"Cannot perform temporal operations with instances of type '{type(item)}'")
+        start = self._start.view(np.int64)
+        end = self._end.view(np.int64)
+        other_start, other_end = bounds
+        if _is_point(item):
+            return (start <= other_start) & (other_start <= end)
+        equal = (start == other_start) & (end == other_end)
+        return ~equal & (start <= other_start) & (other_end <= end)
+
+    def is_before(self, other) -> np.ndarray:
+        """ Test if every period ends before the provided date, datetime or period starts, or before the period at the
+        same position of another array; see `DatePeriod.is_before`
+        """
+        bounds = self._bounds(other)
+        if bounds is None:
+            raise TypeError(f"Cannot perform temporal operations with instances of type '{type(other)}'")
+        return self._end.view(np.int64) < bounds[0]
+
+    def is_after(self, other) -> np.ndarray:
+        """ Test if every period starts after the provided date, datetime or period ends, or after the period at the
+        same position of another array; see `DatePeriod.is_after`
+        """
+        bounds = self._bounds(other)
+        if bounds is None:
+            raise TypeError(f"Cannot perform temporal operations with instances of type '{type(other)}'")
+        return bounds[1] < self._start.view(np.int64)
+
+    def relation(self, other) -> np.ndarray:
+        """ Returns the relation of every period to the provided period, or to the period at the same position of
+        another array, as an array of Relation members; see `DatePeriod.relation`
+        """
+        return _RELATIONS[_classify(*self._period_bounds(other))]
+
+    def overlaps_with(self, other) -> np.ndarray:
+        """ Test if every period overlaps with the provided period which has begun before it, or with the period at the
+        same position of another array; see `DatePeriod.overlaps_with`
+        """
+        if not isinstance(other, DatePeriodArray) and operand_kind(other) not in _DATE_PERIOD_OPERANDS:
+            return np.zeros(len(self), dtype=bool)
+        start, end, other_start, other_end = self._period_bounds(other)
+        return _overlapped(start, end, other_start, other_end)
+
+    def overlapped_by(self, other) -> np.ndarray:
+        """ Test if every period is overlapped by the provided period which has begun after it, or by the period at the
+        same position of another array; see `DatePeriod.overlapped_by`
+        """
+        if not isinstance(other, DatePeriodArray) and operand_kind(other) not in _DATE_PERIOD_OPERANDS:
+            return np.zeros(len(self), dtype=bool)
+        start, end, other_start, other_end = self._period_bounds(other)
+        return _overlapped(other_start, other_end, start, end)
+
+    def get_overlap(self, other) -> tuple['DatePeriodArray', np.ndarray]:
+        """ Returns the overlaps between the periods and the provided period, or the period at the same position of
+        another array, along with a mask of the periods which they have been found for; the same as
+        `DatePeriod.get_overlap`, there is an overlap only when one of the periods has begun before the other one and
+        ends within it. The overlaps are kept in the order of the periods they have been found for:
+        >>> overlaps, found = subscriptions.get_overlap(campaign)
+        >>> overlaps[0]  # The overlap of subscriptions[found][0] with the campaign
+        """
+        start, end, other_start, other_end = self._period_bounds(other)
+        # Either the other period has begun first and ends within this one, or the other way around
+        overlapped_by = (other_start < start) & (start < other_end) & (other_end < end)
+        overlaps = (start < other_start) & (other_start < end) & (end < other_end)
+        found = overlapped_by | overlaps
+        overlap_start = np.where(overlapped_by, start, other_start)[found]
+        overlap_end = np.where(overlapped_by, other_end, end)[found]
+        return self._from_columns(overlap_start.view('datetime64[D]'), overlap_end.view('datetime64[D]')), found
+
+
+_DATE_PERIOD_OPERANDS = (Operand.DATE_PERIOD, Operand.WALLCLOCK_PERIOD, Operand.ABSOLUTE_PERIOD)
+
+
+def _is_point(value) -> bool:
+    """ Test if the value is a single date or datetime, rather than a period or an array of them """
+    return not isinstance(value, DatePeriodArray) and operand_kind(value) in (Operand.DATE, Operand.DATETIME)
+
+
+class TimePeriodArray:
+    """ A fixed sequence of TimePeriods stored as two int32 columns, holding the start and end of every period as whole
+    seconds since midnight. The same as with the other arrays of this module, the methods of this class answer the same
+    question for all periods at once and return a NumPy array holding the answer of each of them, which is the same as
+    the one of the method of TimePeriod with the same name:
+    >>> shifts = TimePeriodArray.from_seconds(starts, ends)
+    >>> shifts.contains(time(22, 30))
+    array([False, True, ...])
+
+    The other value may be a single time, datetime or TimePeriod, which is compared with every period without being
+    copied into an array, an array of times holding a point for every period (as timedelta64 values since midnight,
+    integer seconds since midnight, or datetime64 values whose time of the day is used), or another array of the same
+    length, in which case the periods are compared pair by pair.
+
+    Since the periods are held in whole seconds, periods whose start or end has microseconds cannot be stored in an
+    array, or compared with one; the times and datetimes which the periods are compared with may have microseconds.
+    """
+
+    __slots__ = ('_start', '_end')
+
+    def __init__(self, periods: Iterable = ()):
+        start = []
+        end = []
+        for period in periods:
+            if operand_kind(period) != Operand.TIME_PERIOD:
+                raise TypeError(f"Cannot add instances of type '{type(period)}' to {type(self).__name__}")
+            start.append(_whole_seconds(period.start))
+            end.append(_whole_seconds(period.end))
+        self._start = np.array(start, dtype=np.int32)
+        self._end = np.array(end, dtype=np.int32)
+
+    @classmethod
+    def from_seconds(cls, start, end) -> 'TimePeriodArray':
+        """ Creates an array from the starts and ends of the periods as seconds since midnight, or as timedelta64 values
+        since midnight, whose parts finer than a second are cut.
+
+        Raises:
+            ValueError - raised if any of the periods does not start before its end, or if a value is not within a day
+        """
+        start = _seconds_of_day(start)
+        end = _seconds_of_day(end)
+        if start.shape != end.shape or start.ndim != 1:
+            raise ValueError(f"The starts and ends must be one-dimensional and of the same length; shapes provided: "
+                             f"start={start.shape}, end={end.shape}")
+        invalid = np.flatnonzero((start < 0) | (end >= 86400))
+        if invalid.size:
+            raise ValueError(f"The start and end of a period must be within a day; values provided at position "
+                             f"{invalid[0]}: start={start[invalid[0]]}, end={end[invalid[0]]}")
+        invalid = np.flatnonzero(~(start < end))
+        if invalid.size:
+            raise ValueError(f"The start of a period cannot be equal or after its end; values provided at position "
+                             f"{invalid[0]}: start={start[invalid[0]]}, end={end[invalid[0]]}")
+        return cls._from_columns(start.astype(np.int32), end.astype(np.int32))
+
+    @classmethod
+    def _from_columns(cls, start: np.ndarray, end: np.ndarray) -> 'TimePeriodArray':
+        """ Internal method that creates an array from int32 columns which are already known to be valid """
+        array = cls.__new__(cls)
+        array._start = start
+        array._end = end
+        return array
+
+    @property
+    def start(self) -> np.ndarray:
+        """ The starts of the periods as int32 seconds since midnight """
+        return self._start
+
+    @property
+    def end(self) -> np.ndarray:
+        """ The ends of the periods as int32 seconds since midnight """
+        return self._end
+
+    def __len__(self) -> int:
+        return len(self._start)
+
+    def __getitem__(self, index):
+        """ Returns the TimePeriod at the provided position, or a new array for a slice, a boolean mask or an array of
+        positions
+        """
+        if isinstance(index, (int, np.integer)):
+            return TimePeriod.from_validated(start=_from_seconds(int(self._start[index])),
+                                             end=_from_seconds(int(self._end[index])))
+        return self._from_columns(self._start[index], self._end[index])
+
+    def __iter__(self) -> Iterator[TimePeriod]:
+        for index in range(len(self)):
+            yield self[index]
+
+    def __repr__(self):
+        return f"{type(self).__name__}({list(self)!r})"
+
+    def durations(self) -> np.ndarray:
+        """ Returns the Durations of the periods as a structured array with the fields of a Duration (see
+        `DURATION_DTYPE`); every one of them is the same as the `duration` of the period at the same position
+        """
+        return time_durations(self._start, self._end)
+
+    def isoformat(self) -> np.ndarray:
+        """ Returns the periods as ISO-8601 intervals in a NumPy string array; every one of them is the same as
+        `str(period)` of the period at the same position
+        """
+        buffer = _text_buffer(len(self), '00:00:00/00:00:00')
+        _write_clock(buffer, 0, self._start)
+        _write_clock(buffer, 9, self._end)
+        return _strings(buffer)
+
+    def _points(self, item) -> tuple | None:
+        """ Internal method that returns the times of the provided point, or array of points, as whole seconds since
+        midnight, rounded both down and up; comparing the periods with the rounded down value when they must start
+        before the point, and with the rounded up one when they must end after it, keeps points with microseconds
+        exact. None is returned for values which are not points.
+        """
+        if isinstance(item, np.ndarray):
+            if item.dtype.kind == 'M':
+                values = item.astype('datetime64[us]').view(np.int64) % _DAY_US
+            elif item.dtype.kind == 'm':
+                values = item.astype('timedelta64[us]').view(np.int64)
+            elif item.dtype.kind in 'iu':
+                return item, item
+            else:
+                return None
+            return values // _SECOND_US, -(-values // _SECOND_US)
+        kind = operand_kind(item)
+        if kind == Operand.DATETIME:
+            item = item.time()
+        elif kind != Operand.TIME:
+            return None
+        seconds = item.hour * 3600 + item.minute * 60 + item.second
+        return seconds, seconds + (item.microsecond > 0)
+
+    def _period_bounds(self, other) -> tuple:
+        """ Internal method that returns the bounds of the periods along with the ones of the other TimePeriod, or of
+        the periods of another array
+        """
+        if isinstance(other, TimePeriodArray):
+            return self._start, self._end, other._start, other._end
+        if operand_kind(other) != Operand.TIME_PERIOD:
+            raise TypeError(f"Cannot perform temporal operations with instances of type '{type(other)}'")
+        return self._start, self._end, _whole_seconds(other.start), _whole_seconds(other.end)
+
+    def contains(self, item) -> np.ndarray:
+        """ Test if every period contains the provided time, datetime or period, the point at the same position of an
+        array of times, or the period at the same position of another array, the same way as `item in period`; see
+        `TimePeriod.__contains__`
+        """
+        points = self._points(item)
+        if points is not None:
+            return (self._start <= points[0]) & (points[1] <= self._end)
+        kind = operand_kind(item)
+        if kind == Operand.WALLCLOCK_PERIOD or kind == Operand.ABSOLUTE_PERIOD:
+            start, end = self._start, self._end
+            other_start, other_end = _whole_seconds(item.start.time()), _whole_seconds(item.end.time())
+        else:
+            start, end, other_start, other_end = self._period_bounds(item)
+        equal = (start == other_start) & (end == other_end)
+        return ~equal & (start <= other_start) & (other_end <= end)
+
+    def is_before(self, other) -> np.ndarray:
+        """ Test if every period ends before the provided time or TimePeriod, the point at the same position of an array
+        of times, or the period at the same position of another array; see `TimePeriod.is_before`
+        """
+        if _is_datetime(other):
+            return np.zeros(len(self), dtype=bool)
+        points = self._points(other)
+        if points is not None:
+            return self._end <= points[0]
+        if isinstance(other, TimePeriodArray) or operand_kind(other) == Operand.TIME_PERIOD:
+            return self._end <= self._period_bounds(other)[2]
+        return np.zeros(len(self), dtype=bool)
+
+    def is_after(self, other) -> np.ndarray:
+        """ Test if every period starts after the provided time or TimePeriod, the point at the same position of an
+        array of times, or the period at the same position of another array; see `TimePeriod.is_after`
+        """
+        if _is_datetime(other):
+            return np.zeros(len(self), dtype=bool)
+        points = self._points(other)
+        if points is not None:
+            return points[1] <= self._start
+        if isinstance(other, TimePeriodArray) or operand_kind(other) == Operand.TIME_PERIOD:
+            return self._period_bounds(other)[3] <= self._start
+        return np.zeros(len(self), dtype=bool)
+
+    def relation(self, other) -> np.ndarray:
+        """ Returns the relation of every period to the provided TimePeriod, or to the period at the same position of
+        another array, as an array of Relation members; see `TimePeriod.relation`. Unlike the TimePeriod, the array
+        does not relate its periods to wallclock or absolute periods.
+        """
+        return _RELATIONS[_classify(*self._period_bounds(other))]
+
+    def overlaps_with(self, other) -> np.ndarray:
+        """ Test if every period overlaps with the provided TimePeriod which has begun before it, or with the period at
+        the same position of another array; see `TimePeriod.overlaps_with`
+        """
+        return _overlapped(*self._period_bounds(other))
+
+    def overlapped_by(self, other) -> np.ndarray:
+        """ Test if every period is overlapped by the provided TimePeriod which has begun after it, or by the period at
+        the same position of another array; see `TimePeriod.overlapped_by`
+        """
+        start, end, other_start, other_end = self._period_bounds(other)
+        return _overlapped(other_start, other_end, start, end)
+
+    def get_overlap(self, other) -> tuple['TimePeriodArray', np.ndarray]:
+        """ Returns the overlaps between the periods and the provided TimePeriod, or the period at the same position of
+        another array, along with a mask of the periods which they have been found for; see `TimePeriod.get_overlap`
+        and `DatePeriodArray.get_overlap`
+        """
+        start, end, other_start, other_end = self._period_bounds(other)
+        overlapped_by = (other_start < start) & (start < other_end) & (other_end < end)
+        overlaps = (start < other_start) & (other_start < end) & (end < other_end)
+        found = overlapped_by | overlaps
+        overlap_start = np.where(overlapped_by, start, other_start)[found]
+        overlap_end = np.where(overlapped_by, other_end, end)[found]
+        return self._from_columns(overlap_start.astype(np.int32), overlap_end.astype(np.int32)), found
+
+    def get_disconnect(self, other) -> tuple['TimePeriodArray', np.ndarray]:
+        """ Returns the disconnects of the periods from the provided TimePeriod, or from the period at the same position
+        of another array, along with a mask of the periods which they have been found for; the same as
+        `TimePeriod.get_disconnect`, the disconnect is the part of a period which the other one, overlapping or meeting
+        it, does not cover
+        """
+        start, end, other_start, other_end = self._period_bounds(other)
+        # The other period either overlaps or meets the end of this one, or the start of it
+        overlaps = (start < other_start) & (other_start <= end) & (end < other_end)
+        overlapped_by = (other_start < start) & (start <= other_end) & (other_end < end)
+        found = overlaps | overlapped_by
+        disconnect_start = np.where(overlaps, start, other_end)[found]
+        disconnect_end = np.where(overlaps, other_start, end)[found]
+        return self._from_columns(disconnect_start.astype(np.int32), disconnect_end.astype(np.int32)), found
+
+
+def _whole_seconds(value: time) -> int:
+    """ Returns the seconds since midnight of the time, which may not have microseconds """
+    if value.microsecond:
+        raise ValueError(f"Provided value '{value}' cannot be stored in a TimePeriodArray, which holds whole seconds")
+    return value.hour * 3600 + value.minute * 60 + value.second
+
+
+def _from_seconds(seconds: int) -> time:
+    return time(seconds // 3600, seconds // 60 % 60, seconds % 60)
+
+
+def _is_datetime(value) -> bool:
+    """ Test if the value is a datetime, or an array of datetime64 values """
+    if isinstance(value, np.ndarray):
+        return value.dtype.kind == 'M'
+    return not isinstance(value, TimePeriodArray) and operand_kind(value) == Operand.DATETIME
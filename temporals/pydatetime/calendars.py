@@ -0,0 +1,184 @@
+""" Calendars of days covered by DatePeriods, stored as bitmaps so that set algebra is done by bitwise operations """
+import re
+from datetime import date
+from typing import Iterable
+
+from .periods import DatePeriod
+from .utils import operand_kind, Operand
+
+_RUNS = re.compile('1+')
+
+
+class DateCalendar:
+    """ The days within a collection of DatePeriods, held as a bitmap in a single integer where each bit stands for a
+    day; the same as `date in period`, a DatePeriod covers its first and last day along with the days between them, so
+    a DatePeriod from the 1st to the 4th of a month sets four bits. Single dates can be added as well, each covering
+    its own day.
+
+    The union, intersection, difference and symmetric difference of two calendars are single bitwise operations over
+    their integers, and testing whether a date is covered is done in constant time against a table created on the first
+    membership test. Since the calendar holds days, a date is within the result of an operation exactly when the
+    operation holds for the date being within each calendar:
+    >>> eligible = DateCalendar(contracts) - DateCalendar(suspensions)
+    >>> date(2024, 7, 1) in eligible  # False for any date within one of the suspensions
+
+    The calendar can be turned back into the fewest DatePeriods covering the same days with `to_periods`, where periods
+    that overlap, meet or follow each other on consecutive days are merged.
+
+    A calendar takes a bit per day between its first and last day, so a calendar spanning 30 years takes about 1.4KB.
+    """
+
+    __slots__ = ('_origin', '_bits', '_table')
+
+    def __init__(self, periods: Iterable = ()):
+        spans = []
+        for period in periods:
+            kind = operand_kind(period)
+            if kind == Operand.DATE_PERIOD:
+                spans.append((period.start.toordinal(), period.end.toordinal()))
+            elif kind == Operand.DATE:
+                spans.append((period.toordinal(), period.toordinal()))
+            else:
+                raise TypeError(f"Cannot add instances of type '{type(period)}' to {type(self).__name__}")
+        origin = min((start for start, _ in spans), default=0)
+        bits = 0
+        for start, end in spans:
+            bits |= ((1 << (end - start + 1)) - 1) << (start - origin)
+        self._assign(origin, bits)
+
+    @classmethod
+    def _from_bits(cls, origin: int, bits: int) -> 'DateCalendar':
+        """ Internal method that creates a calendar whose first bit stands for the day with the `origin` ordinal """
+        instance = cls.__new__(cls)
+        instance._assign(origin, bits)
+        return instance
+
+    def _assign(self, origin: int, bits: int) -> None:
+        # The bitmap always starts with a set bit, so that equal calendars have the same origin and integer
+        if bits:
+            shift = (bits & -bits).bit_length() - 1
+            origin += shift
+            bits >>= shift
+        else:
+            origin = 0
+        self._origin = origin
+        self._bits = bits
+        self._table = None
+
+    def _check(self, other) -> None:
+        if type(other) is not type(self):
+            raise TypeError(f"Cannot perform set operations between {type(self).__name__} and '{type(other)}'")
+
+    def _aligned(self, other: 'DateCalendar') -> tuple[int, int, int]:
+        """ Returns the integers of both calendars shifted to the earliest of their origins, along with that origin """
+        origin = min(self._origin, other._origin)
+        return origin, self._bits << (self._origin - origin), other._bits << (other._origin - origin)
+
+    @property
+    def first(self) -> date | None:
+        """ The first day covered by this calendar, or None if it is empty """
+        return date.fromordinal(self._origin) if self._bits else None
+
+    @property
+    def last(self) -> date | None:
+        """ The last day covered by this calendar, or None if it is empty """
+        return date.fromordinal(self._origin + self._bits.bit_length() - 1) if self._bits else None
+
+    def __bool__(self) -> bool:
+        return bool(self._bits)
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self.to_periods()!r})"
+
+    def __eq__(self, other):
+        if type(other) is not type(self):
+            return NotImplemented
+        return self._origin == other._origin and self._bits == other._bits
+
+    def __hash__(self):
+        return hash((type(self), self._origin, self._bits))
+
+    def __contains__(self, item) -> bool:
+        """ Test if a date, the date of a datetime or a DatePeriod is within this calendar; a DatePeriod is within it
+        when all of its days, including its first and last one, are covered by the calendar
+        """
+        kind = operand_kind(item)
+        if kind == Operand.DATETIME:
+            item = item.date()
+        elif kind == Operand.DATE_PERIOD:
+            start = item.start.toordinal() - self._origin
+            if start < 0:
+                return False
+            mask = (1 << (item.end.toordinal() - item.start.toordinal() + 1)) - 1
+            return (self._bits >> start) & mask == mask
+        elif kind != Operand.DATE:
+            raise TypeError(f"Cannot perform temporal operations with instances of type '{type(item)}'")
+        table = self._table
+        if table is None:
+            table = self._table = self._bits.to_bytes((self._bits.bit_length() + 7) // 8, 'little')
+        day = item.toordinal() - self._origin
+        if day < 0 or day >= len(table) * 8:
+            return False
+        return bool(table[day >> 3] >> (day & 7) & 1)
+
+    def to_periods(self) -> list[DatePeriod | date]:
+        """ Returns the fewest DatePeriods covering the days of this calendar, sorted by their start; there is at least
+        a day between any two of them that the calendar does not cover. A day covered on its own cannot be a DatePeriod,
+        which must end after it starts, and it is returned as a date instead.
+        """
+        origin = self._origin
+        fromordinal = date.fromordinal
+        from_validated = DatePeriod.from_validated
+        periods = []
+        # The binary digits, lowest bit first, hold a run of ones for every period
+        for run in _RUNS.finditer(bin(self._bits)[:1:-1]):
+            start = fromordinal(origin + run.start())
+            if run.end() - run.start() == 1:
+                periods.append(start)
+            else:
+                periods.append(from_validated(start=start, end=fromordinal(origin + run.end() - 1)))
+        return periods
+
+    def union(self, other: 'DateCalendar') -> 'DateCalendar':
+        """ Returns a new calendar holding the days within either this calendar or the other one """
+        self._check(other)
+        origin, this, that = self._aligned(other)
+        return self._from_bits(origin, this | that)
+
+    def intersection(self, other: 'DateCalendar') -> 'DateCalendar':
+        """ Returns a new calendar holding the days within both this calendar and the other one """
+        self._check(other)
+        origin, this, that = self._aligned(other)
+        return self._from_bits(origin, this & that)
+
+    def difference(self, other: 'DateCalendar') -> 'DateCalendar':
+        """ Returns a new calendar holding the days within this calendar but not within the other one """
+        self._check(other)
+        origin, this, that = self._aligned(other)
+        return self._from_bits(origin, this & ~that)
+
+    def symmetric_difference(self, other: 'DateCalendar') -> 'DateCalendar':
+        """ Returns a new calendar holding the days within exactly one of this calendar and the other one """
+        self._check(other)
+        origin, this, that = self._aligned(other)
+        return self._from_bits(origin, this ^ that)
+
+    def __or__(self, other):
+        if type(other) is not type(self):
+            return NotImplemented
+        return self.union(other)
+
+    def __and__(self, other):
+        if type(other) is not type(self):
+            return NotImplemented
+        return self.intersection(other)
+
+    def __sub__(self, other):
+        if type(other) is not type(self):
+            return NotImplemented
+        return self.difference(other)
+
+    def __xor__(self, other):
+        if type(other) is not type(self):
+            return NotImplemented
+        return self.symmetric_difference(other)
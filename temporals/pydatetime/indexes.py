@@ -0,0 +1,653 @@
+""" Indexes answering which of a large number of periods contain a point in time, overlap or contain a window, or are
+before or after a cutoff, without testing every single one of them
+"""
+from bisect import bisect_left, bisect_right
+from datetime import date, datetime, time
+from itertools import accumulate, compress
+from typing import Iterable, Iterator
+
+from .utils import check_awareness, operand_kind, to_epoch_us, Operand
+
+
+class _Node:
+    """ A node of the interval tree, holding every indexed period with the same start and end; `max_end` is the latest
+    end within the subtree rooted at this node
+    """
+
+    __slots__ = ('start', 'end', 'periods', 'left', 'right', 'height', 'max_end')
+
+    def __init__(self, start, end, periods: list):
+        self.start = start
+        self.end = end
+        self.periods = periods
+        self.left = None
+        self.right = None
+        self.height = 1
+        self.max_end = end
+
+
+def _update(node: _Node) -> None:
+    left = node.left
+    right = node.right
+    height = 0
+    max_end = node.end
+    if left is not None:
+        height = left.height
+        if left.max_end > max_end:
+            max_end = left.max_end
+    if right is not None:
+        if right.height > height:
+            height = right.height
+        if right.max_end > max_end:
+            max_end = right.max_end
+    node.height = height + 1
+    node.max_end = max_end
+
+
+def _height(node: _Node | None) -> int:
+    return 0 if node is None else node.height
+
+
+def _rotate_right(node: _Node) -> _Node:
+    pivot = node.left
+    node.left = pivot.right
+    pivot.right = node
+    _update(node)
+    _update(pivot)
+    return pivot
+
+
+def _rotate_left(node: _Node) -> _Node:
+    pivot = node.right
+    node.right = pivot.left
+    pivot.left = node
+    _update(node)
+    _update(pivot)
+    return pivot
+
+
+def _balance(node: _Node) -> _Node:
+    _update(node)
+    balance = _height(node.left) - _height(node.right)
+    if balance > 1:
+        if _height(node.left.left) < _height(node.left.right):
+            node.left = _rotate_left(node.left)
+        return _rotate_right(node)
+    if balance < -1:
+        if _height(node.right.right) < _height(node.right.left):
+            node.right = _rotate_right(node.right)
+        return _rotate_left(node)
+    return node
+
+
+def _insert(node: _Node | None, start, end, period) -> _Node:
+    if node is None:
+        return _Node(start, end, [period])
+    if start == node.start and end == node.end:
+        node.periods.append(period)
+        return node
+    if (start, end) < (node.start, node.end):
+        node.left = _insert(node.left, start, end, period)
+    else:
+        node.right = _insert(node.right, start, end, period)
+    return _balance(node)
+
+
+def _remove_first(node: _Node) -> tuple[_Node | None, _Node]:
+    """ Detaches the leftmost node of the subtree, returning the new root of the subtree and the detached node """
+    if node.left is None:
+        return node.right, node
+    node.left, first = _remove_first(node.left)
+    return _balance(node), first
+
+
+def _delete(node: _Node | None, start, end, period) -> _Node | None:
+    if node is None or (start == node.start and end == node.end and period not in node.periods):
+        raise ValueError(f"The period '{period}' is not within this index")
+    if start == node.start and end == node.end:
+        node.periods.remove(period)
+        if node.periods:
+            return node
+        if node.left is None:
+            return node.right
+        if node.right is None:
+            return node.left
+        node.right, successor = _remove_first(node.right)
+        successor.left = node.left
+        successor.right = node.right
+        return _balance(successor)
+    if (start, end) < (node.start, node.end):
+        node.left = _delete(node.left, start, end, period)
+    else:
+        node.right = _delete(node.right, start, end, period)
+    return _balance(node)
+
+
+def _build(spans: list, low: int, high: int) -> _Node | None:
+    """ Builds a balanced subtree out of the sorted spans between the two indexes, high excluded """
+    if low >= high:
+        return None
+    middle = (low + high) // 2
+    start, end, periods = spans[middle]
+    node = _Node(start, end, periods)
+    node.left = _build(spans, low, middle)
+    node.right = _build(spans, middle + 1, high)
+    _update(node)
+    return node
+
+
+def _search(root: _Node | None, min_start, max_start, min_end, max_end) -> list:
+    """ Collects, in order, the periods whose start is between `min_start` and `max_start` and whose end is between
+    `min_end` and `max_end`, all inclusive; `min_start` and `max_end` may be None where there is no such bound.
+
+    Subtrees which end before `min_end` are skipped as a whole, as well as those on either side of a node whose start
+    is already out of the bounds, so that only the nodes that may hold a match are visited.
+    """
+    found = []
+    stack = []
+    node = root
+    while stack or node is not None:
+        while node is not None and node.max_end >= min_end:
+            stack.append(node)
+            if min_start is not None and node.start < min_start:
+                # All of the left subtree starts before this node
+                break
+            node = node.left
+        if not stack:
+            break
+        node = stack.pop()
+        start = node.start
+        if (min_start is None or start >= min_start) and start <= max_start:
+            end = node.end
+            if end >= min_end and (max_end is None or end <= max_end):
+                found.extend(node.periods)
+        if start > max_start:
+            # All of the right subtree starts after this node
+            break
+        node = node.right
+    return found
+
+
+class _IntervalTree:
+    """ Base of the interval tree indexes; an AVL tree of the indexed periods ordered by their start and end, where
+    each node also holds the latest end within its subtree. Inserting or removing a period takes O(log n) time; a
+    query skips every subtree which cannot hold a match and takes O(log n) time for each period it returns, where the
+    `within` query also has to visit the periods that start within the window but end after it.
+
+    Subclasses set the type of period they index, `_bounds` returns the values by which the periods are ordered and
+    `_point` converts a point in time to the same kind of value.
+    """
+
+    __slots__ = ('_root', '_size')
+
+    _kind: int = None
+
+    def __init__(self, periods: Iterable = ()):
+        grouped = {}
+        for period in periods:
+            self._check(period)
+            bounds = self._bounds(period)
+            if bounds in grouped:
+                grouped[bounds].append(period)
+            else:
+                grouped[bounds] = [period]
+        spans = sorted((start, end, group) for (start, end), group in grouped.items())
+        self._root = _build(spans, 0, len(spans))
+        self._size = sum(len(group) for group in grouped.values())
+
+    def _check(self, period) -> None:
+        if operand_kind(period) != self._kind:
+            raise TypeError(f"Cannot perform temporal operations with instances of type '{type(period)}'")
+
+    @staticmethod
+    def _bounds(period) -> tuple:
+        return period.start, period.end
+
+    @staticmethod
+    def _point(value: datetime):
+        return value
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __iter__(self) -> Iterator:
+        stack = []
+        node = self._root
+        while stack or node is not None:
+            while node is not None:
+                stack.append(node)
+                node = node.left
+            node = stack.pop()
+            yield from node.periods
+            node = node.right
+
+    def __contains__(self, item) -> bool:
+        """ Test if the period is within this index """
+        self._check(item)
+        start, end = self._bounds(item)
+        node = self._root
+        while node is not None:
+            if start == node.start and end == node.end:
+                return item in node.periods
+            node = node.left if (start, end) < (node.start, node.end) else node.right
+        return False
+
+    def insert(self, period) -> None:
+        """ Adds the period to this index; the same period may be added more than once """
+        self._check(period)
+        start, end = self._bounds(period)
+        self._root = _insert(self._root, start, end, period)
+        self._size += 1
+
+    def remove(self, period) -> None:
+        """ Removes a single occurrence of the period from this index
+
+        Raises:
+            ValueError - raised if the period is not within this index
+        """
+        self._check(period)
+        start, end = self._bounds(period)
+        self._root = _delete(self._root, start, end, period)
+        self._size -= 1
+
+    def stab(self, point: datetime) -> list:
+        """ Returns all periods that contain the point in time, the same way `point in period` would, including those
+        which start or end exactly at it; the periods are sorted by their start
+        """
+        if operand_kind(point) != Operand.DATETIME:
+            raise TypeError(f"Cannot perform temporal operations with instances of type '{type(point)}'")
+        point = self._point(point)
+        return _search(self._root, None, point, point, None)
+
+    def overlapping(self, window) -> list:
+        """ Returns all periods that share any point in time with the window; these are the ones that overlap, meet, or
+        are within one another with it - every period which is neither before nor after it (see `relation`)
+        """
+        self._check(window)
+        start, end = self._bounds(window)
+        return _search(self._root, None, end, start, None)
+
+    def within(self, window) -> list:
+        """ Returns all periods that are within the window, including those that start or end together with it """
+        self._check(window)
+        start, end = self._bounds(window)
+        return _search(self._root, start, end, start, end)
+
+    def containing(self, window) -> list:
+        """ Returns all periods that contain the window, including those that start or end together with it """
+        self._check(window)
+        start, end = self._bounds(window)
+        return _search(self._root, None, start, end, None)
+
+
+class WallClockPeriodIndex(_IntervalTree):
+    """ An interval tree of WallClockPeriods """
+
+    __slots__ = ()
+
+    _kind = Operand.WALLCLOCK_PERIOD
+
+
+class AbsolutePeriodIndex(_IntervalTree):
+    """ An interval tree of AbsolutePeriods; the periods are ordered by the moments in time they represent, so periods
+    and points in time set in different timezones are compared correctly. The same as naive and aware datetimes cannot
+    be compared, naive and aware periods are not indexed together, and an index of either kind raises a TypeError for
+    periods and points in time of the other kind.
+    """
+
+    __slots__ = ()
+
+    _kind = Operand.ABSOLUTE_PERIOD
+
+    def __init__(self, periods: Iterable = ()):
+        self._root = None
+        super().__init__(periods)
+        if self._root is not None:
+            reference = self._root.periods[0].start
+            for period in self:
+                check_awareness(reference, period.start)
+
+    def _check(self, period) -> None:
+        super()._check(period)
+        self._check_awareness(period.start)
+
+    def _check_awareness(self, value: datetime) -> None:
+        """ The epochs the periods are ordered by take naive datetimes to be in UTC, so they may only be compared with
+        those of datetimes of the same kind as the ones of the indexed periods
+        """
+        if self._root is not None:
+            check_awareness(self._root.periods[0].start, value)
+
+    @staticmethod
+    def _bounds(period) -> tuple:
+        return period.start_epoch_us, period.end_epoch_us
+
+    def _point(self, value: datetime) -> int:
+        self._check_awareness(value)
+        return to_epoch_us(value)
+
+
+class DatePeriodIndex:
+    """ A read-optimized index of DatePeriods; the periods are kept in arrays sorted by their start, along with the
+    latest end among the periods up to each position, and in a second array sorted by their end. Every query is
+    answered by bisecting these arrays and follows the semantics of DatePeriod, where both the start and end dates
+    belong to the period:
+
+    >>> index = DatePeriodIndex(subscriptions)
+    >>> index.overlapping(DatePeriod(start=date(2024, 3, 1), end=date(2024, 3, 31)))
+
+    returns every subscription that includes at least one day of March, including those which end on the first or
+    start on the last day of it.
+
+    The index does not change once created; create a new one to add or remove periods.
+    """
+
+    __slots__ = ('_periods', '_starts', '_ends', '_max_ends', '_by_end', '_sorted_ends')
+
+    def __init__(self, periods: Iterable = ()):
+        periods = list(periods)
+        for period in periods:
+            if operand_kind(period) != Operand.DATE_PERIOD:
+                raise TypeError(f"Cannot perform temporal operations with instances of type '{type(period)}'")
+        periods.sort(key=_period_bounds)
+        self._periods = periods
+        self._starts = [period.start for period in periods]
+        self._ends = [period.end for period in periods]
+        # The ends of the periods sorted by start do not grow steadily; the latest end up to each position does, and
+        # the first position reaching a date is found by bisecting it
+        self._max_ends = list(accumulate(self._ends, max))
+        self._by_end = sorted(periods, key=_period_end)
+        self._sorted_ends = [period.end for period in self._by_end]
+
+    def __len__(self) -> int:
+        return len(self._periods)
+
+    def __iter__(self) -> Iterator:
+        return iter(self._periods)
+
+    def _search(self, first: date, last: date) -> list:
+        """ Returns the periods which include any date from the first to the last one, both included """
+        ends = self._ends
+        periods = self._periods
+        low = bisect_left(self._max_ends, first)
+        high = bisect_right(self._starts, last)
+        return [periods[i] for i in range(low, high) if ends[i] >= first]
+
+    def stab(self, point: date | datetime) -> list:
+        """ Returns the periods which include the date, the same way `point in period` would; for a datetime, only its
+        date is considered. The periods are sorted by their start.
+        """
+        kind = operand_kind(point)
+        if kind == Operand.DATETIME:
+            point = point.date()
+        elif kind != Operand.DATE:
+            raise TypeError(f"Cannot perform temporal operations with instances of type '{type(point)}'")
+        return self._search(point, point)
+
+    def overlapping(self, window) -> list:
+        """ Returns the periods which share at least one date with the window, which may be a DatePeriod or, in which
+        case only the dates of its start and end are considered, a wallclock or absolute period; these are the periods
+        that are neither before nor after the window (see `relation`). The periods are sorted by their start.
+        """
+        kind = operand_kind(window)
+        if kind == Operand.DATE_PERIOD:
+            return self._search(window.start, window.end)
+        if kind == Operand.WALLCLOCK_PERIOD or kind == Operand.ABSOLUTE_PERIOD:
+            return self._search(window.start.date(), window.end.date())
+        raise TypeError(f"Cannot perform temporal operations with instances of type '{type(window)}'")
+
+    def before(self, other) -> list:
+        """ Returns the periods for which `period.is_before(other)` is True, that is to say, the periods which end
+        before the date on which the other period starts, or before the date of the point in time. The periods are
+        sorted by their end.
+        """
+        return self._by_end[:bisect_left(self._sorted_ends, _cutoff(other, 'start'))]
+
+    def after(self, other) -> list:
+        """ Returns the periods for which `period.is_after(other)` is True, that is to say, the periods which start
+        after the date on which the other period ends, or after the date of the point in time. The periods are sorted
+        by their start.
+        """
+        return self._periods[bisect_right(self._starts, _cutoff(other, 'end')):]
+
+
+def _period_bounds(period) -> tuple:
+    return period.start, period.end
+
+
+def _period_end(period) -> date:
+    return period.end
+
+
+def _cutoff(other, attribute: str) -> date:
+    """ Resolves the date which the periods are compared against by DatePeriod's `is_before` and `is_after` """
+    kind = operand_kind(other)
+    if kind == Operand.DATE_PERIOD:
+        return getattr(other, attribute)
+    if kind == Operand.WALLCLOCK_PERIOD or kind == Operand.ABSOLUTE_PERIOD:
+        return getattr(other, attribute).date()
+    if kind == Operand.DATETIME:
+        return other.date()
+    if kind == Operand.DATE:
+        return other
+    raise TypeError(f"Cannot perform temporal operations with instances of type '{type(other)}'")
+
+
+class _Timeline:
+    """ Base of the timelines; a timeline holds periods sorted by their start and, separately, by their end, finding
+    the period closest to a point in time on either side of it by bisecting these in O(log n) time. The lookups follow
+    the `is_before` and `is_after` semantics of the periods, where a period ending at a point in time is before it and
+    a period starting at it is after it.
+
+    Subclasses set the type of period they hold, `_bounds` returns the values by which the periods are ordered and
+    `_point` converts a point in time to the same kind of value.
+
+    The timeline does not change once created; create a new one to add or remove periods.
+    """
+
+    __slots__ = ('_periods', '_starts', '_by_end', '_ends')
+
+    _kind: int = None
+
+    def __init__(self, periods: Iterable = ()):
+        spans = []
+        for period in periods:
+            if operand_kind(period) != self._kind:
+                raise TypeError(f"Cannot perform temporal operations with instances of type '{type(period)}'")
+            start, end = self._bounds(period)
+            spans.append((start, end, period))
+        spans.sort(key=_span_bounds)
+        self._periods = [span[2] for span in spans]
+        self._starts = [span[0] for span in spans]
+        spans.sort(key=_span_end)
+        self._by_end = [span[2] for span in spans]
+        self._ends = [span[1] for span in spans]
+
+    @staticmethod
+    def _bounds(period) -> tuple:
+        return period.start, period.end
+
+    @staticmethod
+    def _point(value: datetime):
+        return value
+
+    def _cutoff(self, other, attribute: str):
+        """ Resolves the value the periods are compared against, which is the point in time itself or, as with
+        `is_before` and `is_after`, either the start or the end of a period
+        """
+        kind = operand_kind(other)
+        if kind == Operand.DATETIME:
+            return self._point(other)
+        if kind == self._kind:
+            start, end = self._bounds(other)
+            return start if attribute == 'start' else end
+        raise TypeError(f"Cannot perform temporal operations with instances of type '{type(other)}'")
+
+    def __len__(self) -> int:
+        return len(self._periods)
+
+    def __iter__(self) -> Iterator:
+        return iter(self._periods)
+
+    def next_start(self, other):
+        """ Returns the period starting first among those for which `period.is_after(other)` is True, that is to say,
+        the first period starting at or after the point in time, or the end of the other period; None is returned if
+        there is no such period
+        """
+        index = bisect_left(self._starts, self._cutoff(other, 'end'))
+        return self._periods[index] if index < len(self._periods) else None
+
+    def previous_start(self, other):
+        """ Returns the period starting last among those which have started before the point in time, or the end of the
+        other period, and are therefore not after it; None is returned if there is no such period
+        """
+        index = bisect_left(self._starts, self._cutoff(other, 'end'))
+        return self._periods[index - 1] if index else None
+
+    def next_end(self, other):
+        """ Returns the period ending first among those which end after the point in time, or the start of the other
+        period, and are therefore not before it; None is returned if there is no such period
+        """
+        index = bisect_right(self._ends, self._cutoff(other, 'start'))
+        return self._by_end[index] if index < len(self._by_end) else None
+
+    def previous_end(self, other):
+        """ Returns the period ending last among those for which `period.is_before(other)` is True, that is to say,
+        the last period ending at or before the point in time, or the start of the other period; None is returned if
+        there is no such period
+        """
+        index = bisect_right(self._ends, self._cutoff(other, 'start'))
+        return self._by_end[index - 1] if index else None
+
+
+def _span_bounds(span: tuple) -> tuple:
+    return span[0], span[1]
+
+
+def _span_end(span: tuple):
+    return span[1]
+
+
+class WallClockTimeline(_Timeline):
+    """ A timeline of WallClockPeriods:
+
+    >>> timeline = WallClockTimeline(windows)
+    >>> timeline.next_start(now)  # The next scheduled window
+    >>> timeline.previous_end(now)  # The last window that has ended
+    """
+
+    __slots__ = ()
+
+    _kind = Operand.WALLCLOCK_PERIOD
+
+
+class AbsoluteTimeline(_Timeline):
+    """ A timeline of AbsolutePeriods; the periods are ordered by the moments in time they represent, so periods and
+    points in time set in different timezones are compared correctly. The same as naive and aware datetimes cannot be
+    compared, naive and aware periods are not held together, and a timeline of either kind raises a TypeError for
+    periods and points in time of the other kind.
+    """
+
+    __slots__ = ()
+
+    _kind = Operand.ABSOLUTE_PERIOD
+
+    def __init__(self, periods: Iterable = ()):
+        super().__init__(periods)
+        for period in self._periods:
+            check_awareness(self._periods[0].start, period.start)
+
+    def _cutoff(self, other, attribute: str):
+        cutoff = super()._cutoff(other, attribute)
+        if self._periods:
+            # The epochs the periods are ordered by take naive datetimes to be in UTC
+            check_awareness(self._periods[0].start, other if operand_kind(other) == Operand.DATETIME else other.start)
+        return cutoff
+
+    @staticmethod
+    def _bounds(period) -> tuple:
+        return period.start_epoch_us, period.end_epoch_us
+
+    @staticmethod
+    def _point(value: datetime) -> int:
+        return to_epoch_us(value)
+
+
+class TimePeriodIndex:
+    """ An index of TimePeriods answering which of them contain a time of the day. Since every TimePeriod lies within
+    a single day, the day is split once, at every start and end of the periods, into runs of time during which the same
+    number of periods is active: the boundaries themselves, which belong to the periods starting and ending at them as
+    well as those spanning over them, and the spans between two consecutive boundaries. Testing if any period contains
+    a time then takes a bisection of the boundaries, in O(log b) time for the b distinct boundaries, to find the run it
+    belongs to.
+
+    >>> opening_hours = TimePeriodIndex(stores)
+    >>> opening_hours.covers(time(21, 30))  # Is any store open?
+    >>> opening_hours.stab(time(21, 30))  # Which stores are open?
+
+    The periods which contain a time are found the same way as with a DatePeriodIndex, by bisecting the periods sorted
+    by their start along with the latest end among the periods up to each position. Creating the index takes
+    O(n log n) time and O(n) memory. The index does not change once created; create a new one to add or remove periods.
+    """
+
+    __slots__ = ('_boundaries', '_covered', '_periods', '_starts', '_ends', '_max_ends')
+
+    def __init__(self, periods: Iterable = ()):
+        spans = []
+        for period in periods:
+            if operand_kind(period) != Operand.TIME_PERIOD:
+                raise TypeError(f"Cannot perform temporal operations with instances of type '{type(period)}'")
+            spans.append((_time_us(period.start), _time_us(period.end), period))
+        spans.sort(key=_span_bounds)
+        self._periods = [span[2] for span in spans]
+        self._starts = [span[0] for span in spans]
+        self._ends = [span[1] for span in spans]
+        self._max_ends = list(accumulate(self._ends, max))
+        self._boundaries = sorted({key for start, end, _ in spans for key in (start, end)})
+        positions = {key: position for position, key in enumerate(self._boundaries)}
+        # Run 2 * i is the boundary at position i and run 2 * i + 1 the span from it until the next boundary; a period
+        # is counted from the run of its start until the run of its end, both included
+        changes = [0] * (2 * len(self._boundaries))
+        for start, end, _ in spans:
+            changes[2 * positions[start]] += 1
+            changes[2 * positions[end] + 1] -= 1
+        self._covered = [count > 0 for count in accumulate(changes[:-1])]
+
+    def __len__(self) -> int:
+        return len(self._periods)
+
+    @staticmethod
+    def _key(point: time | datetime) -> int:
+        """ Converts the time, or the time of the datetime, to microseconds since midnight """
+        kind = operand_kind(point)
+        if kind == Operand.DATETIME:
+            point = point.time()
+        elif kind != Operand.TIME:
+            raise TypeError(f"Cannot perform temporal operations with instances of type '{type(point)}'")
+        return _time_us(point)
+
+    def stab(self, point: time | datetime) -> list:
+        """ Returns the periods which contain the time, the same way `point in period` would, including those which
+        start or end exactly at it; for a datetime, only its time is considered. The periods are sorted by their start.
+        """
+        key = self._key(point)
+        low = bisect_left(self._max_ends, key)
+        high = bisect_right(self._starts, key)
+        # The periods between the two positions have started by the time, those of them which end at or after it
+        # contain it
+        return list(compress(self._periods[low:high], map(key.__le__, self._ends[low:high])))
+
+    def covers(self, point: time | datetime) -> bool:
+        """ Test if any of the periods contains the time """
+        key = self._key(point)
+        boundaries = self._boundaries
+        position = bisect_left(boundaries, key)
+        if position < len(boundaries) and boundaries[position] == key:
+            return self._covered[2 * position]
+        if position == 0 or position == len(boundaries):
+            return False
+        return self._covered[2 * position - 1]
+
+
+def _time_us(value: time) -> int:
+    return ((value.hour * 60 + value.minute) * 60 + value.second) * 1000000 + value.microsecond
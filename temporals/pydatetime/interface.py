@@ -3,10 +3,13 @@ from zoneinfo import ZoneInfo
 from temporals.interfaces import AbstractTimePeriod, AbstractDatePeriod, AbstractAbsolutePeriod, AbstractWallClockPeriod
 from abc import ABC, abstractmethod
 from datetime import time, date, datetime
+from .utils import to_epoch_us
 
 
 class PyTimePeriod(AbstractTimePeriod, ABC):
 
+    __slots__ = ()
+
     @property
     @abstractmethod
     def start(self) -> time:
@@ -55,6 +58,8 @@ class PyTimePeriod(AbstractTimePeriod, ABC):
 
 class PyDatePeriod(AbstractDatePeriod, ABC):
 
+    __slots__ = ()
+
     @property
     @abstractmethod
     def start(self) -> date:
@@ -103,6 +108,8 @@ class PyDatePeriod(AbstractDatePeriod, ABC):
 
 class PyWallClockPeriod(AbstractWallClockPeriod, ABC):
 
+    __slots__ = ()
+
     @property
     @abstractmethod
     def start(self) -> datetime:
@@ -147,6 +154,8 @@ class PyWallClockPeriod(AbstractWallClockPeriod, ABC):
 
 class PyAbsolutePeriod(AbstractAbsolutePeriod, ABC):
 
+    __slots__ = ()
+
     @property
     @abstractmethod
     def start(self) -> datetime:
@@ -157,6 +166,18 @@ class PyAbsolutePeriod(AbstractAbsolutePeriod, ABC):
     def end(self) -> datetime:
         ...
 
+    @property
+    def start_epoch_us(self) -> int:
+        """ The start of the period as microseconds since the UTC epoch, naive datetimes being taken as UTC;
+        implementations are encouraged to precompute it, since it is what the instants of periods are compared by
+        """
+        return to_epoch_us(self.start)
+
+    @property
+    def end_epoch_us(self) -> int:
+        """ The end of the period as microseconds since the UTC epoch, naive datetimes being taken as UTC """
+        return to_epoch_us(self.end)
+
     @abstractmethod
     def is_before(self, other: 'PyDatePeriod' | 'PyAbsolutePeriod' | date | datetime) -> bool:
         ...
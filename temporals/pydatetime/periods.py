@@ -4,8 +4,140 @@ from zoneinfo import ZoneInfo
 from datetime import time, date, datetime, timedelta
 from temporals.interfaces import AbstractDuration
 from temporals.duration import Duration
-from .utils import check_existence
+from .utils import check_awareness, check_existence, operand_kind, to_epoch_us, whole_months, Operand
 from temporals.exceptions import TimeAmbiguityError
+from temporals.relations import Relation
+
+# The relations are compared by identity by every overlap check, binding them to module globals spares the attribute
+# lookup on the Enum class each time
+_BEFORE = Relation.BEFORE
+_MEETS = Relation.MEETS
+_OVERLAPS = Relation.OVERLAPS
+_STARTS = Relation.STARTS
+_DURING = Relation.DURING
+_FINISHES = Relation.FINISHES
+_EQUALS = Relation.EQUALS
+_FINISHED_BY = Relation.FINISHED_BY
+_CONTAINS = Relation.CONTAINS
+_STARTED_BY = Relation.STARTED_BY
+_OVERLAPPED_BY = Relation.OVERLAPPED_BY
+_MET_BY = Relation.MET_BY
+_AFTER = Relation.AFTER
+
+_DAY_US = 86400 * 1000000
+
+
+def _classify(start, end, other_start, other_end) -> Relation:
+    """ Classifies the span between `start` and `end` against the one between `other_start` and `other_end` as one of
+    Allen's interval relations, with at most four comparisons. The ends are compared as points, so spans sharing an end
+    meet rather than overlap.
+
+    Either span may also be a single point (its start equal to its end), which is the case for a wallclock or absolute
+    period starting and ending on the same day once reduced to its dates; the ends are compared for equality first, so
+    that such a point is never considered to meet or overlap the span on whose edge it lies.
+    """
+    if start == other_start:
+        if end == other_end:
+            return _EQUALS
+        return _STARTS if end < other_end else _STARTED_BY
+    if end == other_end:
+        return _FINISHES if other_start < start else _FINISHED_BY
+    if start < other_start:
+        if end < other_start:
+            return _BEFORE
+        if end == other_start:
+            return _MEETS
+        return _OVERLAPS if end < other_end else _CONTAINS
+    if other_end < start:
+        return _AFTER
+    if other_end == start:
+        return _MET_BY
+    return _OVERLAPPED_BY if other_end < end else _DURING
+
+
+def _time_of_day_us(value: time | datetime) -> int:
+    return ((value.hour * 60 + value.minute) * 60 + value.second) * 1000000 + value.microsecond
+
+
+def _time_relation(period: interface.PyWallClockPeriod | interface.PyAbsolutePeriod,
+                   time_period: interface.PyTimePeriod
+                   ) -> Relation:
+    """ Classifies a wallclock or absolute period against a TimePeriod by the time of day of their starts and ends.
+
+    A period which ends on the same day it starts is classified by its times directly. Otherwise, the period is laid out
+    on a continuous time axis beginning at the midnight of its start date and the TimePeriod is placed on each day the
+    period spans; the relation is the one of the only placement which meets, overlaps or is within the period, or the
+    one of the placement on the start date if there is no such placement.
+
+    Raises:
+        TimeAmbiguityError - raised if the TimePeriod meets, overlaps or is within the period on more than one day
+    """
+    start = period.start
+    end = period.end
+    days = end.toordinal() - start.toordinal()
+    if days == 0:
+        return _classify(start.time(), end.time(), time_period.start, time_period.end)
+    this_start = _time_of_day_us(start)
+    this_end = days * _DAY_US + _time_of_day_us(end)
+    other_start = _time_of_day_us(time_period.start)
+    other_end = _time_of_day_us(time_period.end)
+    found = None
+    # Every day but the first and the last one is entirely covered by the period, hence the loop raises by the third
+    # day at the latest
+    for day in range(days + 1):
+        relation = _classify(this_start, this_end, other_start + day * _DAY_US, other_end + day * _DAY_US)
+        if relation is not _BEFORE and relation is not _AFTER:
+            if found is not None:
+                raise TimeAmbiguityError(f"The provided TimePeriod ('{time_period}') is ambiguous compared to the "
+                                         f"period ('{period}') as it relates to it on more than one day. For more "
+                                         f"information on this error, see "
+                                         f"https://github.com/dimitarOnGithub/temporals/wiki/Errors")
+            found = relation
+    if found is None:
+        return _classify(this_start, this_end, other_start, other_end)
+    return found
+
+
+def _time_overlaps(period: interface.PyWallClockPeriod | interface.PyAbsolutePeriod,
+                   time_period: interface.PyTimePeriod
+                   ) -> tuple[bool | None, bool | None]:
+    """ Checks, in a single pass, whether a wallclock or absolute period overlaps with a TimePeriod which starts before
+    it and whether it is overlapped by a TimePeriod which starts after it, comparing the TimePeriod to the times of the
+    start and end of the period. Either of the two is None if the period stretches overnight and the TimePeriod could be
+    starting before or after it, depending on which of its days the TimePeriod is placed on.
+
+    Raises:
+        TimeAmbiguityError - raised if the TimePeriod exists within the period more than once
+    """
+    if period._time_repeats(time_period):
+        raise TimeAmbiguityError(f"The provided TimePeriod '{time_period}' exist within this period ('{period}') more "
+                                 f"than once. For more information on this error, see "
+                                 f"https://github.com/dimitarOnGithub/temporals/wiki/Errors")
+    this_start = period.start.time()
+    this_end = period.end.time()
+    other_start = time_period.start
+    other_end = time_period.end
+    if period.start.date() < period.end.date():
+        overlaps = None
+        if not (other_start < this_start and other_start < this_end):
+            overlaps = not other_end < this_start and other_start <= this_start
+        overlapped = None
+        if not (this_start < other_start and this_end < other_end):
+            overlapped = not this_end < other_start and this_start <= other_start
+        return overlaps, overlapped
+    return ((not other_end < this_start and other_start < this_start and other_end < this_end),
+            (not this_end < other_start and this_start < other_start and this_end < other_end))
+
+
+def _time_ambiguity(period: interface.PyWallClockPeriod | interface.PyAbsolutePeriod,
+                    time_period: interface.PyTimePeriod
+                    ) -> TimeAmbiguityError:
+    return TimeAmbiguityError(f"The provided TimePeriod ('{time_period}') is ambiguous compared to this period "
+                              f"('{period}'); it either starts before or after this period, depending on whether it is "
+                              f"placed on {period.start.date().isoformat()} or on {period.end.date().isoformat()}. "
+                              f"For more information on this error, see "
+                              f"https://github.com/dimitarOnGithub/temporals/wiki/Errors")
+
 
 
 class TimePeriod(interface.PyTimePeriod):
@@ -14,6 +146,8 @@ class TimePeriod(interface.PyTimePeriod):
     below.
     """
 
+    __slots__ = ('_start', '_end', '_duration')
+
     def __init__(self,
                  start: time,
                  end: time,
@@ -27,6 +161,43 @@ class TimePeriod(interface.PyTimePeriod):
                              f"end={end}")
         self._start = start
         self._end = end
+        self._duration = None
+
+    @classmethod
+    def from_validated(cls, start: time, end: time) -> 'TimePeriod':
+        """ Creates a new instance from values that are already known to be valid, skipping all the checks performed
+        by the constructor. This is the path used internally for periods derived from other, already validated,
+        periods and it is intended for bulk loaders that restore periods which have been validated before.
+
+        No validation whatsoever is done here: both `start` and `end` must be instances of datetime.time and `start`
+        must be before `end`; providing anything else results in an instance whose behaviour is undefined.
+        """
+        period = cls.__new__(cls)
+        period._start = start
+        period._end = end
+        period._duration = None
+        return period
+
+    @property
+    def start(self):
+        return self._start
+
+    @property
+    def end(self):
+        return self._end
+
+    @property
+    def duration(self) -> AbstractDuration:
+        if self._duration is None:
+            self._duration = self._compute_duration()
+        return self._duration
+
+    def _compute_duration(self) -> Duration:
+        """ Internal method that decomposes the span of this period into a Duration; it is invoked on the first access
+        of the `duration` property and the result is kept for the lifetime of this instance.
+        """
+        start = self._start
+        end = self._end
         # OOTB datetime.time does not support operations, so we'll turn it into a timedelta
         _start = timedelta(hours=start.hour,
                            minutes=start.minute,
@@ -47,20 +218,8 @@ class TimePeriod(interface.PyTimePeriod):
             minutes = 60 + minutes
         if hours < 0:
             hours = 0
-        self._duration = Duration(total_seconds=total, years=0, months=0, days=0, hours=hours, minutes=minutes,
-                                  seconds=seconds)
-
-    @property
-    def start(self):
-        return self._start
-
-    @property
-    def end(self):
-        return self._end
-
-    @property
-    def duration(self) -> AbstractDuration:
-        return self._duration
+        return Duration(total_seconds=total, years=0, months=0, days=0, hours=hours, minutes=minutes,
+                        seconds=seconds)
 
     def __str__(self):
         return f"{self.start.isoformat()}/{self.end.isoformat()}"
@@ -77,14 +236,61 @@ class TimePeriod(interface.PyTimePeriod):
             get_overlap
             get_disconnect
         """
-        if isinstance(other, interface.PyAbsolutePeriod) or isinstance(other, interface.PyWallClockPeriod):
-            return (self.start == other.start.time()
-                    and self.end == other.end.time())
-        if isinstance(other, interface.PyTimePeriod):
+        kind = operand_kind(other)
+        if kind == Operand.TIME_PERIOD:
             return (self.start == other.start
                     and self.end == other.end)
+        if kind == Operand.WALLCLOCK_PERIOD or kind == Operand.ABSOLUTE_PERIOD:
+            return (self.start == other.start.time()
+                    and self.end == other.end.time())
         return False
 
+    def __hash__(self):
+        """ The hash is computed from the start and end times of the period, which keeps it consistent with the
+        equality between two instances of this class and allows periods to be used as dictionary keys, in sets or in
+        memoization caches.
+
+        Equality with the wallclock and absolute periods classes (see __eq__ above) only compares the time of their
+        start and end, so a TimePeriod may be equal to such a period without sharing its hash; mixing different period
+        types within the same set or as keys of the same dictionary will therefore not de-duplicate them.
+        """
+        return hash((self._start, self._end))
+
+    def __lt__(self, other):
+        """ Instances of this class are ordered by their start times and, for periods starting at the same
+        moment, by their end times, the shorter of the two periods sorting first. This natural order allows lists of
+        periods to be sorted, merged or searched directly with `sorted`, `heapq` and `bisect`, without a key function.
+
+        Ordering is only defined between instances of the same period kind; comparing with any other object results in
+        a TypeError, as it does with the rest of the built-in types.
+        """
+        if operand_kind(other) != Operand.TIME_PERIOD:
+            return NotImplemented
+        if self._start != other.start:
+            return self._start < other.start
+        return self._end < other.end
+
+    def __le__(self, other):
+        if operand_kind(other) != Operand.TIME_PERIOD:
+            return NotImplemented
+        if self._start != other.start:
+            return self._start < other.start
+        return self._end <= other.end
+
+    def __gt__(self, other):
+        if operand_kind(other) != Operand.TIME_PERIOD:
+            return NotImplemented
+        if self._start != other.start:
+            return self._start > other.start
+        return self._end > other.end
+
+    def __ge__(self, other):
+        if operand_kind(other) != Operand.TIME_PERIOD:
+            return NotImplemented
+        if self._start != other.start:
+            return self._start > other.start
+        return self._end >= other.end
+
     def __contains__(self, item):
         """ Membership test can be done with instances of this class, the wallclock or absolute periods classes,
         datetime.datetime and datetime.time objects; When membership test is done for a period, it assumes that the
@@ -115,18 +321,19 @@ class TimePeriod(interface.PyTimePeriod):
             overlap
             disconnect
         """
-        _start = None
-        _end = None
-        if isinstance(item, interface.PyTimePeriod):
+        kind = operand_kind(item)
+        if kind == Operand.TIME:
+            return self.start <= item <= self.end
+        if kind == Operand.DATETIME:
+            return self.start <= item.time() <= self.end
+        if kind == Operand.TIME_PERIOD:
             _start = item.start
             _end = item.end
-        if isinstance(item, interface.PyAbsolutePeriod) or isinstance(item, interface.PyWallClockPeriod):
+        elif kind == Operand.WALLCLOCK_PERIOD or kind == Operand.ABSOLUTE_PERIOD:
             _start = item.start.time()
             _end = item.end.time()
-        if isinstance(item, datetime):
-            item = item.time()
-        if isinstance(item, time):
-            return self.start <= item <= self.end
+        else:
+            raise TypeError(f"Cannot perform temporal operations with instances of type '{type(item)}'")
         if self.start == _start and self.end == _end:
             return False
         return self.start <= _start and _end <= self.end
@@ -147,9 +354,10 @@ class TimePeriod(interface.PyTimePeriod):
                                 |====|
                               1500  1700
         """
-        if isinstance(other, time):
+        kind = operand_kind(other)
+        if kind == Operand.TIME:
             return self.end <= other
-        elif isinstance(other, interface.PyTimePeriod):
+        elif kind == Operand.TIME_PERIOD:
             return self.end <= other.start
         return False
 
@@ -170,9 +378,10 @@ class TimePeriod(interface.PyTimePeriod):
           0700    0900
 
         """
-        if isinstance(other, time):
+        kind = operand_kind(other)
+        if kind == Operand.TIME:
             return other <= self.start
-        elif isinstance(other, interface.PyTimePeriod):
+        elif kind == Operand.TIME_PERIOD:
             return other.end <= self.start
         return False
 
@@ -194,23 +403,83 @@ class TimePeriod(interface.PyTimePeriod):
         """
         _start = None
         _end = None
-        if isinstance(other, time):
+        kind = operand_kind(other)
+        if kind == Operand.TIME:
             if self.is_before(other):
                 _start = self.end
                 _end = other
             elif self.is_after(other):
                 _start = other
                 _end = self.start
-        elif isinstance(other, interface.PyTimePeriod):
+        elif kind == Operand.TIME_PERIOD:
             if self.is_before(other):
                 _start = self.end
                 _end = other.start
             elif self.is_after(other):
                 _start = other.end
                 _end = self.start
+            # Both values come from already validated periods; there is no interim between periods that touch
+            if _start is not None and _start < _end:
+                return TimePeriod.from_validated(start=_start, end=_end)
+            return None
         if _start and _end:
             return TimePeriod(start=_start, end=_end)
 
+    def relation(self,
+                 other: interface.PyTimePeriod | interface.PyAbsolutePeriod | interface.PyWallClockPeriod
+                 ) -> Relation:
+        """ Returns the relation of this period to the other one, as one of the thirteen relations of Allen's interval
+        algebra (see temporals.relations.Relation), classified with a single pass over the start and end of the two
+        periods. A period ending exactly when the other one starts meets it, rather than overlapping it:
+
+        >>> this_period.relation(other_period)
+        <Relation.OVERLAPS: 'overlaps'>
+
+        When the other period is a wallclock or absolute one, only the times of its start and end are considered; if it
+        spans more than a single day, this period is placed on each of these days and it is classified on the only day
+        it meets, overlaps or is within the other period.
+
+        Raises:
+            TypeError - raised if the other object is not a TimePeriod, a wallclock or an absolute period
+            TimeAmbiguityError - raised if the other period spans more than a day and this period meets, overlaps or
+                is within it on more than one of them
+        """
+        relation = self._relate(other, operand_kind(other))
+        if relation is None:
+            raise TypeError(f"Cannot perform temporal operations with instances of type '{type(other)}'")
+        return relation
+
+    def _relate(self, other, kind: int) -> Relation | None:
+        """ Internal method that classifies the other period, which is of the provided operand kind, against this one;
+        None is returned for objects which this period cannot relate to
+        """
+        if kind == Operand.TIME_PERIOD:
+            return _classify(self._start, self._end, other.start, other.end)
+        if kind == Operand.WALLCLOCK_PERIOD or kind == Operand.ABSOLUTE_PERIOD:
+            return _time_relation(other, self).inverse
+        return None
+
+    def _relate_times(self, other, kind: int) -> tuple[Relation | None, time, time]:
+        """ Internal method that classifies the other period, which is of the provided operand kind, against this one by
+        the times of its start and end alone, which are returned along with the relation. The relation is None for a
+        wallclock or absolute period which does not end at a later time than it starts, as it cannot be placed within a
+        single day
+
+        Raises:
+            TypeError - raised if the other object is not a TimePeriod, a wallclock or an absolute period
+        """
+        if kind == Operand.TIME_PERIOD:
+            other_start = other.start
+            other_end = other.end
+        elif kind == Operand.WALLCLOCK_PERIOD or kind == Operand.ABSOLUTE_PERIOD:
+            other_start = other.start.time()
+            other_end = other.end.time()
+        else:
+            raise TypeError(f"Cannot perform temporal operations with instances of type '{type(other)}'")
+        if other_start < other_end:
+            return _classify(self._start, self._end, other_start, other_end), other_start, other_end
+        return None, other_start, other_end
+
     def overlaps_with(self,
                       other: interface.PyTimePeriod | interface.PyAbsolutePeriod | interface.PyWallClockPeriod
                       ) -> bool:
@@ -240,18 +509,16 @@ class TimePeriod(interface.PyTimePeriod):
         Note that both of these checks will only work for partially overlapping periods - for fully overlapping periods,
         use the `in` membership test:
         >>> this_period in other_period
+
+        In terms of `relation`, this is the case when it returns Relation.OVERLAPPED_BY or Relation.MET_BY. Wallclock
+        and absolute periods are compared by the times of their start and end alone, as if both periods were set on the
+        same day.
+
+        Raises:
+            TypeError - raised if the other object is not a TimePeriod, a wallclock or an absolute period
         """
-        other_start: time = None  # type: ignore
-        other_end: time = None  # type: ignore
-        if isinstance(other, interface.PyTimePeriod):
-            other_start = other.start
-            other_end = other.end
-        if isinstance(other, interface.PyAbsolutePeriod) or isinstance(other, interface.PyWallClockPeriod):
-            other_start = other.start.time()
-            other_end = other.end.time()
-        if not other_end < self.start and other_start < self.start and other_end < self.end:
-            return True
-        return False
+        relation = self._relate_times(other, operand_kind(other))[0]
+        return relation is _OVERLAPPED_BY or relation is _MET_BY
 
     def overlapped_by(self,
                       other: interface.PyTimePeriod | interface.PyAbsolutePeriod | interface.PyWallClockPeriod
@@ -281,18 +548,16 @@ class TimePeriod(interface.PyTimePeriod):
         Note that both of these checks will only work for partially overlapping periods - for fully overlapping periods,
         use the `in` membership test:
         >>> this_period in other_period
+
+        In terms of `relation`, this is the case when it returns Relation.OVERLAPS or Relation.MEETS. Wallclock and
+        absolute periods are compared by the times of their start and end alone, as if both periods were set on the
+        same day.
+
+        Raises:
+            TypeError - raised if the other object is not a TimePeriod, a wallclock or an absolute period
         """
-        other_start: time = None  # type: ignore
-        other_end: time = None  # type: ignore
-        if isinstance(other, interface.PyTimePeriod):
-            other_start = other.start
-            other_end = other.end
-        if isinstance(other, interface.PyAbsolutePeriod) or isinstance(other, interface.PyWallClockPeriod):
-            other_start = other.start.time()
-            other_end = other.end.time()
-        if not self.end < other_start and self.start < other_start and self.end < other_end:
-            return True
-        return False
+        relation = self._relate_times(other, operand_kind(other))[0]
+        return relation is _OVERLAPS or relation is _MEETS
 
     def get_overlap(self,
                     other: interface.PyTimePeriod | interface.PyAbsolutePeriod | interface.PyWallClockPeriod
@@ -333,20 +598,15 @@ class TimePeriod(interface.PyTimePeriod):
         result:
         >>> period2.get_overlap(period1)
         TimePeriod(start=datetime.time(10, 0), end=datetime.time(12, 0))
+
+        Raises:
+            TypeError - raised if the other object is not a TimePeriod, a wallclock or an absolute period
         """
-        if (not isinstance(other, interface.PyTimePeriod)
-                and (not isinstance(other, interface.PyAbsolutePeriod)
-                     and not isinstance(other, interface.PyWallClockPeriod))
-                ):
-            raise TypeError(f"Cannot perform temporal operations with instances of type '{type(other)}'")
-        if isinstance(other, interface.PyTimePeriod):
-            return other.get_overlap(self)
-        if self.overlaps_with(other):
-            end_time = other.end if isinstance(other, interface.PyTimePeriod) else other.end.time()
-            return TimePeriod(start=self.start, end=end_time)
-        elif self.overlapped_by(other):
-            start_time = other.start if isinstance(other, interface.PyTimePeriod) else other.start.time()
-            return TimePeriod(start=start_time, end=self.end)
+        relation, other_start, other_end = self._relate_times(other, operand_kind(other))
+        if relation is _OVERLAPPED_BY:
+            return TimePeriod.from_validated(start=self._start, end=other_end)
+        if relation is _OVERLAPS:
+            return TimePeriod.from_validated(start=other_start, end=self._end)
         return None
 
     def get_disconnect(self,
@@ -386,18 +646,15 @@ class TimePeriod(interface.PyTimePeriod):
         But if you want to obtain the same as relative to Period 2 instead:
         >>> period2.get_disconnect(period1)
         TimePeriod(start=datetime.time(12, 0), end=datetime.time(13, 0))
+
+        Raises:
+            TypeError - raised if the other object is not a TimePeriod, a wallclock or an absolute period
         """
-        if (not isinstance(other, interface.PyTimePeriod)
-                and (not isinstance(other, interface.PyAbsolutePeriod)
-                     and not isinstance(other, interface.PyWallClockPeriod))
-        ):
-            raise TypeError(f"Cannot perform temporal operations with instances of type '{type(other)}'")
-        if self.overlapped_by(other):
-            end_time = other.start if isinstance(other, interface.PyTimePeriod) else other.start.time()
-            return TimePeriod(start=self.start, end=end_time)
-        elif self.overlaps_with(other):
-            start_time = other.end if isinstance(other, interface.PyTimePeriod) else other.end.time()
-            return TimePeriod(start=start_time, end=self.end)
+        relation, other_start, other_end = self._relate_times(other, operand_kind(other))
+        if relation is _OVERLAPS or relation is _MEETS:
+            return TimePeriod.from_validated(start=self._start, end=other_start)
+        if relation is _OVERLAPPED_BY or relation is _MET_BY:
+            return TimePeriod.from_validated(start=other_end, end=self._end)
         return None
 
     def to_wallclock(self, specific_date: interface.PyDatePeriod | date) -> interface.PyWallClockPeriod:
@@ -410,15 +667,16 @@ class TimePeriod(interface.PyTimePeriod):
         """
         _start = None
         _end = None
-        if isinstance(specific_date, date):
+        kind = operand_kind(specific_date)
+        if kind == Operand.DATE or kind == Operand.DATETIME:
             _start = datetime.combine(specific_date, self.start)
             _end = datetime.combine(specific_date, self.end)
-        elif isinstance(specific_date, DatePeriod):
+        elif kind == Operand.DATE_PERIOD:
             _start = datetime.combine(specific_date.start, self.start)
             _end = datetime.combine(specific_date.end, self.end,)
         else:
             raise ValueError(f"Provided object '{specific_date}' is not an instance of datetime.date or DatePeriod")
-        return WallClockPeriod(start=_start, end=_end)
+        return WallClockPeriod.from_validated(start=check_existence(_start), end=check_existence(_end))
 
     def to_absolute(self,
                     specific_date: interface.PyDatePeriod | date, timezone: ZoneInfo
@@ -435,15 +693,16 @@ class TimePeriod(interface.PyTimePeriod):
         """
         _start = None
         _end = None
-        if isinstance(specific_date, date):
+        kind = operand_kind(specific_date)
+        if kind == Operand.DATE or kind == Operand.DATETIME:
             _start = datetime.combine(specific_date, self.start, tzinfo=timezone)
             _end = datetime.combine(specific_date, self.end, tzinfo=timezone)
-        elif isinstance(specific_date, interface.PyDatePeriod):
+        elif kind == Operand.DATE_PERIOD:
             _start = datetime.combine(specific_date.start, self.start, tzinfo=timezone)
             _end = datetime.combine(specific_date.end, self.end, tzinfo=timezone)
         else:
             raise ValueError(f"Provided object '{specific_date}' is not an instance of datetime.date or DatePeriod")
-        return AbsolutePeriod(start=_start, end=_end)
+        return AbsolutePeriod.from_validated(start=check_existence(_start), end=check_existence(_end))
 
 
 class DatePeriod(interface.PyDatePeriod):
@@ -452,6 +711,8 @@ class DatePeriod(interface.PyDatePeriod):
     (see __contains__) below.
     """
 
+    __slots__ = ('_start', '_end', '_duration')
+
     def __init__(self,
                  start: date,
                  end: date,
@@ -465,6 +726,44 @@ class DatePeriod(interface.PyDatePeriod):
                              f"end={end}")
         self._start = start
         self._end = end
+        self._duration = None
+
+    @classmethod
+    def from_validated(cls, start: date, end: date) -> 'DatePeriod':
+        """ Creates a new instance from values that are already known to be valid, skipping all the checks performed
+        by the constructor. This is the path used internally for periods derived from other, already validated,
+        periods and it is intended for bulk loaders that restore periods which have been validated before.
+
+        No validation whatsoever is done here: both `start` and `end` must be instances of datetime.date (but not
+        datetime.datetime) and `start` must be before `end`; providing anything else results in an instance whose
+        behaviour is undefined.
+        """
+        period = cls.__new__(cls)
+        period._start = start
+        period._end = end
+        period._duration = None
+        return period
+
+    @property
+    def start(self) -> date:
+        return self._start
+
+    @property
+    def end(self) -> date:
+        return self._end
+
+    @property
+    def duration(self) -> AbstractDuration:
+        if self._duration is None:
+            self._duration = self._compute_duration()
+        return self._duration
+
+    def _compute_duration(self) -> Duration:
+        """ Internal method that decomposes the span of this period into a Duration; it is invoked on the first access
+        of the `duration` property and the result is kept for the lifetime of this instance.
+        """
+        start = self._start
+        end = self._end
         # The total duration in seconds
         _total: int = 0
         # First calculate the years difference, collect the days and subtract them from the total amount of days
@@ -475,40 +774,14 @@ class DatePeriod(interface.PyDatePeriod):
             _years = _years - 1
         leap_days = calendar.leapdays(start.year, end.year)
         total_days = (end - start).days
-        # Turn all the days into seconds and store them in the self._total attr
+        # Turn all the days into seconds and add them to the total
         _total += total_days * 24 * 60 * 60
         # Remove the total amount of years from the days pool
         days_left = (total_days - (_years * 365)) - leap_days
-        _months: int = 0
-        _year = start.year
-        next_month = start.month + _months
-        days_to_go = abs(days_left)
-        while days_to_go > 0:
-            if next_month > 12:
-                next_month = 1
-                _year += 1
-            days_in_month = calendar.monthrange(_year, next_month)[1]
-            if days_to_go - days_in_month >= 0:
-                _months += 1
-                next_month += 1
-                days_to_go -= days_in_month
-            else:
-                break
-        _days: int = days_to_go
-        self._duration = Duration(total_seconds=_total, years=_years, months=_months, days=_days, hours=0, minutes=0,
-                                  seconds=0)
-
-    @property
-    def start(self) -> date:
-        return self._start
-
-    @property
-    def end(self) -> date:
-        return self._end
-
-    @property
-    def duration(self) -> AbstractDuration:
-        return self._duration
+        # Collect as many whole months, starting from the month of the start date, as the remaining days fit
+        _months, _days = whole_months(start, abs(days_left))
+        return Duration(total_seconds=_total, years=_years, months=_months, days=_days, hours=0, minutes=0,
+                        seconds=0)
 
     def __str__(self):
         return f"{self.start.isoformat()}/{self.end.isoformat()}"
@@ -525,14 +798,61 @@ class DatePeriod(interface.PyDatePeriod):
             get_overlap
             get_disconnect
         """
-        if isinstance(other, interface.PyAbsolutePeriod) or isinstance(other, interface.PyWallClockPeriod):
-            return (self.start == other.start.date()
-                    and self.end == other.end.date())
-        if isinstance(other, interface.PyDatePeriod):
+        kind = operand_kind(other)
+        if kind == Operand.DATE_PERIOD:
             return (self.start == other.start
                     and self.end == other.end)
+        if kind == Operand.WALLCLOCK_PERIOD or kind == Operand.ABSOLUTE_PERIOD:
+            return (self.start == other.start.date()
+                    and self.end == other.end.date())
         return False
 
+    def __hash__(self):
+        """ The hash is computed from the start and end dates of the period, which keeps it consistent with the
+        equality between two instances of this class and allows periods to be used as dictionary keys, in sets or in
+        memoization caches.
+
+        Equality with the wallclock and absolute periods classes (see __eq__ above) only compares the date of their
+        start and end, so a DatePeriod may be equal to such a period without sharing its hash; mixing different period
+        types within the same set or as keys of the same dictionary will therefore not de-duplicate them.
+        """
+        return hash((self._start, self._end))
+
+    def __lt__(self, other):
+        """ Instances of this class are ordered by their start dates and, for periods starting at the same
+        moment, by their end dates, the shorter of the two periods sorting first. This natural order allows lists of
+        periods to be sorted, merged or searched directly with `sorted`, `heapq` and `bisect`, without a key function.
+
+        Ordering is only defined between instances of the same period kind; comparing with any other object results in
+        a TypeError, as it does with the rest of the built-in types.
+        """
+        if operand_kind(other) != Operand.DATE_PERIOD:
+            return NotImplemented
+        if self._start != other.start:
+            return self._start < other.start
+        return self._end < other.end
+
+    def __le__(self, other):
+        if operand_kind(other) != Operand.DATE_PERIOD:
+            return NotImplemented
+        if self._start != other.start:
+            return self._start < other.start
+        return self._end <= other.end
+
+    def __gt__(self, other):
+        if operand_kind(other) != Operand.DATE_PERIOD:
+            return NotImplemented
+        if self._start != other.start:
+            return self._start > other.start
+        return self._end > other.end
+
+    def __ge__(self, other):
+        if operand_kind(other) != Operand.DATE_PERIOD:
+            return NotImplemented
+        if self._start != other.start:
+            return self._start > other.start
+        return self._end >= other.end
+
     def __contains__(self, item):
         """ Membership test can be done with instances of this class, wallclock or absolute periods classes,
         datetime.datetime and datetime.date objects; When membership test is done for a period, it assumes that the
@@ -563,18 +883,19 @@ class DatePeriod(interface.PyDatePeriod):
             get_overlap
             get_disconnect
         """
-        _start = None
-        _end = None
-        if isinstance(item, interface.PyDatePeriod):
+        kind = operand_kind(item)
+        if kind == Operand.DATE:
+            return self.start <= item <= self.end
+        if kind == Operand.DATETIME:
+            return self.start <= item.date() <= self.end
+        if kind == Operand.DATE_PERIOD:
             _start = item.start
             _end = item.end
-        if isinstance(item, interface.PyAbsolutePeriod) or isinstance(item, interface.PyWallClockPeriod):
+        elif kind == Operand.WALLCLOCK_PERIOD or kind == Operand.ABSOLUTE_PERIOD:
             _start = item.start.date()
             _end = item.end.date()
-        if isinstance(item, datetime):
-            item = item.date()
-        if isinstance(item, date):
-            return self.start <= item <= self.end
+        else:
+            raise TypeError(f"Cannot perform temporal operations with instances of type '{type(item)}'")
         if self.start == _start and self.end == _end:
             return False
         return self.start <= _start and _end <= self.end
@@ -593,11 +914,12 @@ class DatePeriod(interface.PyDatePeriod):
         Since dates do not distinguish between specific hours, periods sharing the same start-end date, or vice versa,
         are considered overlapping.
         """
-        if isinstance(other, interface.PyDatePeriod):
+        kind = operand_kind(other)
+        if kind == Operand.DATE_PERIOD:
             _value = other.start
-        elif isinstance(other, interface.PyAbsolutePeriod) or isinstance(other, interface.PyWallClockPeriod):
+        elif kind == Operand.WALLCLOCK_PERIOD or kind == Operand.ABSOLUTE_PERIOD:
             _value = other.start.date()
-        elif isinstance(other, datetime):
+        elif kind == Operand.DATETIME:
             _value = other.date()
         else:
             _value = other
@@ -613,14 +935,19 @@ class DatePeriod(interface.PyDatePeriod):
         """
         _start = None
         _end = None
-        if isinstance(other, interface.PyDatePeriod):
+        kind = operand_kind(other)
+        if kind == Operand.DATE_PERIOD:
             if self.is_before(other):
                 _start = self.end
                 _end = other.start
             elif self.is_after(other):
                 _start = other.end
                 _end = self.start
-        elif isinstance(other, date):
+            # Both values come from already validated periods which cannot share a date if one is before the other
+            if _start is not None:
+                return DatePeriod.from_validated(start=_start, end=_end)
+            return None
+        elif kind == Operand.DATE or kind == Operand.DATETIME:
             if self.is_before(other):
                 _start = self.end
                 _end = other
@@ -645,16 +972,47 @@ class DatePeriod(interface.PyDatePeriod):
         Since dates do not distinguish between specific hours, periods sharing the same start-end date, or vice versa,
         are considered overlapping.
         """
-        if isinstance(other, interface.PyDatePeriod):
+        kind = operand_kind(other)
+        if kind == Operand.DATE_PERIOD:
             _value = other.end
-        elif isinstance(other, interface.PyAbsolutePeriod) or isinstance(other, interface.PyWallClockPeriod):
+        elif kind == Operand.WALLCLOCK_PERIOD or kind == Operand.ABSOLUTE_PERIOD:
             _value = other.end.date()
-        elif isinstance(other, datetime):
+        elif kind == Operand.DATETIME:
             _value = other.date()
         else:
             _value = other
         return _value < self.start
 
+    def relation(self,
+                 other: interface.PyDatePeriod | interface.PyAbsolutePeriod | interface.PyWallClockPeriod
+                 ) -> Relation:
+        """ Returns the relation of this period to the other one, as one of the thirteen relations of Allen's interval
+        algebra (see temporals.relations.Relation), classified with a single pass over the start and end of the two
+        periods. A period ending exactly when the other one starts meets it, rather than overlapping it:
+
+        >>> this_period.relation(other_period)
+        <Relation.OVERLAPS: 'overlaps'>
+
+        When the other period is a wallclock or absolute one, only the dates of its start and end are considered.
+
+        Raises:
+            TypeError - raised if the other object is not a DatePeriod, a wallclock or an absolute period
+        """
+        relation = self._relate(other, operand_kind(other))
+        if relation is None:
+            raise TypeError(f"Cannot perform temporal operations with instances of type '{type(other)}'")
+        return relation
+
+    def _relate(self, other, kind: int) -> Relation | None:
+        """ Internal method that classifies the other period, which is of the provided operand kind, against this one;
+        None is returned for objects which this period cannot relate to
+        """
+        if kind == Operand.DATE_PERIOD:
+            return _classify(self._start, self._end, other.start, other.end)
+        if kind == Operand.WALLCLOCK_PERIOD or kind == Operand.ABSOLUTE_PERIOD:
+            return _classify(self._start, self._end, other.start.date(), other.end.date())
+        return None
+
     def overlaps_with(self,
                       other: interface.PyDatePeriod | interface.PyAbsolutePeriod | interface.PyWallClockPeriod
                       ) -> bool:
@@ -684,20 +1042,11 @@ class DatePeriod(interface.PyDatePeriod):
         Note that both of these checks will only work for partially overlapping periods - for fully overlapping periods,
         use the `in` membership test:
         >>> this_period in other_period
+
+        In terms of `relation`, this is the case when it returns Relation.OVERLAPPED_BY or Relation.MET_BY.
         """
-        other_start: date = None  # type: ignore
-        other_end: date = None  # type: ignore
-        if isinstance(other, interface.PyDatePeriod):
-            other_start = other.start
-            other_end = other.end
-        if isinstance(other, interface.PyAbsolutePeriod) or isinstance(other, interface.PyWallClockPeriod):
-            other_start = other.start.date()
-            other_end = other.end.date()
-        if other_start is None or other_end is None:
-            return False
-        if not other_end < self.start and other_start < self.start and other_end < self.end:
-            return True
-        return False
+        relation = self._relate(other, operand_kind(other))
+        return relation is _OVERLAPPED_BY or relation is _MET_BY
 
     def overlapped_by(self,
                       other: interface.PyDatePeriod | interface.PyAbsolutePeriod | interface.PyWallClockPeriod
@@ -727,20 +1076,11 @@ class DatePeriod(interface.PyDatePeriod):
         Note that both of these checks will only work for partially overlapping periods - for fully overlapping periods,
         use the `in` membership test:
         >>> this_period in other_period
+
+        In terms of `relation`, this is the case when it returns Relation.OVERLAPS or Relation.MEETS.
         """
-        other_start: date = None  # type: ignore
-        other_end: date = None  # type: ignore
-        if isinstance(other, interface.PyDatePeriod):
-            other_start = other.start
-            other_end = other.end
-        if isinstance(other, interface.PyAbsolutePeriod) or isinstance(other, interface.PyWallClockPeriod):
-            other_start = other.start.date()
-            other_end = other.end.date()
-        if other_start is None or other_end is None:
-            return False
-        if not self.end < other_start and self.start < other_start and self.end < other_end:
-            return True
-        return False
+        relation = self._relate(other, operand_kind(other))
+        return relation is _OVERLAPS or relation is _MEETS
 
     def get_overlap(self,
                     other: interface.PyDatePeriod | interface.PyAbsolutePeriod | interface.PyWallClockPeriod
@@ -782,18 +1122,16 @@ class DatePeriod(interface.PyDatePeriod):
         >>> period2.get_overlap(period1)
         TimePeriod(start=datetime.time(10, 0), end=datetime.time(12, 0))
         """
-        if (not isinstance(other, interface.PyDatePeriod) and
-                (not isinstance(other, interface.PyAbsolutePeriod)
-                 and not isinstance(other, interface.PyWallClockPeriod)
-                )
-        ):
+        kind = operand_kind(other)
+        relation = self._relate(other, kind)
+        if relation is None:
             raise TypeError(f"Cannot perform temporal operations with instances of type '{type(other)}'")
-        if self.overlaps_with(other):
-            end_date = other.end if isinstance(other, interface.PyDatePeriod) else other.end.date()
-            return DatePeriod(start=self.start, end=end_date)
-        elif self.overlapped_by(other):
-            start_date = other.start if isinstance(other, interface.PyDatePeriod) else other.start.date()
-            return DatePeriod(start=start_date, end=self.end)
+        if relation is _OVERLAPPED_BY:
+            end = other.end if kind == Operand.DATE_PERIOD else other.end.date()
+            return DatePeriod.from_validated(start=self._start, end=end)
+        if relation is _OVERLAPS:
+            start = other.start if kind == Operand.DATE_PERIOD else other.start.date()
+            return DatePeriod.from_validated(start=start, end=self._end)
         return None
 
     def get_disconnect(self,
@@ -834,18 +1172,16 @@ class DatePeriod(interface.PyDatePeriod):
         >>> period2.get_disconnect(period1)
         DatePeriod(start=datetime.date(2024, 1, 10), end=datetime.date(2024, 1, 15))
         """
-        if (not isinstance(other, interface.PyDatePeriod) and
-                (not isinstance(other, interface.PyAbsolutePeriod)
-                 and not isinstance(other, interface.PyWallClockPeriod)
-                )
-        ):
+        kind = operand_kind(other)
+        relation = self._relate(other, kind)
+        if relation is None:
             raise TypeError(f"Cannot perform temporal operations with instances of type '{type(other)}'")
-        if self.overlapped_by(other):
-            end_date = other.start if isinstance(other, interface.PyDatePeriod) else other.start.date()
-            return DatePeriod(start=self.start, end=end_date)
-        elif self.overlaps_with(other):
-            start_date = other.end if isinstance(other, interface.PyDatePeriod) else other.end.date()
-            return DatePeriod(start=start_date, end=self.end)
+        if relation is _OVERLAPS or relation is _MEETS:
+            start = other.start if kind == Operand.DATE_PERIOD else other.start.date()
+            return DatePeriod.from_validated(start=self._start, end=start)
+        if relation is _OVERLAPPED_BY or relation is _MET_BY:
+            end = other.end if kind == Operand.DATE_PERIOD else other.end.date()
+            return DatePeriod.from_validated(start=end, end=self._end)
         return None
 
     def to_wallclock(self, specific_time: interface.PyTimePeriod | time) -> interface.PyWallClockPeriod:
@@ -858,15 +1194,16 @@ class DatePeriod(interface.PyDatePeriod):
         """
         _start = None
         _end = None
-        if isinstance(specific_time, time):
+        kind = operand_kind(specific_time)
+        if kind == Operand.TIME:
             _start = datetime.combine(self.start, specific_time)
             _end = datetime.combine(self.end, specific_time)
-        elif isinstance(specific_time, interface.PyTimePeriod):
+        elif kind == Operand.TIME_PERIOD:
             _start = datetime.combine(self.start, specific_time.start)
             _end = datetime.combine(self.end, specific_time.end)
         else:
             raise ValueError(f"Provided object '{specific_time}' is not an instance of datetime.time or TimePeriod")
-        return WallClockPeriod(start=_start, end=_end)
+        return WallClockPeriod.from_validated(start=check_existence(_start), end=check_existence(_end))
 
     def to_absolute(self,
                     specific_time: interface.PyTimePeriod | time,
@@ -884,19 +1221,22 @@ class DatePeriod(interface.PyDatePeriod):
         """
         _start = None
         _end = None
-        if isinstance(specific_time, time):
+        kind = operand_kind(specific_time)
+        if kind == Operand.TIME:
             _start = datetime.combine(self.start, specific_time, tzinfo=timezone)
             _end = datetime.combine(self.end, specific_time, tzinfo=timezone)
-        elif isinstance(specific_time, interface.PyTimePeriod):
+        elif kind == Operand.TIME_PERIOD:
             _start = datetime.combine(self.start, specific_time.start, tzinfo=timezone)
             _end = datetime.combine(self.end, specific_time.end, tzinfo=timezone)
         else:
             raise ValueError(f"Provided object '{specific_time}' is not an instance of datetime.time or TimePeriod")
-        return AbsolutePeriod(start=_start, end=_end)
+        return AbsolutePeriod.from_validated(start=check_existence(_start), end=check_existence(_end))
 
 
 class WallClockPeriod(interface.PyWallClockPeriod):
 
+    __slots__ = ('_start', '_end', '_duration')
+
     def __init__(self,
                  start: datetime,
                  end: datetime,
@@ -912,62 +1252,23 @@ class WallClockPeriod(interface.PyWallClockPeriod):
                              f"end={end}")
         self._start = check_existence(start)
         self._end = check_existence(end)
-        # The total duration in seconds
-        self._total: int = 0
-        self._seconds = end.second - start.second
-        self._minutes = end.minute - start.minute
-        self._hours = end.hour - start.hour
-        if self._seconds < 0:
-            self._minutes -= 1
-            self._seconds = 60 - abs(self._seconds)
-        elif self._seconds >= 60:
-            self._minutes += 1
-            self._seconds = 60 - self._seconds
-        self._total += self._seconds
-        if self._minutes < 0:
-            self._hours -= 1
-            self._minutes = 60 - abs(self._minutes)
-        elif self._minutes >= 60:
-            self._hours += 1
-            self._minutes = 60 - self._minutes
-        self._total += self._minutes * 60
-        adjustment_days = 0
-        if self._hours < 0:
-            self._hours = 24 - abs(self._hours)
-            adjustment_days = -1
-        elif self._hours >= 24:
-            self._hours = 24 - self._hours
-            adjustment_days = 1
-        self._total += self._hours * 60
-        # First calculate the years difference, collect the days and subtract them from the total amount of days
-        self._years: int = end.year - start.year
-        # If the month of the end date is before the month of the start date, remove 1 year from the total count as it
-        # wasn't one full year
-        if end.month < start.month:
-            self._years = self._years - 1
-        leap_days = calendar.leapdays(start.year, end.year)
-        total_days = (end - start).days + adjustment_days
-        # Remove the total amount of years from the days pool
-        days_left = (total_days - (self._years * 365)) - leap_days
-        self._months: int = 0
-        _year = start.year
-        next_month = start.month + self._months
-        while days_left > 0:
-            if next_month > 12:
-                next_month = 1
-                _year += 1
-            days_in_month = calendar.monthrange(_year, next_month)[1]
-            if days_left - days_in_month >= 0:
-                self._months += 1
-                next_month += 1
-                days_left -= days_in_month
-                self._total += days_in_month * 86400
-            else:
-                break
-        self._days: int = days_left
-        if self._days < 0:
-            self._days = 0
-        self._total += self._days * 86400
+        self._duration = None
+
+    @classmethod
+    def from_validated(cls, start: datetime, end: datetime) -> 'WallClockPeriod':
+        """ Creates a new instance from values that are already known to be valid, skipping all the checks performed
+        by the constructor. This is the path used internally for periods derived from other, already validated,
+        periods and it is intended for bulk loaders that restore periods which have been validated before.
+
+        No validation whatsoever is done here: both `start` and `end` must be instances of datetime.datetime, `start`
+        must be before `end` and neither of them may be nonexistent in its timezone; providing anything else results in
+        an instance whose behaviour is undefined.
+        """
+        period = cls.__new__(cls)
+        period._start = start
+        period._end = end
+        period._duration = None
+        return period
 
     @property
     def start(self) -> datetime:
@@ -979,8 +1280,62 @@ class WallClockPeriod(interface.PyWallClockPeriod):
 
     @property
     def duration(self) -> AbstractDuration:
-        return Duration(total_seconds=self._total, years=self._years, months=self._months, days=self._days,
-                        hours=self._hours, minutes=self._minutes, seconds=self._seconds)
+        if self._duration is None:
+            self._duration = self._compute_duration()
+        return self._duration
+
+    def _compute_duration(self) -> Duration:
+        """ Internal method that decomposes the span of this period into a Duration; it is invoked on the first access
+        of the `duration` property and the result is kept for the lifetime of this instance.
+        """
+        start = self._start
+        end = self._end
+        # The total duration in seconds
+        _total: int = 0
+        _seconds = end.second - start.second
+        _minutes = end.minute - start.minute
+        _hours = end.hour - start.hour
+        if _seconds < 0:
+            _minutes -= 1
+            _seconds = 60 - abs(_seconds)
+        elif _seconds >= 60:
+            _minutes += 1
+            _seconds = 60 - _seconds
+        _total += _seconds
+        if _minutes < 0:
+            _hours -= 1
+            _minutes = 60 - abs(_minutes)
+        elif _minutes >= 60:
+            _hours += 1
+            _minutes = 60 - _minutes
+        _total += _minutes * 60
+        adjustment_days = 0
+        if _hours < 0:
+            _hours = 24 - abs(_hours)
+            adjustment_days = -1
+        elif _hours >= 24:
+            _hours = 24 - _hours
+            adjustment_days = 1
+        _total += _hours * 60
+        # First calculate the years difference, collect the days and subtract them from the total amount of days
+        _years: int = end.year - start.year
+        # If the month of the end date is before the month of the start date, remove 1 year from the total count as it
+        # wasn't one full year
+        if end.month < start.month:
+            _years = _years - 1
+        leap_days = calendar.leapdays(start.year, end.year)
+        total_days = (end - start).days + adjustment_days
+        # Remove the total amount of years from the days pool
+        days_left = (total_days - (_years * 365)) - leap_days
+        # Collect as many whole months, starting from the month of the start date, as the remaining days fit; the
+        # months and the days left over after them make up all the remaining days
+        _months, _days = whole_months(start, days_left)
+        if _days < 0:
+            _days = 0
+        else:
+            _total += days_left * 86400
+        return Duration(total_seconds=_total, years=_years, months=_months, days=_days, hours=_hours,
+                        minutes=_minutes, seconds=_seconds)
 
     def __str__(self):
         return f"{self.start.isoformat()}/{self.end.isoformat()}"
@@ -1015,22 +1370,24 @@ class WallClockPeriod(interface.PyWallClockPeriod):
         0700                         2000                0700                           2000
 
          """
-        if isinstance(_t, time):
-            if self.duration.days >= 2:
+        days = self.duration.days
+        kind = operand_kind(_t)
+        if kind == Operand.TIME:
+            if days >= 2:
                 return True
-            elif self.duration.days == 1:
+            elif days == 1:
                 if self.start.time() <= _t <= self.end.time():
                     return True
-        if isinstance(_t, interface.PyTimePeriod):
-            if self.duration.days > 2:
+        if kind == Operand.TIME_PERIOD:
+            if days > 2:
                 # No situation in which the period won't repeat when the period is over 2 days long
                 return True
-            if self.duration.days == 2:
+            if days == 2:
                 # If the period is 2 days long, the TimePeriod must start before it and end after it in order not to
                 # repeat, otherwise, it will repeat
                 if not _t.start < self.start.time() or not self.end.time() < _t.end:
                     return True
-            elif self.duration.days == 1:
+            elif days == 1:
                 # If the period is (at least) 1 day long, it must either start before it or end after it not to repeat
                 if self.start.time() <= _t.start and _t.end <= self.end.time():
                     # The other period starts at the same time or later and ends either before or at the same time as
@@ -1053,17 +1410,64 @@ class WallClockPeriod(interface.PyWallClockPeriod):
             get_overlap
             get_disconnect
         """
-        if isinstance(other, interface.PyWallClockPeriod):
+        kind = operand_kind(other)
+        if kind == Operand.WALLCLOCK_PERIOD:
             return (self.start == other.start
                     and self.end == other.end)
-        if isinstance(other, interface.PyDatePeriod):
+        if kind == Operand.DATE_PERIOD:
             return (self.start.date() == other.start
                     and self.end.date() == other.end)
-        if isinstance(other, interface.PyTimePeriod):
+        if kind == Operand.TIME_PERIOD:
             return (self.start.time() == other.start
                     and self.end.time() == other.end)
         return False
 
+    def __hash__(self):
+        """ The hash is computed from the start and end datetimes of the period, which keeps it consistent with the
+        equality between two instances of this class and allows periods to be used as dictionary keys, in sets or in
+        memoization caches.
+
+        Equality with the TimePeriod and DatePeriod classes (see __eq__ above) only compares the time or the date of
+        this period, so a WallClockPeriod may be equal to such a period without sharing its hash; mixing different
+        period types within the same set or as keys of the same dictionary will therefore not de-duplicate them.
+        """
+        return hash((self._start, self._end))
+
+    def __lt__(self, other):
+        """ Instances of this class are ordered by their start datetimes and, for periods starting at the same
+        moment, by their end datetimes, the shorter of the two periods sorting first. This natural order allows lists of
+        periods to be sorted, merged or searched directly with `sorted`, `heapq` and `bisect`, without a key function.
+
+        Ordering is only defined between instances of the same period kind; comparing with any other object results in
+        a TypeError, as it does with the rest of the built-in types.
+        """
+        if operand_kind(other) != Operand.WALLCLOCK_PERIOD:
+            return NotImplemented
+        if self._start != other.start:
+            return self._start < other.start
+        return self._end < other.end
+
+    def __le__(self, other):
+        if operand_kind(other) != Operand.WALLCLOCK_PERIOD:
+            return NotImplemented
+        if self._start != other.start:
+            return self._start < other.start
+        return self._end <= other.end
+
+    def __gt__(self, other):
+        if operand_kind(other) != Operand.WALLCLOCK_PERIOD:
+            return NotImplemented
+        if self._start != other.start:
+            return self._start > other.start
+        return self._end > other.end
+
+    def __ge__(self, other):
+        if operand_kind(other) != Operand.WALLCLOCK_PERIOD:
+            return NotImplemented
+        if self._start != other.start:
+            return self._start > other.start
+        return self._end >= other.end
+
     def __contains__(self, item):
         """ Membership test can be done with instances of this class, the DatePeriod and TimePeriod classes,
         datetime.datetime and datetime.date objects; When membership test is done for a period, it assumes that the
@@ -1101,8 +1505,9 @@ class WallClockPeriod(interface.PyWallClockPeriod):
                 <url to doc>
                 for more information.
         """
-        if isinstance(item, interface.PyWallClockPeriod) or isinstance(item, interface.PyAbsolutePeriod):
-            if isinstance(item, interface.PyAbsolutePeriod):
+        kind = operand_kind(item)
+        if kind == Operand.WALLCLOCK_PERIOD or kind == Operand.ABSOLUTE_PERIOD:
+            if kind == Operand.ABSOLUTE_PERIOD:
                 # We can abort early if the duration of the provided period is longer than the duration of this instance
                 if item.duration > self.duration:
                     return False
@@ -1110,12 +1515,12 @@ class WallClockPeriod(interface.PyWallClockPeriod):
                 # Equality
                 return False
             return (self.start <= item.start and item.end <= self.end) and (self.duration > item.duration)
-        if isinstance(item, interface.PyDatePeriod):
+        if kind == Operand.DATE_PERIOD:
             if self.start.date() == item.start and self.end.date() == item.end:
                 # Equality
                 return False
             return self.start.date() <= item.start and item.end <= self.end.date()
-        if isinstance(item, interface.PyTimePeriod):
+        if kind == Operand.TIME_PERIOD:
             if self._time_repeats(item):
                 raise TimeAmbiguityError(f"The provided TimePeriod '{item}' exist within this period "
                                          f"('{self}') more than once. For more information on this error, "
@@ -1134,11 +1539,11 @@ class WallClockPeriod(interface.PyWallClockPeriod):
                         # Starts equal or later but ends later too - existing only once
                         return True
             return self.start.time() <= item.start and item.end <= self.end.time()
-        if isinstance(item, datetime):
+        if kind == Operand.DATETIME:
             return self.start <= item <= self.end
-        if isinstance(item, date):
+        if kind == Operand.DATE:
             return self.start.date() <= item <= self.end.date()
-        if isinstance(item, time):
+        if kind == Operand.TIME:
             if self._time_repeats(item):
                 raise TimeAmbiguityError(f"The provided unit of time ('{item}') exist within this period "
                                          f"('{self}')  more than once. For more information on this error, "
@@ -1156,11 +1561,12 @@ class WallClockPeriod(interface.PyWallClockPeriod):
         and the provided date/DatePeriod begins on the 2024-01-02). In all other cases (datetime and wallclock or
         absolute periods), objects are allowed to share the same end-start datetime.
         """
-        if isinstance(other, interface.PyDatePeriod):
+        kind = operand_kind(other)
+        if kind == Operand.DATE_PERIOD:
             return self.end.date() < other.start
-        elif isinstance(other, datetime):
+        elif kind == Operand.DATETIME:
             return self.end <= other
-        elif isinstance(other, date):
+        elif kind == Operand.DATE:
             return self.end.date() < other
         return self.end <= other.start
 
@@ -1172,11 +1578,12 @@ class WallClockPeriod(interface.PyWallClockPeriod):
         2024-01-02 and the provided date/DatePeriod ends on the 2024-01-01). In all other cases (datetime and
         wallclock or absolute periods), objects are allowed to share the same end-start datetime.
         """
-        if isinstance(other, interface.PyDatePeriod):
+        kind = operand_kind(other)
+        if kind == Operand.DATE_PERIOD:
             return other.end < self.start.date()
-        elif isinstance(other, datetime):
+        elif kind == Operand.DATETIME:
             return other <= self.start
-        elif isinstance(other, date):
+        elif kind == Operand.DATE:
             return other < self.start.date()
         return other.end <= self.start
 
@@ -1192,14 +1599,19 @@ class WallClockPeriod(interface.PyWallClockPeriod):
         """
         _start = None
         _end = None
-        if isinstance(other, interface.PyWallClockPeriod):
+        kind = operand_kind(other)
+        if kind == Operand.WALLCLOCK_PERIOD:
             if self.is_before(other):
                 _start = self.end
                 _end = other.start
             elif self.is_after(other):
                 _start = other.end
                 _end = self.start
-        elif isinstance(other, datetime):
+            # Both values come from already validated periods; there is no interim between periods that touch
+            if _start is not None and _start < _end:
+                return WallClockPeriod.from_validated(start=_start, end=_end)
+            return None
+        elif kind == Operand.DATETIME:
             if self.is_before(other):
                 _start = self.end
                 _end = other
@@ -1209,6 +1621,44 @@ class WallClockPeriod(interface.PyWallClockPeriod):
         if  _start and _end:
             return WallClockPeriod(start=_start, end=_end)
 
+    def relation(self,
+                 other: interface.PyTimePeriod | interface.PyDatePeriod | interface.PyWallClockPeriod
+                 ) -> Relation:
+        """ Returns the relation of this period to the other one, as one of the thirteen relations of Allen's interval
+        algebra (see temporals.relations.Relation), classified with a single pass over the start and end of the two
+        periods. A period ending exactly when the other one starts meets it, rather than overlapping it:
+
+        >>> this_period.relation(other_period)
+        <Relation.OVERLAPS: 'overlaps'>
+
+        When the other period is a DatePeriod, only the dates of this period are considered.
+
+        When the other period is a TimePeriod, only the times of this period are considered; if this period spans more
+        than a single day, the TimePeriod is placed on each of these days and it is classified on the only day it
+        meets, overlaps or is within this period.
+
+        Raises:
+            TypeError - raised if the other object is not a TimePeriod, a DatePeriod or an instance of this class
+            TimeAmbiguityError - raised if this period spans more than a day and the TimePeriod meets, overlaps or is
+                within it on more than one of them
+        """
+        relation = self._relate(other, operand_kind(other))
+        if relation is None:
+            raise TypeError(f"Cannot perform temporal operations with instances of type '{type(other)}'")
+        return relation
+
+    def _relate(self, other, kind: int) -> Relation | None:
+        """ Internal method that classifies the other period, which is of the provided operand kind, against this one;
+        None is returned for objects which this period cannot relate to
+        """
+        if kind == Operand.WALLCLOCK_PERIOD:
+            return _classify(self._start, self._end, other.start, other.end)
+        if kind == Operand.DATE_PERIOD:
+            return _classify(self._start.date(), self._end.date(), other.start, other.end)
+        if kind == Operand.TIME_PERIOD:
+            return _time_relation(self, other)
+        return None
+
     def overlaps_with(self,
                       other: interface.PyTimePeriod | interface.PyDatePeriod | interface.PyWallClockPeriod
                       ) -> bool:
@@ -1238,33 +1688,22 @@ class WallClockPeriod(interface.PyWallClockPeriod):
         Note that both of these checks will only work for partially overlapping periods - for fully overlapping periods,
         use the `in` membership test:
         >>> this_period in other_period
+
+        In terms of `relation`, this is the case when it returns Relation.OVERLAPPED_BY or Relation.MET_BY.
+        A TimePeriod is compared to the times of the start and end of this period instead.
+
+        Raises:
+            TimeAmbiguityError - raised if the other one is a TimePeriod which exists within this period more than
+                once, or which starts either before or after this period depending on the day it is placed on
         """
-        if isinstance(other, interface.PyTimePeriod):
-            if self._time_repeats(other):
-                raise TimeAmbiguityError(f"The provided TimePeriod '{other}' exist within this period "
-                                         f"('{self}') more than once. For more information on this error, "
-                                         f"see https://github.com/dimitarOnGithub/temporals/wiki/Errors")
-            if self.start.date() < self.end.date():
-                # Day stretches overnight - the start time must be before the start of this period but also after the
-                # end of it
-                if other.start < self.start.time() and other.start < self.end.time():
-                    raise TimeAmbiguityError(f"The provided TimePeriod ('{other}') is ambiguous compared to this "
-                                             f"WallClockPeriod ('{self}'); it's overlapped by (starts before) this "
-                                             f"period on {self.start.date().isoformat()} but this period continues "
-                                             f"until after it's start on {self.end.date().isoformat()}")
-                else:
-                    if not other.end < self.start.time():
-                        return other.start <= self.start.time()
-            else:
-                if not other.end < self.start.time():
-                    return other.start < self.start.time() and other.end < self.end.time()
-        if isinstance(other, interface.PyDatePeriod):
-            if not other.end < self.start.date():
-                return other.start < self.start.date() and other.end < self.end.date()
-        if isinstance(other, interface.PyWallClockPeriod):
-            if not other.end < self.start:
-                return other.start < self.start and other.end < self.end
-        return False
+        kind = operand_kind(other)
+        if kind == Operand.TIME_PERIOD:
+            overlaps = _time_overlaps(self, other)[0]
+            if overlaps is None:
+                raise _time_ambiguity(self, other)
+            return overlaps
+        relation = self._relate(other, kind)
+        return relation is _OVERLAPPED_BY or relation is _MET_BY
 
     def overlapped_by(self,
                       other: interface.PyTimePeriod | interface.PyDatePeriod | interface.PyWallClockPeriod
@@ -1294,33 +1733,22 @@ class WallClockPeriod(interface.PyWallClockPeriod):
         Note that both of these checks will only work for partially overlapping periods - for fully overlapping periods,
         use the `in` membership test:
         >>> this_period in other_period
+
+        In terms of `relation`, this is the case when it returns Relation.OVERLAPS or Relation.MEETS.
+        A TimePeriod is compared to the times of the start and end of this period instead.
+
+        Raises:
+            TimeAmbiguityError - raised if the other one is a TimePeriod which exists within this period more than
+                once, or which starts either before or after this period depending on the day it is placed on
         """
-        if isinstance(other, interface.PyTimePeriod):
-            if self._time_repeats(other):
-                raise TimeAmbiguityError(f"The provided TimePeriod '{other}' exist within this WallClockPeriod "
-                                         f"('{self}') more than once. For more information on this error, "
-                                         f"see https://github.com/dimitarOnGithub/temporals/wiki/Errors")
-            if self.start.date() < self.end.date():
-                # Day stretches overnight - the start time must be after the start of this period but also after the
-                # end of it
-                if self.start.time() < other.start and self.end.time() < other.end:
-                    raise TimeAmbiguityError(f"The provided TimePeriod ('{other}') is ambiguous compared to this "
-                                             f"WallClockPeriod ('{self}'); it overlaps with (starts after) this "
-                                             f"period on {self.start.date().isoformat()} but this period continues "
-                                             f"until after it's start on {self.end.date().isoformat()}")
-                else:
-                    if not self.end.time() < other.start:
-                        return self.start.time() <= other.start
-            else:
-                if not self.end.time() < other.start:
-                    return self.start.time() < other.start and self.end.time() < other.end
-        if isinstance(other, interface.PyDatePeriod):
-            if not self.end.date() < other.start:
-                return self.start.date() < other.start and self.end.date() < other.end
-        if isinstance(other, interface.PyWallClockPeriod):
-            if not self.end < other.start:
-                return self.start < other.start and self.end < other.end
-        return False
+        kind = operand_kind(other)
+        if kind == Operand.TIME_PERIOD:
+            overlapped = _time_overlaps(self, other)[1]
+            if overlapped is None:
+                raise _time_ambiguity(self, other)
+            return overlapped
+        relation = self._relate(other, kind)
+        return relation is _OVERLAPS or relation is _MEETS
 
     def get_overlap(self,
                     other: interface.PyTimePeriod | interface.PyDatePeriod | interface.PyWallClockPeriod
@@ -1362,30 +1790,45 @@ class WallClockPeriod(interface.PyWallClockPeriod):
         result:
         >>> period2.get_overlap(period1)
         TimePeriod(start=datetime.time(10, 0), end=datetime.time(12, 0))
+
+        Raises:
+            TypeError - raised if the other object is not a TimePeriod, a DatePeriod or an instance of this class
+            TimeAmbiguityError - raised if the other one is a TimePeriod which exists within this period more than
+                once, or which starts either before or after this period depending on the day it is placed on
         """
-        if (not isinstance(other, interface.PyTimePeriod)
-                and not isinstance(other, interface.PyDatePeriod)
-                and not isinstance(other, interface.PyWallClockPeriod)):
-            raise TypeError(f"Cannot perform temporal operations with instances of type '{type(other)}'")
-        period_to_use = None
-        _start = None
-        _end = None
-        if self.overlaps_with(other) or self.overlapped_by(other):
-            if isinstance(other, interface.PyTimePeriod):
-                period_to_use = TimePeriod
-                _start = self.start.time() if self.overlaps_with(other) else other.start
-                _end = other.end if self.overlaps_with(other) else self.end.time()
-            elif isinstance(other, interface.PyDatePeriod):
-                period_to_use = DatePeriod
-                _start = self.start.date() if self.overlaps_with(other) else other.start
-                _end = other.end if self.overlaps_with(other) else self.end.date()
+        kind = operand_kind(other)
+        if kind == Operand.TIME_PERIOD:
+            overlaps, overlapped = _time_overlaps(self, other)
+            if overlaps is None:
+                raise _time_ambiguity(self, other)
+            if overlaps:
+                _start = self._start.time()
+                _end = other.end
             else:
-                period_to_use = WallClockPeriod
-                _start = self.start if self.overlaps_with(other) else other.start
-                _end = other.end if self.overlaps_with(other) else self.end
-            return period_to_use(start=_start, end=_end)
-        else:
+                if overlapped is None:
+                    raise _time_ambiguity(self, other)
+                if not overlapped:
+                    return None
+                _start = other.start
+                _end = self._end.time()
+            # The times of a period stretching overnight may not form an overlap within a single day
+            if _start < _end:
+                return TimePeriod.from_validated(start=_start, end=_end)
             return None
+        relation = self._relate(other, kind)
+        if relation is None:
+            raise TypeError(f"Cannot perform temporal operations with instances of type '{type(other)}'")
+        if relation is _OVERLAPPED_BY:
+            # The other period has begun first, the overlap lasts from the start of this period until its end
+            if kind == Operand.DATE_PERIOD:
+                return DatePeriod.from_validated(start=self._start.date(), end=other.end)
+            return WallClockPeriod.from_validated(start=self._start, end=other.end)
+        if relation is _OVERLAPS:
+            # This period has begun first, the overlap lasts from the start of the other period until its end
+            if kind == Operand.DATE_PERIOD:
+                return DatePeriod.from_validated(start=other.start, end=self._end.date())
+            return WallClockPeriod.from_validated(start=other.start, end=self._end)
+        return None
 
     def get_disconnect(self,
                        other: interface.PyTimePeriod | interface.PyDatePeriod | interface.PyWallClockPeriod
@@ -1424,45 +1867,55 @@ class WallClockPeriod(interface.PyWallClockPeriod):
         But if you want to obtain the same as relative to Period 2 instead:
         >>> period2.get_disconnect(period1)
         WallClockPeriod(start=datetime.datetime(2024, 1, 1, 12, 0), end=datetime.datetime(2024, 1, 1, 13, 0))
+
+        Raises:
+            TypeError - raised if the other object is not a TimePeriod, a DatePeriod or an instance of this class
+            TimeAmbiguityError - raised if the other one is a TimePeriod which exists within this period more than
+                once, or which starts either before or after this period depending on the day it is placed on
         """
-        if (not isinstance(other, TimePeriod)
-                and not isinstance(other, DatePeriod)
-                and not isinstance(other, WallClockPeriod)):
-            raise TypeError(f"Cannot perform temporal operations with instances of type '{type(other)}'")
+        kind = operand_kind(other)
         period_to_use = None
         _start = None
         _end = None
-        if isinstance(other, interface.PyTimePeriod):
-            period_to_use = TimePeriod
-            if self.overlapped_by(other):
-                _start = self.start.time()
+        if kind == Operand.TIME_PERIOD:
+            overlaps, overlapped = _time_overlaps(self, other)
+            if overlapped is None:
+                raise _time_ambiguity(self, other)
+            if overlapped:
+                _start = self._start.time()
                 _end = other.start
-            elif self.overlaps_with(other):
-                _start = other.end
-                _end = self.end.time()
-        elif isinstance(other, interface.PyDatePeriod):
+            else:
+                if overlaps is None:
+                    raise _time_ambiguity(self, other)
+                if overlaps:
+                    _start = other.end
+                    _end = self._end.time()
+            # The times of a period stretching overnight may not form a disconnect within a single day
+            if _start is not None and _start < _end:
+                return TimePeriod.from_validated(start=_start, end=_end)
+            return None
+        relation = self._relate(other, kind)
+        if relation is None:
+            raise TypeError(f"Cannot perform temporal operations with instances of type '{type(other)}'")
+        if kind == Operand.DATE_PERIOD:
             period_to_use = DatePeriod
-            if self.overlapped_by(other):
-                _start = self.start.date()
-                _end = other.start
-            elif self.overlaps_with(other):
-                _start = other.end
-                _end = self.end.date()
+            _start = self._start.date()
+            _end = self._end.date()
         else:
             period_to_use = WallClockPeriod
-            if self.overlapped_by(other):
-                _start = self.start
-                _end = other.start
-            elif self.overlaps_with(other):
-                _start = other.end
-                _end = self.end
-        if period_to_use and _start and _end:
-            return period_to_use(start=_start, end=_end)
+            _start = self._start
+            _end = self._end
+        if relation is _OVERLAPS or relation is _MEETS:
+            return period_to_use.from_validated(start=_start, end=other.start)
+        if relation is _OVERLAPPED_BY or relation is _MET_BY:
+            return period_to_use.from_validated(start=other.end, end=_end)
         return None
 
 
 class AbsolutePeriod(interface.PyAbsolutePeriod):
 
+    __slots__ = ('_start', '_end', '_start_us', '_end_us', '_duration')
+
     def __init__(self,
                  start: datetime,
                  end: datetime,
@@ -1478,95 +1931,126 @@ class AbsolutePeriod(interface.PyAbsolutePeriod):
                              f"end={end}")
         self._start = check_existence(start)
         self._end = check_existence(end)
+        self._start_us = to_epoch_us(start)
+        self._end_us = to_epoch_us(end)
+        self._duration = None
+
+    @classmethod
+    def from_validated(cls, start: datetime, end: datetime) -> 'AbsolutePeriod':
+        """ Creates a new instance from values that are already known to be valid, skipping all the checks performed
+        by the constructor. This is the path used internally for periods derived from other, already validated,
+        periods and it is intended for bulk loaders that restore periods which have been validated before.
+
+        No validation whatsoever is done here: both `start` and `end` must be instances of datetime.datetime, `start`
+        must be before `end` and neither of them may be nonexistent in its timezone; providing anything else results in
+        an instance whose behaviour is undefined.
+        """
+        period = cls.__new__(cls)
+        period._start = start
+        period._end = end
+        period._start_us = to_epoch_us(start)
+        period._end_us = to_epoch_us(end)
+        period._duration = None
+        return period
+
+    @property
+    def start(self) -> datetime:
+        return self._start
+
+    @property
+    def end(self) -> datetime:
+        return self._end
+
+    @property
+    def start_epoch_us(self) -> int:
+        """ The start of the period as microseconds since the UTC epoch, computed once when the period is created; naive
+        datetimes are taken to be in UTC. All comparisons between instants made by this class use these values.
+        """
+        return self._start_us
+
+    @property
+    def end_epoch_us(self) -> int:
+        """ The end of the period as microseconds since the UTC epoch, see `start_epoch_us` """
+        return self._end_us
+
+    @property
+    def duration(self) -> AbstractDuration:
+        if self._duration is None:
+            self._duration = self._compute_duration()
+        return self._duration
+
+    def _compute_duration(self) -> Duration:
+        """ Internal method that decomposes the span of this period into a Duration; it is invoked on the first access
+        of the `duration` property and the result is kept for the lifetime of this instance.
+        """
+        start = self._start
+        end = self._end
         # The total duration in seconds
-        self._total: int = 0
-        self._seconds = end.second - start.second
-        self._minutes = end.minute - start.minute
-        self._hours = end.hour - start.hour
+        _total: int = 0
+        _seconds = end.second - start.second
+        _minutes = end.minute - start.minute
+        _hours = end.hour - start.hour
         start_dst = 0
-        if self.start.dst() is not None:
-            start_dst = int(self.start.dst().total_seconds())
+        if start.dst() is not None:
+            start_dst = int(start.dst().total_seconds())
         end_dst = 0
-        if self.end.dst() is not None:
-            end_dst = int(self.end.dst().total_seconds())
+        if end.dst() is not None:
+            end_dst = int(end.dst().total_seconds())
         if start_dst != 0 and end_dst != 0:
             # Both start and end times are in DST, we can stop here
             pass
         else:
             if start_dst != 0:
                 offset_duration = Duration.from_seconds(start_dst)
-                self._hours += offset_duration.hours
-                self._minutes += offset_duration.minutes
-                self._seconds += offset_duration.seconds
+                _hours += offset_duration.hours
+                _minutes += offset_duration.minutes
+                _seconds += offset_duration.seconds
             elif end_dst != 0:
                 offset_duration = Duration.from_seconds(end_dst)
-                self._hours -= offset_duration.hours
-                self._minutes -= offset_duration.minutes
-                self._seconds -= offset_duration.seconds
-        if self._seconds < 0:
-            self._minutes -= 1
-            self._seconds = 60 - abs(self._seconds)
-        elif self._seconds >= 60:
-            self._minutes += 1
-            self._seconds = 60 - self._seconds
-        self._total += self._seconds
-        if self._minutes < 0:
-            self._hours -= 1
-            self._minutes = 60 - abs(self._minutes)
-        elif self._minutes >= 60:
-            self._hours += 1
-            self._minutes = 60 - self._minutes
-        self._total += self._minutes * 60
+                _hours -= offset_duration.hours
+                _minutes -= offset_duration.minutes
+                _seconds -= offset_duration.seconds
+        if _seconds < 0:
+            _minutes -= 1
+            _seconds = 60 - abs(_seconds)
+        elif _seconds >= 60:
+            _minutes += 1
+            _seconds = 60 - _seconds
+        _total += _seconds
+        if _minutes < 0:
+            _hours -= 1
+            _minutes = 60 - abs(_minutes)
+        elif _minutes >= 60:
+            _hours += 1
+            _minutes = 60 - _minutes
+        _total += _minutes * 60
         adjustment_days = 0
-        if self._hours < 0:
-            self._hours = 24 - abs(self._hours)
+        if _hours < 0:
+            _hours = 24 - abs(_hours)
             adjustment_days = -1
-        elif self._hours >= 24:
-            self._hours = 24 - self._hours
+        elif _hours >= 24:
+            _hours = 24 - _hours
             adjustment_days = 1
-        self._total += self._hours * 60
+        _total += _hours * 60
         # First calculate the years difference, collect the days and subtract them from the total amount of days
-        self._years: int = end.year - start.year
+        _years: int = end.year - start.year
         # If the month of the end date is before the month of the start date, remove 1 year from the total count as it
         # wasn't one full year
         if end.month < start.month:
-            self._years = self._years - 1
+            _years = _years - 1
         leap_days = calendar.leapdays(start.year, end.year)
         total_days = (end - start).days + adjustment_days
         # Remove the total amount of years from the days pool
-        days_left = (total_days - (self._years * 365)) - leap_days
-        self._months: int = 0
-        _year = start.year
-        next_month = start.month + self._months
-        while days_left > 0:
-            if next_month > 12:
-                next_month = 1
-                _year += 1
-            days_in_month = calendar.monthrange(_year, next_month)[1]
-            if days_left - days_in_month >= 0:
-                self._months += 1
-                next_month += 1
-                days_left -= days_in_month
-                self._total += days_in_month * 86400
-            else:
-                break
-        self._days: int = days_left
-        if self._days < 0:
-            self._days = 0
-        self._total += self._days * 86400
-
-    @property
-    def start(self) -> datetime:
-        return self._start
-
-    @property
-    def end(self) -> datetime:
-        return self._end
-
-    @property
-    def duration(self) -> AbstractDuration:
-        return Duration(total_seconds=self._total, years=self._years, months=self._months, days=self._days,
-                        hours=self._hours, minutes=self._minutes, seconds=self._seconds)
+        days_left = (total_days - (_years * 365)) - leap_days
+        # Collect as many whole months, starting from the month of the start date, as the remaining days fit; the
+        # months and the days left over after them make up all the remaining days
+        _months, _days = whole_months(start, days_left)
+        if _days < 0:
+            _days = 0
+        else:
+            _total += days_left * 86400
+        return Duration(total_seconds=_total, years=_years, months=_months, days=_days, hours=_hours,
+                        minutes=_minutes, seconds=_seconds)
 
     def __str__(self):
         return f"{self.start.isoformat()}/{self.end.isoformat()}"
@@ -1601,22 +2085,24 @@ class AbsolutePeriod(interface.PyAbsolutePeriod):
         0700                         2000                0700                           2000
 
          """
-        if isinstance(_t, time):
-            if self.duration.days >= 2:
+        days = self.duration.days
+        kind = operand_kind(_t)
+        if kind == Operand.TIME:
+            if days >= 2:
                 return True
-            elif self.duration.days == 1:
+            elif days == 1:
                 if self.start.time() <= _t <= self.end.time():
                     return True
-        if isinstance(_t, interface.PyTimePeriod):
-            if self.duration.days > 2:
+        if kind == Operand.TIME_PERIOD:
+            if days > 2:
                 # No situation in which the period won't repeat when the period is over 2 days long
                 return True
-            if self.duration.days == 2:
+            if days == 2:
                 # If the period is 2 days long, the TimePeriod must start before it and end after it in order not to
                 # repeat, otherwise, it will repeat
                 if not _t.start < self.start.time() or not self.end.time() < _t.end:
                     return True
-            elif self.duration.days == 1:
+            elif days == 1:
                 # If the period is (at least) 1 day long, it must either start before it or end after it not to repeat
                 if self.start.time() <= _t.start and _t.end <= self.end.time():
                     # The other period starts at the same time or later and ends either before or at the same time as
@@ -1630,7 +2116,9 @@ class AbsolutePeriod(interface.PyAbsolutePeriod):
 
         For instances of TimePeriod, equality will be measured in terms of hours;
         For instances of DatePeriod, equality will be measured in terms of dates;
-        For instances of this class, equality will be measured for both.
+        For instances of this class, equality will be measured for both, comparing the moments in time of the periods
+        (see `start_epoch_us`), regardless of the timezone they are expressed in; a naive period is never equal to an
+        aware one, the same as naive and aware datetimes.
 
         This method does not account for overlaps between the start and end times and/or dates of the periods, to get
         this functionality, look at the following methods:
@@ -1639,17 +2127,78 @@ class AbsolutePeriod(interface.PyAbsolutePeriod):
             get_overlap
             get_disconnect
         """
-        if isinstance(other, interface.PyAbsolutePeriod):
-            return (self.start == other.start
-                    and self.end == other.end)
-        if isinstance(other, interface.PyDatePeriod):
+        kind = operand_kind(other)
+        if kind == Operand.ABSOLUTE_PERIOD:
+            if (self._start.tzinfo is None) != (other.start.tzinfo is None):
+                return False
+            return (self._start_us == other.start_epoch_us
+                    and self._end_us == other.end_epoch_us)
+        if kind == Operand.DATE_PERIOD:
             return (self.start.date() == other.start
                     and self.end.date() == other.end)
-        if isinstance(other, interface.PyTimePeriod):
+        if kind == Operand.TIME_PERIOD:
             return (self.start.time() == other.start
                     and self.end.time() == other.end)
         return False
 
+    def __hash__(self):
+        """ The hash is computed from the start and end datetimes of the period, which keeps it consistent with the
+        equality between two instances of this class and allows periods to be used as dictionary keys, in sets or in
+        memoization caches. The period is hashed by the moments in time it represents (see `start_epoch_us`), so
+        periods describing the same moments in different timezones are equal and share the same hash as well.
+
+        Equality with the TimePeriod and DatePeriod classes (see __eq__ above) only compares the time or the date of
+        this period, so an AbsolutePeriod may be equal to such a period without sharing its hash; mixing different
+        period types within the same set or as keys of the same dictionary will therefore not de-duplicate them.
+        """
+        return hash((self._start_us, self._end_us))
+
+    def __lt__(self, other):
+        """ Instances of this class are ordered by their start datetimes and, for periods starting at the same
+        moment, by their end datetimes, the shorter of the two periods sorting first. This natural order allows lists of
+        periods to be sorted, merged or searched directly with `sorted`, `heapq` and `bisect`, without a key function.
+        The periods are compared by the moments in time they represent (see `start_epoch_us`), so periods set in
+        different timezones are ordered by their instants rather than by their wall clock values.
+
+        Ordering is only defined between instances of the same period kind; comparing with any other object results in
+        a TypeError, as it does with the rest of the built-in types. The same as with datetimes, comparing a naive
+        period with an aware one raises a TypeError as well.
+        """
+        if operand_kind(other) != Operand.ABSOLUTE_PERIOD:
+            return NotImplemented
+        check_awareness(self._start, other.start)
+        other_start = other.start_epoch_us
+        if self._start_us != other_start:
+            return self._start_us < other_start
+        return self._end_us < other.end_epoch_us
+
+    def __le__(self, other):
+        if operand_kind(other) != Operand.ABSOLUTE_PERIOD:
+            return NotImplemented
+        check_awareness(self._start, other.start)
+        other_start = other.start_epoch_us
+        if self._start_us != other_start:
+            return self._start_us < other_start
+        return self._end_us <= other.end_epoch_us
+
+    def __gt__(self, other):
+        if operand_kind(other) != Operand.ABSOLUTE_PERIOD:
+            return NotImplemented
+        check_awareness(self._start, other.start)
+        other_start = other.start_epoch_us
+        if self._start_us != other_start:
+            return self._start_us > other_start
+        return self._end_us > other.end_epoch_us
+
+    def __ge__(self, other):
+        if operand_kind(other) != Operand.ABSOLUTE_PERIOD:
+            return NotImplemented
+        check_awareness(self._start, other.start)
+        other_start = other.start_epoch_us
+        if self._start_us != other_start:
+            return self._start_us > other_start
+        return self._end_us >= other.end_epoch_us
+
     def __contains__(self, item):
         """ Membership test can be done with instances of this class, the DatePeriod and TimePeriod classes,
         datetime.datetime and datetime.date objects; When membership test is done for a period, it assumes that the
@@ -1687,21 +2236,29 @@ class AbsolutePeriod(interface.PyAbsolutePeriod):
                 <url to doc>
                 for more information.
         """
-        if isinstance(item, interface.PyAbsolutePeriod) or isinstance(item, interface.PyWallClockPeriod):
-            if isinstance(item, interface.PyWallClockPeriod):
-                # We can abort early if the duration of the provided period is longer than the duration of this instance
-                if item.duration > self.duration:
-                    return False
+        kind = operand_kind(item)
+        if kind == Operand.ABSOLUTE_PERIOD:
+            check_awareness(self._start, item.start)
+            item_start = item.start_epoch_us
+            item_end = item.end_epoch_us
+            if self._start_us == item_start and self._end_us == item_end:
+                # Equality
+                return False
+            return (self._start_us <= item_start and item_end <= self._end_us) and (self.duration > item.duration)
+        if kind == Operand.WALLCLOCK_PERIOD:
+            # We can abort early if the duration of the provided period is longer than the duration of this instance
+            if item.duration > self.duration:
+                return False
             if self.start == item.start and self.end == item.end:
                 # Equality
                 return False
             return (self.start <= item.start and item.end <= self.end) and (self.duration > item.duration)
-        if isinstance(item, interface.PyDatePeriod):
+        if kind == Operand.DATE_PERIOD:
             if self.start.date() == item.start and self.end.date() == item.end:
                 # Equality
                 return False
             return self.start.date() <= item.start and item.end <= self.end.date()
-        if isinstance(item, interface.PyTimePeriod):
+        if kind == Operand.TIME_PERIOD:
             if self._time_repeats(item):
                 raise TimeAmbiguityError(f"The provided TimePeriod '{item}' exist within this AbsolutePeriod "
                                          f"('{self}') more than once. For more information on this error, "
@@ -1720,11 +2277,12 @@ class AbsolutePeriod(interface.PyAbsolutePeriod):
                         # Starts equal or later but ends later too - existing only once
                         return True
             return self.start.time() <= item.start and item.end <= self.end.time()
-        if isinstance(item, datetime):
-            return self.start <= item <= self.end
-        if isinstance(item, date):
+        if kind == Operand.DATETIME:
+            check_awareness(self._start, item)
+            return self._start_us <= to_epoch_us(item) <= self._end_us
+        if kind == Operand.DATE:
             return self.start.date() <= item <= self.end.date()
-        if isinstance(item, time):
+        if kind == Operand.TIME:
             if self._time_repeats(item):
                 raise TimeAmbiguityError(f"The provided unit of time ('{item}') exist within this AbsolutePeriod "
                                          f"('{self}')  more than once. For more information on this error, "
@@ -1742,11 +2300,16 @@ class AbsolutePeriod(interface.PyAbsolutePeriod):
         and the provided date/DatePeriod begins on the 2024-01-02). In all other cases (datetime and AbsolutePeriod),
         objects are allowed to share the same end-start datetime.
         """
-        if isinstance(other, interface.PyDatePeriod):
+        kind = operand_kind(other)
+        if kind == Operand.ABSOLUTE_PERIOD:
+            check_awareness(self._start, other.start)
+            return self._end_us <= other.start_epoch_us
+        elif kind == Operand.DATE_PERIOD:
             return self.end.date() < other.start
-        elif isinstance(other, datetime):
-            return self.end <= other
-        elif isinstance(other, date):
+        elif kind == Operand.DATETIME:
+            check_awareness(self._start, other)
+            return self._end_us <= to_epoch_us(other)
+        elif kind == Operand.DATE:
             return self.end.date() < other
         return self.end <= other.start
 
@@ -1758,11 +2321,16 @@ class AbsolutePeriod(interface.PyAbsolutePeriod):
         2024-01-02 and the provided date/DatePeriod ends on the 2024-01-01). In all other cases (datetime and
         AbsolutePeriod), objects are allowed to share the same end-start datetime.
         """
-        if isinstance(other, interface.PyDatePeriod):
+        kind = operand_kind(other)
+        if kind == Operand.ABSOLUTE_PERIOD:
+            check_awareness(self._start, other.start)
+            return other.end_epoch_us <= self._start_us
+        elif kind == Operand.DATE_PERIOD:
             return other.end < self.start.date()
-        elif isinstance(other, datetime):
-            return other <= self.start
-        elif isinstance(other, date):
+        elif kind == Operand.DATETIME:
+            check_awareness(self._start, other)
+            return to_epoch_us(other) <= self._start_us
+        elif kind == Operand.DATE:
             return other < self.start.date()
         return other.end <= self.start
 
@@ -1778,14 +2346,16 @@ class AbsolutePeriod(interface.PyAbsolutePeriod):
         """
         _start = None
         _end = None
-        if isinstance(other, interface.PyAbsolutePeriod):
-            if self.is_before(other):
-                _start = self.end
-                _end = other.start
-            elif self.is_after(other):
-                _start = other.end
-                _end = self.start
-        elif isinstance(other, datetime):
+        kind = operand_kind(other)
+        if kind == Operand.ABSOLUTE_PERIOD:
+            # Both values come from already validated periods; there is no interim between periods that touch
+            check_awareness(self._start, other.start)
+            if self._end_us < other.start_epoch_us:
+                return AbsolutePeriod.from_validated(start=self.end, end=other.start)
+            if other.end_epoch_us < self._start_us:
+                return AbsolutePeriod.from_validated(start=other.end, end=self.start)
+            return None
+        elif kind == Operand.DATETIME:
             if self.is_before(other):
                 _start = self.end
                 _end = other
@@ -1795,6 +2365,48 @@ class AbsolutePeriod(interface.PyAbsolutePeriod):
         if  _start and _end:
             return AbsolutePeriod(start=_start, end=_end)
 
+    def relation(self,
+                 other: interface.PyTimePeriod | interface.PyDatePeriod | interface.PyAbsolutePeriod
+                 ) -> Relation:
+        """ Returns the relation of this period to the other one, as one of the thirteen relations of Allen's interval
+        algebra (see temporals.relations.Relation), classified with a single pass over the start and end of the two
+        periods. A period ending exactly when the other one starts meets it, rather than overlapping it:
+
+        >>> this_period.relation(other_period)
+        <Relation.OVERLAPS: 'overlaps'>
+
+        When the other period is a DatePeriod, only the dates of this period are considered. Absolute periods are
+        compared by the moments in time they represent (see `start_epoch_us`), regardless of the timezone they are set in.
+
+        When the other period is a TimePeriod, only the times of this period are considered; if this period spans more
+        than a single day, the TimePeriod is placed on each of these days and it is classified on the only day it
+        meets, overlaps or is within this period.
+
+        Raises:
+            TypeError - raised if the other object is not a TimePeriod, a DatePeriod or an instance of this class, or
+                if it is an instance of this class and only one of the two periods is naive
+            TimeAmbiguityError - raised if this period spans more than a day and the TimePeriod meets, overlaps or is
+                within it on more than one of them
+        """
+        relation = self._relate(other, operand_kind(other))
+        if relation is None:
+            raise TypeError(f"Cannot perform temporal operations with instances of type '{type(other)}'")
+        return relation
+
+    def _relate(self, other, kind: int) -> Relation | None:
+        """ Internal method that classifies the other period, which is of the provided operand kind, against this one;
+        None is returned for objects which this period cannot relate to
+        """
+        if kind == Operand.ABSOLUTE_PERIOD:
+            # The overlaps and disconnects are made of the start and end of both periods, which must not be mixed
+            check_awareness(self._start, other.start)
+            return _classify(self._start_us, self._end_us, other.start_epoch_us, other.end_epoch_us)
+        if kind == Operand.DATE_PERIOD:
+            return _classify(self._start.date(), self._end.date(), other.start, other.end)
+        if kind == Operand.TIME_PERIOD:
+            return _time_relation(self, other)
+        return None
+
     def overlaps_with(self,
                       other: interface.PyTimePeriod | interface.PyDatePeriod | interface.PyAbsolutePeriod
                       ) -> bool:
@@ -1824,33 +2436,24 @@ class AbsolutePeriod(interface.PyAbsolutePeriod):
         Note that both of these checks will only work for partially overlapping periods - for fully overlapping periods,
         use the `in` membership test:
         >>> this_period in other_period
+
+        In terms of `relation`, this is the case when it returns Relation.OVERLAPPED_BY or Relation.MET_BY.
+        A TimePeriod is compared to the times of the start and end of this period instead.
+
+        Raises:
+            TypeError - raised if the other object is an instance of this class and only one of the two periods is
+                naive
+            TimeAmbiguityError - raised if the other one is a TimePeriod which exists within this period more than
+                once, or which starts either before or after this period depending on the day it is placed on
         """
-        if isinstance(other, interface.PyTimePeriod):
-            if self._time_repeats(other):
-                raise TimeAmbiguityError(f"The provided TimePeriod '{other}' exist within this AbsolutePeriod "
-                                         f"('{self}') more than once. For more information on this error, "
-                                         f"see https://github.com/dimitarOnGithub/temporals/wiki/Errors")
-            if self.start.date() < self.end.date():
-                # Day stretches overnight - the start time must be before the start of this period but also after the
-                # end of it
-                if other.start < self.start.time() and other.start < self.end.time():
-                    raise TimeAmbiguityError(f"The provided TimePeriod ('{other}') is ambiguous compared to this "
-                                             f"AbsolutePeriod ('{self}'); it's overlapped by (starts before) this "
-                                             f"period on {self.start.date().isoformat()} but this period continues "
-                                             f"until after it's start on {self.end.date().isoformat()}")
-                else:
-                    if not other.end < self.start.time():
-                        return other.start <= self.start.time()
-            else:
-                if not other.end < self.start.time():
-                    return other.start < self.start.time() and other.end < self.end.time()
-        if isinstance(other, interface.PyDatePeriod):
-            if not other.end < self.start.date():
-                return other.start < self.start.date() and other.end < self.end.date()
-        if isinstance(other, interface.PyAbsolutePeriod):
-            if not other.end < self.start:
-                return other.start < self.start and other.end < self.end
-        return False
+        kind = operand_kind(other)
+        if kind == Operand.TIME_PERIOD:
+            overlaps = _time_overlaps(self, other)[0]
+            if overlaps is None:
+                raise _time_ambiguity(self, other)
+            return overlaps
+        relation = self._relate(other, kind)
+        return relation is _OVERLAPPED_BY or relation is _MET_BY
 
     def overlapped_by(self,
                       other: interface.PyTimePeriod | interface.PyDatePeriod | interface.PyAbsolutePeriod
@@ -1880,33 +2483,24 @@ class AbsolutePeriod(interface.PyAbsolutePeriod):
         Note that both of these checks will only work for partially overlapping periods - for fully overlapping periods,
         use the `in` membership test:
         >>> this_period in other_period
+
+        In terms of `relation`, this is the case when it returns Relation.OVERLAPS or Relation.MEETS.
+        A TimePeriod is compared to the times of the start and end of this period instead.
+
+        Raises:
+            TypeError - raised if the other object is an instance of this class and only one of the two periods is
+                naive
+            TimeAmbiguityError - raised if the other one is a TimePeriod which exists within this period more than
+                once, or which starts either before or after this period depending on the day it is placed on
         """
-        if isinstance(other, interface.PyTimePeriod):
-            if self._time_repeats(other):
-                raise TimeAmbiguityError(f"The provided TimePeriod '{other}' exist within this AbsolutePeriod "
-                                         f"('{self}') more than once. For more information on this error, "
-                                         f"see https://github.com/dimitarOnGithub/temporals/wiki/Errors")
-            if self.start.date() < self.end.date():
-                # Day stretches overnight - the start time must be after the start of this period but also after the
-                # end of it
-                if self.start.time() < other.start and self.end.time() < other.end:
-                    raise TimeAmbiguityError(f"The provided TimePeriod ('{other}') is ambiguous compared to this "
-                                             f"AbsolutePeriod ('{self}'); it overlaps with (starts after) this "
-                                             f"period on {self.start.date().isoformat()} but this period continues "
-                                             f"until after it's start on {self.end.date().isoformat()}")
-                else:
-                    if not self.end.time() < other.start:
-                        return self.start.time() <= other.start
-            else:
-                if not self.end.time() < other.start:
-                    return self.start.time() < other.start and self.end.time() < other.end
-        if isinstance(other, interface.PyDatePeriod):
-            if not self.end.date() < other.start:
-                return self.start.date() < other.start and self.end.date() < other.end
-        if isinstance(other, interface.PyAbsolutePeriod):
-            if not self.end < other.start:
-                return self.start < other.start and self.end < other.end
-        return False
+        kind = operand_kind(other)
+        if kind == Operand.TIME_PERIOD:
+            overlapped = _time_overlaps(self, other)[1]
+            if overlapped is None:
+                raise _time_ambiguity(self, other)
+            return overlapped
+        relation = self._relate(other, kind)
+        return relation is _OVERLAPS or relation is _MEETS
 
     def get_overlap(self,
                     other: interface.PyTimePeriod | interface.PyDatePeriod | interface.PyAbsolutePeriod
@@ -1948,30 +2542,46 @@ class AbsolutePeriod(interface.PyAbsolutePeriod):
         result:
         >>> period2.get_overlap(period1)
         TimePeriod(start=datetime.time(10, 0), end=datetime.time(12, 0))
+
+        Raises:
+            TypeError - raised if the other object is not a TimePeriod, a DatePeriod or an instance of this class, or
+                if it is an instance of this class and only one of the two periods is naive
+            TimeAmbiguityError - raised if the other one is a TimePeriod which exists within this period more than
+                once, or which starts either before or after this period depending on the day it is placed on
         """
-        if (not isinstance(other, interface.PyTimePeriod)
-                and not isinstance(other, interface.PyDatePeriod)
-                and not isinstance(other, interface.PyAbsolutePeriod)):
-            raise TypeError(f"Cannot perform temporal operations with instances of type '{type(other)}'")
-        period_to_use = None
-        _start = None
-        _end = None
-        if self.overlaps_with(other) or self.overlapped_by(other):
-            if isinstance(other, interface.PyTimePeriod):
-                period_to_use = TimePeriod
-                _start = self.start.time() if self.overlaps_with(other) else other.start
-                _end = other.end if self.overlaps_with(other) else self.end.time()
-            elif isinstance(other, interface.PyDatePeriod):
-                period_to_use = DatePeriod
-                _start = self.start.date() if self.overlaps_with(other) else other.start
-                _end = other.end if self.overlaps_with(other) else self.end.date()
+        kind = operand_kind(other)
+        if kind == Operand.TIME_PERIOD:
+            overlaps, overlapped = _time_overlaps(self, other)
+            if overlaps is None:
+                raise _time_ambiguity(self, other)
+            if overlaps:
+                _start = self._start.time()
+                _end = other.end
             else:
-                period_to_use = AbsolutePeriod
-                _start = self.start if self.overlaps_with(other) else other.start
-                _end = other.end if self.overlaps_with(other) else self.end
-            return period_to_use(start=_start, end=_end)
-        else:
+                if overlapped is None:
+                    raise _time_ambiguity(self, other)
+                if not overlapped:
+                    return None
+                _start = other.start
+                _end = self._end.time()
+            # The times of a period stretching overnight may not form an overlap within a single day
+            if _start < _end:
+                return TimePeriod.from_validated(start=_start, end=_end)
             return None
+        relation = self._relate(other, kind)
+        if relation is None:
+            raise TypeError(f"Cannot perform temporal operations with instances of type '{type(other)}'")
+        if relation is _OVERLAPPED_BY:
+            # The other period has begun first, the overlap lasts from the start of this period until its end
+            if kind == Operand.DATE_PERIOD:
+                return DatePeriod.from_validated(start=self._start.date(), end=other.end)
+            return AbsolutePeriod.from_validated(start=self._start, end=other.end)
+        if relation is _OVERLAPS:
+            # This period has begun first, the overlap lasts from the start of the other period until its end
+            if kind == Operand.DATE_PERIOD:
+                return DatePeriod.from_validated(start=other.start, end=self._end.date())
+            return AbsolutePeriod.from_validated(start=other.start, end=self._end)
+        return None
 
     def get_disconnect(self,
                        other: interface.PyTimePeriod | interface.PyDatePeriod | interface.PyAbsolutePeriod
@@ -2010,38 +2620,47 @@ class AbsolutePeriod(interface.PyAbsolutePeriod):
         But if you want to obtain the same as relative to Period 2 instead:
         >>> period2.get_disconnect(period1)
         AbsolutePeriod(start=datetime.datetime(2024, 1, 1, 12, 0), end=datetime.datetime(2024, 1, 1, 13, 0))
+
+        Raises:
+            TypeError - raised if the other object is not a TimePeriod, a DatePeriod or an instance of this class, or
+                if it is an instance of this class and only one of the two periods is naive
+            TimeAmbiguityError - raised if the other one is a TimePeriod which exists within this period more than
+                once, or which starts either before or after this period depending on the day it is placed on
         """
-        if (not isinstance(other, interface.PyTimePeriod)
-                and not isinstance(other, interface.PyDatePeriod)
-                and not isinstance(other, interface.PyAbsolutePeriod)):
-            raise TypeError(f"Cannot perform temporal operations with instances of type '{type(other)}'")
+        kind = operand_kind(other)
         period_to_use = None
         _start = None
         _end = None
-        if isinstance(other, TimePeriod):
-            period_to_use = TimePeriod
-            if self.overlapped_by(other):
-                _start = self.start.time()
+        if kind == Operand.TIME_PERIOD:
+            overlaps, overlapped = _time_overlaps(self, other)
+            if overlapped is None:
+                raise _time_ambiguity(self, other)
+            if overlapped:
+                _start = self._start.time()
                 _end = other.start
-            elif self.overlaps_with(other):
-                _start = other.end
-                _end = self.end.time()
-        elif isinstance(other, DatePeriod):
+            else:
+                if overlaps is None:
+                    raise _time_ambiguity(self, other)
+                if overlaps:
+                    _start = other.end
+                    _end = self._end.time()
+            # The times of a period stretching overnight may not form a disconnect within a single day
+            if _start is not None and _start < _end:
+                return TimePeriod.from_validated(start=_start, end=_end)
+            return None
+        relation = self._relate(other, kind)
+        if relation is None:
+            raise TypeError(f"Cannot perform temporal operations with instances of type '{type(other)}'")
+        if kind == Operand.DATE_PERIOD:
             period_to_use = DatePeriod
-            if self.overlapped_by(other):
-                _start = self.start.date()
-                _end = other.start
-            elif self.overlaps_with(other):
-                _start = other.end
-                _end = self.end.date()
+            _start = self._start.date()
+            _end = self._end.date()
         else:
             period_to_use = AbsolutePeriod
-            if self.overlapped_by(other):
-                _start = self.start
-                _end = other.start
-            elif self.overlaps_with(other):
-                _start = other.end
-                _end = self.end
-        if period_to_use and _start and _end:
-            return period_to_use(start=_start, end=_end)
+            _start = self._start
+            _end = self._end
+        if relation is _OVERLAPS or relation is _MEETS:
+            return period_to_use.from_validated(start=_start, end=other.start)
+        if relation is _OVERLAPPED_BY or relation is _MET_BY:
+            return period_to_use.from_validated(start=other.end, end=_end)
         return None
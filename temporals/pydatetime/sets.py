@@ -0,0 +1,300 @@
+""" Sets of periods of a single type, kept sorted and coalesced, with set algebra done by a linear merge of members """
+from bisect import bisect_right
+from typing import Iterable, Iterator
+
+from .periods import TimePeriod, DatePeriod, WallClockPeriod, AbsolutePeriod
+from .utils import check_awareness, operand_kind, Operand
+
+
+class _PeriodSet:
+    """ Base of the period sets; a set holds disjoint periods of a single type, sorted by their start, where no two
+    members overlap or meet each other - periods that do are coalesced into a single member when the set is created.
+
+    Every operation between two sets walks their members side by side once, so that the union, intersection,
+    difference and symmetric difference of sets with `n` and `m` members are obtained in O(n + m) time.
+
+    Subclasses set the type of period they hold; `_bounds` returns the values by which the periods are ordered.
+    """
+
+    __slots__ = ('_periods', '_starts', '_ends')
+
+    _period_class: type = None
+    _kind: int = None
+
+    def __init__(self, periods: Iterable = ()):
+        spans = []
+        for period in periods:
+            if operand_kind(period) != self._kind:
+                raise TypeError(f"Cannot add instances of type '{type(period)}' to {type(self).__name__}")
+            start_key, end_key = self._bounds(period)
+            spans.append([start_key, end_key, period.start, period.end, period])
+        spans.sort(key=_span_start)
+        self._assign(_coalesce(spans))
+
+    @staticmethod
+    def _bounds(period) -> tuple:
+        return period.start, period.end
+
+    @classmethod
+    def _from_spans(cls, spans: list) -> '_PeriodSet':
+        """ Internal method that creates a set from spans which are already sorted, disjoint and coalesced """
+        instance = cls.__new__(cls)
+        instance._assign(spans)
+        return instance
+
+    def _assign(self, spans: list) -> None:
+        """ Spans are lists of [start key, end key, start, end, period], where the period is the untouched member that
+        the span has been taken from, or None if a new one must be created for it
+        """
+        period_class = self._period_class
+        periods = []
+        starts = []
+        ends = []
+        for start_key, end_key, start, end, period in spans:
+            if period is None:
+                period = period_class.from_validated(start=start, end=end)
+            periods.append(period)
+            starts.append(start_key)
+            ends.append(end_key)
+        self._periods = tuple(periods)
+        self._starts = starts
+        self._ends = ends
+
+    def _check(self, other) -> None:
+        if type(other) is not type(self):
+            raise TypeError(f"Cannot perform set operations between {type(self).__name__} and '{type(other)}'")
+
+    @property
+    def periods(self) -> tuple:
+        """ The members of this set, sorted by their start """
+        return self._periods
+
+    def __iter__(self) -> Iterator:
+        return iter(self._periods)
+
+    def __len__(self) -> int:
+        return len(self._periods)
+
+    def __bool__(self) -> bool:
+        return bool(self._periods)
+
+    def __repr__(self):
+        return f"{type(self).__name__}({list(self._periods)!r})"
+
+    def __eq__(self, other):
+        if type(other) is not type(self):
+            return NotImplemented
+        return self._starts == other._starts and self._ends == other._ends
+
+    def __hash__(self):
+        return hash((type(self), tuple(self._starts), tuple(self._ends)))
+
+    def __contains__(self, item) -> bool:
+        """ Test if a period of the type held by this set is fully contained within one of its members; since the
+        members are disjoint, only the last member starting before the period has to be checked
+        """
+        if operand_kind(item) != self._kind:
+            raise TypeError(f"Cannot perform temporal operations with instances of type '{type(item)}'")
+        start, end = self._bounds(item)
+        index = bisect_right(self._starts, start) - 1
+        return index >= 0 and end <= self._ends[index]
+
+    def union(self, other: '_PeriodSet') -> '_PeriodSet':
+        """ Returns a new set holding every span of time that is within either this set or the other one """
+        self._check(other)
+        return self._from_spans(_coalesce(_merge(self._spans(), other._spans())))
+
+    def intersection(self, other: '_PeriodSet') -> '_PeriodSet':
+        """ Returns a new set holding the spans of time that are within both this set and the other one """
+        self._check(other)
+        return self._from_spans(_intersect(self, other))
+
+    def difference(self, other: '_PeriodSet') -> '_PeriodSet':
+        """ Returns a new set holding the spans of time that are within this set but not within the other one """
+        self._check(other)
+        return self._from_spans(_subtract(self, other))
+
+    def symmetric_difference(self, other: '_PeriodSet') -> '_PeriodSet':
+        """ Returns a new set holding the spans of time that are within exactly one of this set and the other one """
+        self._check(other)
+        return self._from_spans(_coalesce(_merge(_subtract(self, other), _subtract(other, self))))
+
+    def __or__(self, other):
+        if type(other) is not type(self):
+            return NotImplemented
+        return self.union(other)
+
+    def __and__(self, other):
+        if type(other) is not type(self):
+            return NotImplemented
+        return self.intersection(other)
+
+    def __sub__(self, other):
+        if type(other) is not type(self):
+            return NotImplemented
+        return self.difference(other)
+
+    def __xor__(self, other):
+        if type(other) is not type(self):
+            return NotImplemented
+        return self.symmetric_difference(other)
+
+    def _spans(self) -> list:
+        return [[start_key, end_key, period.start, period.end, period]
+                for start_key, end_key, period in zip(self._starts, self._ends, self._periods)]
+
+
+def _span_start(span):
+    return span[0]
+
+
+def _merge(first: list, second: list) -> list:
+    """ Merges two lists of spans, each sorted by start, into one sorted list """
+    merged = []
+    i = 0
+    j = 0
+    first_len = len(first)
+    second_len = len(second)
+    while i < first_len and j < second_len:
+        if second[j][0] < first[i][0]:
+            merged.append(second[j])
+            j += 1
+        else:
+            merged.append(first[i])
+            i += 1
+    merged.extend(first[i:])
+    merged.extend(second[j:])
+    return merged
+
+
+def _coalesce(spans: list) -> list:
+    """ Coalesces spans sorted by start into disjoint spans where no two of them overlap or meet """
+    result = []
+    last = None
+    for span in spans:
+        if last is not None and span[0] <= last[1]:
+            if span[1] > last[1]:
+                result[-1] = last = [last[0], span[1], last[2], span[3], None]
+            continue
+        result.append(span)
+        last = span
+    return result
+
+
+def _intersect(this: _PeriodSet, other: _PeriodSet) -> list:
+    this_periods, this_starts, this_ends = this._periods, this._starts, this._ends
+    other_periods, other_starts, other_ends = other._periods, other._starts, other._ends
+    this_len = len(this_periods)
+    other_len = len(other_periods)
+    spans = []
+    i = 0
+    j = 0
+    while i < this_len and j < other_len:
+        this_period = this_periods[i]
+        other_period = other_periods[j]
+        if this_starts[i] < other_starts[j]:
+            start_key, start = other_starts[j], other_period.start
+        else:
+            start_key, start = this_starts[i], this_period.start
+        # The member that ends first cannot intersect anything past the current member of the other set
+        if this_ends[i] < other_ends[j]:
+            end_key, end = this_ends[i], this_period.end
+            i += 1
+        else:
+            end_key, end = other_ends[j], other_period.end
+            j += 1
+        if start_key < end_key:
+            spans.append([start_key, end_key, start, end, None])
+    return spans
+
+
+def _subtract(this: _PeriodSet, other: _PeriodSet) -> list:
+    other_periods, other_starts, other_ends = other._periods, other._starts, other._ends
+    other_len = len(other_periods)
+    spans = []
+    j = 0
+    for start_key, end_key, period in zip(this._starts, this._ends, this._periods):
+        # Members of the other set ending before this member starts cannot reach any of the following members either
+        while j < other_len and other_ends[j] <= start_key:
+            j += 1
+        current_key = start_key
+        current = period.start
+        untouched = True
+        k = j
+        while k < other_len and other_starts[k] < end_key:
+            if other_starts[k] > current_key:
+                spans.append([current_key, other_starts[k], current, other_periods[k].start, None])
+            untouched = False
+            if other_ends[k] >= end_key:
+                current_key = None
+                break
+            current_key = other_ends[k]
+            current = other_periods[k].end
+            k += 1
+        # The member at `k` may extend past this member and remove a part of the next one as well
+        j = k
+        if current_key is not None:
+            spans.append([current_key, end_key, current, period.end, period if untouched else None])
+    return spans
+
+
+class TimePeriodSet(_PeriodSet):
+    """ A set of disjoint TimePeriods within a single day """
+
+    __slots__ = ()
+
+    _period_class = TimePeriod
+    _kind = Operand.TIME_PERIOD
+
+
+class DatePeriodSet(_PeriodSet):
+    """ A set of disjoint DatePeriods """
+
+    __slots__ = ()
+
+    _period_class = DatePeriod
+    _kind = Operand.DATE_PERIOD
+
+
+class WallClockPeriodSet(_PeriodSet):
+    """ A set of disjoint WallClockPeriods """
+
+    __slots__ = ()
+
+    _period_class = WallClockPeriod
+    _kind = Operand.WALLCLOCK_PERIOD
+
+
+class AbsolutePeriodSet(_PeriodSet):
+    """ A set of disjoint AbsolutePeriods; the members are ordered and coalesced by the moments in time they represent,
+    so periods set in different timezones are combined together. Naive and aware periods cannot be held by the same
+    set, nor combined with each other, which raises a TypeError.
+    """
+
+    __slots__ = ()
+
+    _period_class = AbsolutePeriod
+    _kind = Operand.ABSOLUTE_PERIOD
+
+    @staticmethod
+    def _bounds(period) -> tuple:
+        return period.start_epoch_us, period.end_epoch_us
+
+    def __init__(self, periods: Iterable = ()):
+        periods = tuple(periods)
+        super().__init__(periods)
+        # The members are coalesced by their epochs, which take naive datetimes to be in UTC; the same as naive and
+        # aware datetimes cannot be compared, naive and aware periods cannot be combined into one
+        for period in periods:
+            check_awareness(periods[0].start, period.start)
+
+    def _check(self, other) -> None:
+        super()._check(other)
+        if self._periods and other._periods:
+            check_awareness(self._periods[0].start, other._periods[0].start)
+
+    def __contains__(self, item) -> bool:
+        # The same as `item in period` for any of the members, a naive period is not compared with aware ones
+        if self._periods and operand_kind(item) == self._kind:
+            check_awareness(self._periods[0].start, item.start)
+        return super().__contains__(item)
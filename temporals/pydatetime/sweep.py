@@ -0,0 +1,477 @@
+""" Sweep-line algorithms over iterables of periods of a single type; each of them visits the periods once, in the order
+of their start, keeping only the state of the sweep in memory
+"""
+import heapq
+from datetime import timedelta
+from typing import Iterable, Iterator
+
+from .periods import TimePeriod, DatePeriod, WallClockPeriod, AbsolutePeriod
+from .utils import operand_kind, check_awareness, Operand
+
+_US_PER_DAY = 86400 * 1000000
+_MICROSECOND = timedelta(microseconds=1)
+
+_PERIOD_CLASSES = {
+    Operand.TIME_PERIOD: TimePeriod,
+    Operand.DATE_PERIOD: DatePeriod,
+    Operand.WALLCLOCK_PERIOD: WallClockPeriod,
+    Operand.ABSOLUTE_PERIOD: AbsolutePeriod,
+}
+
+
+def _time_us(value) -> int:
+    return ((value.hour * 60 + value.minute) * 60 + value.second) * 1000000 + value.microsecond
+
+
+def _sort_bounds(period, kind: int) -> tuple:
+    """ The start and end of the period on a single axis for each type of period, which the periods are sorted by and
+    the difference of which measures the gap between them: microseconds since midnight for TimePeriods, since the start
+    of the proleptic Gregorian calendar for DatePeriods and since the epoch for AbsolutePeriods. WallClockPeriods keep
+    their datetimes, which are ordered by their wall clock values, regardless of their `fold`, the same way
+    `WallClockPeriod.__lt__` orders the periods.
+    """
+    if kind == Operand.ABSOLUTE_PERIOD:
+        return period.start_epoch_us, period.end_epoch_us
+    if kind == Operand.WALLCLOCK_PERIOD:
+        return period.start, period.end
+    if kind == Operand.DATE_PERIOD:
+        return period.start.toordinal() * _US_PER_DAY, period.end.toordinal() * _US_PER_DAY
+    return _time_us(period.start), _time_us(period.end)
+
+
+def _period_kind(period, kind: int | None) -> int:
+    """ Resolves the kind of the period, checking that it is a period of the same type as the ones before it """
+    period_kind = operand_kind(period)
+    if period_kind not in _PERIOD_CLASSES:
+        raise TypeError(f"Cannot perform temporal operations with instances of type '{type(period)}'")
+    if kind is not None and period_kind != kind:
+        raise TypeError(f"Cannot combine instances of type '{type(period)}' with periods of another type")
+    return period_kind
+
+
+def _check_mixed(period, first, kind: int) -> None:
+    """ The same as naive and aware datetimes cannot be compared, naive and aware wallclock or absolute periods are not
+    swept over together and raise a TypeError
+    """
+    if kind == Operand.ABSOLUTE_PERIOD or kind == Operand.WALLCLOCK_PERIOD:
+        check_awareness(first.start, period.start)
+
+
+def _sort_by_start(periods: Iterable) -> list:
+    """ Sorts the periods by their start and end, as measured by `_sort_bounds`, checking they are of a single type """
+    kind = None
+    keyed = []
+    for period in periods:
+        kind = _period_kind(period, kind)
+        if keyed:
+            _check_mixed(period, keyed[0][1], kind)
+        keyed.append((_sort_bounds(period, kind), period))
+    keyed.sort(key=_first)
+    return [period for _, period in keyed]
+
+
+def _first(item):
+    return item[0]
+
+
+def coalesce(periods: Iterable, adjacency: timedelta | None = timedelta(0)) -> list:
+    """ Collapses the periods into the fewest periods covering all of them, sorted by their start; the periods may be
+    provided in any order, but must all be of the same type.
+
+    The `adjacency` sets how far apart two periods can be and still be merged into one, which then covers the gap
+    between them as well: by default, periods which overlap or meet each other are merged, while with `adjacency=None`
+    only the periods which overlap are merged.
+    Since both the start and end dates belong to a DatePeriod, consecutive DatePeriods are merged by allowing a day
+    between them:
+
+    >>> coalesce([DatePeriod(start=date(2024, 1, 1), end=date(2024, 1, 5)),
+    ...           DatePeriod(start=date(2024, 1, 6), end=date(2024, 1, 9))], adjacency=timedelta(days=1))
+    [DatePeriod(start=datetime.date(2024, 1, 1), end=datetime.date(2024, 1, 9))]
+
+    Periods that are not merged with any other one are returned as they are, new periods are created only for the
+    merged ones. The periods are sorted once and then coalesced in a single pass; see `coalesce_sorted` for periods
+    that are already sorted.
+
+    Raises:
+        TypeError - raised if the periods are not all periods of the same type
+        ValueError - raised if the adjacency is negative
+    """
+    return list(coalesce_sorted(_sort_by_start(periods), adjacency))
+
+
+def coalesce_sorted(periods: Iterable, adjacency: timedelta | None = timedelta(0)) -> Iterator:
+    """ Generator that coalesces periods which are already sorted by their start, the same way `coalesce` does, while
+    they are being iterated over; each merged period is produced as soon as the period following it starts too far
+    from it, so that only the period being merged is held in memory at any time.
+
+    Raises:
+        TypeError - raised if the periods are not all periods of the same type
+        ValueError - raised if the adjacency is negative, or if the periods are found not to be sorted by their start
+    """
+    if adjacency is None:
+        # Meeting periods have no gap between them; requiring a negative one leaves only the overlapping periods
+        gap = -1
+    elif adjacency < timedelta(0):
+        raise ValueError(f"The adjacency of the periods cannot be negative; value provided: {adjacency}")
+    else:
+        gap = adjacency // _MICROSECOND
+    kind = None
+    current = None
+    current_start = current_end = 0
+    merged_end = None
+    for period in periods:
+        kind = _period_kind(period, kind)
+        start, end = _sort_bounds(period, kind)
+        if current is None:
+            period_class = _PERIOD_CLASSES[kind]
+            if kind == Operand.WALLCLOCK_PERIOD:
+                # The datetimes of wallclock periods are subtracted as they are
+                gap = gap * _MICROSECOND
+            current, current_start, current_end = period, start, end
+            continue
+        _check_mixed(period, current, kind)
+        if start < current_start:
+            raise ValueError(f"The periods are not sorted by their start; '{period}' follows '{current}'")
+        if start - current_end <= gap:
+            # Periods within the current one leave it as it is
+            if end > current_end:
+                current_end = end
+                merged_end = period.end
+            continue
+        yield current if merged_end is None else period_class.from_validated(start=current.start, end=merged_end)
+        current, current_start, current_end = period, start, end
+        merged_end = None
+    if current is not None:
+        yield current if merged_end is None else period_class.from_validated(start=current.start, end=merged_end)
+
+
+def gaps(periods: Iterable, within=None) -> Iterator:
+    """ Returns a lazy iterator over the gaps between the periods, which must all be of the same type and sorted by
+    their start; each gap is a period of the same type, from the latest end among the periods preceding it until the
+    start of the period following it, the same way `get_interim` would return it for these two periods. Periods which
+    overlap or meet each other have no gap between them.
+
+    When an enclosing period of the same type is provided as `within`, the gaps are bounded by it: the gaps from its
+    start until the first period and from the last period until its end are included as well, and the iteration stops
+    as soon as the periods reach its end, without consuming the rest of them.
+
+    >>> jobs = [WallClockPeriod(start=datetime(2024, 1, 1, 9, 0), end=datetime(2024, 1, 1, 11, 0)),
+    ...         WallClockPeriod(start=datetime(2024, 1, 1, 13, 0), end=datetime(2024, 1, 1, 17, 0))]
+    >>> day = WallClockPeriod(start=datetime(2024, 1, 1, 8, 0), end=datetime(2024, 1, 1, 18, 0))
+    >>> for gap in gaps(jobs, within=day):
+    ...     print(gap)
+    2024-01-01T08:00:00/2024-01-01T09:00:00
+    2024-01-01T11:00:00/2024-01-01T13:00:00
+    2024-01-01T17:00:00/2024-01-01T18:00:00
+
+    Raises:
+        TypeError - raised if the periods, or the enclosing period, are not all periods of the same type
+        ValueError - raised, while iterating, if the periods are found not to be sorted by their start
+    """
+    kind = None
+    if within is not None:
+        kind = _period_kind(within, None)
+    return _gaps(periods, within, kind)
+
+
+def _gaps(periods: Iterable, within, kind: int | None) -> Iterator:
+    periods = iter(periods)
+    if within is None:
+        # The sweep starts at the end of the first period
+        first = next(periods, None)
+        if first is None:
+            return
+        kind = _period_kind(first, None)
+        start_key, cursor_key = _bounds(first, kind)
+        cursor = first.end
+        limit_key = None
+        previous_start = start_key
+        reference = first
+    else:
+        start_key, limit_key = _bounds(within, kind)
+        cursor_key = start_key
+        cursor = within.start
+        previous_start = None
+        reference = within
+    period_class = _PERIOD_CLASSES[kind]
+    datetimes = kind == Operand.ABSOLUTE_PERIOD or kind == Operand.WALLCLOCK_PERIOD
+    limited = limit_key is not None
+    for period in periods:
+        if type(period) is not period_class:
+            _period_kind(period, kind)
+        # Only the order of the starts and ends matters, which the times, dates and wall clock values already provide;
+        # absolute periods are compared by their epochs, as they are sorted, since they may be in different timezones
+        if datetimes:
+            check_awareness(reference.start, period.start)
+            start, end = _bounds(period, kind)
+        else:
+            start = period.start
+            end = period.end
+        if previous_start is not None and start < previous_start:
+            raise ValueError(f"The periods are not sorted by their start; '{period}' follows a period starting later")
+        previous_start = start
+        if start > cursor_key:
+            if limited and start >= limit_key:
+                break
+            yield period_class.from_validated(start=cursor, end=period.start)
+        if end > cursor_key:
+            cursor_key = end
+            cursor = period.end
+            if limited and cursor_key >= limit_key:
+                # Nothing is left to be found within the enclosing period
+                break
+    if limited and cursor_key < limit_key:
+        yield period_class.from_validated(start=cursor, end=within.end)
+
+
+def _bounds(period, kind: int) -> tuple:
+    """ The values the sweeps order the periods by; the same order as the one of `_sort_bounds`, which the periods are
+    sorted by, without converting the times and dates
+    """
+    if kind == Operand.ABSOLUTE_PERIOD:
+        return period.start_epoch_us, period.end_epoch_us
+    return period.start, period.end
+
+
+def depth_profile(periods: Iterable) -> Iterator:
+    """ Returns a lazy iterator over the depth profile of the periods, which must all be of the same type: the number of
+    periods active at any point in time, as a step function of (instant, count) tuples for each instant where the
+    count changes. A period is active from its start until its end, so that the count drops when a period ends and
+    periods that meet each other are never active at the same time:
+
+    >>> sessions = [WallClockPeriod(start=datetime(2024, 1, 1, 9, 0), end=datetime(2024, 1, 1, 11, 0)),
+    ...             WallClockPeriod(start=datetime(2024, 1, 1, 10, 0), end=datetime(2024, 1, 1, 12, 0)),
+    ...             WallClockPeriod(start=datetime(2024, 1, 1, 12, 0), end=datetime(2024, 1, 1, 13, 0))]
+    >>> for instant, count in depth_profile(sessions):
+    ...     print(instant.time(), count)
+    09:00:00 1
+    10:00:00 2
+    11:00:00 1
+    13:00:00 0
+
+    The periods may be provided in any order; they are sorted once, in O(n log n) time, and then swept over as
+    `depth_profile_sorted` does.
+
+    Raises:
+        TypeError - raised if the periods are not all periods of the same type
+    """
+    return depth_profile_sorted(_sort_by_start(periods))
+
+
+def depth_profile_sorted(periods: Iterable) -> Iterator:
+    """ Generator producing the depth profile, as `depth_profile` does, of periods which are already sorted by their
+    start; each change point is produced as soon as the periods have moved past it, and only the ends of the periods
+    which are active at the time are held in memory, taking O(log n) time for each period.
+
+    Raises:
+        TypeError - raised if the periods are not all periods of the same type
+        ValueError - raised if the periods are found not to be sorted by their start
+    """
+    count = 0
+    reported = 0
+    current_key = None
+    current = None
+    for key, instant, change in _events(periods):
+        if key != current_key:
+            if count != reported:
+                yield current, count
+                reported = count
+            current_key = key
+            current = instant
+        count += change
+    if count != reported:
+        yield current, count
+
+
+def _events(periods: Iterable) -> Iterator:
+    """ Produces the starts and ends of periods sorted by their start as (key, instant, change) tuples, sorted by the
+    key; the ends of the active periods wait in a heap until a period starting at or after them is reached
+    """
+    kind = None
+    first = None
+    active = []
+    previous_start = None
+    for sequence, period in enumerate(periods):
+        kind = _period_kind(period, kind)
+        if first is None:
+            first = period
+        _check_mixed(period, first, kind)
+        start, end = _bounds(period, kind)
+        if previous_start is not None and start < previous_start:
+            raise ValueError(f"The periods are not sorted by their start; '{period}' follows a period starting later")
+        previous_start = start
+        while active and active[0][0] <= start:
+            end_key, _, instant = heapq.heappop(active)
+            yield end_key, instant, -1
+        yield start, period.start, 1
+        # The sequence keeps instants, which may not be comparable with each other, out of the comparison
+        heapq.heappush(active, (end, sequence, period.end))
+    while active:
+        end_key, _, instant = heapq.heappop(active)
+        yield end_key, instant, -1
+
+
+def max_depth(periods: Iterable) -> tuple[int, list]:
+    """ Returns the largest number of periods that are active at the same time, as measured by `depth_profile`, and
+    the periods that reached it - all periods which are active at any point in time when that many of them are.
+    The periods, which must all be of the same type, are returned sorted by their start.
+
+    >>> depth, reached = max_depth(sessions)
+    >>> depth
+    2
+    >>> [str(period.start.time()) for period in reached]
+    ['09:00:00', '10:00:00']
+
+    Raises:
+        TypeError - raised if the periods are not all periods of the same type
+    """
+    periods = _sort_by_start(periods)
+    if not periods:
+        return 0, []
+    kind = operand_kind(periods[0])
+    # The spans of time during which the count is at its largest, as the keys of their start and end
+    peaks = []
+    depth = 0
+    count = 0
+    current_key = None
+    for key, _, change in _events(periods):
+        if key != current_key:
+            # The count has been the same since the previous key
+            if count > depth:
+                depth = count
+                peaks = [(current_key, key)]
+            elif count == depth and count:
+                peaks.append((current_key, key))
+            current_key = key
+        count += change
+    # Both the peaks and the periods are sorted by their start, and a period reaching a peak overlaps it
+    reached = []
+    index = 0
+    for period in periods:
+        start, end = _bounds(period, kind)
+        while index < len(peaks) and peaks[index][1] <= start:
+            index += 1
+        if index < len(peaks) and peaks[index][0] < end:
+            reached.append(period)
+    return depth, reached
+
+
+def overlap_join(left: Iterable, right: Iterable) -> Iterator:
+    """ Returns a lazy iterator over every pair of a period from the left and a period from the right that share a span
+    of time, as (left, right) tuples; these are the pairs which overlap or are within one another, but not those that
+    only meet each other. All periods, on both sides, must be of the same type.
+
+    >>> for shift, booking in overlap_join(shifts, bookings):
+    ...     assign(shift, booking)
+
+    Both sides are sorted once and then swept over together, keeping only the periods active at the time in memory,
+    so that the join takes O((n + m) log(n + m) + k) time for the k pairs it produces; the pairs are produced in the
+    order of the start of the period starting later.
+
+    Raises:
+        TypeError - raised if the periods are not all periods of the same type
+    """
+    return _pairs(_join(*_join_spans(left, right)))
+
+
+def containment_join(outer: Iterable, inner: Iterable) -> Iterator:
+    """ Returns a lazy iterator over every pair of a period from the outer and a period from the inner periods, where
+    the inner period is within the outer one, as `inner in outer` would test it, as (outer, inner) tuples; periods
+    starting or ending together with the outer period are within it, while equal periods are not.
+
+    The pairs are found by the same sweep as the one of `overlap_join`, keeping only those that match.
+
+    Raises:
+        TypeError - raised if the periods are not all periods of the same type
+    """
+    return _contained(_join(*_join_spans(outer, inner)))
+
+
+def overlap_amounts(left: Iterable, right: Iterable) -> Iterator:
+    """ Returns a lazy iterator over the same pairs as `overlap_join`, along with the span of time the two periods
+    share, as (left, right, overlap) tuples; the overlap is a period of the same type which, for periods partially
+    overlapping each other, is the one `get_overlap` returns, and for a period within the other one, the inner period.
+
+    Raises:
+        TypeError - raised if the periods are not all periods of the same type
+    """
+    left_spans, right_spans, kind = _join_spans(left, right)
+    return _amounts(_join(left_spans, right_spans, kind), kind)
+
+
+def _join_spans(left: Iterable, right: Iterable) -> tuple[list, list, int | None]:
+    """ Sorts both sides of a join by their start, as (start, end, period) spans, checking all periods are of the same
+    type, which is returned along with them
+    """
+    left = _sort_by_start(left)
+    right = _sort_by_start(right)
+    if not left or not right:
+        return [], [], None
+    kind = operand_kind(left[0])
+    _period_kind(right[0], kind)
+    _check_mixed(right[0], left[0], kind)
+    left_spans = [(*_bounds(period, kind), period) for period in left]
+    right_spans = [(*_bounds(period, kind), period) for period in right]
+    return left_spans, right_spans, kind
+
+
+def _join(left: list, right: list, kind: int | None) -> Iterator:
+    """ Sweeps over the spans of both sides, sorted by their start, pairing each of them with the spans of the other
+    side which started before it and have not ended yet; the spans that are active wait in a heap for each side,
+    sorted by their end
+    """
+    left_active = []
+    right_active = []
+    left_len = len(left)
+    right_len = len(right)
+    i = 0
+    j = 0
+    while i < left_len or j < right_len:
+        # On a tie the left span starts first, so that the right one finds it among the active spans
+        if j >= right_len or (i < left_len and left[i][0] <= right[j][0]):
+            span = left[i]
+            start = span[0]
+            while right_active and right_active[0][0] <= start:
+                heapq.heappop(right_active)
+            for _, _, other in right_active:
+                yield span, other
+            # The position keeps the periods, which may not be comparable with each other, out of the comparison
+            heapq.heappush(left_active, (span[1], i, span))
+            i += 1
+        else:
+            span = right[j]
+            start = span[0]
+            while left_active and left_active[0][0] <= start:
+                heapq.heappop(left_active)
+            for _, _, other in left_active:
+                yield other, span
+            heapq.heappush(right_active, (span[1], j, span))
+            j += 1
+
+
+def _pairs(joined: Iterator) -> Iterator:
+    for left, right in joined:
+        yield left[2], right[2]
+
+
+def _contained(joined: Iterator) -> Iterator:
+    for outer, inner in joined:
+        outer_start, outer_end, _ = outer
+        inner_start, inner_end, _ = inner
+        if outer_start <= inner_start and inner_end <= outer_end and (
+                outer_start != inner_start or outer_end != inner_end):
+            yield outer[2], inner[2]
+
+
+def _amounts(joined: Iterator, kind: int | None) -> Iterator:
+    for left, right in joined:
+        left_start, left_end, left_period = left
+        right_start, right_end, right_period = right
+        starts_later = left_period if left_start >= right_start else right_period
+        ends_earlier = left_period if left_end <= right_end else right_period
+        if starts_later is ends_earlier:
+            # One period is within the other
+            overlap = starts_later
+        else:
+            overlap = _PERIOD_CLASSES[kind].from_validated(start=starts_later.start, end=ends_earlier.end)
+        yield left_period, right_period, overlap
@@ -3,6 +3,7 @@ from zoneinfo import ZoneInfo
 import pytest
 from datetime import time, date, datetime
 from temporals.pydatetime.periods import TimePeriod, DatePeriod, AbsolutePeriod, WallClockPeriod
+from temporals.relations import Relation
 from temporals.exceptions import TimeAmbiguityError
 
 
@@ -28,6 +29,19 @@ class TestAbsolutePeriod:
         with pytest.raises(ValueError):
             AbsolutePeriod(start=self.start, end=self.end)
 
+    def test_from_validated(self):
+        self.period = AbsolutePeriod.from_validated(start=datetime(2024, 1, 1, 8, 0), end=datetime(2024, 1, 1, 12, 0))
+        assert isinstance(self.period, AbsolutePeriod)
+        self.constructed = AbsolutePeriod(start=datetime(2024, 1, 1, 8, 0), end=datetime(2024, 1, 1, 12, 0))
+        assert self.period == self.constructed
+        assert self.period.duration == self.constructed.duration
+
+    def test_slots(self):
+        self.period = AbsolutePeriod(start=datetime(2024, 1, 1, 8, 0), end=datetime(2024, 1, 1, 12, 0))
+        assert not hasattr(self.period, '__dict__')
+        with pytest.raises(AttributeError):
+            self.period.foo = 'bar'
+
     def test_nonrepeating_time(self):
         """ This tests the internal _time_repeats method """
         self.start = datetime(2024, 1, 1, 8, 0)
@@ -118,6 +132,100 @@ class TestAbsolutePeriod:
         self.period = AbsolutePeriod(start=self.start, end=self.end)
         assert self.random_dt != self.period
 
+    def test_hash(self):
+        self.period = AbsolutePeriod(start=datetime(2024, 1, 1, 8, 0), end=datetime(2024, 1, 1, 12, 0))
+        self.same_period = AbsolutePeriod(start=datetime(2024, 1, 1, 8, 0), end=datetime(2024, 1, 1, 12, 0))
+        self.other_period = AbsolutePeriod(start=datetime(2024, 1, 2, 8, 0), end=datetime(2024, 1, 2, 12, 0))
+        assert hash(self.period) == hash(self.same_period)
+        assert len({self.period, self.same_period, self.other_period}) == 2
+
+        # The same moments in time, expressed in different timezones
+        self.period = AbsolutePeriod(start=datetime(2024, 1, 1, 8, 0, tzinfo=ZoneInfo('Europe/Paris')),
+                                     end=datetime(2024, 1, 1, 12, 0, tzinfo=ZoneInfo('Europe/Paris')))
+        self.same_period = AbsolutePeriod(start=datetime(2024, 1, 1, 7, 0, tzinfo=ZoneInfo('UTC')),
+                                          end=datetime(2024, 1, 1, 11, 0, tzinfo=ZoneInfo('UTC')))
+        assert self.period == self.same_period
+        assert hash(self.period) == hash(self.same_period)
+
+    def test_ordering(self):
+        self.early = AbsolutePeriod(start=datetime(2024, 1, 1, 8, 0), end=datetime(2024, 1, 1, 9, 0))
+        self.long = AbsolutePeriod(start=datetime(2024, 1, 1, 8, 0), end=datetime(2024, 1, 2, 9, 0))
+        self.late = AbsolutePeriod(start=datetime(2024, 1, 1, 8, 30), end=datetime(2024, 1, 1, 9, 0))
+        assert self.early < self.long < self.late
+        assert sorted([self.late, self.long, self.early]) == [self.early, self.long, self.late]
+
+        # Periods in different timezones are ordered by the moments they represent rather than by their wall clock;
+        # 08:00 in Paris is 07:00 UTC and 12:00 in New York is 17:00 UTC
+        self.paris = AbsolutePeriod(start=datetime(2024, 1, 1, 8, 0, tzinfo=ZoneInfo('Europe/Paris')),
+                                    end=datetime(2024, 1, 1, 20, 0, tzinfo=ZoneInfo('Europe/Paris')))
+        self.utc = AbsolutePeriod(start=datetime(2024, 1, 1, 7, 30, tzinfo=ZoneInfo('UTC')),
+                                  end=datetime(2024, 1, 1, 8, 0, tzinfo=ZoneInfo('UTC')))
+        self.new_york = AbsolutePeriod(start=datetime(2024, 1, 1, 12, 0, tzinfo=ZoneInfo('America/New_York')),
+                                       end=datetime(2024, 1, 1, 13, 0, tzinfo=ZoneInfo('America/New_York')))
+        assert sorted([self.new_york, self.utc, self.paris]) == [self.paris, self.utc, self.new_york]
+        assert self.paris <= self.utc <= self.new_york
+
+    def test_epoch_us(self):
+        self.period = AbsolutePeriod(start=datetime(1970, 1, 1, 1, 0, tzinfo=ZoneInfo('Europe/Paris')),
+                                     end=datetime(1970, 1, 1, 2, 0, 0, 1, tzinfo=ZoneInfo('Europe/Paris')))
+        assert self.period.start_epoch_us == 0
+        assert self.period.end_epoch_us == 3600000001
+        with pytest.raises(AttributeError):
+            self.period.start_epoch_us = 1
+        # Naive datetimes are taken to be in UTC
+        self.naive = AbsolutePeriod(start=datetime(1970, 1, 1, 0, 0), end=datetime(1970, 1, 1, 1, 0, 0, 1))
+        assert self.naive.start_epoch_us == self.period.start_epoch_us
+        assert self.naive.end_epoch_us == self.period.end_epoch_us
+        self.validated = AbsolutePeriod.from_validated(start=datetime(1969, 12, 31, 23, 0), end=datetime(1970, 1, 1))
+        assert self.validated.start_epoch_us == -3600000000
+        assert self.validated.end_epoch_us == 0
+
+    def test_epoch_us_fold(self):
+        # 03:30 occurs twice in Sofia on the 26th of Oct 2025; both occurrences are equal as datetimes but they are
+        # different moments in time
+        self.zone = ZoneInfo('Europe/Sofia')
+        self.first = AbsolutePeriod(start=datetime(2025, 10, 26, 3, 0, tzinfo=self.zone),
+                                    end=datetime(2025, 10, 26, 3, 30, tzinfo=self.zone))
+        self.second = AbsolutePeriod(start=datetime(2025, 10, 26, 3, 30, tzinfo=self.zone, fold=1),
+                                     end=datetime(2025, 10, 26, 3, 45, tzinfo=self.zone, fold=1))
+        assert self.second.start_epoch_us - self.first.end_epoch_us == 3600 * 1000000
+        assert self.first.is_before(self.second)
+        assert self.first.get_interim(self.second).start == self.first.end
+        assert self.first < self.second
+        assert not self.first.overlapped_by(self.second)
+
+
+    def test_mixed_awareness(self):
+        # Naive datetimes cannot be compared with aware ones, neither can periods made of them
+        self.naive = AbsolutePeriod(start=datetime(2024, 1, 1, 8, 0), end=datetime(2024, 1, 1, 12, 30))
+        self.aware = AbsolutePeriod(start=datetime(2024, 1, 1, 10, 30, tzinfo=ZoneInfo('UTC')),
+                                    end=datetime(2024, 1, 1, 14, 0, tzinfo=ZoneInfo('UTC')))
+        self.same = AbsolutePeriod(start=datetime(2024, 1, 1, 8, 0, tzinfo=ZoneInfo('UTC')),
+                                   end=datetime(2024, 1, 1, 12, 30, tzinfo=ZoneInfo('UTC')))
+        assert self.naive != self.same
+        assert not self.naive == self.same
+        with pytest.raises(TypeError):
+            self.naive.get_overlap(self.aware)
+        with pytest.raises(TypeError):
+            self.naive.get_disconnect(self.aware)
+        with pytest.raises(TypeError):
+            self.naive.overlaps_with(self.aware)
+        with pytest.raises(TypeError):
+            self.naive.relation(self.aware)
+        with pytest.raises(TypeError):
+            self.naive.get_interim(self.aware)
+        with pytest.raises(TypeError):
+            self.naive.is_before(self.aware)
+        with pytest.raises(TypeError):
+            self.naive.is_after(self.aware)
+        with pytest.raises(TypeError):
+            _ = self.naive < self.aware
+        with pytest.raises(TypeError):
+            _ = self.naive >= self.aware
+        with pytest.raises(TypeError):
+            _ = self.aware in self.naive
+        with pytest.raises(TypeError):
+            _ = datetime(2024, 1, 1, 9, 0, tzinfo=ZoneInfo('UTC')) in self.naive
     def test_timeshift_eq(self):
         # shift forward by 1 hour
         period = AbsolutePeriod(start=datetime(2025, 3, 30, 1, 0, tzinfo=ZoneInfo(key='Europe/Paris')),
@@ -570,6 +678,12 @@ class TestAbsolutePeriod:
                                                                             datetime(2024, 1, 1, 12, 0, 5)
                                                                             )
 
+    def test_get_interim_touching(self):
+        self.period = AbsolutePeriod(start=datetime(2024, 1, 1, 8, 0), end=datetime(2024, 1, 1, 12, 0))
+        self.other_period = AbsolutePeriod(start=datetime(2024, 1, 1, 12, 0), end=datetime(2024, 1, 1, 14, 0))
+        assert self.period.get_interim(self.other_period) is None
+        assert self.other_period.get_interim(self.period) is None
+
     def test_get_overlap(self):
         # Same day period
         self.start = datetime(2024, 1, 1, 8, 0)
@@ -708,3 +822,27 @@ class TestAbsolutePeriod:
         assert self.dc is None
         self.other_dc = self.dt_period.get_disconnect(self.period)
         assert self.other_dc is None
+
+    def test_relation(self):
+        """
+            The periods are compared by the moments they represent, regardless of the timezone they are set in
+        """
+        self.period = AbsolutePeriod(start=datetime(2024, 1, 1, 8, 0, tzinfo=ZoneInfo('UTC')),
+                                     end=datetime(2024, 1, 1, 12, 0, tzinfo=ZoneInfo('UTC')))
+        self.other_period = AbsolutePeriod(start=datetime(2024, 1, 1, 7, 0, tzinfo=ZoneInfo('America/New_York')),
+                                           end=datetime(2024, 1, 1, 9, 0, tzinfo=ZoneInfo('America/New_York')))
+        assert self.period.relation(self.other_period) is Relation.MEETS
+        assert self.other_period.relation(self.period) is Relation.MET_BY
+        assert self.period.overlapped_by(self.other_period) is True
+        assert self.period.get_overlap(self.other_period) is None
+        assert self.period.get_disconnect(self.other_period) == self.period
+
+        self.other_period = AbsolutePeriod(start=datetime(2024, 1, 1, 5, 0, tzinfo=ZoneInfo('America/New_York')),
+                                           end=datetime(2024, 1, 1, 9, 0, tzinfo=ZoneInfo('America/New_York')))
+        assert self.period.relation(self.other_period) is Relation.OVERLAPS
+        assert self.period.get_overlap(self.other_period) == AbsolutePeriod(
+            start=datetime(2024, 1, 1, 5, 0, tzinfo=ZoneInfo('America/New_York')),
+            end=datetime(2024, 1, 1, 12, 0, tzinfo=ZoneInfo('UTC')))
+
+        with pytest.raises(TypeError):
+            self.period.relation(WallClockPeriod(start=datetime(2024, 1, 1, 8, 0), end=datetime(2024, 1, 1, 12, 0)))
@@ -0,0 +1,597 @@
+from zoneinfo import ZoneInfo
+
+import pytest
+from datetime import time, date, datetime, timedelta, timezone
+from temporals.pydatetime.periods import TimePeriod, DatePeriod, WallClockPeriod, AbsolutePeriod
+from temporals.relations import Relation
+
+np = pytest.importorskip('numpy')
+from temporals.pydatetime.arrays import (TimePeriodArray, DatePeriodArray, AbsolutePeriodArray,  # noqa: E402
+                                         DURATION_DTYPE, time_durations, date_durations, wallclock_durations,
+                                         isoformat_durations)
+
+
+def _fields(duration) -> tuple:
+    return (duration.total_seconds, duration.years, duration.months, duration.days, duration.hours, duration.minutes,
+            duration.seconds)
+
+
+def _expected(periods: list, method: str, other) -> list:
+    return [getattr(period, method)(other) for period in periods]
+
+
+class TestAbsolutePeriodArray:
+
+    def setup_method(self):
+        self.periods = [
+            AbsolutePeriod(start=datetime(2024, 1, 1, 8, 0, tzinfo=ZoneInfo('UTC')),
+                           end=datetime(2024, 1, 1, 12, 0, tzinfo=ZoneInfo('UTC'))),
+            AbsolutePeriod(start=datetime(2024, 1, 1, 9, 0, tzinfo=ZoneInfo('Asia/Tokyo')),
+                           end=datetime(2024, 1, 2, 9, 0, tzinfo=ZoneInfo('America/New_York'))),
+            AbsolutePeriod(start=datetime(2024, 1, 1, 10, 0), end=datetime(2024, 1, 1, 11, 0)),
+        ]
+        self.array = AbsolutePeriodArray(self.periods)
+
+    def test_columns(self):
+        assert len(self.array) == 3
+        assert self.array.start_epoch_us.tolist() == [period.start_epoch_us for period in self.periods]
+        assert self.array.end_epoch_us.tolist() == [period.end_epoch_us for period in self.periods]
+        assert self.array.start[1] == np.datetime64('2024-01-01T00:00:00', 'us')
+        assert self.array.end_zones.tolist() == [ZoneInfo('UTC'), ZoneInfo('America/New_York'), None]
+
+    def test_items(self):
+        # The periods are recreated in the timezones they were set in
+        for period, found in zip(self.periods, self.array):
+            assert found == period
+            assert str(found) == str(period)
+        assert str(self.array[-1]) == str(self.periods[-1])
+        assert list(self.array[1:]) == self.periods[1:]
+        assert list(self.array[np.array([True, False, True])]) == [self.periods[0], self.periods[2]]
+        assert len(AbsolutePeriodArray()) == 0
+
+    def test_predicates(self):
+        self.point = datetime(2024, 1, 1, 10, 0, tzinfo=ZoneInfo('UTC'))
+        self.aware = self.array[:2]
+        self.naive = self.array[2:]
+        assert self.aware.contains(self.point).tolist() == [True, True]
+        assert self.naive.is_before(datetime(2024, 1, 1, 12, 0)).tolist() == [True]
+        assert self.array.is_after(date(2023, 12, 31)).tolist() == [True, True, True]
+        assert self.aware.relation(self.periods[0]).tolist() == [Relation.EQUALS, Relation.CONTAINS]
+        assert self.naive.relation(self.periods[2]).tolist() == [Relation.EQUALS]
+        assert self.aware.overlaps_with(self.periods[1]).tolist() == [False, False]
+        assert self.aware.contains(self.periods[0]).tolist() == [False, True]
+        # Values which a period cannot operate with are not contained by any of them
+        assert self.array.contains('2024-01-01').tolist() == [False, False, False]
+        assert self.array.overlaps_with(5).tolist() == [False, False, False]
+
+    def test_awareness(self):
+        # Naive periods cannot be compared with aware values, nor aware periods with naive ones
+        self.point = datetime(2024, 1, 1, 10, 0, tzinfo=ZoneInfo('UTC'))
+        with pytest.raises(TypeError):
+            self.array.contains(self.point)
+        with pytest.raises(TypeError):
+            self.array[:2].is_before(datetime(2024, 1, 1, 12, 0))
+        with pytest.raises(TypeError):
+            self.array[2:].relation(self.periods[0])
+        with pytest.raises(TypeError):
+            self.array[:2].overlaps_with(self.periods[2])
+        with pytest.raises(TypeError):
+            self.array[1:].contains(self.array[:2])
+        assert self.array[:2].is_after(self.array[:2]).tolist() == [False, False]
+
+    def test_time_operands(self):
+        self.wallclock = WallClockPeriod(start=datetime(2024, 1, 1, 8, 0), end=datetime(2024, 1, 1, 9, 0))
+        for operand in (time(8, 0), TimePeriod(start=time(8, 0), end=time(9, 0)), self.wallclock):
+            with pytest.raises(TypeError):
+                self.array.contains(operand)
+            with pytest.raises(TypeError):
+                self.array.is_before(operand)
+        with pytest.raises(TypeError):
+            self.array.overlaps_with(TimePeriod(start=time(8, 0), end=time(9, 0)))
+        with pytest.raises(TypeError):
+            self.array.relation(self.wallclock)
+        with pytest.raises(TypeError):
+            AbsolutePeriodArray([self.wallclock])
+
+    def test_from_epoch_us(self):
+        self.zone = timezone(timedelta(hours=-5))
+        self.periods = [
+            AbsolutePeriod(start=datetime(2024, 1, 1, 20, 0, tzinfo=self.zone),
+                           end=datetime(2024, 1, 2, 1, 0, tzinfo=self.zone)),
+            AbsolutePeriod(start=datetime(1969, 12, 31, 18, 0, tzinfo=self.zone),
+                           end=datetime(1969, 12, 31, 19, 0, 0, 1, tzinfo=self.zone)),
+        ]
+        self.array = AbsolutePeriodArray.from_epoch_us([period.start_epoch_us for period in self.periods],
+                                                       np.array([period.end_epoch_us for period in self.periods]),
+                                                       zone=self.zone)
+        assert [str(period) for period in self.array] == [str(period) for period in self.periods]
+        assert self.array.is_before(date(2024, 1, 2)).tolist() == [False, True]
+        self.array = AbsolutePeriodArray.from_epoch_us(np.array(['2024-01-01T10:00'], dtype='datetime64[m]'),
+                                                       np.array(['2024-01-01T11:00'], dtype='datetime64[m]'))
+        assert self.array[0] == AbsolutePeriod(start=datetime(2024, 1, 1, 10, 0), end=datetime(2024, 1, 1, 11, 0))
+        with pytest.raises(ValueError):
+            AbsolutePeriodArray.from_epoch_us([10, 20], [20, 20])
+        with pytest.raises(ValueError):
+            AbsolutePeriodArray.from_epoch_us([10], [20, 30])
+        with pytest.raises(ValueError):
+            AbsolutePeriodArray.from_epoch_us([10], [20], zone=ZoneInfo('Europe/Paris'))
+
+    def test_boundaries(self):
+        """
+            Periods spanning the transitions of New York and the half hour one of Lord Howe, or given in different
+            timezones, match the periods on the values they share their starts and ends with
+        """
+        self.new_york = ZoneInfo('America/New_York')
+        self.utc = ZoneInfo('UTC')
+        self.periods = [
+            # 0100 until the second 0145 in New York, 0500 until 0645 in UTC
+            AbsolutePeriod(start=datetime(2024, 11, 3, 1, 0, tzinfo=self.new_york),
+                           end=datetime(2024, 11, 3, 1, 45, tzinfo=self.new_york, fold=1)),
+            AbsolutePeriod(start=datetime(2024, 11, 3, 5, 0, tzinfo=self.utc),
+                           end=datetime(2024, 11, 3, 6, 45, tzinfo=self.utc)),
+            AbsolutePeriod(start=datetime(2024, 11, 3, 14, 0, tzinfo=ZoneInfo('Asia/Tokyo')),
+                           end=datetime(2024, 11, 3, 1, 0, tzinfo=self.new_york, fold=1)),
+            AbsolutePeriod(start=datetime(2024, 11, 3, 12, 15, tzinfo=timezone(timedelta(hours=5, minutes=30))),
+                           end=datetime(2024, 11, 3, 7, 0, tzinfo=self.utc)),
+            AbsolutePeriod(start=datetime(2024, 3, 10, 1, 30, tzinfo=self.new_york),
+                           end=datetime(2024, 3, 10, 3, 30, tzinfo=self.new_york)),
+            AbsolutePeriod(start=datetime(2024, 4, 7, 1, 30, tzinfo=ZoneInfo('Australia/Lord_Howe')),
+                           end=datetime(2024, 4, 7, 1, 45, tzinfo=ZoneInfo('Australia/Lord_Howe'), fold=1)),
+        ]
+        self.array = AbsolutePeriodArray(self.periods)
+        self.operands = [date(2024, 11, 2), date(2024, 11, 3),
+                         DatePeriod(start=date(2024, 11, 3), end=date(2024, 11, 4)),
+                         DatePeriod(start=date(2024, 3, 9), end=date(2024, 11, 3))]
+        for period in self.periods:
+            self.operands.extend([
+                period,
+                period.start,
+                period.end,
+                period.end.astimezone(self.utc),
+                AbsolutePeriod(start=period.end, end=period.end + timedelta(hours=1)),
+                AbsolutePeriod(start=period.start.astimezone(self.utc), end=period.end.astimezone(self.utc)
+                               + timedelta(minutes=15)),
+            ])
+        for operand in self.operands:
+            for method in ('contains', 'is_before', 'is_after', 'overlaps_with', 'overlapped_by'):
+                expected = _expected(self.periods, '__contains__' if method == 'contains' else method, operand)
+                assert getattr(self.array, method)(operand).tolist() == expected, (method, operand)
+            if isinstance(operand, (AbsolutePeriod, DatePeriod)):
+                assert self.array.relation(operand).tolist() == _expected(self.periods, 'relation', operand)
+        assert self.array.relation(self.periods[0]).tolist()[:4] == [Relation.EQUALS, Relation.EQUALS,
+                                                                     Relation.STARTS, Relation.MET_BY]
+
+    def test_naive_boundaries(self):
+        self.periods = [
+            AbsolutePeriod(start=datetime(2024, 1, 1, 8, 0), end=datetime(2024, 1, 1, 10, 0)),
+            AbsolutePeriod(start=datetime(2024, 1, 1, 10, 0), end=datetime(2024, 1, 2, 0, 0)),
+            AbsolutePeriod(start=datetime(2023, 12, 31, 23, 59, 59, 999999), end=datetime(2024, 1, 1, 8, 0)),
+        ]
+        self.array = AbsolutePeriodArray(self.periods)
+        self.operands = [datetime(2024, 1, 1), datetime(2024, 1, 2), date(2023, 12, 31), date(2024, 1, 1),
+                         date(2024, 1, 2), DatePeriod(start=date(2024, 1, 1), end=date(2024, 1, 2))]
+        for period in self.periods:
+            self.operands.extend([period, period.start, period.end,
+                                  AbsolutePeriod(start=period.end, end=period.end + timedelta(hours=1))])
+        for operand in self.operands:
+            for method in ('contains', 'is_before', 'is_after', 'overlaps_with', 'overlapped_by'):
+                expected = _expected(self.periods, '__contains__' if method == 'contains' else method, operand)
+                assert getattr(self.array, method)(operand).tolist() == expected, (method, operand)
+            if isinstance(operand, (AbsolutePeriod, DatePeriod)):
+                assert self.array.relation(operand).tolist() == _expected(self.periods, 'relation', operand)
+
+    def test_pairwise(self):
+        """
+            Each period is paired with an equal one, the one meeting it, and one ending an hour later, given in UTC
+        """
+        self.zone = ZoneInfo('America/New_York')
+        self.periods = [
+            AbsolutePeriod(start=datetime(2024, 11, 3, 0, 30, tzinfo=self.zone),
+                           end=datetime(2024, 11, 3, 1, 30, tzinfo=self.zone, fold=1)),
+            AbsolutePeriod(start=datetime(2024, 3, 10, 1, 0, tzinfo=self.zone),
+                           end=datetime(2024, 3, 10, 4, 0, tzinfo=self.zone)),
+        ]
+        self.others = []
+        for period in self.periods:
+            start = period.start.astimezone(ZoneInfo('UTC'))
+            end = period.end.astimezone(ZoneInfo('UTC'))
+            self.others.extend([AbsolutePeriod(start=start, end=end),
+                                AbsolutePeriod(start=end, end=end + timedelta(hours=1)),
+                                AbsolutePeriod(start=start, end=end + timedelta(hours=1)),
+                                AbsolutePeriod(start=start - timedelta(hours=1), end=end - timedelta(minutes=1))])
+        self.periods = [period for period in self.periods for _ in range(4)]
+        self.array = AbsolutePeriodArray(self.periods)
+        self.other_array = AbsolutePeriodArray(self.others)
+        assert self.array.contains(self.other_array).tolist() == [other in period for period, other in
+                                                                   zip(self.periods, self.others)]
+        assert self.array.relation(self.other_array).tolist() == [Relation.EQUALS, Relation.MEETS, Relation.STARTS,
+                                                                   Relation.OVERLAPPED_BY] * 2
+        for method in ('is_before', 'is_after', 'overlaps_with', 'overlapped_by'):
+            assert getattr(self.array, method)(self.other_array).tolist() == [
+                getattr(period, method)(other) for period, other in zip(self.periods, self.others)
+            ], method
+
+
+class TestDatePeriodArray:
+
+    def setup_method(self):
+        self.periods = [
+            DatePeriod(start=date(2024, 1, 1), end=date(2024, 1, 31)),
+            DatePeriod(start=date(2024, 1, 15), end=date(2024, 2, 15)),
+            DatePeriod(start=date(2024, 3, 1), end=date(2024, 12, 31)),
+        ]
+        self.array = DatePeriodArray(self.periods)
+
+    def test_columns(self):
+        assert len(self.array) == 3
+        assert self.array.start.dtype == np.dtype('datetime64[D]')
+        assert self.array.end.tolist() == [date(2024, 1, 31), date(2024, 2, 15), date(2024, 12, 31)]
+        assert list(self.array) == self.periods
+        assert list(self.array[::2]) == [self.periods[0], self.periods[2]]
+        self.array = DatePeriodArray.from_dates(['2024-01-01', '2024-01-15', '2024-03-01'],
+                                                np.array(['2024-01-31T10:00', '2024-02-15', '2024-12-31'],
+                                                         dtype='datetime64[m]'))
+        assert list(self.array) == self.periods
+        with pytest.raises(ValueError):
+            DatePeriodArray.from_dates(['2024-01-01', '2024-01-02'], ['2024-01-02', '2024-01-02'])
+        with pytest.raises(ValueError):
+            DatePeriodArray.from_dates(['2024-01-01'], ['NaT'])
+        with pytest.raises(TypeError):
+            DatePeriodArray([AbsolutePeriod(start=datetime(2024, 1, 1), end=datetime(2024, 1, 2))])
+
+    def test_predicates(self):
+        assert self.array.contains(date(2024, 1, 31)).tolist() == [True, True, False]
+        assert self.array.contains(datetime(2024, 2, 15, 23, 59)).tolist() == [False, True, False]
+        assert self.array.is_before(date(2024, 2, 1)).tolist() == [True, False, False]
+        assert self.array.is_after(self.periods[0]).tolist() == [False, False, True]
+        assert self.array.relation(self.periods[1]).tolist() == [Relation.OVERLAPS, Relation.EQUALS, Relation.AFTER]
+        assert self.array.overlaps_with(self.periods[0]).tolist() == [False, True, False]
+        assert self.array.overlaps_with(date(2024, 1, 1)).tolist() == [False, False, False]
+        with pytest.raises(TypeError):
+            self.array.contains(time(10, 0))
+        with pytest.raises(TypeError):
+            self.array.relation(date(2024, 1, 1))
+        with pytest.raises(TypeError):
+            self.array.get_overlap(date(2024, 1, 1))
+
+    def test_get_overlap(self):
+        self.campaign = DatePeriod(start=date(2024, 1, 20), end=date(2024, 6, 1))
+        self.overlaps, self.found = self.array.get_overlap(self.campaign)
+        assert self.found.tolist() == [True, True, True]
+        assert list(self.overlaps) == [DatePeriod(start=date(2024, 1, 20), end=date(2024, 1, 31)),
+                                       DatePeriod(start=date(2024, 1, 20), end=date(2024, 2, 15)),
+                                       DatePeriod(start=date(2024, 3, 1), end=date(2024, 6, 1))]
+        # A period within the other one is not a partial overlap
+        self.overlaps, self.found = self.array.get_overlap(DatePeriod(start=date(2024, 1, 20), end=date(2024, 1, 25)))
+        assert self.found.tolist() == [False, False, False]
+        self.overlaps, self.found = self.array.get_overlap(self.array[::-1])
+        assert self.found.tolist() == [False, False, False]
+        assert len(self.overlaps) == 0
+
+    def test_boundaries(self):
+        """
+            Periods meeting each other, following each other on consecutive days, or compared with datetimes at the
+            start and end of their last day, match the periods
+        """
+        self.periods = [
+            DatePeriod(start=date(2024, 1, 1), end=date(2024, 1, 31)),
+            DatePeriod(start=date(2024, 1, 31), end=date(2024, 2, 29)),
+            DatePeriod(start=date(2024, 3, 1), end=date(2024, 3, 31)),
+            DatePeriod(start=date(2024, 1, 1), end=date(2024, 3, 31)),
+        ]
+        self.array = DatePeriodArray(self.periods)
+        self.operands = []
+        for period in self.periods:
+            self.operands.extend([
+                period,
+                period.start,
+                period.end,
+                datetime.combine(period.end, time(0, 0)),
+                datetime.combine(period.end, time(23, 59)),
+                DatePeriod(start=period.end, end=period.end + timedelta(days=1)),
+                DatePeriod(start=period.end + timedelta(days=1), end=period.end + timedelta(days=2)),
+                AbsolutePeriod(start=datetime.combine(period.end, time(23, 0)),
+                               end=datetime.combine(period.end, time(23, 0)) + timedelta(hours=2)),
+                AbsolutePeriod(start=datetime.combine(period.start, time(0, 0), tzinfo=ZoneInfo('America/New_York')),
+                               end=datetime.combine(period.end, time(0, 0), tzinfo=ZoneInfo('UTC'))),
+                WallClockPeriod(start=datetime.combine(period.start, time(12, 0)),
+                                end=datetime.combine(period.end, time(12, 0))),
+            ])
+        for operand in self.operands:
+            assert self.array.contains(operand).tolist() == [operand in period for period in self.periods]
+            for method in ('is_before', 'is_after', 'overlaps_with', 'overlapped_by'):
+                assert getattr(self.array, method)(operand).tolist() == _expected(self.periods, method, operand)
+            if isinstance(operand, (date, datetime)):
+                continue
+            assert self.array.relation(operand).tolist() == _expected(self.periods, 'relation', operand)
+            self.overlaps, self.found = self.array.get_overlap(operand)
+            expected = _expected(self.periods, 'get_overlap', operand)
+            assert self.found.tolist() == [overlap is not None for overlap in expected]
+            assert list(self.overlaps) == [overlap for overlap in expected if overlap is not None]
+        assert self.array.relation(self.periods[1]).tolist() == [Relation.MEETS, Relation.EQUALS, Relation.AFTER,
+                                                                 Relation.CONTAINS]
+
+    def test_pairwise(self):
+        self.periods = [
+            DatePeriod(start=date(2024, 1, 1), end=date(2024, 1, 31)),
+            DatePeriod(start=date(2024, 1, 1), end=date(2024, 1, 31)),
+            DatePeriod(start=date(2024, 1, 1), end=date(2024, 1, 31)),
+            DatePeriod(start=date(2024, 2, 28), end=date(2024, 3, 1)),
+            DatePeriod(start=date(2024, 2, 28), end=date(2024, 3, 1)),
+        ]
+        self.others = [
+            DatePeriod(start=date(2024, 1, 1), end=date(2024, 1, 31)),
+            DatePeriod(start=date(2024, 1, 31), end=date(2024, 2, 1)),
+            DatePeriod(start=date(2023, 12, 1), end=date(2024, 1, 1)),
+            DatePeriod(start=date(2024, 2, 29), end=date(2024, 3, 2)),
+            DatePeriod(start=date(2024, 2, 29), end=date(2024, 3, 1)),
+        ]
+        self.array = DatePeriodArray(self.periods)
+        self.other_array = DatePeriodArray(self.others)
+        pairs = list(zip(self.periods, self.others))
+        assert self.array.contains(self.other_array).tolist() == [other in period for period, other in pairs]
+        assert self.array.relation(self.other_array).tolist() == [Relation.EQUALS, Relation.MEETS, Relation.MET_BY,
+                                                                   Relation.OVERLAPS, Relation.FINISHED_BY]
+        self.overlaps, self.found = self.array.get_overlap(self.other_array)
+        assert list(self.overlaps) == [overlap for overlap in (period.get_overlap(other) for period, other in pairs)
+                                       if overlap is not None]
+        assert self.array.durations().tolist() == [_fields(period.duration) for period in self.periods]
+
+
+class TestTimePeriodArray:
+
+    def setup_method(self):
+        self.periods = [
+            TimePeriod(start=time(8, 0), end=time(12, 0)),
+            TimePeriod(start=time(10, 0), end=time(13, 0)),
+            TimePeriod(start=time(22, 0), end=time(23, 59, 59)),
+        ]
+        self.array = TimePeriodArray(self.periods)
+
+    def test_columns(self):
+        assert len(self.array) == 3
+        assert self.array.start.dtype == np.int32
+        assert self.array.end.tolist() == [43200, 46800, 86399]
+        assert list(self.array) == self.periods
+        assert list(self.array[1:]) == self.periods[1:]
+        self.array = TimePeriodArray.from_seconds(np.array([8, 10, 22], dtype='timedelta64[h]'), [43200, 46800, 86399])
+        assert list(self.array) == self.periods
+        with pytest.raises(ValueError):
+            TimePeriodArray.from_seconds([3600, 7200], [7200, 7200])
+        with pytest.raises(ValueError):
+            TimePeriodArray.from_seconds([3600], [86400])
+        with pytest.raises(ValueError):
+            TimePeriodArray([TimePeriod(start=time(8, 0), end=time(8, 0, 0, 500))])
+        with pytest.raises(TypeError):
+            TimePeriodArray([DatePeriod(start=date(2024, 1, 1), end=date(2024, 1, 2))])
+
+    def test_predicates(self):
+        assert self.array.contains(time(12, 0)).tolist() == [True, True, False]
+        # A point with microseconds is compared exactly, even though the periods are held in whole seconds
+        assert self.array.contains(time(12, 0, 0, 1)).tolist() == [False, True, False]
+        assert self.array.contains(datetime(2024, 1, 1, 23, 30)).tolist() == [False, False, True]
+        assert self.array.contains(np.array([9, 9, 23], dtype='timedelta64[h]')).tolist() == [True, False, True]
+        assert self.array.is_before(time(13, 0)).tolist() == [True, True, False]
+        assert self.array.is_before(datetime(2024, 1, 1, 23, 0)).tolist() == [False, False, False]
+        assert self.array.is_after(self.periods[0]).tolist() == [False, False, True]
+        assert self.array.relation(self.periods[1]).tolist() == [Relation.OVERLAPS, Relation.EQUALS, Relation.AFTER]
+        assert self.array.overlaps_with(self.periods[0]).tolist() == [False, True, False]
+        self.overlaps, self.found = self.array.get_overlap(self.periods[0])
+        assert self.found.tolist() == [False, True, False]
+        assert list(self.overlaps) == [TimePeriod(start=time(10, 0), end=time(12, 0))]
+        self.disconnects, self.found = self.array.get_disconnect(self.periods[1])
+        assert self.found.tolist() == [True, False, False]
+        assert list(self.disconnects) == [TimePeriod(start=time(8, 0), end=time(10, 0))]
+        with pytest.raises(TypeError):
+            self.array.relation(time(10, 0))
+        with pytest.raises(TypeError):
+            self.array.contains(date(2024, 1, 1))
+
+    def test_boundaries(self):
+        """
+            Periods meeting each other, or starting at midnight and ending at the last second of the day, match the
+            periods on their starts, ends and the microseconds after them
+        """
+        self.periods = [
+            TimePeriod(start=time(0, 0), end=time(8, 0)),
+            TimePeriod(start=time(8, 0), end=time(12, 0)),
+            TimePeriod(start=time(8, 0), end=time(10, 0)),
+            TimePeriod(start=time(9, 0), end=time(12, 0)),
+            TimePeriod(start=time(12, 0), end=time(23, 59, 59)),
+            TimePeriod(start=time(0, 0), end=time(23, 59, 59)),
+        ]
+        self.array = TimePeriodArray(self.periods)
+        self.operands = [time(23, 59, 59, 999999)]
+        for period in self.periods:
+            self.operands.extend([
+                period,
+                period.start,
+                period.end,
+                time(period.end.hour, period.end.minute, period.end.second, 1),
+                datetime.combine(date(2024, 1, 1), period.start),
+                TimePeriod(start=period.start, end=time(23, 59, 59)) if period.end != time(23, 59, 59) else period,
+            ])
+        for operand in self.operands:
+            assert self.array.contains(operand).tolist() == [operand in period for period in self.periods]
+            for method in ('is_before', 'is_after'):
+                assert getattr(self.array, method)(operand).tolist() == _expected(self.periods, method, operand)
+            if not isinstance(operand, TimePeriod):
+                continue
+            for method in ('relation', 'overlaps_with', 'overlapped_by'):
+                assert getattr(self.array, method)(operand).tolist() == _expected(self.periods, method, operand)
+            for method in ('get_overlap', 'get_disconnect'):
+                self.found_periods, self.found = getattr(self.array, method)(operand)
+                expected = _expected(self.periods, method, operand)
+                assert self.found.tolist() == [found is not None for found in expected]
+                assert list(self.found_periods) == [found for found in expected if found is not None]
+        assert self.array.relation(self.periods[1]).tolist() == [Relation.MEETS, Relation.EQUALS, Relation.STARTS,
+                                                                 Relation.FINISHES, Relation.MET_BY, Relation.CONTAINS]
+
+    def test_pairwise(self):
+        self.periods = [TimePeriod(start=time(8, 0), end=time(12, 0)) for _ in range(5)]
+        self.others = [
+            TimePeriod(start=time(8, 0), end=time(12, 0)),
+            TimePeriod(start=time(12, 0), end=time(13, 0)),
+            TimePeriod(start=time(10, 0), end=time(13, 0)),
+            TimePeriod(start=time(8, 0), end=time(9, 0)),
+            TimePeriod(start=time(0, 0), end=time(23, 59, 59)),
+        ]
+        self.array = TimePeriodArray(self.periods)
+        self.other_array = TimePeriodArray(self.others)
+        pairs = list(zip(self.periods, self.others))
+        assert self.array.contains(self.other_array).tolist() == [other in period for period, other in pairs]
+        assert self.array.relation(self.other_array).tolist() == [Relation.EQUALS, Relation.MEETS, Relation.OVERLAPS,
+                                                                   Relation.STARTED_BY, Relation.DURING]
+        self.disconnects, self.found = self.array.get_disconnect(self.other_array)
+        assert list(self.disconnects) == [found for found in (period.get_disconnect(other) for period, other in pairs)
+                                          if found is not None]
+        # A point for every period, at its start, its end, and the seconds around them
+        points = [time(8, 0), time(12, 0), time(7, 59, 59), time(12, 0, 1), time(0, 0)]
+        self.points = np.array([t.hour * 3600 + t.minute * 60 + t.second for t in points])
+        assert self.array.contains(self.points).tolist() == [point in period for period, point in zip(self.periods,
+                                                                                                         points)]
+        assert self.array.is_before(self.points).tolist() == [period.is_before(point) for period, point in
+                                                              zip(self.periods, points)]
+        assert self.array.durations().tolist() == [_fields(period.duration) for period in self.periods]
+
+
+class TestDurations:
+
+    def test_dtype(self):
+        self.durations = time_durations([3600], [7265])
+        assert self.durations.dtype == DURATION_DTYPE
+        assert self.durations.dtype.names == ('total_seconds', 'years', 'months', 'days', 'hours', 'minutes',
+                                              'seconds')
+        assert self.durations.tolist() == [(3665, 0, 0, 0, 1, 1, 5)]
+        assert len(date_durations([], [])) == 0
+
+    def test_time(self):
+        # Microseconds borrowing from the seconds, and the last microsecond of the day
+        self.periods = [
+            TimePeriod(start=time(8, 0, 59, 999999), end=time(8, 1, 0, 1)),
+            TimePeriod(start=time(0, 0), end=time(23, 59, 59, 999999)),
+            TimePeriod(start=time(9, 59, 30, 500000), end=time(11, 0, 29, 499999)),
+            TimePeriod(start=time(12, 0), end=time(12, 0, 0, 1)),
+        ]
+        starts = np.array([timedelta(hours=p.start.hour, minutes=p.start.minute, seconds=p.start.second,
+                                     microseconds=p.start.microsecond) for p in self.periods], dtype='timedelta64[us]')
+        ends = np.array([timedelta(hours=p.end.hour, minutes=p.end.minute, seconds=p.end.second,
+                                   microseconds=p.end.microsecond) for p in self.periods], dtype='timedelta64[us]')
+        assert time_durations(starts, ends).tolist() == [_fields(period.duration) for period in self.periods]
+
+    def test_date(self):
+        # The ends of months and of leap Februaries, and dates before the epoch
+        self.periods = [
+            DatePeriod(start=date(2024, 1, 31), end=date(2024, 2, 29)),
+            DatePeriod(start=date(2024, 1, 31), end=date(2024, 3, 1)),
+            DatePeriod(start=date(2024, 2, 29), end=date(2025, 2, 28)),
+            DatePeriod(start=date(2023, 2, 28), end=date(2024, 2, 29)),
+            DatePeriod(start=date(2023, 12, 31), end=date(2024, 1, 1)),
+            DatePeriod(start=date(1899, 12, 31), end=date(2000, 2, 29)),
+            DatePeriod(start=date(1969, 12, 31), end=date(1970, 1, 31)),
+            DatePeriod(start=date(2024, 3, 31), end=date(2024, 4, 30)),
+        ]
+        starts = np.array([period.start for period in self.periods], dtype='datetime64[D]')
+        ends = np.array([period.end for period in self.periods], dtype='datetime64[D]')
+        assert date_durations(starts, ends).tolist() == [_fields(period.duration) for period in self.periods]
+
+    def test_wallclock(self):
+        self.periods = [
+            WallClockPeriod(start=datetime(2024, 1, 31, 23, 0), end=datetime(2024, 2, 29, 22, 0)),
+            WallClockPeriod(start=datetime(2024, 2, 29, 12, 0), end=datetime(2025, 3, 1, 11, 59, 59, 999999)),
+            WallClockPeriod(start=datetime(1969, 12, 31, 23, 59, 59, 999999), end=datetime(1970, 1, 1)),
+            WallClockPeriod(start=datetime(2023, 12, 31, 12, 30, 0, 500000), end=datetime(2024, 1, 1, 12, 29, 59)),
+            WallClockPeriod(start=datetime(1960, 3, 31, 6, 0), end=datetime(2040, 2, 29, 5, 0)),
+        ]
+        starts = np.array([period.start for period in self.periods], dtype='datetime64[us]')
+        ends = np.array([period.end for period in self.periods], dtype='datetime64[us]')
+        assert wallclock_durations(starts, ends).tolist() == [_fields(period.duration) for period in self.periods]
+
+    def test_absolute(self):
+        """
+            Periods spanning the transitions of New York, Dublin and Lord Howe, or starting and ending in different
+            timezones
+        """
+        self.new_york = ZoneInfo('America/New_York')
+        self.dublin = ZoneInfo('Europe/Dublin')
+        self.lord_howe = ZoneInfo('Australia/Lord_Howe')
+        self.periods = [
+            AbsolutePeriod(start=datetime(2024, 3, 10, 1, 30, tzinfo=self.new_york),
+                           end=datetime(2024, 3, 10, 3, 30, tzinfo=self.new_york)),
+            AbsolutePeriod(start=datetime(2024, 11, 3, 1, 30, tzinfo=self.new_york),
+                           end=datetime(2024, 11, 3, 1, 45, tzinfo=self.new_york, fold=1)),
+            AbsolutePeriod(start=datetime(2024, 11, 2, 1, 30, tzinfo=self.new_york, fold=1),
+                           end=datetime(2024, 11, 4, 1, 0, tzinfo=self.new_york)),
+            AbsolutePeriod(start=datetime(2024, 3, 31, 0, 30, tzinfo=self.dublin),
+                           end=datetime(2024, 10, 27, 1, 30, tzinfo=self.dublin, fold=1)),
+            AbsolutePeriod(start=datetime(2024, 4, 7, 1, 30, tzinfo=self.lord_howe),
+                           end=datetime(2024, 4, 7, 1, 45, tzinfo=self.lord_howe, fold=1)),
+            AbsolutePeriod(start=datetime(2024, 1, 31, 23, 0, tzinfo=ZoneInfo('Asia/Tokyo')),
+                           end=datetime(2024, 2, 29, 12, 0, tzinfo=self.new_york)),
+            AbsolutePeriod(start=datetime(1900, 1, 1, tzinfo=self.dublin),
+                           end=datetime(1900, 1, 2, tzinfo=timezone.utc)),
+            AbsolutePeriod(start=datetime(2024, 2, 29, 8, 0), end=datetime(2028, 2, 29, 7, 59, 59, 999999)),
+        ]
+        self.array = AbsolutePeriodArray(self.periods)
+        assert self.array.durations().tolist() == [_fields(period.duration) for period in self.periods]
+        self.mask = np.arange(len(self.periods)) % 3 == 0
+        assert self.array[self.mask].durations().tolist() == [_fields(period.duration) for period, selected
+                                                              in zip(self.periods, self.mask) if selected]
+
+
+class TestIsoformat:
+
+    def test_examples(self):
+        self.durations = time_durations([3600, 0], [7265, 30])
+        assert isoformat_durations(self.durations).tolist() == ['PT1H1M5S', 'PT30S']
+        assert isoformat_durations(self.durations, fold=False).tolist() == ['P0Y0M0DT1H1M5S', 'P0Y0M0DT0H0M30S']
+        assert isoformat_durations(np.zeros(1, dtype=DURATION_DTYPE)).tolist() == ['P']
+        assert isoformat_durations(np.zeros(0, dtype=DURATION_DTYPE)).tolist() == []
+        # Fields with values too far apart to be looked up in a table of all of them
+        self.durations = np.array([(0, 100000, 0, 0, 0, 0, 0), (0, -3, 0, 0, 0, 0, 5)], dtype=DURATION_DTYPE)
+        assert isoformat_durations(self.durations).tolist() == ['P100000Y', 'P-3YT5S']
+        assert isoformat_durations(self.durations, fold=False).tolist() == ['P100000Y0M0DT0H0M0S', 'P-3Y0M0DT0H0M5S']
+        self.array = AbsolutePeriodArray([
+            AbsolutePeriod(start=datetime(2024, 1, 1, 8, 0), end=datetime(2024, 1, 1, 17, 0, 0, 250)),
+            AbsolutePeriod(start=datetime(1900, 1, 1, tzinfo=ZoneInfo('Europe/Dublin')),
+                           end=datetime(1900, 1, 2, tzinfo=timezone.utc)),
+        ])
+        assert self.array.isoformat().tolist() == ['2024-01-01T08:00:00/2024-01-01T17:00:00.000250',
+                                                   '1900-01-01T00:00:00-00:25:21/1900-01-02T00:00:00+00:00']
+        assert DatePeriodArray.from_dates(['0999-01-01'], ['2024-12-31']).isoformat().tolist() == [
+            '0999-01-01/2024-12-31']
+        assert TimePeriodArray.from_seconds([0], [86399]).isoformat().tolist() == ['00:00:00/23:59:59']
+
+    def test_matches_periods(self):
+        """
+            Periods with and without microseconds, around the epoch, at the transitions of New York and Lord Howe, with
+            fractional offsets, or naive, are written the same way as the periods write them
+        """
+        self.new_york = ZoneInfo('America/New_York')
+        self.lord_howe = ZoneInfo('Australia/Lord_Howe')
+        self.periods = [
+            AbsolutePeriod(start=datetime(2024, 11, 3, 1, 30, tzinfo=self.new_york),
+                           end=datetime(2024, 11, 3, 1, 45, tzinfo=self.new_york, fold=1)),
+            AbsolutePeriod(start=datetime(2024, 3, 10, 1, 59, 59, 999999, tzinfo=self.new_york),
+                           end=datetime(2024, 3, 10, 3, 0, tzinfo=self.new_york)),
+            AbsolutePeriod(start=datetime(2024, 4, 7, 1, 30, tzinfo=self.lord_howe),
+                           end=datetime(2024, 4, 7, 1, 45, tzinfo=self.lord_howe, fold=1)),
+            AbsolutePeriod(start=datetime(1960, 2, 29, 12, 0, 0, 1, tzinfo=timezone(timedelta(hours=5, minutes=30))),
+                           end=datetime(1960, 3, 1, tzinfo=timezone(timedelta(hours=-9, minutes=-30)))),
+            AbsolutePeriod(start=datetime(1969, 12, 31, 23, 59, 59), end=datetime(1970, 1, 1, 0, 0, 0, 500000)),
+            AbsolutePeriod(start=datetime(2024, 1, 31, 23, 0, tzinfo=ZoneInfo('Asia/Tokyo')),
+                           end=datetime(2027, 3, 1, 12, 0, tzinfo=ZoneInfo('UTC'))),
+        ]
+        self.arrays = [AbsolutePeriodArray(self.periods),
+                       DatePeriodArray([DatePeriod(start=date(2024, 1, 31), end=date(2024, 2, 29)),
+                                        DatePeriod(start=date(2023, 2, 28), end=date(2024, 2, 29)),
+                                        DatePeriod(start=date(1969, 12, 31), end=date(2025, 1, 1))]),
+                       TimePeriodArray([TimePeriod(start=time(0, 0), end=time(23, 59, 59)),
+                                        TimePeriod(start=time(9, 59, 59), end=time(10, 0, 1)),
+                                        TimePeriod(start=time(12, 0), end=time(12, 0, 1))])]
+        for self.array in self.arrays:
+            self.periods = list(self.array)
+            assert self.array.isoformat().tolist() == [str(period) for period in self.periods]
+            for fold in (True, False):
+                assert isoformat_durations(self.array.durations(), fold=fold).tolist() == [
+                    period.duration.isoformat(fold=fold) for period in self.periods]
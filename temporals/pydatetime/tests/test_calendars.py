@@ -0,0 +1,131 @@
+import pytest
+from datetime import date, datetime, timedelta
+from temporals.pydatetime.periods import DatePeriod, WallClockPeriod
+from temporals.pydatetime.sets import DatePeriodSet
+from temporals.pydatetime.calendars import DateCalendar
+
+
+class TestDateCalendar:
+
+    def setup_method(self):
+        self.january = DatePeriod(start=date(2024, 1, 1), end=date(2024, 1, 31))
+        self.spring = DatePeriod(start=date(2024, 3, 1), end=date(2024, 5, 31))
+        self.april = DatePeriod(start=date(2024, 4, 1), end=date(2024, 4, 30))
+        self.calendar = DateCalendar([self.spring, self.january, self.april])
+
+    def test_to_periods(self):
+        assert self.calendar.to_periods() == [self.january, self.spring]
+        assert self.calendar.first == date(2024, 1, 1)
+        assert self.calendar.last == date(2024, 5, 31)
+        # Periods meeting each other are merged
+        self.calendar = DateCalendar([DatePeriod(start=date(2024, 2, 1), end=date(2024, 2, 10)),
+                                      DatePeriod(start=date(2024, 2, 10), end=date(2024, 2, 20))])
+        assert self.calendar.to_periods() == [DatePeriod(start=date(2024, 2, 1), end=date(2024, 2, 20))]
+        # And so are periods following each other on consecutive days, as no day between them is left out
+        self.calendar = DateCalendar([DatePeriod(start=date(2024, 2, 1), end=date(2024, 2, 10)),
+                                      DatePeriod(start=date(2024, 2, 11), end=date(2024, 2, 20)),
+                                      date(2024, 2, 21), date(2024, 2, 25)])
+        assert self.calendar.to_periods() == [DatePeriod(start=date(2024, 2, 1), end=date(2024, 2, 21)),
+                                              date(2024, 2, 25)]
+        assert self.calendar == DateCalendar(self.calendar.to_periods())
+
+    def test_empty(self):
+        self.calendar = DateCalendar()
+        assert not self.calendar
+        assert self.calendar.to_periods() == []
+        assert self.calendar.first is None and self.calendar.last is None
+        assert date(2024, 1, 1) not in self.calendar
+        assert self.calendar == DateCalendar() - DateCalendar([self.january])
+
+    def test_contains(self):
+        # The first and last day of every period are within the calendar, the same as within the period
+        assert date(2024, 1, 1) in self.calendar
+        assert date(2024, 1, 31) in self.calendar
+        assert date(2024, 2, 1) not in self.calendar
+        assert date(2023, 12, 31) not in self.calendar
+        assert date(2024, 6, 1) not in self.calendar
+        assert datetime(2024, 5, 31, 23, 59) in self.calendar
+        assert DatePeriod(start=date(2024, 3, 10), end=date(2024, 5, 31)) in self.calendar
+        assert DatePeriod(start=date(2024, 1, 10), end=date(2024, 3, 10)) not in self.calendar
+        assert DatePeriod(start=date(2023, 12, 1), end=date(2024, 1, 10)) not in self.calendar
+        with pytest.raises(TypeError):
+            WallClockPeriod(start=datetime(2024, 1, 1), end=datetime(2024, 1, 2)) in self.calendar
+
+    def test_operations(self):
+        self.other = DateCalendar([DatePeriod(start=date(2024, 1, 20), end=date(2024, 3, 10))])
+        assert (self.calendar | self.other).to_periods() == [DatePeriod(start=date(2024, 1, 1), end=date(2024, 5, 31))]
+        assert (self.calendar & self.other).to_periods() == [
+            DatePeriod(start=date(2024, 1, 20), end=date(2024, 1, 31)),
+            DatePeriod(start=date(2024, 3, 1), end=date(2024, 3, 10)),
+        ]
+        assert (self.calendar - self.other).to_periods() == [
+            DatePeriod(start=date(2024, 1, 1), end=date(2024, 1, 19)),
+            DatePeriod(start=date(2024, 3, 11), end=date(2024, 5, 31)),
+        ]
+        assert (self.other - self.calendar).to_periods() == [DatePeriod(start=date(2024, 2, 1), end=date(2024, 2, 29))]
+        assert self.calendar ^ self.other == (self.calendar - self.other) | (self.other - self.calendar)
+        assert self.calendar == DateCalendar(self.calendar.to_periods())
+        assert hash(self.calendar) == hash(DateCalendar(self.calendar.to_periods()))
+        with pytest.raises(TypeError):
+            self.calendar.union(DatePeriodSet([self.january]))
+        with pytest.raises(TypeError):
+            self.calendar | DatePeriodSet([self.january])
+
+    def test_invalid_periods(self):
+        with pytest.raises(TypeError):
+            DateCalendar([WallClockPeriod(start=datetime(2024, 1, 1), end=datetime(2024, 1, 2))])
+
+    def test_boundaries(self):
+        # A day at the boundary of a period is within it, so it is left out of a difference and kept in an intersection
+        self.contracts = DateCalendar([DatePeriod(start=date(2024, 1, 1), end=date(2024, 12, 31))])
+        self.eligible = self.contracts - DateCalendar([DatePeriod(start=date(2024, 7, 1), end=date(2024, 7, 2))])
+        assert date(2024, 6, 30) in self.eligible
+        assert date(2024, 7, 1) not in self.eligible
+        assert date(2024, 7, 2) not in self.eligible
+        assert date(2024, 7, 3) in self.eligible
+        self.both = (DateCalendar([DatePeriod(start=date(2024, 1, 1), end=date(2024, 1, 5))])
+                     & DateCalendar([DatePeriod(start=date(2024, 1, 5), end=date(2024, 1, 10))]))
+        assert date(2024, 1, 5) in self.both
+        assert date(2024, 1, 4) not in self.both and date(2024, 1, 6) not in self.both
+        assert self.both.to_periods() == [date(2024, 1, 5)]
+        assert self.both.first == self.both.last == date(2024, 1, 5)
+
+    def test_alignment(self):
+        """
+            Calendars starting on different days, across the end of a leap February and of a year, or empty, contain
+            the same days as the periods they are created from
+        """
+        self.cases = [
+            ([DatePeriod(start=date(2024, 2, 27), end=date(2024, 3, 2))],
+             [DatePeriod(start=date(2024, 2, 29), end=date(2024, 3, 5))]),
+            ([DatePeriod(start=date(2024, 12, 30), end=date(2025, 1, 2)), date(2025, 1, 4)],
+             [DatePeriod(start=date(2024, 12, 1), end=date(2024, 12, 30)), date(2025, 1, 3)]),
+            ([DatePeriod(start=date(2024, 1, 1), end=date(2024, 1, 3))],
+             [DatePeriod(start=date(2024, 12, 29), end=date(2025, 1, 3))]),
+            ([date(2024, 6, 1), date(2024, 6, 3)], []),
+            ([], [DatePeriod(start=date(2024, 6, 1), end=date(2024, 6, 2))]),
+        ]
+        self.days = [date(2024, 1, 1) + timedelta(days=day) for day in range(372)]
+        for first, second in self.cases:
+            self.first = DateCalendar(first)
+            self.second = DateCalendar(second)
+            for point in self.days:
+                in_first = any(point in period if isinstance(period, DatePeriod) else point == period
+                               for period in first)
+                in_second = any(point in period if isinstance(period, DatePeriod) else point == period
+                                for period in second)
+                assert (point in self.first) == in_first
+                assert (point in (self.first | self.second)) == (in_first or in_second)
+                assert (point in (self.first & self.second)) == (in_first and in_second)
+                assert (point in (self.first - self.second)) == (in_first and not in_second)
+                assert (point in (self.first ^ self.second)) == (in_first != in_second)
+            assert self.first == DateCalendar(self.first.to_periods())
+        assert (DateCalendar(self.cases[0][0]) & DateCalendar(self.cases[0][1])).to_periods() == [
+            DatePeriod(start=date(2024, 2, 29), end=date(2024, 3, 2)),
+        ]
+        assert (DateCalendar(self.cases[1][0]) | DateCalendar(self.cases[1][1])).to_periods() == [
+            DatePeriod(start=date(2024, 12, 1), end=date(2025, 1, 4)),
+        ]
+        # A DatePeriodSet covers the same days as the periods it is created from
+        self.periods = self.cases[2][0] + self.cases[2][1]
+        assert DateCalendar(self.periods) == DateCalendar(DatePeriodSet(self.periods).periods)
@@ -1,7 +1,9 @@
 from zoneinfo import ZoneInfo
+import heapq
 import pytest
 from datetime import time, date, datetime
 from temporals.pydatetime.periods import DatePeriod, TimePeriod, WallClockPeriod, AbsolutePeriod
+from temporals.relations import Relation
 
 
 class TestDatePeriod:
@@ -32,6 +34,18 @@ class TestDatePeriod:
         with pytest.raises(ValueError):
             DatePeriod(start=self.start, end=self.end)
 
+    def test_from_validated(self):
+        self.period = DatePeriod.from_validated(start=date(2024, 1, 1), end=date(2024, 1, 10))
+        assert isinstance(self.period, DatePeriod)
+        assert self.period == DatePeriod(start=date(2024, 1, 1), end=date(2024, 1, 10))
+        assert self.period.duration == DatePeriod(start=date(2024, 1, 1), end=date(2024, 1, 10)).duration
+
+    def test_slots(self):
+        self.period = DatePeriod(start=date(2024, 1, 1), end=date(2024, 1, 10))
+        assert not hasattr(self.period, '__dict__')
+        with pytest.raises(AttributeError):
+            self.period.foo = 'bar'
+
     def test_eq_dateperiod(self):
         self.start = date(2024, 1, 1)
         self.end = date(2024, 1, 30)
@@ -68,6 +82,28 @@ class TestDatePeriod:
         self.period = DatePeriod(start=self.start, end=self.end)
         assert self.random_date != self.period
 
+    def test_hash(self):
+        self.period = DatePeriod(start=date(2024, 1, 1), end=date(2024, 1, 10))
+        self.same_period = DatePeriod(start=date(2024, 1, 1), end=date(2024, 1, 10))
+        self.other_period = DatePeriod(start=date(2024, 1, 1), end=date(2024, 1, 11))
+        assert hash(self.period) == hash(self.same_period)
+        assert len({self.period, self.same_period, self.other_period}) == 2
+        self.cache = {self.period: 'holiday'}
+        assert self.cache[self.same_period] == 'holiday'
+
+    def test_ordering(self):
+        self.early = DatePeriod(start=date(2024, 1, 1), end=date(2024, 1, 5))
+        self.long = DatePeriod(start=date(2024, 1, 1), end=date(2024, 2, 1))
+        self.late = DatePeriod(start=date(2024, 1, 2), end=date(2024, 1, 3))
+        assert self.early < self.long < self.late
+        assert self.late >= self.long >= self.early
+        assert sorted([self.late, self.long, self.early]) == [self.early, self.long, self.late]
+        self.heap = [self.late, self.long, self.early]
+        heapq.heapify(self.heap)
+        assert heapq.heappop(self.heap) == self.early
+        with pytest.raises(TypeError):
+            self.early < date(2024, 1, 2)
+
     def test_membership_date(self):
         self.random_date = date(2024, 1, 15)
         self.start = date(2024, 1, 1)
@@ -351,3 +387,23 @@ class TestDatePeriod:
 
         self.second_disconnect = self.other_period.get_disconnect(self.period)
         assert self.second_disconnect is None
+
+    def test_relation(self):
+        self.period = DatePeriod(start=date(2024, 1, 10), end=date(2024, 1, 20))
+        assert self.period.relation(DatePeriod(start=date(2024, 1, 1), end=date(2024, 1, 5))) is Relation.AFTER
+        assert self.period.relation(DatePeriod(start=date(2024, 1, 1), end=date(2024, 1, 10))) is Relation.MET_BY
+        assert self.period.relation(DatePeriod(start=date(2024, 1, 12), end=date(2024, 1, 15))) is Relation.CONTAINS
+        assert self.period.relation(DatePeriod(start=date(2024, 1, 10), end=date(2024, 1, 20))) is Relation.EQUALS
+        assert self.period.relation(DatePeriod(start=date(2024, 1, 15), end=date(2024, 1, 25))) is Relation.OVERLAPS
+
+        # Only the dates of the datetime periods are considered
+        self.other_period = WallClockPeriod(start=datetime(2024, 1, 20, 8, 0), end=datetime(2024, 1, 25, 8, 0))
+        assert self.period.relation(self.other_period) is Relation.MEETS
+        assert self.other_period.relation(self.period) is Relation.MET_BY
+        self.other_period = AbsolutePeriod(start=datetime(2024, 1, 5, 8, 0, tzinfo=ZoneInfo('UTC')),
+                                           end=datetime(2024, 1, 20, 8, 0, tzinfo=ZoneInfo('UTC')))
+        assert self.period.relation(self.other_period) is Relation.FINISHES
+        assert self.other_period.relation(self.period) is Relation.FINISHED_BY
+
+        with pytest.raises(TypeError):
+            self.period.relation(TimePeriod(start=time(8, 0), end=time(10, 0)))
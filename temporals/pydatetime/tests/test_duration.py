@@ -22,6 +22,16 @@ class TestDuration:
         assert period.duration.minutes == 1
         assert period.duration.seconds == 1
 
+    def test_slots(self):
+        period = WallClockPeriod(start=datetime(2025, 1, 1, 10, 0, 0), end=datetime(2025, 1, 2, 12, 15, 30))
+        assert not hasattr(period.duration, '__dict__')
+
+    def test_cached(self):
+        period = WallClockPeriod(start=datetime(2025, 1, 1, 10, 0, 0), end=datetime(2025, 1, 2, 12, 15, 30))
+        assert period.duration is period.duration
+        period = AbsolutePeriod(start=datetime(2025, 1, 1, 10, 0, 0), end=datetime(2025, 1, 2, 12, 15, 30))
+        assert period.duration is period.duration
+
     def test_date(self):
         period = DatePeriod(start=date(2025, 1, 1), end=date(2025, 1, 2))
         assert period.duration.days == 1
@@ -48,6 +58,13 @@ class TestDuration:
         # Total is more than the non-leap date test above because February has more days
         assert period.duration.total_seconds == 5184000
 
+    def test_long_date(self):
+        period = DatePeriod(start=date(1925, 3, 15), end=date(2025, 4, 30))
+        assert period.duration.years == 100
+        assert period.duration.months == 1
+        assert period.duration.days == 15
+        assert period.duration.total_seconds == 36571 * 86400
+
     def test_wallclock(self):
         period = WallClockPeriod(start=datetime(2025, 1, 1, 10, 0, 0),
                                  end=datetime(2025, 1, 2, 12, 15, 30))
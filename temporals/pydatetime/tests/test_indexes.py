@@ -0,0 +1,370 @@
+from zoneinfo import ZoneInfo
+
+import pytest
+from datetime import date, datetime, time, timedelta
+from temporals.pydatetime.periods import TimePeriod, DatePeriod, WallClockPeriod, AbsolutePeriod
+from temporals.pydatetime.indexes import (WallClockPeriodIndex, AbsolutePeriodIndex, DatePeriodIndex, TimePeriodIndex,
+                                          WallClockTimeline, AbsoluteTimeline, _height)
+
+
+def _check_tree(node) -> int:
+    """ Verifies the balance and the latest end of every node of the subtree, returning its height """
+    if node is None:
+        return 0
+    left = _check_tree(node.left)
+    right = _check_tree(node.right)
+    assert abs(left - right) <= 1
+    assert node.height == max(left, right) + 1 == _height(node)
+    ends = [node.end] + [child.max_end for child in (node.left, node.right) if child is not None]
+    assert node.max_end == max(ends)
+    return node.height
+
+
+class TestIntervalTree:
+
+    def test_queries(self):
+        self.periods = [
+            WallClockPeriod(start=datetime(2024, 1, 1, 8, 0), end=datetime(2024, 1, 1, 12, 0)),
+            WallClockPeriod(start=datetime(2024, 1, 1, 10, 0), end=datetime(2024, 1, 1, 14, 0)),
+            WallClockPeriod(start=datetime(2024, 1, 1, 12, 0), end=datetime(2024, 1, 1, 13, 0)),
+            WallClockPeriod(start=datetime(2024, 1, 1, 16, 0), end=datetime(2024, 1, 1, 18, 0)),
+        ]
+        self.index = WallClockPeriodIndex(self.periods)
+        assert len(self.index) == 4
+        assert list(self.index) == self.periods
+        assert self.index.stab(datetime(2024, 1, 1, 12, 0)) == self.periods[:3]
+        assert self.index.stab(datetime(2024, 1, 1, 15, 0)) == []
+        self.window = WallClockPeriod(start=datetime(2024, 1, 1, 13, 0), end=datetime(2024, 1, 1, 16, 0))
+        assert self.index.overlapping(self.window) == self.periods[1:]
+        self.window = WallClockPeriod(start=datetime(2024, 1, 1, 10, 0), end=datetime(2024, 1, 1, 14, 0))
+        assert self.index.within(self.window) == self.periods[1:3]
+        self.window = WallClockPeriod(start=datetime(2024, 1, 1, 12, 0), end=datetime(2024, 1, 1, 12, 30))
+        assert self.index.containing(self.window) == self.periods[1:3]
+
+    def test_insert_remove(self):
+        self.period = WallClockPeriod(start=datetime(2024, 1, 1, 8, 0), end=datetime(2024, 1, 1, 12, 0))
+        self.index = WallClockPeriodIndex()
+        self.index.insert(self.period)
+        self.index.insert(self.period)
+        assert len(self.index) == 2
+        assert self.period in self.index
+        self.index.remove(self.period)
+        assert self.index.stab(datetime(2024, 1, 1, 9, 0)) == [self.period]
+        self.index.remove(self.period)
+        assert self.period not in self.index
+        with pytest.raises(ValueError):
+            self.index.remove(self.period)
+
+    def test_invalid_operands(self):
+        self.index = WallClockPeriodIndex()
+        with pytest.raises(TypeError):
+            self.index.insert(DatePeriod(start=date(2024, 1, 1), end=date(2024, 1, 2)))
+        with pytest.raises(TypeError):
+            self.index.stab(date(2024, 1, 1))
+        with pytest.raises(TypeError):
+            AbsolutePeriodIndex([WallClockPeriod(start=datetime(2024, 1, 1), end=datetime(2024, 1, 2))])
+
+    def test_boundaries(self):
+        """
+            Periods starting or ending exactly at a point in time contain it, and periods meeting a window overlap it
+        """
+        self.period = WallClockPeriod(start=datetime(2024, 1, 1, 8, 0), end=datetime(2024, 1, 1, 12, 0))
+        self.index = WallClockPeriodIndex([self.period])
+        assert self.index.stab(self.period.start) == [self.period]
+        assert self.index.stab(self.period.end) == [self.period]
+        assert self.index.stab(datetime(2024, 1, 1, 12, 0, 0, 1)) == []
+        self.window = WallClockPeriod(start=datetime(2024, 1, 1, 12, 0), end=datetime(2024, 1, 1, 14, 0))
+        assert self.index.overlapping(self.window) == [self.period]
+        self.window = WallClockPeriod(start=datetime(2024, 1, 1, 12, 0, 0, 1), end=datetime(2024, 1, 1, 14, 0))
+        assert self.index.overlapping(self.window) == []
+        # An equal window is both within and containing the period
+        assert self.index.within(self.period) == [self.period]
+        assert self.index.containing(self.period) == [self.period]
+
+    def test_balance(self):
+        """
+            Inserting periods in the order of their start, the worst case for an unbalanced tree, and then removing
+            every other one keeps the tree balanced
+        """
+        self.start = datetime(2024, 1, 1)
+        self.periods = [WallClockPeriod(start=self.start + timedelta(hours=hour),
+                                        end=self.start + timedelta(hours=hour + 2)) for hour in range(256)]
+        self.index = WallClockPeriodIndex()
+        for period in self.periods:
+            self.index.insert(period)
+        assert _check_tree(self.index._root) <= 12
+        for period in self.periods[::2]:
+            self.index.remove(period)
+        _check_tree(self.index._root)
+        assert list(self.index) == self.periods[1::2]
+        assert self.index.stab(self.start + timedelta(hours=4)) == [self.periods[3]]
+
+    def test_wallclock_fold(self):
+        """
+            Periods are ordered by their wall clock values, the same way `get_overlap` compares them, so a period
+            starting at the second occurrence of 01:20 in New York on the 3rd of Nov 2024 overlaps one ending at 01:40
+        """
+        self.zone = ZoneInfo('America/New_York')
+        self.first = WallClockPeriod(start=datetime(2024, 11, 3, 0, 0, tzinfo=self.zone),
+                                     end=datetime(2024, 11, 3, 1, 40, tzinfo=self.zone))
+        self.second = WallClockPeriod(start=datetime(2024, 11, 3, 1, 20, tzinfo=self.zone, fold=1),
+                                      end=datetime(2024, 11, 3, 2, 30, tzinfo=self.zone))
+        self.index = WallClockPeriodIndex([self.second])
+        assert self.first.get_overlap(self.second) is not None
+        assert self.index.overlapping(self.first) == [self.second]
+        assert self.index.stab(datetime(2024, 11, 3, 1, 30, tzinfo=self.zone)) == [self.second]
+
+    def test_absolute_timezones(self):
+        """
+            Periods and points in time set in different timezones are compared by the moments they represent
+        """
+        self.utc = ZoneInfo('UTC')
+        self.tokyo = ZoneInfo('Asia/Tokyo')
+        self.first = AbsolutePeriod(start=datetime(2024, 1, 1, 8, 0, tzinfo=self.utc),
+                                    end=datetime(2024, 1, 1, 12, 0, tzinfo=self.utc))
+        self.second = AbsolutePeriod(start=datetime(2024, 1, 1, 20, 0, tzinfo=self.tokyo),
+                                     end=datetime(2024, 1, 1, 22, 0, tzinfo=self.tokyo))
+        self.index = AbsolutePeriodIndex([self.first, self.second])
+        assert list(self.index) == [self.first, self.second]
+        assert self.index.stab(datetime(2024, 1, 1, 18, 0, tzinfo=self.tokyo)) == [self.first]
+        assert self.index.stab(datetime(2024, 1, 1, 12, 30, tzinfo=self.utc)) == [self.second]
+        self.index.remove(AbsolutePeriod(start=datetime(2024, 1, 1, 11, 0, tzinfo=self.utc),
+                                         end=datetime(2024, 1, 1, 13, 0, tzinfo=self.utc)))
+        assert list(self.index) == [self.first]
+
+    def test_absolute_awareness(self):
+        """
+            The same as `point in period`, naive and aware periods and points in time are not compared with each other
+        """
+        self.aware = AbsolutePeriod(start=datetime(2024, 1, 1, 8, 0, tzinfo=ZoneInfo('UTC')),
+                                    end=datetime(2024, 1, 1, 12, 0, tzinfo=ZoneInfo('UTC')))
+        self.naive = AbsolutePeriod(start=datetime(2024, 1, 1, 9, 0), end=datetime(2024, 1, 1, 10, 0))
+        with pytest.raises(TypeError):
+            AbsolutePeriodIndex([self.aware, self.naive])
+        self.index = AbsolutePeriodIndex([self.aware])
+        with pytest.raises(TypeError):
+            self.index.stab(datetime(2024, 1, 1, 9, 0))
+        with pytest.raises(TypeError):
+            self.index.overlapping(self.naive)
+        with pytest.raises(TypeError):
+            self.index.insert(self.naive)
+        assert len(self.index) == 1
+        # An empty index takes periods of either kind
+        self.index.remove(self.aware)
+        self.index.insert(self.naive)
+        assert self.index.stab(datetime(2024, 1, 1, 9, 30)) == [self.naive]
+        with pytest.raises(TypeError):
+            self.index.within(self.aware)
+
+
+class TestDatePeriodIndex:
+
+    def test_queries(self):
+        self.periods = [
+            DatePeriod(start=date(2024, 1, 1), end=date(2024, 12, 31)),
+            DatePeriod(start=date(2024, 2, 10), end=date(2024, 3, 1)),
+            DatePeriod(start=date(2024, 3, 31), end=date(2024, 4, 30)),
+            DatePeriod(start=date(2024, 4, 1), end=date(2024, 4, 2)),
+        ]
+        self.index = DatePeriodIndex(reversed(self.periods))
+        assert list(self.index) == self.periods
+        # Periods ending on the first and starting on the last day of the month are touching it
+        self.march = DatePeriod(start=date(2024, 3, 1), end=date(2024, 3, 31))
+        assert self.index.overlapping(self.march) == self.periods[:3]
+        assert self.index.stab(date(2024, 4, 1)) == [self.periods[0], self.periods[2], self.periods[3]]
+        assert self.index.stab(datetime(2024, 3, 1, 23, 0)) == self.periods[:2]
+        # As with `is_before`, a period ending on the first day of the month is not before it
+        assert self.index.before(self.march) == []
+        assert self.index.before(date(2024, 3, 2)) == [self.periods[1]]
+        assert self.index.after(date(2024, 3, 31)) == [self.periods[3]]
+        self.window = WallClockPeriod(start=datetime(2024, 4, 2, 8, 0), end=datetime(2024, 4, 3, 8, 0))
+        assert self.index.overlapping(self.window) == [self.periods[0], self.periods[2], self.periods[3]]
+
+    def test_invalid_operands(self):
+        with pytest.raises(TypeError):
+            DatePeriodIndex([WallClockPeriod(start=datetime(2024, 1, 1), end=datetime(2024, 1, 2))])
+        self.index = DatePeriodIndex()
+        assert self.index.overlapping(DatePeriod(start=date(2024, 1, 1), end=date(2024, 1, 2))) == []
+        with pytest.raises(TypeError):
+            self.index.stab('2024-01-01')
+
+    def test_boundaries(self):
+        """
+            Both the start and end dates belong to the periods, so that the queries agree with the membership test,
+            `is_before` and `is_after` of the periods on either side of their bounds
+        """
+        self.periods = [
+            DatePeriod(start=date(2024, 3, 10), end=date(2024, 3, 20)),
+            DatePeriod(start=date(2024, 3, 10), end=date(2024, 3, 11)),
+            DatePeriod(start=date(2024, 3, 20), end=date(2024, 3, 25)),
+        ]
+        self.index = DatePeriodIndex(self.periods)
+        assert list(self.index) == [self.periods[1], self.periods[0], self.periods[2]]
+        for day in (9, 10, 11, 12, 19, 20, 21, 25, 26):
+            point = date(2024, 3, day)
+            assert self.index.stab(point) == [p for p in self.index if point in p]
+            assert sorted(self.index.before(point)) == sorted(p for p in self.index if p.is_before(point))
+            assert self.index.after(point) == [p for p in self.index if p.is_after(point)]
+        # Windows meeting the periods on either side of them
+        self.window = DatePeriod(start=date(2024, 3, 1), end=date(2024, 3, 10))
+        assert self.index.overlapping(self.window) == [self.periods[1], self.periods[0]]
+        assert self.index.after(self.window) == [self.periods[2]]
+        self.window = DatePeriod(start=date(2024, 3, 25), end=date(2024, 3, 30))
+        assert self.index.overlapping(self.window) == [self.periods[2]]
+        assert self.index.before(self.window) == [self.periods[1], self.periods[0]]
+
+
+class TestTimeline:
+
+    def test_lookups(self):
+        self.windows = [
+            WallClockPeriod(start=datetime(2024, 1, 1, 8, 0), end=datetime(2024, 1, 1, 10, 0)),
+            WallClockPeriod(start=datetime(2024, 1, 1, 9, 0), end=datetime(2024, 1, 1, 17, 0)),
+            WallClockPeriod(start=datetime(2024, 1, 1, 12, 0), end=datetime(2024, 1, 1, 13, 0)),
+        ]
+        self.timeline = WallClockTimeline(reversed(self.windows))
+        assert list(self.timeline) == self.windows
+        self.now = datetime(2024, 1, 1, 12, 0)
+        # A window starting now is after it, as `is_after` considers it
+        assert self.timeline.next_start(self.now) == self.windows[2]
+        assert self.timeline.previous_start(self.now) == self.windows[1]
+        assert self.timeline.next_end(self.now) == self.windows[2]
+        assert self.timeline.previous_end(self.now) == self.windows[0]
+        assert self.timeline.next_start(datetime(2024, 1, 1, 12, 1)) is None
+        assert self.timeline.previous_end(datetime(2024, 1, 1, 9, 59)) is None
+        # For a period, the windows after it start after its end, and the ones before it end before its start
+        self.period = WallClockPeriod(start=datetime(2024, 1, 1, 10, 0), end=datetime(2024, 1, 1, 11, 0))
+        assert self.timeline.next_start(self.period) == self.windows[2]
+        assert self.timeline.previous_end(self.period) == self.windows[0]
+        with pytest.raises(TypeError):
+            self.timeline.next_start(date(2024, 1, 1))
+
+    def test_absolute_timezones(self):
+        self.first = AbsolutePeriod(start=datetime(2024, 1, 1, 8, 0, tzinfo=ZoneInfo('UTC')),
+                                    end=datetime(2024, 1, 1, 12, 0, tzinfo=ZoneInfo('UTC')))
+        self.second = AbsolutePeriod(start=datetime(2024, 1, 1, 8, 0, tzinfo=ZoneInfo('America/New_York')),
+                                     end=datetime(2024, 1, 1, 9, 0, tzinfo=ZoneInfo('America/New_York')))
+        self.timeline = AbsoluteTimeline([self.second, self.first])
+        self.now = datetime(2024, 1, 1, 12, 0, tzinfo=ZoneInfo('UTC'))
+        assert self.timeline.next_start(self.now) == self.second
+        assert self.timeline.previous_end(self.now) == self.first
+        assert self.timeline.previous_end(datetime(2024, 1, 1, 6, 59, tzinfo=ZoneInfo('America/New_York'))) is None
+
+    def test_absolute_awareness(self):
+        """
+            The same as `is_before` and `is_after`, naive and aware periods and points in time are not compared with
+            each other
+        """
+        self.aware = AbsolutePeriod(start=datetime(2024, 1, 1, 8, 0, tzinfo=ZoneInfo('UTC')),
+                                    end=datetime(2024, 1, 1, 12, 0, tzinfo=ZoneInfo('UTC')))
+        self.naive = AbsolutePeriod(start=datetime(2024, 1, 1, 9, 0), end=datetime(2024, 1, 1, 10, 0))
+        with pytest.raises(TypeError):
+            AbsoluteTimeline([self.aware, self.naive])
+        self.timeline = AbsoluteTimeline([self.aware])
+        with pytest.raises(TypeError):
+            self.timeline.next_end(datetime(2024, 1, 1, 9, 0))
+        with pytest.raises(TypeError):
+            self.timeline.previous_start(self.naive)
+        self.timeline = AbsoluteTimeline([self.naive])
+        assert self.timeline.next_end(datetime(2024, 1, 1, 9, 30)) == self.naive
+        with pytest.raises(TypeError):
+            self.timeline.next_start(self.aware)
+        assert AbsoluteTimeline().next_start(datetime(2024, 1, 1, 9, 0)) is None
+
+    def test_boundaries(self):
+        """
+            The lookups agree with `is_before` and `is_after` at the start and end of the windows, where several windows
+            may start or end together
+        """
+        self.windows = [
+            WallClockPeriod(start=datetime(2024, 1, 1, 8, 0), end=datetime(2024, 1, 1, 12, 0)),
+            WallClockPeriod(start=datetime(2024, 1, 1, 10, 0), end=datetime(2024, 1, 1, 12, 0)),
+            WallClockPeriod(start=datetime(2024, 1, 1, 12, 0), end=datetime(2024, 1, 1, 14, 0)),
+        ]
+        self.timeline = WallClockTimeline(self.windows)
+        self.now = datetime(2024, 1, 1, 12, 0)
+        assert self.timeline.next_start(self.now) == self.windows[2]
+        assert self.timeline.previous_end(self.now).end == self.now
+        assert self.timeline.previous_start(self.now) == self.windows[1]
+        # The windows ending now are before it
+        assert self.timeline.next_end(self.now) == self.windows[2]
+        assert self.timeline.previous_start(self.windows[0].start) is None
+        assert self.timeline.next_end(self.windows[2].end) is None
+        assert self.timeline.next_start(datetime(2024, 1, 1, 12, 0, 0, 1)) is None
+        assert WallClockTimeline().previous_end(self.now) is None
+
+    def test_wallclock_fold(self):
+        """
+            The windows are ordered by their wall clock values, so the second occurrence of 01:30 in New York on the
+            3rd of Nov 2024 comes before 01:40
+        """
+        self.zone = ZoneInfo('America/New_York')
+        self.window = WallClockPeriod(start=datetime(2024, 11, 3, 1, 30, tzinfo=self.zone, fold=1),
+                                      end=datetime(2024, 11, 3, 3, 0, tzinfo=self.zone))
+        self.timeline = WallClockTimeline([self.window])
+        self.now = datetime(2024, 11, 3, 1, 40, tzinfo=self.zone)
+        assert self.window.is_after(self.now) is False
+        assert self.timeline.next_start(self.now) is None
+        assert self.timeline.previous_start(self.now) == self.window
+
+
+class TestTimePeriodIndex:
+
+    def setup_method(self):
+        self.morning = TimePeriod(start=time(8, 0), end=time(12, 0))
+        self.lunch = TimePeriod(start=time(12, 0), end=time(13, 0))
+        self.afternoon = TimePeriod(start=time(13, 30), end=time(18, 0))
+        self.all_day = TimePeriod(start=time(9, 0), end=time(17, 0))
+        self.index = TimePeriodIndex([self.afternoon, self.lunch, self.morning, self.all_day])
+
+    def test_stab(self):
+        assert len(self.index) == 4
+        assert self.index.stab(time(10, 0)) == [self.morning, self.all_day]
+        # Periods contain their start and end, so both periods meeting at noon contain it
+        assert self.index.stab(time(12, 0)) == [self.morning, self.all_day, self.lunch]
+        assert self.index.stab(time(13, 15)) == [self.all_day]
+        assert self.index.stab(time(17, 30)) == [self.afternoon]
+        assert self.index.stab(datetime(2024, 1, 1, 18, 0)) == [self.afternoon]
+        assert self.index.stab(time(7, 59, 59, 999999)) == []
+        assert self.index.stab(time(18, 0, 0, 1)) == []
+
+    def test_covers(self):
+        self.index = TimePeriodIndex([self.morning, self.afternoon])
+        assert self.index.covers(time(8, 0))
+        assert self.index.covers(time(12, 0))
+        assert not self.index.covers(time(12, 0, 0, 1))
+        assert not self.index.covers(time(13, 0))
+        assert self.index.covers(datetime(2024, 1, 1, 14, 0))
+        assert not self.index.covers(time(0, 0))
+        assert not self.index.covers(time(23, 59))
+
+    def test_empty(self):
+        self.index = TimePeriodIndex()
+        assert len(self.index) == 0
+        assert self.index.stab(time(12, 0)) == []
+        assert not self.index.covers(time(12, 0))
+
+    def test_invalid_types(self):
+        with pytest.raises(TypeError):
+            TimePeriodIndex([DatePeriod(start=date(2024, 1, 1), end=date(2024, 1, 2))])
+        with pytest.raises(TypeError):
+            self.index.stab(date(2024, 1, 1))
+        with pytest.raises(TypeError):
+            self.index.covers(self.morning)
+
+    def test_nested(self):
+        """
+            Nested periods sharing their start or end, and the bounds of the day
+        """
+        self.periods = [TimePeriod(start=time(hour, 0), end=time(23 - hour, 0)) for hour in range(12)]
+        self.periods.append(TimePeriod(start=time(0, 0), end=time(23, 59, 59, 999999)))
+        self.periods.append(TimePeriod(start=time(0, 0), end=time(6, 0)))
+        self.index = TimePeriodIndex(self.periods)
+        assert len(self.index) == 14
+        for hour in (0, 5, 6, 7, 11, 12, 17, 23):
+            point = time(hour, 0)
+            contained = [period for period in self.periods if point in period]
+            assert sorted(self.index.stab(point)) == sorted(contained)
+            assert self.index.covers(point) == bool(contained)
+        assert self.index.stab(time(23, 59, 59, 999999)) == [self.periods[12]]
+        assert sorted(self.index.stab(time(11, 30))) == sorted(self.periods[:13])
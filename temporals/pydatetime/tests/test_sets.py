@@ -0,0 +1,157 @@
+from zoneinfo import ZoneInfo
+
+import pytest
+from datetime import time, date, datetime, timedelta
+from temporals.pydatetime.periods import TimePeriod, DatePeriod, WallClockPeriod, AbsolutePeriod
+from temporals.pydatetime.sets import TimePeriodSet, DatePeriodSet, WallClockPeriodSet, AbsolutePeriodSet
+
+
+class TestPeriodSet:
+
+    def test_coalesce(self):
+        self.periods = [
+            TimePeriod(start=time(13, 0), end=time(15, 0)),
+            TimePeriod(start=time(8, 0), end=time(10, 0)),
+            TimePeriod(start=time(9, 0), end=time(11, 0)),
+            TimePeriod(start=time(11, 0), end=time(12, 0)),
+            TimePeriod(start=time(13, 30), end=time(14, 0)),
+        ]
+        self.period_set = TimePeriodSet(self.periods)
+        assert self.period_set.periods == (
+            TimePeriod(start=time(8, 0), end=time(12, 0)),
+            TimePeriod(start=time(13, 0), end=time(15, 0)),
+        )
+        # Members which did not have to be coalesced are kept as they are
+        assert self.period_set.periods[1] is self.periods[0]
+        assert len(self.period_set) == 2
+        assert bool(TimePeriodSet()) is False
+
+    def test_invalid_members(self):
+        with pytest.raises(TypeError):
+            TimePeriodSet([DatePeriod(start=date(2024, 1, 1), end=date(2024, 1, 2))])
+        with pytest.raises(TypeError):
+            TimePeriodSet([time(8, 0)])
+
+    def test_operations(self):
+        self.first = TimePeriodSet([
+            TimePeriod(start=time(8, 0), end=time(12, 0)),
+            TimePeriod(start=time(14, 0), end=time(18, 0)),
+        ])
+        self.second = TimePeriodSet([
+            TimePeriod(start=time(10, 0), end=time(15, 0)),
+            TimePeriod(start=time(18, 0), end=time(20, 0)),
+        ])
+        assert self.first | self.second == TimePeriodSet([TimePeriod(start=time(8, 0), end=time(20, 0))])
+        assert self.first & self.second == TimePeriodSet([
+            TimePeriod(start=time(10, 0), end=time(12, 0)),
+            TimePeriod(start=time(14, 0), end=time(15, 0)),
+        ])
+        assert self.first - self.second == TimePeriodSet([
+            TimePeriod(start=time(8, 0), end=time(10, 0)),
+            TimePeriod(start=time(15, 0), end=time(18, 0)),
+        ])
+        assert self.first ^ self.second == TimePeriodSet([
+            TimePeriod(start=time(8, 0), end=time(10, 0)),
+            TimePeriod(start=time(12, 0), end=time(14, 0)),
+            TimePeriod(start=time(15, 0), end=time(20, 0)),
+        ])
+        with pytest.raises(TypeError):
+            self.first.union(DatePeriodSet())
+        with pytest.raises(TypeError):
+            self.first | DatePeriodSet()
+
+    def test_boundaries(self):
+        """
+            Members meeting each other are merged, and the results never hold a member without a duration
+        """
+        self.first = TimePeriodSet([TimePeriod(start=time(8, 0), end=time(10, 0))])
+        self.second = TimePeriodSet([TimePeriod(start=time(10, 0), end=time(12, 0))])
+        assert self.first | self.second == TimePeriodSet([TimePeriod(start=time(8, 0), end=time(12, 0))])
+        assert not self.first & self.second
+        assert self.first - self.second == self.first
+        assert self.first ^ self.second == TimePeriodSet([TimePeriod(start=time(8, 0), end=time(12, 0))])
+        assert not self.first - self.first
+        assert not self.first ^ self.first
+        assert self.first & self.first == self.first
+        assert self.first | TimePeriodSet() == self.first
+        assert not self.first & TimePeriodSet()
+        # A member within the other one, starting or ending together with it
+        self.second = TimePeriodSet([
+            TimePeriod(start=time(8, 0), end=time(9, 0)),
+            TimePeriod(start=time(9, 30), end=time(10, 0)),
+        ])
+        assert self.first & self.second == self.second
+        assert self.first - self.second == TimePeriodSet([TimePeriod(start=time(9, 0), end=time(9, 30))])
+        assert self.second - self.first == TimePeriodSet()
+
+    def test_membership(self):
+        self.period_set = DatePeriodSet([
+            DatePeriod(start=date(2024, 1, 1), end=date(2024, 1, 10)),
+            DatePeriod(start=date(2024, 2, 1), end=date(2024, 2, 10)),
+        ])
+        assert DatePeriod(start=date(2024, 2, 3), end=date(2024, 2, 5)) in self.period_set
+        assert DatePeriod(start=date(2024, 1, 5), end=date(2024, 2, 5)) not in self.period_set
+        assert DatePeriod(start=date(2023, 12, 1), end=date(2023, 12, 5)) not in self.period_set
+        # The start and end dates of the members belong to them
+        assert DatePeriod(start=date(2024, 1, 1), end=date(2024, 1, 10)) in self.period_set
+        assert DatePeriod(start=date(2024, 1, 10), end=date(2024, 2, 1)) not in self.period_set
+
+    def test_wallclock(self):
+        self.start = datetime(2024, 1, 1, 8, 0)
+        self.first = WallClockPeriodSet([WallClockPeriod(start=self.start, end=self.start + timedelta(days=2))])
+        self.second = WallClockPeriodSet([
+            WallClockPeriod(start=self.start + timedelta(hours=12), end=self.start + timedelta(hours=36)),
+        ])
+        assert self.first - self.second == WallClockPeriodSet([
+            WallClockPeriod(start=self.start, end=self.start + timedelta(hours=12)),
+            WallClockPeriod(start=self.start + timedelta(hours=36), end=self.start + timedelta(days=2)),
+        ])
+
+    def test_wallclock_fold(self):
+        """
+            Wallclock members are ordered by their wall clock values, so a member starting at the second occurrence of
+            01:20 in New York on the 3rd of Nov 2024 overlaps one ending at 01:40
+        """
+        self.zone = ZoneInfo('America/New_York')
+        self.first = WallClockPeriod(start=datetime(2024, 11, 3, 0, 0, tzinfo=self.zone),
+                                     end=datetime(2024, 11, 3, 1, 40, tzinfo=self.zone))
+        self.second = WallClockPeriod(start=datetime(2024, 11, 3, 1, 20, tzinfo=self.zone, fold=1),
+                                      end=datetime(2024, 11, 3, 2, 30, tzinfo=self.zone))
+        assert WallClockPeriodSet([self.second, self.first]).periods == (
+            WallClockPeriod(start=self.first.start, end=self.second.end),
+        )
+
+    def test_absolute_timezones(self):
+        """
+            Members set in different timezones are ordered and coalesced by the moments in time they represent
+        """
+        self.utc = ZoneInfo('UTC')
+        self.new_york = ZoneInfo('America/New_York')
+        self.first = AbsolutePeriod(start=datetime(2024, 1, 1, 8, 0, tzinfo=self.utc),
+                                    end=datetime(2024, 1, 1, 12, 0, tzinfo=self.utc))
+        self.second = AbsolutePeriod(start=datetime(2024, 1, 1, 7, 0, tzinfo=self.new_york),
+                                     end=datetime(2024, 1, 1, 9, 0, tzinfo=self.new_york))
+        self.period_set = AbsolutePeriodSet([self.second, self.first])
+        assert len(self.period_set) == 1
+        assert self.period_set.periods[0].start_epoch_us == self.first.start_epoch_us
+        assert self.period_set.periods[0].end_epoch_us == self.second.end_epoch_us
+        assert not self.period_set - AbsolutePeriodSet([self.first, self.second])
+
+    def test_absolute_awareness(self):
+        """
+            Naive and aware members cannot be combined into one set
+        """
+        self.naive = AbsolutePeriod(start=datetime(2024, 1, 1, 8, 0), end=datetime(2024, 1, 1, 12, 0))
+        self.aware = AbsolutePeriod(start=datetime(2024, 1, 1, 10, 0, tzinfo=ZoneInfo('UTC')),
+                                    end=datetime(2024, 1, 1, 14, 0, tzinfo=ZoneInfo('UTC')))
+        with pytest.raises(TypeError):
+            AbsolutePeriodSet([self.naive, self.aware])
+        with pytest.raises(TypeError):
+            AbsolutePeriodSet([self.naive]) | AbsolutePeriodSet([self.aware])
+        with pytest.raises(TypeError):
+            AbsolutePeriodSet([self.naive]) & AbsolutePeriodSet([self.aware])
+        assert AbsolutePeriodSet([self.naive]) | AbsolutePeriodSet() == AbsolutePeriodSet([self.naive])
+        with pytest.raises(TypeError):
+            self.naive in AbsolutePeriodSet([self.aware])
+        assert self.naive in AbsolutePeriodSet([self.naive])
+        assert self.aware not in AbsolutePeriodSet()
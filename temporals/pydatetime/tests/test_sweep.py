@@ -0,0 +1,412 @@
+from zoneinfo import ZoneInfo
+
+import pytest
+from datetime import time, date, datetime, timedelta
+from temporals.pydatetime.periods import TimePeriod, DatePeriod, WallClockPeriod, AbsolutePeriod
+from temporals.pydatetime.sets import TimePeriodSet
+from temporals.pydatetime.sweep import (coalesce, coalesce_sorted, gaps, depth_profile, depth_profile_sorted, max_depth,
+                                        overlap_join, containment_join, overlap_amounts)
+from temporals.relations import Relation
+
+
+class TestCoalesce:
+
+    def test_coalesce(self):
+        self.periods = [
+            TimePeriod(start=time(13, 0), end=time(15, 0)),
+            TimePeriod(start=time(8, 0), end=time(10, 0)),
+            TimePeriod(start=time(10, 0), end=time(11, 0)),
+            TimePeriod(start=time(8, 30), end=time(9, 0)),
+            TimePeriod(start=time(11, 30), end=time(12, 0)),
+        ]
+        assert coalesce(self.periods) == [
+            TimePeriod(start=time(8, 0), end=time(11, 0)),
+            TimePeriod(start=time(11, 30), end=time(12, 0)),
+            TimePeriod(start=time(13, 0), end=time(15, 0)),
+        ]
+        # Periods which have not been merged are returned as they are
+        assert coalesce(self.periods)[2] is self.periods[0]
+        assert coalesce([]) == []
+
+    def test_adjacency(self):
+        self.periods = [
+            TimePeriod(start=time(8, 0), end=time(10, 0)),
+            TimePeriod(start=time(10, 0), end=time(11, 0)),
+            TimePeriod(start=time(11, 30), end=time(12, 0)),
+        ]
+        assert coalesce(self.periods, adjacency=None) == self.periods
+        assert coalesce(self.periods, adjacency=timedelta(minutes=30)) == [
+            TimePeriod(start=time(8, 0), end=time(12, 0)),
+        ]
+        with pytest.raises(ValueError):
+            coalesce(self.periods, adjacency=timedelta(minutes=-1))
+
+    def test_consecutive_dates(self):
+        self.periods = [
+            DatePeriod(start=date(2024, 1, 6), end=date(2024, 1, 9)),
+            DatePeriod(start=date(2024, 1, 1), end=date(2024, 1, 5)),
+            DatePeriod(start=date(2024, 1, 11), end=date(2024, 1, 12)),
+        ]
+        assert coalesce(self.periods) == [self.periods[1], self.periods[0], self.periods[2]]
+        assert coalesce(self.periods, adjacency=timedelta(days=1)) == [
+            DatePeriod(start=date(2024, 1, 1), end=date(2024, 1, 9)),
+            DatePeriod(start=date(2024, 1, 11), end=date(2024, 1, 12)),
+        ]
+
+    def test_absolute_timezones(self):
+        self.first = AbsolutePeriod(start=datetime(2024, 1, 1, 8, 0, tzinfo=ZoneInfo('UTC')),
+                                    end=datetime(2024, 1, 1, 12, 0, tzinfo=ZoneInfo('UTC')))
+        self.second = AbsolutePeriod(start=datetime(2024, 1, 1, 7, 0, tzinfo=ZoneInfo('America/New_York')),
+                                     end=datetime(2024, 1, 1, 9, 0, tzinfo=ZoneInfo('America/New_York')))
+        self.coalesced = coalesce([self.second, self.first])
+        assert len(self.coalesced) == 1
+        assert self.coalesced[0].start == self.first.start
+        assert self.coalesced[0].end == self.second.end
+
+    def test_mixed_awareness(self):
+        # Naive and aware periods cannot be compared, so they are neither merged nor swept over together
+        self.naive = AbsolutePeriod(start=datetime(2024, 1, 1, 8, 0), end=datetime(2024, 1, 1, 12, 0))
+        self.aware = AbsolutePeriod(start=datetime(2024, 1, 1, 10, 0, tzinfo=ZoneInfo('UTC')),
+                                    end=datetime(2024, 1, 1, 14, 0, tzinfo=ZoneInfo('UTC')))
+        self.later = AbsolutePeriod(start=datetime(2024, 1, 1, 15, 0, tzinfo=ZoneInfo('UTC')),
+                                    end=datetime(2024, 1, 1, 16, 0, tzinfo=ZoneInfo('UTC')))
+        with pytest.raises(TypeError):
+            coalesce([self.naive, self.aware])
+        with pytest.raises(TypeError):
+            list(coalesce_sorted([self.naive, self.aware]))
+        with pytest.raises(TypeError):
+            list(gaps([self.naive, self.later]))
+        with pytest.raises(TypeError):
+            list(gaps([self.aware], within=AbsolutePeriod(start=datetime(2024, 1, 1), end=datetime(2024, 1, 2))))
+        with pytest.raises(TypeError):
+            list(depth_profile_sorted([self.naive, self.aware]))
+        with pytest.raises(TypeError):
+            max_depth([self.aware, self.naive])
+        with pytest.raises(TypeError):
+            list(overlap_join([self.naive], [self.aware]))
+
+    def test_invalid_periods(self):
+        with pytest.raises(TypeError):
+            coalesce([TimePeriod(start=time(8, 0), end=time(10, 0)),
+                      DatePeriod(start=date(2024, 1, 1), end=date(2024, 1, 2))])
+        with pytest.raises(TypeError):
+            coalesce([time(8, 0)])
+
+    def test_coalesce_sorted(self):
+        self.start = datetime(2024, 1, 1)
+        self.periods = (WallClockPeriod(start=self.start + timedelta(hours=hour),
+                                        end=self.start + timedelta(hours=hour + 2)) for hour in range(0, 100, 3))
+        self.coalesced = coalesce_sorted(self.periods, adjacency=timedelta(hours=1))
+        assert next(self.coalesced) == WallClockPeriod(start=self.start, end=self.start + timedelta(hours=101))
+        assert next(self.coalesced, None) is None
+
+        self.periods = [
+            WallClockPeriod(start=self.start + timedelta(hours=5), end=self.start + timedelta(hours=6)),
+            WallClockPeriod(start=self.start, end=self.start + timedelta(hours=1)),
+        ]
+        with pytest.raises(ValueError):
+            list(coalesce_sorted(self.periods))
+
+    def test_boundaries(self):
+        # Contained, duplicate and meeting periods, with the same starts in any order
+        self.periods = [
+            TimePeriod(start=time(8, 0), end=time(12, 0)),
+            TimePeriod(start=time(9, 0), end=time(10, 0)),
+            TimePeriod(start=time(8, 0), end=time(9, 0)),
+            TimePeriod(start=time(8, 0), end=time(12, 0)),
+            TimePeriod(start=time(12, 0), end=time(13, 0)),
+            TimePeriod(start=time(14, 0), end=time(15, 0)),
+            TimePeriod(start=time(15, 0), end=time(15, 30)),
+            TimePeriod(start=time(16, 0), end=time(17, 0)),
+        ]
+        assert coalesce(self.periods) == [
+            TimePeriod(start=time(8, 0), end=time(13, 0)),
+            TimePeriod(start=time(14, 0), end=time(15, 30)),
+            TimePeriod(start=time(16, 0), end=time(17, 0)),
+        ]
+        assert coalesce(self.periods) == list(TimePeriodSet(self.periods))
+        assert coalesce(self.periods[::-1]) == list(TimePeriodSet(self.periods))
+        assert coalesce(self.periods[:1]) == [self.periods[0]]
+
+
+class TestGaps:
+
+    def test_gaps(self):
+        self.periods = [
+            TimePeriod(start=time(8, 0), end=time(10, 0)),
+            TimePeriod(start=time(9, 0), end=time(11, 0)),
+            TimePeriod(start=time(9, 30), end=time(10, 0)),
+            TimePeriod(start=time(12, 0), end=time(13, 0)),
+            TimePeriod(start=time(13, 0), end=time(14, 0)),
+            TimePeriod(start=time(16, 0), end=time(17, 0)),
+        ]
+        assert list(gaps(self.periods)) == [
+            TimePeriod(start=time(11, 0), end=time(12, 0)),
+            TimePeriod(start=time(14, 0), end=time(16, 0)),
+        ]
+        assert list(gaps([])) == []
+        assert list(gaps(self.periods[:1])) == []
+
+    def test_within(self):
+        self.periods = [
+            DatePeriod(start=date(2023, 12, 20), end=date(2024, 1, 3)),
+            DatePeriod(start=date(2024, 1, 10), end=date(2024, 1, 12)),
+            DatePeriod(start=date(2024, 1, 31), end=date(2024, 2, 5)),
+        ]
+        self.january = DatePeriod(start=date(2024, 1, 1), end=date(2024, 1, 31))
+        assert list(gaps(self.periods, within=self.january)) == [
+            DatePeriod(start=date(2024, 1, 3), end=date(2024, 1, 10)),
+            DatePeriod(start=date(2024, 1, 12), end=date(2024, 1, 31)),
+        ]
+        assert list(gaps([], within=self.january)) == [self.january]
+        self.february = DatePeriod(start=date(2024, 2, 1), end=date(2024, 2, 29))
+        assert list(gaps(self.periods, within=self.february)) == [
+            DatePeriod(start=date(2024, 2, 5), end=date(2024, 2, 29)),
+        ]
+
+    def test_lazy(self):
+        """
+            The iteration stops at the first period starting after the end of the enclosing period
+        """
+        self.start = datetime(2024, 1, 1)
+
+        def jobs():
+            for hour in range(0, 10, 2):
+                yield WallClockPeriod(start=self.start + timedelta(hours=hour),
+                                      end=self.start + timedelta(hours=hour + 1))
+            raise AssertionError('The periods after the enclosing period have been consumed')
+
+        self.day = WallClockPeriod(start=self.start, end=self.start + timedelta(hours=5))
+        self.gaps = gaps(jobs(), within=self.day)
+        assert next(self.gaps) == WallClockPeriod(start=self.start + timedelta(hours=1),
+                                                  end=self.start + timedelta(hours=2))
+        assert [gap.end for gap in self.gaps] == [self.start + timedelta(hours=4)]
+
+    def test_boundaries(self):
+        """
+            Meeting and contained periods leave no gap, while the gaps between periods in different timezones match
+            `get_interim`
+        """
+        self.utc = ZoneInfo('UTC')
+        self.sofia = ZoneInfo('Europe/Sofia')
+        self.periods = [
+            AbsolutePeriod(start=datetime(2024, 1, 1, 8, 0, tzinfo=self.utc),
+                           end=datetime(2024, 1, 1, 10, 0, tzinfo=self.utc)),
+            AbsolutePeriod(start=datetime(2024, 1, 1, 10, 0, tzinfo=self.utc),
+                           end=datetime(2024, 1, 1, 11, 0, tzinfo=self.utc)),
+            AbsolutePeriod(start=datetime(2024, 1, 1, 12, 0, tzinfo=self.sofia),
+                           end=datetime(2024, 1, 1, 13, 0, tzinfo=self.sofia)),
+            AbsolutePeriod(start=datetime(2024, 1, 1, 14, 0, tzinfo=self.sofia),
+                           end=datetime(2024, 1, 1, 14, 30, tzinfo=self.sofia)),
+            AbsolutePeriod(start=datetime(2024, 1, 1, 12, 0, tzinfo=self.utc),
+                           end=datetime(2024, 1, 1, 13, 0, tzinfo=self.utc)),
+        ]
+        self.gaps = list(gaps(self.periods))
+        assert self.gaps == [
+            AbsolutePeriod(start=datetime(2024, 1, 1, 11, 0, tzinfo=self.utc),
+                           end=datetime(2024, 1, 1, 12, 0, tzinfo=self.utc)),
+        ]
+        self.coalesced = coalesce(self.periods)
+        assert self.gaps == [first.get_interim(second) for first, second in zip(self.coalesced, self.coalesced[1:])]
+
+    def test_invalid_periods(self):
+        self.periods = [
+            TimePeriod(start=time(12, 0), end=time(13, 0)),
+            TimePeriod(start=time(8, 0), end=time(10, 0)),
+        ]
+        with pytest.raises(ValueError):
+            list(gaps(self.periods))
+        with pytest.raises(TypeError):
+            gaps(self.periods, within=date(2024, 1, 1))
+        with pytest.raises(TypeError):
+            list(gaps(self.periods, within=DatePeriod(start=date(2024, 1, 1), end=date(2024, 1, 2))))
+        with pytest.raises(TypeError):
+            list(gaps(self.periods, within=WallClockPeriod(start=datetime(2024, 1, 1), end=datetime(2024, 1, 2))))
+
+
+class TestDepth:
+
+    def test_depth_profile(self):
+        self.periods = [
+            TimePeriod(start=time(12, 0), end=time(13, 0)),
+            TimePeriod(start=time(9, 0), end=time(11, 0)),
+            TimePeriod(start=time(10, 0), end=time(12, 0)),
+            TimePeriod(start=time(10, 0), end=time(11, 0)),
+        ]
+        # The periods ending at 1200 and 1100 are replaced by others starting at the same time
+        assert list(depth_profile(self.periods)) == [
+            (time(9, 0), 1),
+            (time(10, 0), 3),
+            (time(11, 0), 1),
+            (time(13, 0), 0),
+        ]
+        assert max_depth(self.periods) == (3, [self.periods[1], self.periods[3], self.periods[2]])
+        assert list(depth_profile([])) == []
+        assert max_depth([]) == (0, [])
+
+    def test_absolute_timezones(self):
+        self.first = AbsolutePeriod(start=datetime(2024, 1, 1, 8, 0, tzinfo=ZoneInfo('UTC')),
+                                    end=datetime(2024, 1, 1, 12, 0, tzinfo=ZoneInfo('UTC')))
+        self.second = AbsolutePeriod(start=datetime(2024, 1, 1, 5, 0, tzinfo=ZoneInfo('America/New_York')),
+                                     end=datetime(2024, 1, 1, 9, 0, tzinfo=ZoneInfo('America/New_York')))
+        self.profile = list(depth_profile([self.first, self.second]))
+        assert [count for _, count in self.profile] == [1, 2, 1, 0]
+        assert self.profile[1][0] == datetime(2024, 1, 1, 10, 0, tzinfo=ZoneInfo('UTC'))
+        assert max_depth([self.first, self.second]) == (2, [self.first, self.second])
+
+    def test_wallclock_fold(self):
+        """
+            The sweeps order wallclock periods by their wall clock values, the same way they are sorted, so the second
+            occurrence of 01:30 in New York on the 3rd of Nov 2024 comes before 01:40
+        """
+        self.zone = ZoneInfo('America/New_York')
+        self.first = WallClockPeriod(start=datetime(2024, 11, 3, 1, 30, tzinfo=self.zone, fold=1),
+                                     end=datetime(2024, 11, 3, 3, 0, tzinfo=self.zone))
+        self.second = WallClockPeriod(start=datetime(2024, 11, 3, 1, 40, tzinfo=self.zone),
+                                      end=datetime(2024, 11, 3, 2, 30, tzinfo=self.zone))
+        self.periods = sorted([self.second, self.first])
+        assert self.periods == [self.first, self.second]
+        assert list(coalesce_sorted(self.periods)) == [self.first]
+        assert list(gaps(self.periods)) == []
+        assert list(depth_profile_sorted(self.periods)) == [
+            (self.first.start, 1),
+            (self.second.start, 2),
+            (self.second.end, 1),
+            (self.first.end, 0),
+        ]
+        assert max_depth([self.second, self.first]) == (2, [self.first, self.second])
+
+    def test_wallclock_fold_overlap(self):
+        """
+            A period starting at the second occurrence of 01:20 overlaps one ending at 01:40, as `get_overlap` and the
+            sets find it
+        """
+        self.zone = ZoneInfo('America/New_York')
+        self.first = WallClockPeriod(start=datetime(2024, 11, 3, 0, 0, tzinfo=self.zone),
+                                     end=datetime(2024, 11, 3, 1, 40, tzinfo=self.zone))
+        self.second = WallClockPeriod(start=datetime(2024, 11, 3, 1, 20, tzinfo=self.zone, fold=1),
+                                      end=datetime(2024, 11, 3, 2, 30, tzinfo=self.zone))
+        self.overlap = self.first.get_overlap(self.second)
+        assert self.overlap is not None
+        assert coalesce([self.first, self.second]) == [WallClockPeriod(start=self.first.start, end=self.second.end)]
+        assert list(overlap_join([self.first], [self.second])) == [(self.first, self.second)]
+        assert list(overlap_amounts([self.first], [self.second])) == [(self.first, self.second, self.overlap)]
+
+    def test_depth_profile_sorted(self):
+        self.start = datetime(2024, 1, 1)
+        self.periods = (WallClockPeriod(start=self.start + timedelta(hours=hour),
+                                        end=self.start + timedelta(hours=hour + 3)) for hour in range(1000))
+        self.profile = depth_profile_sorted(self.periods)
+        assert next(self.profile) == (self.start, 1)
+        assert next(self.profile) == (self.start + timedelta(hours=1), 2)
+        assert next(self.profile) == (self.start + timedelta(hours=2), 3)
+        assert next(self.profile) == (self.start + timedelta(hours=1000), 2)
+
+        self.periods = [
+            WallClockPeriod(start=self.start + timedelta(hours=5), end=self.start + timedelta(hours=6)),
+            WallClockPeriod(start=self.start, end=self.start + timedelta(hours=1)),
+        ]
+        with pytest.raises(ValueError):
+            list(depth_profile_sorted(self.periods))
+        with pytest.raises(TypeError):
+            list(depth_profile([self.periods[0], DatePeriod(start=date(2024, 1, 1), end=date(2024, 1, 2))]))
+
+    def test_boundaries(self):
+        """
+            Periods meeting at a point never count as concurrent, while periods with the same start or end change the
+            depth once
+        """
+        self.periods = [
+            TimePeriod(start=time(8, 0), end=time(10, 0)),
+            TimePeriod(start=time(8, 0), end=time(9, 0)),
+            TimePeriod(start=time(10, 0), end=time(12, 0)),
+            TimePeriod(start=time(11, 0), end=time(12, 0)),
+            TimePeriod(start=time(12, 0), end=time(13, 0)),
+        ]
+        assert list(depth_profile(self.periods)) == [
+            (time(8, 0), 2),
+            (time(9, 0), 1),
+            (time(11, 0), 2),
+            (time(12, 0), 1),
+            (time(13, 0), 0),
+        ]
+        # Both peaks are reached, the first one by both of the periods starting at 0800
+        assert max_depth(self.periods) == (2, sorted(self.periods[:4]))
+        assert max_depth(self.periods[2:]) == (2, self.periods[2:4])
+        assert max_depth(self.periods[4:]) == (1, self.periods[4:])
+
+
+class TestJoin:
+
+    def test_overlap_join(self):
+        self.shifts = [
+            TimePeriod(start=time(8, 0), end=time(12, 0)),
+            TimePeriod(start=time(12, 0), end=time(16, 0)),
+        ]
+        self.bookings = [
+            TimePeriod(start=time(9, 0), end=time(10, 0)),
+            TimePeriod(start=time(11, 0), end=time(13, 0)),
+            TimePeriod(start=time(16, 0), end=time(17, 0)),
+        ]
+        # The booking starting at 1600 only meets the second shift
+        assert list(overlap_join(self.shifts, self.bookings)) == [
+            (self.shifts[0], self.bookings[0]),
+            (self.shifts[0], self.bookings[1]),
+            (self.shifts[1], self.bookings[1]),
+        ]
+        assert list(containment_join(self.shifts, self.bookings)) == [(self.shifts[0], self.bookings[0])]
+        assert [overlap for _, _, overlap in overlap_amounts(self.shifts, self.bookings)] == [
+            self.bookings[0],
+            TimePeriod(start=time(11, 0), end=time(12, 0)),
+            TimePeriod(start=time(12, 0), end=time(13, 0)),
+        ]
+        assert list(overlap_join([], self.bookings)) == []
+
+    def test_equal_periods(self):
+        self.period = DatePeriod(start=date(2024, 1, 1), end=date(2024, 1, 10))
+        self.other_period = DatePeriod(start=date(2024, 1, 1), end=date(2024, 1, 10))
+        assert list(overlap_join([self.period], [self.other_period])) == [(self.period, self.other_period)]
+        assert list(containment_join([self.period], [self.other_period])) == []
+
+    def test_invalid_periods(self):
+        with pytest.raises(TypeError):
+            overlap_join([TimePeriod(start=time(8, 0), end=time(12, 0))],
+                         [DatePeriod(start=date(2024, 1, 1), end=date(2024, 1, 10))])
+
+    def test_relations(self):
+        """
+            A single period of the left side is joined to one period of the right side for each relation, given in
+            another timezone
+        """
+        self.utc = ZoneInfo('UTC')
+        self.sofia = ZoneInfo('Europe/Sofia')
+
+        def period(start, end):
+            # A period between the two hours of the 1st of Jan 2024 in UTC, given in Sofia time
+            return AbsolutePeriod(start=datetime(2024, 1, 1, start, tzinfo=self.utc).astimezone(self.sofia),
+                                  end=datetime(2024, 1, 1, end, tzinfo=self.utc).astimezone(self.sofia))
+
+        self.left = [AbsolutePeriod(start=datetime(2024, 1, 1, 10, tzinfo=self.utc),
+                                    end=datetime(2024, 1, 1, 14, tzinfo=self.utc))]
+        self.right = [period(6, 8), period(8, 10), period(9, 11), period(9, 15), period(10, 12), period(10, 14),
+                      period(11, 13), period(12, 14), period(13, 15), period(14, 16), period(15, 17)]
+        assert [self.left[0].relation(other) for other in self.right] == [
+            Relation.AFTER, Relation.MET_BY, Relation.OVERLAPPED_BY, Relation.DURING, Relation.STARTED_BY,
+            Relation.EQUALS, Relation.CONTAINS, Relation.FINISHED_BY, Relation.OVERLAPS, Relation.MEETS,
+            Relation.BEFORE,
+        ]
+        assert list(overlap_join(self.left, self.right)) == [(self.left[0], other) for other in self.right[2:9]]
+        assert list(containment_join(self.left, self.right)) == [
+            (self.left[0], self.right[4]),
+            (self.left[0], self.right[6]),
+            (self.left[0], self.right[7]),
+        ]
+        self.amounts = list(overlap_amounts(self.left, self.right))
+        assert [overlap.start_epoch_us for _, _, overlap in self.amounts] == [
+            max(self.left[0].start_epoch_us, other.start_epoch_us) for other in self.right[2:9]
+        ]
+        assert [overlap.end_epoch_us for _, _, overlap in self.amounts] == [
+            min(self.left[0].end_epoch_us, other.end_epoch_us) for other in self.right[2:9]
+        ]
+        assert self.amounts[0][2] == self.left[0].get_overlap(self.right[2])
+        assert self.amounts[6][2] == self.left[0].get_overlap(self.right[8])
@@ -1,7 +1,11 @@
 from zoneinfo import ZoneInfo
+import bisect
 import pytest
 from datetime import time, date, datetime
 from temporals.pydatetime.periods import TimePeriod, DatePeriod, WallClockPeriod, AbsolutePeriod
+from temporals.relations import Relation
+from temporals.exceptions import TimeAmbiguityError
+from temporals.interfaces import AbstractTimePeriod
 
 
 class TestTimePeriod:
@@ -26,6 +30,18 @@ class TestTimePeriod:
         with pytest.raises(ValueError):
             TimePeriod(start=self.start, end=self.end)
 
+    def test_from_validated(self):
+        self.period = TimePeriod.from_validated(start=time(8, 0), end=time(12, 0))
+        assert isinstance(self.period, TimePeriod)
+        assert self.period == TimePeriod(start=time(8, 0), end=time(12, 0))
+        assert self.period.duration == TimePeriod(start=time(8, 0), end=time(12, 0)).duration
+
+    def test_slots(self):
+        self.period = TimePeriod(start=time(8, 0), end=time(12, 0))
+        assert not hasattr(self.period, '__dict__')
+        with pytest.raises(AttributeError):
+            self.period.foo = 'bar'
+
     def test_timeperiod_eq(self):
         self.start = time(8, 0, 0)
         self.end = time(10, 0, 0)
@@ -62,6 +78,47 @@ class TestTimePeriod:
         self.period = TimePeriod(start=self.start, end=self.end)
         assert self.random_time != self.period
 
+    def test_hash(self):
+        self.period = TimePeriod(start=time(8, 0), end=time(12, 0))
+        self.same_period = TimePeriod(start=time(8, 0), end=time(12, 0))
+        self.other_period = TimePeriod(start=time(8, 0), end=time(13, 0))
+        assert hash(self.period) == hash(self.same_period)
+        assert len({self.period, self.same_period, self.other_period}) == 2
+        self.cache = {self.period: 'morning'}
+        assert self.cache[self.same_period] == 'morning'
+
+    def test_ordering(self):
+        self.early = TimePeriod(start=time(8, 0), end=time(9, 0))
+        self.long = TimePeriod(start=time(8, 0), end=time(12, 0))
+        self.late = TimePeriod(start=time(9, 0), end=time(10, 0))
+        assert self.early < self.long < self.late
+        assert self.late > self.long > self.early
+        assert self.early <= TimePeriod(start=time(8, 0), end=time(9, 0))
+        assert self.early >= TimePeriod(start=time(8, 0), end=time(9, 0))
+        assert sorted([self.late, self.long, self.early]) == [self.early, self.long, self.late]
+        self.periods = [self.early, self.late]
+        bisect.insort(self.periods, self.long)
+        assert self.periods == [self.early, self.long, self.late]
+        with pytest.raises(TypeError):
+            self.early < time(9, 0)
+        with pytest.raises(TypeError):
+            self.early < WallClockPeriod(start=datetime(2024, 1, 1, 8, 0), end=datetime(2024, 1, 1, 9, 0))
+
+    def test_subclass_operands(self):
+        class ShiftPeriod(TimePeriod):
+            pass
+
+        class Timestamp(datetime):
+            pass
+
+        self.period = TimePeriod(start=time(8, 0), end=time(12, 0))
+        self.shift = ShiftPeriod(start=time(8, 0), end=time(12, 0))
+        assert self.period == self.shift
+        assert self.shift == self.period
+        assert ShiftPeriod(start=time(9, 0), end=time(10, 0)) in self.period
+        assert Timestamp(2024, 1, 1, 9, 0) in self.period
+        assert Timestamp(2024, 1, 1, 13, 0) not in self.period
+
     def test_membership_time(self):
         self.random_time = time(9, 0, 0)
         self.start = time(8, 0, 0)
@@ -243,6 +300,12 @@ class TestTimePeriod:
         self.other_period = TimePeriod(start=self.other_start, end=self.other_end)
         assert self.period.get_interim(self.other_period) == TimePeriod(time(12, 0), time(14, 0))
 
+    def test_get_interim_touching(self):
+        self.period = TimePeriod(start=time(8, 0), end=time(12, 0))
+        self.other_period = TimePeriod(start=time(12, 0), end=time(14, 0))
+        assert self.period.get_interim(self.other_period) is None
+        assert self.other_period.get_interim(self.period) is None
+
     def test_overlaps(self):
         """
            0800     Period 1    1000
@@ -304,3 +367,96 @@ class TestTimePeriod:
 
         self.second_disconnect = self.other_period.get_disconnect(self.period)
         assert self.second_disconnect is None
+
+    def test_relation(self):
+        self.period = TimePeriod(start=time(10, 0), end=time(14, 0))
+        self.cases = [
+            (time(6, 0), time(8, 0), Relation.AFTER),
+            (time(8, 0), time(10, 0), Relation.MET_BY),
+            (time(8, 0), time(12, 0), Relation.OVERLAPPED_BY),
+            (time(10, 0), time(12, 0), Relation.STARTED_BY),
+            (time(11, 0), time(12, 0), Relation.CONTAINS),
+            (time(12, 0), time(14, 0), Relation.FINISHED_BY),
+            (time(10, 0), time(14, 0), Relation.EQUALS),
+            (time(8, 0), time(14, 0), Relation.FINISHES),
+            (time(8, 0), time(16, 0), Relation.DURING),
+            (time(10, 0), time(16, 0), Relation.STARTS),
+            (time(12, 0), time(16, 0), Relation.OVERLAPS),
+            (time(14, 0), time(16, 0), Relation.MEETS),
+            (time(16, 0), time(18, 0), Relation.BEFORE),
+        ]
+        for other_start, other_end, expected in self.cases:
+            self.other_period = TimePeriod(start=other_start, end=other_end)
+            assert self.period.relation(self.other_period) is expected
+            assert self.other_period.relation(self.period) is expected.inverse
+
+        with pytest.raises(TypeError):
+            self.period.relation(DatePeriod(start=date(2024, 1, 1), end=date(2024, 1, 2)))
+
+    def test_relation_multiple_days(self):
+        """
+            The TimePeriod is placed on each day of a period spanning midnight; it overlaps the start of the period on
+            the first day and does not reach it on the second one
+        """
+        self.period = TimePeriod(start=time(21, 0), end=time(23, 0))
+        self.other_period = WallClockPeriod(start=datetime(2024, 1, 1, 22, 0), end=datetime(2024, 1, 2, 6, 0))
+        assert self.period.relation(self.other_period) is Relation.OVERLAPS
+
+    def test_relation_ambiguous(self):
+        """
+            The TimePeriod overlaps the start of the other period on the first day and is within it on the second one,
+            so its relation cannot be answered by a single day
+        """
+        self.period = TimePeriod(start=time(21, 0), end=time(23, 0))
+        self.others = [
+            WallClockPeriod(start=datetime(2024, 1, 1, 22, 0), end=datetime(2024, 1, 3, 6, 0)),
+            AbsolutePeriod(start=datetime(2024, 1, 1, 22, 0, tzinfo=ZoneInfo('UTC')),
+                           end=datetime(2024, 1, 3, 6, 0, tzinfo=ZoneInfo('UTC'))),
+        ]
+        for other in self.others:
+            with pytest.raises(TimeAmbiguityError):
+                self.period.relation(other)
+
+    def test_overlaps_multiple_days(self):
+        """
+            The overlap tests compare the times of the start and end of a wallclock or absolute period alone, as if
+            both periods were set on the same day, regardless of the number of days the period spans
+        """
+        self.period = TimePeriod(start=time(8, 0), end=time(10, 0))
+        self.other_period = WallClockPeriod(start=datetime(2024, 1, 1, 9, 0), end=datetime(2024, 1, 3, 9, 0))
+        assert self.period.overlaps_with(self.other_period) is False
+        assert self.period.overlapped_by(self.other_period) is False
+        assert self.period.get_overlap(self.other_period) is None
+        assert self.period.get_disconnect(self.other_period) is None
+        self.other_period = WallClockPeriod(start=datetime(2024, 1, 1, 9, 0), end=datetime(2024, 1, 3, 11, 0))
+        assert self.period.overlapped_by(self.other_period) is True
+        assert self.period.get_overlap(self.other_period) == TimePeriod(start=time(9, 0), end=time(10, 0))
+        assert self.period.get_disconnect(self.other_period) == TimePeriod(start=time(8, 0), end=time(9, 0))
+        self.other_period = AbsolutePeriod(start=datetime(2024, 1, 1, 6, 0, tzinfo=ZoneInfo('UTC')),
+                                           end=datetime(2024, 1, 4, 9, 0, tzinfo=ZoneInfo('UTC')))
+        assert self.period.overlaps_with(self.other_period) is True
+        assert self.period.get_overlap(self.other_period) == TimePeriod(start=time(8, 0), end=time(9, 0))
+        assert self.period.get_disconnect(self.other_period) == TimePeriod(start=time(9, 0), end=time(10, 0))
+        # A period ending at an earlier time than it starts is not placed within a single day
+        self.other_period = WallClockPeriod(start=datetime(2024, 1, 1, 22, 0), end=datetime(2024, 1, 2, 9, 0))
+        assert self.period.overlaps_with(self.other_period) is False
+        assert self.period.get_overlap(self.other_period) is None
+
+    def test_relation_not_required(self):
+        """
+            Implementations of the interface which do not provide a relation remain instantiable
+        """
+        self.methods = {name: lambda *args: None for name in AbstractTimePeriod.__abstractmethods__}
+        self.legacy = type('LegacyPeriod', (AbstractTimePeriod,), self.methods)()
+        assert 'relation' not in AbstractTimePeriod.__abstractmethods__
+        with pytest.raises(NotImplementedError):
+            self.legacy.relation(TimePeriod(start=time(8, 0), end=time(9, 0)))
+
+    def test_get_overlap_timeperiod(self):
+        self.period = TimePeriod(start=time(8, 0), end=time(12, 0))
+        self.other_period = TimePeriod(start=time(10, 0), end=time(13, 0))
+        self.overlap = TimePeriod(start=time(10, 0), end=time(12, 0))
+        assert self.period.get_overlap(self.other_period) == self.overlap
+        assert self.other_period.get_overlap(self.period) == self.overlap
+        assert self.period.get_disconnect(self.other_period) == TimePeriod(start=time(8, 0), end=time(10, 0))
+        assert self.other_period.get_disconnect(self.period) == TimePeriod(start=time(12, 0), end=time(13, 0))
@@ -0,0 +1,137 @@
+import pytest
+from datetime import date, datetime, timedelta, timezone, tzinfo
+from zoneinfo import ZoneInfo
+from temporals.exceptions import NonexistentTimeError
+import calendar
+from temporals.pydatetime import interface
+from temporals.pydatetime.utils import (check_existence, classify_existence, whole_months, operand_kind, Existence,
+                                       Operand)
+
+
+def _round_trip(value: datetime) -> int:
+    """ The reference implementation - converting to UTC and back changes the wall clock of nonexistent times, while
+    the two occurrences of an ambiguous time have different offsets
+    """
+    if value != value.astimezone(ZoneInfo("UTC")).astimezone(value.tzinfo):
+        return Existence.NONEXISTENT
+    if value.replace(fold=1 - value.fold).utcoffset() != value.utcoffset():
+        return Existence.AMBIGUOUS
+    return Existence.NORMAL
+
+
+class _FixedShift(tzinfo):
+    """ A tzinfo that is not a ZoneInfo, shifting forward by an hour at 2024-03-31 02:00 """
+
+    def utcoffset(self, dt):
+        if dt.replace(tzinfo=None) < datetime(2024, 3, 31, 2, 0):
+            return timedelta(hours=1)
+        return timedelta(hours=2)
+
+    def dst(self, dt):
+        return None
+
+    def fromutc(self, dt):
+        naive = dt.replace(tzinfo=None)
+        if naive < datetime(2024, 3, 31, 1, 0):
+            return (naive + timedelta(hours=1)).replace(tzinfo=self)
+        return (naive + timedelta(hours=2)).replace(tzinfo=self)
+
+
+class TestCheckExistence:
+
+    def test_classify(self):
+        self.zone = ZoneInfo('Europe/Sofia')
+        assert classify_existence(datetime(2025, 3, 30, 2, 59, tzinfo=self.zone)) == Existence.NORMAL
+        assert classify_existence(datetime(2025, 3, 30, 3, 0, tzinfo=self.zone)) == Existence.NONEXISTENT
+        assert classify_existence(datetime(2025, 3, 30, 3, 59, 59, tzinfo=self.zone)) == Existence.NONEXISTENT
+        assert classify_existence(datetime(2025, 3, 30, 4, 0, tzinfo=self.zone)) == Existence.NORMAL
+        assert classify_existence(datetime(2025, 10, 26, 3, 30, tzinfo=self.zone)) == Existence.AMBIGUOUS
+        assert classify_existence(datetime(2025, 10, 26, 3, 30, tzinfo=self.zone, fold=1)) == Existence.AMBIGUOUS
+        assert classify_existence(datetime(2025, 10, 26, 4, 0, tzinfo=self.zone)) == Existence.NORMAL
+        assert classify_existence(datetime(2025, 3, 30, 3, 30)) == Existence.NORMAL
+        assert classify_existence(datetime(2025, 3, 30, 3, 30, tzinfo=timezone.utc)) == Existence.NORMAL
+
+    def test_check_existence(self):
+        self.zone = ZoneInfo('America/New_York')
+        self.value = datetime(2025, 11, 2, 1, 30, tzinfo=self.zone)
+        assert check_existence(self.value) is self.value
+        with pytest.raises(NonexistentTimeError):
+            check_existence(datetime(2025, 3, 9, 2, 30, tzinfo=self.zone))
+
+    def test_other_tzinfo(self):
+        self.zone = _FixedShift()
+        assert classify_existence(datetime(2024, 3, 31, 1, 59, tzinfo=self.zone)) == Existence.NORMAL
+        assert classify_existence(datetime(2024, 3, 31, 2, 30, tzinfo=self.zone)) == Existence.NONEXISTENT
+        with pytest.raises(NonexistentTimeError):
+            check_existence(datetime(2024, 3, 31, 2, 30, tzinfo=self.zone))
+
+    @pytest.mark.parametrize('key, year', [
+        ('Europe/Sofia', 2025),
+        ('America/New_York', 2024),
+        ('Australia/Lord_Howe', 2025),
+        ('Pacific/Apia', 2011),
+        ('America/Sao_Paulo', 2018),
+        ('Asia/Kolkata', 1942),
+    ])
+    def test_matches_round_trip(self, key, year):
+        # Every half an hour of the year, both occurrences, must be classified the same way as the reference does
+        self.zone = ZoneInfo(key)
+        self.value = datetime(year, 1, 1, tzinfo=self.zone)
+        while self.value.year == year:
+            for fold in (0, 1):
+                self.folded = self.value.replace(fold=fold)
+                assert classify_existence(self.folded) == _round_trip(self.folded), self.folded
+            self.value += timedelta(minutes=30)
+
+
+def _month_walk(year: int, month: int, days: int) -> tuple[int, int]:
+    """ The reference implementation - subtracting the length of each month in turn while the days suffice """
+    months = 0
+    while days > 0:
+        if month > 12:
+            month = 1
+            year += 1
+        days_in_month = calendar.monthrange(year, month)[1]
+        if days - days_in_month < 0:
+            break
+        months += 1
+        month += 1
+        days -= days_in_month
+    return months, days
+
+
+class TestWholeMonths:
+
+    def test_whole_months(self):
+        assert whole_months(date(2024, 1, 1), 0) == (0, 0)
+        assert whole_months(date(2024, 1, 1), -3) == (0, -3)
+        assert whole_months(date(2024, 1, 1), 30) == (0, 30)
+        assert whole_months(date(2024, 1, 15), 31) == (1, 0)
+        assert whole_months(date(2024, 2, 1), 29) == (1, 0)
+        assert whole_months(date(2025, 2, 28), 29) == (1, 1)
+        assert whole_months(date(2024, 12, 31), 365) == (12, 0)
+
+    @pytest.mark.parametrize('year', [1999, 2000, 2023, 2024, 2100])
+    def test_matches_month_walk(self, year):
+        for month in range(1, 13):
+            for days in range(0, 1200):
+                assert whole_months(date(year, month, 1), days) == _month_walk(year, month, days), (year, month, days)
+
+
+class TestOperandKind:
+
+    def test_operand_kind(self):
+        assert operand_kind(datetime(2024, 1, 1)) == Operand.DATETIME
+        assert operand_kind(date(2024, 1, 1)) == Operand.DATE
+        assert operand_kind('2024-01-01') == Operand.UNSUPPORTED
+
+    def test_registered_later(self):
+        """
+            A type registered with one of the interfaces after it has been resolved as unsupported is picked up
+        """
+        class Shift:
+            pass
+
+        assert operand_kind(Shift()) == Operand.UNSUPPORTED
+        interface.PyTimePeriod.register(Shift)
+        assert operand_kind(Shift()) == Operand.TIME_PERIOD
@@ -1,6 +1,7 @@
 import pytest
 from datetime import time, date, datetime
 from temporals.pydatetime.periods import TimePeriod, DatePeriod, WallClockPeriod, AbsolutePeriod
+from temporals.relations import Relation
 from temporals.exceptions import TimeAmbiguityError
 
 
@@ -26,6 +27,19 @@ class TestWallClockPeriod:
         with pytest.raises(ValueError):
             WallClockPeriod(start=self.start, end=self.end)
 
+    def test_from_validated(self):
+        self.period = WallClockPeriod.from_validated(start=datetime(2024, 1, 1, 8, 0), end=datetime(2024, 1, 1, 12, 0))
+        assert isinstance(self.period, WallClockPeriod)
+        self.constructed = WallClockPeriod(start=datetime(2024, 1, 1, 8, 0), end=datetime(2024, 1, 1, 12, 0))
+        assert self.period == self.constructed
+        assert self.period.duration == self.constructed.duration
+
+    def test_slots(self):
+        self.period = WallClockPeriod(start=datetime(2024, 1, 1, 8, 0), end=datetime(2024, 1, 1, 12, 0))
+        assert not hasattr(self.period, '__dict__')
+        with pytest.raises(AttributeError):
+            self.period.foo = 'bar'
+
     def test_nonrepeating_time(self):
         """ This tests the internal _time_repeats method """
         self.start = datetime(2024, 1, 1, 8, 0)
@@ -116,6 +130,35 @@ class TestWallClockPeriod:
         self.period = WallClockPeriod(start=self.start, end=self.end)
         assert self.random_dt != self.period
 
+    def test_hash(self):
+        self.period = WallClockPeriod(start=datetime(2024, 1, 1, 8, 0), end=datetime(2024, 1, 1, 12, 0))
+        self.same_period = WallClockPeriod(start=datetime(2024, 1, 1, 8, 0), end=datetime(2024, 1, 1, 12, 0))
+        self.other_period = WallClockPeriod(start=datetime(2024, 1, 2, 8, 0), end=datetime(2024, 1, 2, 12, 0))
+        assert hash(self.period) == hash(self.same_period)
+        assert len({self.period, self.same_period, self.other_period}) == 2
+        self.cache = {self.period: 'meeting'}
+        assert self.cache[self.same_period] == 'meeting'
+
+    def test_ordering(self):
+        self.early = WallClockPeriod(start=datetime(2024, 1, 1, 8, 0), end=datetime(2024, 1, 1, 9, 0))
+        self.long = WallClockPeriod(start=datetime(2024, 1, 1, 8, 0), end=datetime(2024, 1, 2, 9, 0))
+        self.late = WallClockPeriod(start=datetime(2024, 1, 1, 8, 30), end=datetime(2024, 1, 1, 9, 0))
+        assert self.early < self.long < self.late
+        assert not self.long < self.early
+        assert sorted([self.late, self.long, self.early]) == [self.early, self.long, self.late]
+        with pytest.raises(TypeError):
+            self.early < AbsolutePeriod(start=datetime(2024, 1, 1, 8, 0), end=datetime(2024, 1, 1, 9, 0))
+
+    def test_subclass_operands(self):
+        class Timestamp(datetime):
+            pass
+
+        self.period = WallClockPeriod(start=datetime(2024, 1, 1, 8, 0), end=datetime(2024, 1, 1, 12, 0))
+        # Subclasses of datetime must not be mistaken for dates, which are compared with a whole day difference
+        assert self.period.is_before(Timestamp(2024, 1, 1, 12, 0))
+        assert self.period.is_after(Timestamp(2024, 1, 1, 8, 0))
+        assert Timestamp(2024, 1, 1, 10, 0) in self.period
+
     def test_valid_membership_time(self):
         # Same day period
         self.start = datetime(2024, 1, 1, 8, 0)
@@ -560,6 +603,12 @@ class TestWallClockPeriod:
                                                                             datetime(2024, 1, 1, 12, 0, 5)
                                                                             )
 
+    def test_get_interim_touching(self):
+        self.period = WallClockPeriod(start=datetime(2024, 1, 1, 8, 0), end=datetime(2024, 1, 1, 12, 0))
+        self.other_period = WallClockPeriod(start=datetime(2024, 1, 1, 12, 0), end=datetime(2024, 1, 1, 14, 0))
+        assert self.period.get_interim(self.other_period) is None
+        assert self.other_period.get_interim(self.period) is None
+
     def test_get_overlap(self):
         # Same day period
         self.start = datetime(2024, 1, 1, 8, 0)
@@ -698,3 +747,40 @@ class TestWallClockPeriod:
         assert self.dc is None
         self.other_dc = self.dt_period.get_disconnect(self.period)
         assert self.other_dc is None
+
+    def test_relation(self):
+        self.period = WallClockPeriod(start=datetime(2024, 1, 1, 8, 0), end=datetime(2024, 1, 1, 12, 0))
+        self.other_period = WallClockPeriod(start=datetime(2024, 1, 1, 12, 0), end=datetime(2024, 1, 1, 14, 0))
+        assert self.period.relation(self.other_period) is Relation.MEETS
+        assert self.other_period.relation(self.period) is Relation.MET_BY
+        assert self.period.relation(TimePeriod(start=time(9, 0), end=time(10, 0))) is Relation.CONTAINS
+        assert self.period.relation(DatePeriod(start=date(2024, 1, 1), end=date(2024, 1, 2))) is Relation.STARTS
+
+        with pytest.raises(TypeError):
+            self.period.relation(AbsolutePeriod(start=datetime(2024, 1, 1, 8, 0), end=datetime(2024, 1, 1, 12, 0)))
+
+    def test_relation_overnight(self):
+        """
+            A TimePeriod that overlaps the end of an overnight period on the second day only; the overlap tests compare
+            it to the times of the period instead, by which it starts before the period on the first day
+        """
+        self.period = WallClockPeriod(start=datetime(2024, 1, 1, 22, 0), end=datetime(2024, 1, 2, 6, 0))
+        self.other_period = TimePeriod(start=time(5, 0), end=time(8, 0))
+        assert self.period.relation(self.other_period) is Relation.OVERLAPS
+        assert self.other_period.relation(self.period) is Relation.OVERLAPPED_BY
+        assert self.period.overlapped_by(self.other_period) is False
+        with pytest.raises(TimeAmbiguityError):
+            self.period.overlaps_with(self.other_period)
+        with pytest.raises(TimeAmbiguityError):
+            self.period.get_overlap(self.other_period)
+
+    def test_relation_ambiguous(self):
+        """
+            The TimePeriod is within the period on each of the three days it spans
+        """
+        self.period = WallClockPeriod(start=datetime(2024, 1, 1, 8, 0), end=datetime(2024, 1, 3, 20, 0))
+        self.other_period = TimePeriod(start=time(10, 0), end=time(12, 0))
+        with pytest.raises(TimeAmbiguityError):
+            self.period.relation(self.other_period)
+        with pytest.raises(TimeAmbiguityError):
+            self.other_period.relation(self.period)
@@ -1,6 +1,194 @@
-from datetime import datetime
+from datetime import time, date, datetime, timedelta, timezone
+from functools import lru_cache
 from zoneinfo import ZoneInfo
 from temporals.exceptions import NonexistentTimeError
+from . import interface
+
+
+class Operand:
+    """ The kinds of values that the periods of this package operate with, as resolved by `operand_kind`. These are
+    plain integers rather than an Enum since they are compared on every single operation, where the attribute lookup of
+    an Enum member would cost as much as the isinstance checks this is meant to replace.
+    """
+    UNSUPPORTED = 0
+    TIME = 1
+    DATE = 2
+    DATETIME = 3
+    TIME_PERIOD = 4
+    DATE_PERIOD = 5
+    WALLCLOCK_PERIOD = 6
+    ABSOLUTE_PERIOD = 7
+
+
+# Concrete types are resolved with a single dictionary lookup, new types are added as they are encountered
+_OPERANDS: dict[type, int] = {
+    time: Operand.TIME,
+    date: Operand.DATE,
+    datetime: Operand.DATETIME,
+}
+
+
+def _resolve_operand(value_type: type) -> int:
+    """ Resolves the kind of a type which has not been seen yet by going through the (considerably slower) abstract base
+    class checks, this way third-party implementations of the interfaces, as well as subclasses of the datetime types,
+    are still supported. The result is stored so that this happens only once per type; unsupported types are not
+    stored, since they may still be registered with one of the interfaces (see `ABCMeta.register`) later on.
+    """
+    if issubclass(value_type, interface.PyTimePeriod):
+        kind = Operand.TIME_PERIOD
+    elif issubclass(value_type, interface.PyDatePeriod):
+        kind = Operand.DATE_PERIOD
+    elif issubclass(value_type, interface.PyWallClockPeriod):
+        kind = Operand.WALLCLOCK_PERIOD
+    elif issubclass(value_type, interface.PyAbsolutePeriod):
+        kind = Operand.ABSOLUTE_PERIOD
+    elif issubclass(value_type, datetime):
+        # Must be checked before date, since datetime is a subclass of it
+        kind = Operand.DATETIME
+    elif issubclass(value_type, date):
+        kind = Operand.DATE
+    elif issubclass(value_type, time):
+        kind = Operand.TIME
+    else:
+        return Operand.UNSUPPORTED
+    _OPERANDS[value_type] = kind
+    return kind
+
+
+def operand_kind(value) -> int:
+    """ Returns the kind of the provided value as one of the `Operand` constants; values of types that the periods
+    cannot operate with are resolved to Operand.UNSUPPORTED
+    """
+    kind = _OPERANDS.get(value.__class__)
+    if kind is None:
+        return _resolve_operand(value.__class__)
+    return kind
+
+
+_EPOCH = datetime(1970, 1, 1)
+_EPOCH_UTC = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_MICROSECOND = timedelta(microseconds=1)
+
+
+def to_epoch_us(value: datetime) -> int:
+    """ Returns the number of microseconds between the UTC epoch and the provided datetime, which is negative for
+    values before it. Aware datetimes are converted by their offset (honouring their `fold`), while naive datetimes
+    are taken to be in UTC; see `check_awareness` before comparing the epochs of a naive and an aware datetime.
+    """
+    if value.tzinfo is None:
+        return (value - _EPOCH) // _MICROSECOND
+    return (value - _EPOCH_UTC) // _MICROSECOND
+
+
+def check_awareness(value: datetime, other: datetime) -> None:
+    """ Raises a TypeError if one of the datetimes is naive and the other one is aware, the same as comparing them does.
+    Since `to_epoch_us` takes naive datetimes to be in UTC, the epochs of two datetimes may only be compared with each
+    other once this check has passed.
+    """
+    if (value.tzinfo is None) != (other.tzinfo is None):
+        raise TypeError("can't compare offset-naive and offset-aware datetimes")
+
+
+def whole_months(start: date, days: int) -> tuple[int, int]:
+    """ Returns the number of consecutive calendar months, beginning with the month of the provided date, that fit
+    entirely within the provided number of days, along with the number of days left over after them.
+
+    This is equivalent to subtracting the length of each month in turn for as long as the remaining days suffice, but
+    it is done in constant time regardless of how many months the days span: stepping `days` forward from the first of
+    the starting month lands on the month where the walk would stop, and on the day that is left over within it.
+    """
+    if days < 28:
+        # Not even the shortest month fits
+        return 0, days
+    reached = date.fromordinal(start.toordinal() - start.day + 1 + days)
+    return (reached.year - start.year) * 12 + reached.month - start.month, reached.day - 1
+
+
+class Existence:
+    """ The possible outcomes of `classify_existence` for a local (wall clock) time within its timezone; plain integers
+    for the same reason as `Operand` above.
+    """
+    NORMAL = 0
+    NONEXISTENT = 1
+    AMBIGUOUS = 2
+
+
+# Transitions are located by sampling the UTC offset of the zone at this interval and bisecting to the second wherever
+# it changes; no zone in the tz database has had two transitions less than this far apart
+_SCAN_STEP = 6 * 3600
+
+
+def _offset_at(zone: ZoneInfo, start: datetime, seconds: int) -> timedelta:
+    return (start + timedelta(seconds=seconds)).astimezone(zone).utcoffset()
+
+
+@lru_cache(maxsize=1024)
+def _transition_windows(zone: ZoneInfo, year: int) -> tuple[tuple[datetime, datetime, int], ...]:
+    """ Returns the windows of local time around the transitions of `zone` that affect the given year, as tuples of
+    (start, end, kind) where the start is inclusive, the end is exclusive and the kind is either
+    Existence.NONEXISTENT (the clock shifted forward) or Existence.AMBIGUOUS (the clock shifted backward).
+
+    The boundaries are set in the same `zone`, and since aware datetimes sharing the same tzinfo are compared by their
+    wall clock values, checking a value against them requires neither a conversion nor any new objects.
+    """
+    windows = []
+    # Start and end a couple of days outside the year, so transitions shifting the local time across the new year are
+    # included as well
+    current = datetime(year - 1, 12, 30, tzinfo=timezone.utc)
+    stop = datetime(year + 1, 1, 3, tzinfo=timezone.utc)
+    offset = current.astimezone(zone).utcoffset()
+    while current < stop:
+        if _offset_at(zone, current, _SCAN_STEP) == offset:
+            current += timedelta(seconds=_SCAN_STEP)
+            continue
+        # The offset has changed within this step, find the first second at which it did
+        low, high = 0, _SCAN_STEP
+        while high - low > 1:
+            middle = (low + high) // 2
+            if _offset_at(zone, current, middle) == offset:
+                low = middle
+            else:
+                high = middle
+        current += timedelta(seconds=high)
+        new_offset = current.astimezone(zone).utcoffset()
+        transition = current.replace(tzinfo=None)
+        if new_offset > offset:
+            windows.append(((transition + offset).replace(tzinfo=zone),
+                            (transition + new_offset).replace(tzinfo=zone),
+                            Existence.NONEXISTENT))
+        else:
+            windows.append(((transition + new_offset).replace(tzinfo=zone),
+                            (transition + offset).replace(tzinfo=zone),
+                            Existence.AMBIGUOUS))
+        offset = new_offset
+    return tuple(windows)
+
+
+def classify_existence(value: datetime) -> int:
+    """ Classifies the provided datetime as one of the `Existence` constants, based on its wall clock value within its
+    timezone:
+        NORMAL - the time occurs exactly once; naive datetimes are always considered normal;
+        NONEXISTENT - the time is skipped as the clock shifts forward;
+        AMBIGUOUS - the time occurs twice as the clock shifts backward, the `fold` attribute tells which of the two
+            occurrences is meant.
+
+    For ZoneInfo timezones the transitions of each zone are computed once per year and cached; any other tzinfo
+    implementation is evaluated by converting the value to UTC and back.
+    """
+    zone = value.tzinfo
+    if zone is None or zone.__class__ is timezone:
+        # Fixed offsets never shift
+        return Existence.NORMAL
+    if isinstance(zone, ZoneInfo) and 1 < value.year < 9999:
+        for start, end, kind in _transition_windows(zone, value.year):
+            if start <= value < end:
+                return kind
+        return Existence.NORMAL
+    if value != value.astimezone(timezone.utc).astimezone(zone):
+        return Existence.NONEXISTENT
+    if value.replace(fold=1 - value.fold).utcoffset() != value.utcoffset():
+        return Existence.AMBIGUOUS
+    return Existence.NORMAL
 
 
 def check_existence(value: datetime) -> datetime:
@@ -8,7 +196,7 @@ def check_existence(value: datetime) -> datetime:
     forward).
 
     Important to note, in the case of repeating time, an error will not be raised - it's up to you to decide whether the
-    provided time is intended as-is.
+    provided time is intended as-is. To tell the repeating times apart, see `classify_existence`.
 
     Kudos go to @ariebovenberg (https://github.com/ariebovenberg) and his article on common pitfalls with the datetime
     library - https://dev.arie.bovenberg.net/blog/python-datetime-pitfalls/
@@ -18,10 +206,6 @@ def check_existence(value: datetime) -> datetime:
     """
     if value.tzinfo is None:
         return value
-    # If a time does not exist due to the clock shifting forward, switching the timezone to UTC and back to the original
-    # one, will result in a time shift as well; evaluate if the modified object equals the original one
-    orig_tz = value.tzinfo
-    shifted = value.astimezone(ZoneInfo("UTC")).astimezone(orig_tz)
-    if value != shifted:
-        raise NonexistentTimeError(value, orig_tz)
+    if classify_existence(value) == Existence.NONEXISTENT:
+        raise NonexistentTimeError(value, value.tzinfo)
     return value
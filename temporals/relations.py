@@ -0,0 +1,56 @@
+from enum import Enum
+
+
+class Relation(Enum):
+    """ The thirteen relations of Allen's interval algebra, describing how a period relates to another one. Every pair
+    of periods is in exactly one of these relations, which is always read from the point of view of the period that is
+    being asked; `a.relation(b)` returning Relation.BEFORE means "a is before b".
+
+                              |==========|         <---- The other period
+        BEFORE       |====|   |          |         This period ends before the other one starts
+        MEETS            |====|          |         This period ends exactly when the other one starts
+        OVERLAPS            |=====|      |         This period starts first and ends within the other one
+        STARTS                |=====|    |         Both start together, this period ends first
+        DURING                |  |===|   |         This period is strictly within the other one
+        FINISHES              |    |=====|         Both end together, this period starts later
+        EQUALS                |==========|         Both start and end together
+
+    The remaining six are the inverse of the ones above (AFTER, MET_BY, OVERLAPPED_BY, STARTED_BY, CONTAINS and
+    FINISHED_BY); when `a.relation(b)` is Relation.OVERLAPS, `b.relation(a)` is Relation.OVERLAPPED_BY. See the
+    `inverse` property.
+    """
+    BEFORE = 'before'
+    MEETS = 'meets'
+    OVERLAPS = 'overlaps'
+    STARTS = 'starts'
+    DURING = 'during'
+    FINISHES = 'finishes'
+    EQUALS = 'equals'
+    FINISHED_BY = 'finished_by'
+    CONTAINS = 'contains'
+    STARTED_BY = 'started_by'
+    OVERLAPPED_BY = 'overlapped_by'
+    MET_BY = 'met_by'
+    AFTER = 'after'
+
+    @property
+    def inverse(self) -> 'Relation':
+        """ The relation of the other period to this one """
+        return _INVERSES[self]
+
+
+_INVERSES = {
+    Relation.BEFORE: Relation.AFTER,
+    Relation.MEETS: Relation.MET_BY,
+    Relation.OVERLAPS: Relation.OVERLAPPED_BY,
+    Relation.STARTS: Relation.STARTED_BY,
+    Relation.DURING: Relation.CONTAINS,
+    Relation.FINISHES: Relation.FINISHED_BY,
+    Relation.EQUALS: Relation.EQUALS,
+    Relation.FINISHED_BY: Relation.FINISHES,
+    Relation.CONTAINS: Relation.DURING,
+    Relation.STARTED_BY: Relation.STARTS,
+    Relation.OVERLAPPED_BY: Relation.OVERLAPS,
+    Relation.MET_BY: Relation.MEETS,
+    Relation.AFTER: Relation.BEFORE,
+}